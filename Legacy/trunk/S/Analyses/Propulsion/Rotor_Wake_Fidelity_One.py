@@ -13,6 +13,7 @@ from Legacy.trunk.S.Components.Energy.Energy_Component import Energy_Component
 from Legacy.trunk.S.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero import Rotor_Wake_Fidelity_Zero
 from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import fidelity_one_wake_convergence
 from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity 
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_tree_wake_induced_velocity import compute_tree_wake_induced_velocity 
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.extract_wing_VD import extract_wing_collocation_points
 
 # package imports
@@ -65,6 +66,8 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         self.wake_settings.number_rotor_rotations     = 5
         self.wake_settings.number_steps_per_rotation  = 72
         self.wake_settings.initial_timestep_offset    = 0    # initial timestep
+        self.wake_settings.induced_velocity_method    = 'direct' # 'direct' sum or Barnes-Hut 'tree' code
+        self.wake_settings.induced_velocity_tolerance = 0.2  # tree code opening angle, smaller is more accurate
         
         # wake convergence criteria
         self.maximum_convergence_iteration            = 10
@@ -236,7 +239,11 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
     
         # compute the induced velocity from the rotor wake on the lifting surfaces
         VD.Wake         = wake_vortex_distribution
-        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
+        if self.wake_settings.induced_velocity_method == 'tree':
+            rot_V_wake_ind  = compute_tree_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts,
+                                                                 tolerance=self.wake_settings.induced_velocity_tolerance)
+        else:
+            rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
         
         return rot_V_wake_ind
     
@@ -26,8 +26,12 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget = dict.get
 objgetattrib = object.__getattribute__
 
+# marks a missing key, values may be None
+_missing = object()
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -49,7 +53,8 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks k up as a key first, if it is not a key treats it as an object attribute.
+            No exception is raised on the way, which keeps method lookups cheap
     
             Source:
             N/A
@@ -63,16 +68,18 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,_missing)
+        if v is _missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
             This one tries to treat k as an object, if that fails it treats it as a key.
+            Names that are neither class nor instance attributes, i.e. almost every write, are stored as keys
+            without raising an exception.
     
             Source:
             N/A
@@ -87,6 +94,9 @@ class Data(dict):
             Properties Used:
             N/A    
         """
+        if getattr(type(self),k,_missing) is _missing and k not in objgetattrib(self,'__dict__'):
+            self[k] = v
+            return
         try:
             objgetattrib(self, k)
         except:
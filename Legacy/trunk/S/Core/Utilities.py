@@ -6,7 +6,9 @@
 # ----------------------------------------------------------------------
 #   Imports
 # ----------------------------------------------------------------------
+import hashlib
 import numpy as np
+from .Data import Data
  
 def interp2d(x,y,xp,yp,zp,fill_value= None):
     """
@@ -54,3 +56,128 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
         z = np.where(oob, fill_value, z)
 
     return z
+
+# ----------------------------------------------------------------------
+#  Hash Data
+# ----------------------------------------------------------------------
+## @ingroup Core
+def hash_data(value):
+    """ Computes a content hash of a data structure made of Data, dicts, lists, arrays, numbers, strings and
+    classes. The hash only depends on the values, so it is the same in every process.
+
+    Assumptions:
+    Objects that can not be hashed by value are hashed by identity, so they never match
+    Shared entries are hashed by their first occurrence
+
+    Source:
+    None
+
+    Inputs:
+    value  - data structure                       [Unitless]
+
+    Outputs:
+    key    - hex digest                           [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    digest  = hashlib.sha1()
+    visited = {}
+
+    def update(value):
+        if value is None or isinstance(value,(bool,int,float,complex,str,bytes,np.generic)):
+            digest.update(repr((type(value).__name__,value)).encode())
+        elif isinstance(value,np.ndarray):
+            digest.update(repr((value.dtype.str,value.shape)).encode())
+            digest.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode())
+        elif isinstance(value,type):
+            digest.update(('type ' + value.__module__ + '.' + value.__qualname__).encode())
+        elif id(value) in visited:
+            digest.update(('ref ' + str(visited[id(value)])).encode())
+        elif isinstance(value,dict):
+            visited[id(value)] = len(visited)
+            digest.update(('dict ' + type(value).__name__ + ' ' + str(len(value))).encode())
+            for k,v in value.items():
+                update(k)
+                update(v)
+        elif isinstance(value,(list,tuple)):
+            visited[id(value)] = len(visited)
+            digest.update(('list ' + str(len(value))).encode())
+            for v in value:
+                update(v)
+        else:
+            digest.update(('object ' + type(value).__name__ + ' ' + str(id(value))).encode())
+
+    update(value)
+
+    return digest.hexdigest()
+
+# ----------------------------------------------------------------------
+#  Flatten Data
+# ----------------------------------------------------------------------
+## @ingroup Core
+def flatten_data(data, prefix=''):
+    """ Flattens nested Data into arrays named by their path, so they can be stored in a numpy archive.
+
+    Assumptions:
+    Keys do not contain '/', which separates the levels of a path
+
+    Source:
+    None
+
+    Inputs:
+    data    - nested Data                                 [Unitless]
+    prefix  - path of data within the outermost Data      [Unitless]
+
+    Outputs:
+    arrays  - arrays named by their path                  [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    arrays = {}
+    for key,value in data.items():
+        if isinstance(value,Data):
+            arrays.update(flatten_data(value,prefix + key + '/'))
+        else:
+            arrays[prefix + key] = np.asarray(value)
+    return arrays
+
+# ----------------------------------------------------------------------
+#  Unflatten Data
+# ----------------------------------------------------------------------
+## @ingroup Core
+def unflatten_data(arrays):
+    """ Rebuilds nested Data from arrays named by their path, see flatten_data.
+
+    Assumptions:
+    Zero dimensional arrays were stored from scalars and become scalars again
+
+    Source:
+    None
+
+    Inputs:
+    arrays  - arrays named by their path, as loaded by numpy.load   [Unitless]
+
+    Outputs:
+    data    - nested Data                                           [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    data = Data()
+    for name in arrays.files:
+        value = arrays[name]
+        if value.ndim == 0:
+            value = value.item()
+        path  = name.split('/')
+        level = data
+        for key in path[:-1]:
+            if key not in level:
+                level[key] = Data()
+            level = level[key]
+        level[path[-1]] = value
+    return data
@@ -15,8 +15,8 @@ from Legacy.trunk.S.Core import  Data
 
 # package imports 
 import numpy as np  
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
-from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution       import generate_vortex_distribution 
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_influence_matrices          import cached_influence_matrices, solve_influence_matrices
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_vortex_distribution         import cached_vortex_distribution 
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
 
 # ----------------------------------------------------------------------
@@ -95,6 +95,12 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.vortex_distribution_cache         [Data], panelizations reused across calls, see cached_vortex_distribution
+    settings.influence_matrix_cache            [Data], factorized influence matrices, see cached_influence_matrices
+    settings.linear_solver                     ['direct' or 'gmres'], LU factorization or block Jacobi preconditioned GMRES
+    settings.linear_solver_tolerance           [unitless], residual GMRES stops at, relative to the right hand side
+    settings.gmres_restart                     [unitless], Krylov vectors GMRES builds between restarts
+    settings.gmres_maximum_cycles              [unitless], GMRES restarts before the direct solve is used instead
        
     conditions.aerodynamics.angles.alpha       [radians]
     conditions.aerodynamics.angles.beta        [radians]
@@ -185,8 +191,8 @@ def VLM(conditions,settings,geometry):
     # ---------------------------------------------------------------------------------------
     # STEPS 1-9: Generate Panelization and Vortex Distribution
     # ------------------ --------------------------------------------------------------------    
-    # generate vortex distribution (VLM steps 1-9)
-    VD   = generate_vortex_distribution(geometry,settings)  
+    # generate vortex distribution (VLM steps 1-9), reused if this configuration has been panelized before
+    VD   = cached_vortex_distribution(geometry,settings)  
     
     if not VD.is_postprocessed:
         raise ValueError('postprocess_VD has not been called since the panels have been modified')
@@ -245,30 +251,20 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
-    # This is not affected by AoA, so we can use unique mach numbers only
+    # Build induced velocity matrix, C_mn, and the Aerodynamic Influence Coefficient Matrix
+    # This is not affected by AoA, so we can use unique mach numbers only and factorize each once
     m_unique, inv = np.unique(mach,return_inverse=True)
-    m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
-    
-    C_mn  = C_mn_small[inv,:,:,:]
-    RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
+    inv           = np.reshape(inv,-1)
+    influence     = cached_influence_matrices(VD,m_unique,delta,phi,settings)
+    s             = influence.s
+    RFLAG         = influence.RFLAG[inv,:]
+    EW            = influence.EW[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
 
     # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    GAMMA  = solve_influence_matrices(influence.systems,inv,RHS,settings)
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
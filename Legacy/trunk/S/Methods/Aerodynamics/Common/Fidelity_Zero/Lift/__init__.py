@@ -10,6 +10,8 @@ from .generate_wing_wake_grid                 import generate_wing_wake_grid
 from .compute_wing_wake                       import compute_wing_wake
 from .compute_propeller_nonuniform_freestream import compute_propeller_nonuniform_freestream
 from .generate_vortex_distribution            import generate_vortex_distribution
+from .cached_vortex_distribution              import cached_vortex_distribution
+from .cached_influence_matrices               import cached_influence_matrices, solve_influence_matrices
 from .fuselage_correction                     import fuselage_correction
 from .make_VLM_wings                          import make_VLM_wings
 from .generate_VD_helpers                     import postprocess_VD, compute_panel_area, compute_unit_normal
@@ -0,0 +1,442 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# cached_influence_matrices.py
+#
+# Created:  Oct 2026, RCAIDE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+import warnings
+from scipy.linalg import lu_factor, lu_solve
+from Legacy.trunk.S.Core import Data
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
+
+# previously solved conditions kept to start the GMRES solver from
+stored_solutions     = 32
+
+# memory of the factorizations kept in settings.influence_matrix_cache, unless settings say otherwise
+cache_memory         = 256 * 2**20
+
+# ----------------------------------------------------------------------
+#  Cached Influence Matrices
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_influence_matrices(VD,mach,delta,phi,settings):
+    """ Builds the aerodynamic influence coefficient matrix of each unique Mach number and factorizes it once. The
+    matrices only depend on the panelization and the Mach number, so every angle of attack, sideslip, rate and
+    velocity perturbation at that Mach number is solved with the same LU factorization.
+
+    With settings.linear_solver = 'gmres' the matrices are not factorized. Only the diagonal blocks of the panels of
+    each wing are factorized instead, as the block Jacobi preconditioner of solve_influence_matrices.
+
+    Assumptions:
+    Factorizations are kept in settings.influence_matrix_cache for vortex distributions that come from
+    cached_vortex_distribution, using at most settings.influence_matrix_cache_memory bytes. The oldest factorizations
+    are dropped first, one that does not fit on its own is not kept. Otherwise they are only shared within the call.
+    The matrices are built block by block of control points into one array, so the temporaries stay within
+    settings.induced_velocity_memory_budget.
+    delta and phi are the same for every condition, they only depend on the panelization.
+    Matrices are built in settings.floating_point_precision but factorized and solved in at least double precision,
+    as np.linalg.solve did with the double precision right hand sides. GMRES systems are kept in double precision too,
+    as the linear solver tolerance sets their accuracy.
+    Wings only weakly interact, so the blocks of their panels make an effective preconditioner at a fraction of the
+    cost of factorizing the whole matrix.
+
+    Source:
+    None
+
+    Inputs:
+    VD       - vehicle vortex distribution                     [Unitless]
+    mach     - unique Mach numbers                             [Unitless]
+    delta    - mean camber surface angle                       [radians]
+    phi      - dihedral angle                                  [radians]
+    settings.use_VORLAX_matrix_calculation                     [Boolean]
+    settings.influence_matrix_cache_memory                     [bytes]
+    settings.induced_velocity_memory_budget                    [bytes]
+    settings.induced_velocity_threads                          [Unitless]
+    settings.linear_solver                                     ['direct' or 'gmres']
+    settings.floating_point_precision                          [np.dtype]
+
+    Outputs:
+    influence.
+      s              - semispan of the horshoe vortices        [m]
+      RFLAG          - sonic vortex flag of each Mach number   [Boolean]
+      EW             - VORLAX frame induced velocities         [Unitless]
+      systems        - LU factorization of each Mach number,   [Unitless]
+                       or matrix and preconditioner for GMRES
+
+    Properties Used:
+    N/A
+    """
+
+    mach       = np.atleast_1d(np.squeeze(mach))
+    use_VORLAX = settings.use_VORLAX_matrix_calculation
+    iterative  = 'linear_solver' in settings and settings.linear_solver == 'gmres'
+    keys       = [influence_matrix_key(VD,m,use_VORLAX) + ('_gmres' if iterative else '') for m in mach]
+
+    if 'influence_matrix_cache' in settings and 'cache_key' in VD:
+        cache  = settings.influence_matrix_cache
+        memory = settings.influence_matrix_cache_memory if 'influence_matrix_cache_memory' in settings else cache_memory
+    else:
+        cache  = Data()
+        memory = 0
+
+    entries = [cache[key] if key in cache else None for key in keys]
+    missing = [i for i,entry in enumerate(entries) if entry is None]
+    if len(missing):
+        if not use_VORLAX and not (shared_rows(delta) and shared_rows(phi)):
+            raise ValueError('The influence matrices are built with the mean camber and dihedral angles of the first condition, they must be the same for every condition')
+        memory_budget      = settings.induced_velocity_memory_budget if 'induced_velocity_memory_budget' in settings else None
+        number_of_threads  = settings.induced_velocity_threads if 'induced_velocity_threads' in settings else 1
+        if not use_VORLAX:
+            # the velocities of each block of control points are projected onto the normals, validated from book eqn 7.42
+            normal = np.stack([ np.sin(delta[0])*np.cos(phi[0]),
+                                np.cos(delta[0])*np.sin(phi[0]),
+                               -np.cos(phi[0])*np.cos(delta[0])],axis=-1)
+        else:
+            normal = None
+        C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD,np.atleast_2d(mach[missing]).T,compute_EW=True,
+                                                           memory_budget=memory_budget,number_of_threads=number_of_threads,
+                                                           normal=normal)
+        A = C_mn if not use_VORLAX else EW
+
+        # the right hand sides are double precision, so the systems are solved in at least double precision
+        precision = settings.floating_point_precision if 'floating_point_precision' in settings else A.dtype
+        precision = np.result_type(precision,np.float64)
+
+        for j,i in enumerate(missing):
+            entry               = Data()
+            entry.s             = s
+            entry.RFLAG         = RFLAG[j]
+            entry.EW            = EW[j]
+            if iterative:
+                entry.system    = block_jacobi_system(VD,np.asarray(A[j],dtype=precision))
+            else:
+                entry.system    = lu_factor(np.asarray(A[j],dtype=precision),check_finite=False)
+            entry.memory        = influence_matrix_memory(entry,iterative)
+            entries[i]          = entry
+            if entry.memory <= memory:
+                while len(cache) and sum([cached.memory for cached in cache.values()]) + entry.memory > memory:
+                    del cache[next(iter(cache.keys()))]
+                cache[keys[i]] = entry
+
+    influence                = Data()
+    influence.s              = entries[0].s
+    influence.RFLAG          = np.stack([entry.RFLAG for entry in entries])
+    influence.EW             = np.stack([entry.EW for entry in entries])
+    influence.systems        = [entry.system for entry in entries]
+
+    return influence
+
+# ----------------------------------------------------------------------
+#  Solve Influence Matrices
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_influence_matrices(systems,inverse,RHS,settings=Data()):
+    """ Solves for the vortex strengths of every condition, all conditions at the same Mach number are solved at
+    once as columns of one right hand side, either with the LU factorization of the influence matrix or with GMRES.
+
+    Assumptions:
+    GMRES stops once the residual of every condition is below settings.linear_solver_tolerance relative to its
+    right hand side. Conditions it does not solve within settings.gmres_maximum_cycles restarts are solved with the
+    LU factorization of the influence matrix instead, with a warning
+
+    Source:
+    None
+
+    Inputs:
+    systems        - influence matrix systems, see cached_influence_matrices  [Unitless]
+    inverse        - unique Mach number of each condition                      [Unitless]
+    RHS            - right hand side of each condition                         [Unitless]
+    settings.linear_solver_tolerance                                           [Unitless]
+    settings.gmres_restart                                                     [Unitless]
+    settings.gmres_maximum_cycles                                              [Unitless]
+
+    Outputs:
+    GAMMA          - vortex strengths                                          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    tolerance      = settings.linear_solver_tolerance if 'linear_solver_tolerance' in settings else 1e-8
+    restart        = settings.gmres_restart if 'gmres_restart' in settings else 30
+    maximum_cycles = settings.gmres_maximum_cycles if 'gmres_maximum_cycles' in settings else 50
+    GAMMA          = np.empty(np.shape(RHS),dtype=np.result_type(RHS,np.float64))
+    for i,system in enumerate(systems):
+        rows        = inverse == i
+        if isinstance(system,Data):
+            GAMMA[rows] = solve_block_jacobi_system(system,RHS[rows].T,tolerance,restart,maximum_cycles).T
+        else:
+            GAMMA[rows] = lu_solve(system,RHS[rows].T,check_finite=False).T
+
+    return GAMMA
+
+# ----------------------------------------------------------------------
+#  Block Jacobi System
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def block_jacobi_system(VD,A):
+    """ Sets up the influence matrix for GMRES, with the LU factorizations of the diagonal blocks of the panels of
+    every wing as block Jacobi preconditioner.
+
+    Assumptions:
+    The panels of each wing, and of each fuselage, are contiguous
+
+    Source:
+    None
+
+    Inputs:
+    VD.chordwise_breaks  - first panel of every strip           [Unitless]
+    VD.spanwise_breaks   - first strip of every wing            [Unitless]
+    A                    - influence matrix                     [Unitless]
+
+    Outputs:
+    system.
+      matrix             - influence matrix                     [Unitless]
+      blocks             - first and last panel of every block  [Unitless]
+      factorizations     - LU factorization of every block      [Unitless]
+      solutions          - previously solved vortex strengths   [Unitless]
+      right_hand_sides   - their right hand sides               [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    breaks = np.append(np.asarray(VD.chordwise_breaks)[np.asarray(VD.spanwise_breaks)],len(A))
+
+    system                  = Data()
+    system.matrix           = A
+    system.blocks           = list(zip(breaks[:-1],breaks[1:]))
+    system.factorizations   = [lu_factor(A[i0:i1,i0:i1],check_finite=False) for i0,i1 in system.blocks]
+    system.solutions        = np.zeros((len(A),0))
+    system.right_hand_sides = np.zeros((len(A),0))
+
+    return system
+
+# ----------------------------------------------------------------------
+#  Solve Block Jacobi System
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_block_jacobi_system(system,RHS,tolerance,restart=30,maximum_cycles=50):
+    """ Solves the influence matrix system for several right hand sides with restarted, right preconditioned GMRES.
+    The Krylov spaces of all right hand sides are built together, so every iteration multiplies the influence matrix
+    with one block of vectors.
+
+    Assumptions:
+    The initial guess is the combination of previously solved conditions at this Mach number that best fits the
+    right hand sides. The right hand sides of the VLM only span a few directions, so many conditions are solved
+    without any iteration.
+    Columns that are not solved to the tolerance within the maximum number of restarts are solved with the LU
+    factorization of the whole matrix, with a warning. Only columns solved to the tolerance are kept to start from,
+    so the results never depend on earlier unconverged solves.
+
+    Source:
+    Saad, Y., Schultz, M. H., "GMRES: A Generalized Minimal Residual Algorithm for Solving Nonsymmetric Linear
+    Systems", SIAM J. Sci. Stat. Comput. 7(3), 1986.
+
+    Inputs:
+    system          - influence matrix system, see block_jacobi_system  [Unitless]
+    RHS             - right hand sides, one per column                  [Unitless]
+    tolerance       - residual relative to the right hand sides         [Unitless]
+    restart         - Krylov vectors built between restarts             [Unitless]
+    maximum_cycles  - restarts before the direct solve is used          [Unitless]
+
+    Outputs:
+    GAMMA           - vortex strengths, one per column                  [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    A       = system.matrix
+    B       = np.asarray(RHS,dtype=A.dtype)
+    n, k    = np.shape(B)
+    B_norm  = np.linalg.norm(B,axis=0)
+    B_norm[B_norm == 0] = 1.
+
+    # start from the previously solved conditions
+    GAMMA   = np.zeros((n,k))
+    if np.shape(system.solutions)[1]:
+        weights = np.linalg.lstsq(system.right_hand_sides,B,rcond=None)[0]
+        GAMMA   = system.solutions @ weights
+
+    for cycle in range(maximum_cycles):
+        R      = B - A @ GAMMA
+        beta   = np.linalg.norm(R,axis=0)
+        active = np.where(beta > tolerance*B_norm)[0]
+        if not len(active):
+            break
+        R, beta = R[:,active], beta[active]
+        m       = len(active)
+
+        V       = np.zeros((restart + 1,n,m))
+        Z       = np.zeros((restart,n,m))
+        H       = np.zeros((m,restart + 1,restart))
+        cs      = np.zeros((m,restart))
+        sn      = np.zeros((m,restart))
+        g       = np.zeros((m,restart + 1))
+        V[0]    = R/beta
+        g[:,0]  = beta
+        for j in range(restart):
+            # Arnoldi step with modified Gram-Schmidt
+            Z[j] = apply_block_jacobi(system,V[j])
+            W    = A @ Z[j]
+            for i in range(j + 1):
+                H[:,i,j] = np.sum(W*V[i],axis=0)
+                W       -= H[:,i,j]*V[i]
+            H[:,j+1,j] = np.linalg.norm(W,axis=0)
+            V[j+1]     = W/np.where(H[:,j+1,j] == 0,1.,H[:,j+1,j])
+
+            # Givens rotations reduce the Hessenberg matrix to triangular form
+            for i in range(j):
+                h_i       = cs[:,i]*H[:,i,j] + sn[:,i]*H[:,i+1,j]
+                H[:,i+1,j] = -sn[:,i]*H[:,i,j] + cs[:,i]*H[:,i+1,j]
+                H[:,i,j]  = h_i
+            norm       = np.hypot(H[:,j,j],H[:,j+1,j])
+            norm[norm == 0] = 1.
+            cs[:,j]    = H[:,j,j]/norm
+            sn[:,j]    = H[:,j+1,j]/norm
+            H[:,j,j]   = norm
+            H[:,j+1,j] = 0.
+            g[:,j+1]   = -sn[:,j]*g[:,j]
+            g[:,j]     = cs[:,j]*g[:,j]
+            if np.all(np.abs(g[:,j+1]) <= tolerance*B_norm[active]):
+                break
+
+        y = np.linalg.solve(H[:,:j+1,:j+1],g[:,:j+1,None])[:,:,0]
+        GAMMA[:,active] += np.einsum('jnm,mj->nm',Z[:j+1],y)
+    else:
+        active = np.where(np.linalg.norm(B - A @ GAMMA,axis=0) > tolerance*B_norm)[0]
+
+    # solve the columns GMRES did not converge directly
+    if len(active):
+        warnings.warn('GMRES did not reach the linear solver tolerance for ' + str(len(active)) + ' of ' + str(k) +
+                      ' conditions within ' + str(maximum_cycles) + ' restarts, they are solved directly', stacklevel=1)
+        GAMMA[:,active] = lu_solve(lu_factor(A,check_finite=False),B[:,active],check_finite=False)
+
+    # keep the latest conditions solved to the tolerance to start from
+    solved                  = np.linalg.norm(B - A @ GAMMA,axis=0) <= tolerance*B_norm
+    system.solutions        = np.concatenate([system.solutions,GAMMA[:,solved]],axis=1)[:,-stored_solutions:]
+    system.right_hand_sides = np.concatenate([system.right_hand_sides,B[:,solved]],axis=1)[:,-stored_solutions:]
+
+    return GAMMA
+
+# ----------------------------------------------------------------------
+#  Apply Block Jacobi
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def apply_block_jacobi(system,V):
+    """ Applies the block Jacobi preconditioner, the inverse of the diagonal blocks of the influence matrix, to a
+    block of vectors.
+
+    Assumptions:
+    The blocks do not overlap and cover every panel
+
+    Source:
+    None
+
+    Inputs:
+    system.blocks          - first and last panel of every block    [Unitless]
+    system.factorizations  - LU factorization of every block        [Unitless]
+    V                      - vectors, one per column                [Unitless]
+
+    Outputs:
+    Z                      - preconditioned vectors                 [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    Z = np.empty_like(V)
+    for (i0,i1),factorization in zip(system.blocks,system.factorizations):
+        Z[i0:i1] = lu_solve(factorization,V[i0:i1],check_finite=False)
+    return Z
+
+# ----------------------------------------------------------------------
+#  Shared Rows
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def shared_rows(a):
+    """ Checks that every row of an array equals the first one, so the first row can stand for all conditions.
+
+    Assumptions:
+    NaN entries equal each other
+
+    Source:
+    None
+
+    Inputs:
+    a          - array, one condition per row                  [Unitless]
+
+    Outputs:
+    shared     - every row equals the first one                [Boolean]
+
+    Properties Used:
+    N/A
+    """
+    a = np.asarray(a)
+    return bool(np.all((a == a[:1]) | (np.isnan(a) & np.isnan(a[:1]))))
+
+# ----------------------------------------------------------------------
+#  Influence Matrix Memory
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_matrix_memory(entry,iterative):
+    """ Computes the memory held by a cached influence matrix entry.
+
+    Assumptions:
+    GMRES entries are counted with the largest number of solutions they keep to start from
+
+    Source:
+    None
+
+    Inputs:
+    entry.EW       - VORLAX frame induced velocities                     [Unitless]
+    entry.RFLAG    - sonic vortex flag                                   [Boolean]
+    entry.system   - LU factorization, or matrix and preconditioner      [Unitless]
+    iterative      - the entry is set up for GMRES                       [Boolean]
+
+    Outputs:
+    memory         - memory held by the entry                            [bytes]
+
+    Properties Used:
+    N/A
+    """
+    memory = entry.EW.nbytes + np.asarray(entry.RFLAG).nbytes
+    if iterative:
+        system  = entry.system
+        memory += system.matrix.nbytes + sum([lu.nbytes + piv.nbytes for lu,piv in system.factorizations])
+        memory += 2*len(system.matrix)*stored_solutions*system.matrix.itemsize
+    else:
+        memory += entry.system[0].nbytes + entry.system[1].nbytes
+    return memory
+
+# ----------------------------------------------------------------------
+#  Influence Matrix Key
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_matrix_key(VD,mach,use_VORLAX):
+    """ Names the influence matrix of a vortex distribution at a Mach number.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    VD.cache_key   - key of the vortex distribution               [Unitless]
+    mach           - Mach number                                  [Unitless]
+    use_VORLAX     - VORLAX influence matrix                      [Boolean]
+
+    Outputs:
+    key            - name of the influence matrix                 [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    return str(VD.cache_key if 'cache_key' in VD else '') + '_' + repr(float(mach)) + '_' + str(bool(use_VORLAX))
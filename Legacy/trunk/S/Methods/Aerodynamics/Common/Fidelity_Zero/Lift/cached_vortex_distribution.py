@@ -0,0 +1,103 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# cached_vortex_distribution.py
+#
+# Created:  Oct 2026, RCAIDE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+from Legacy.trunk.S.Core import hash_data
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution import generate_vortex_distribution
+
+# settings that change the panelization
+discretization_settings = ['spanwise_cosine_spacing','model_fuselage','floating_point_precision','verbose',
+                           'number_of_spanwise_vortices','number_of_chordwise_vortices',
+                           'wing_spanwise_vortices','wing_chordwise_vortices',
+                           'fuselage_spanwise_vortices','fuselage_chordwise_vortices',
+                           'discretize_control_surfaces']
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Distribution
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_vortex_distribution(geometry,settings):
+    """ Returns the vortex distribution of the geometry, generating it only if the same wings, fuselages, control
+    surface deflections and discretization settings have not been panelized before. Surrogate training and repeated
+    VLM evaluations only change the freestream and reuse the panelization.
+
+    Assumptions:
+    The vortex distributions are kept in settings.vortex_distribution_cache, without it the panelization is
+    always generated. The oldest distribution is dropped once settings.vortex_distribution_cache_size are kept.
+    The vortex distribution returned is not modified by its users, other than VLM setting XBAR and ZBAR.
+
+    Source:
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]
+    geometry.fuselages                            [Unitless]
+    settings                                      [Unitless], see generate_vortex_distribution
+
+    Outputs:
+    VD - vehicle vortex distribution              [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    if not 'vortex_distribution_cache' in settings:
+        return generate_vortex_distribution(geometry,settings)
+
+    cache = settings.vortex_distribution_cache
+    key   = vortex_distribution_key(geometry,settings)
+    if key in cache:
+        VD = cache[key]
+        geometry.vortex_distribution = VD
+        return VD
+
+    VD           = generate_vortex_distribution(geometry,settings)
+    VD.cache_key = key
+
+    size = settings.vortex_distribution_cache_size if 'vortex_distribution_cache_size' in settings else 16
+    while len(cache) and len(cache) >= size:
+        del cache[next(iter(cache.keys()))]
+    if size > 0:
+        cache[key] = VD
+
+    return VD
+
+# ----------------------------------------------------------------------
+#  Vortex Distribution Key
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_distribution_key(geometry,settings):
+    """ Hashes everything the panelization depends on: the wings (including their segments, airfoils and control
+    surface deflections), the fuselages and the discretization settings.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    geometry.wings                                [Unitless]
+    geometry.fuselages                            [Unitless]
+    settings                                      [Unitless]
+
+    Outputs:
+    key - hex digest                              [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    values = [geometry.wings,geometry.fuselages]
+    for name in discretization_settings:
+        values.append(name)
+        values.append(settings[name] if name in settings else None)
+
+    return 'VD_' + hash_data(values)
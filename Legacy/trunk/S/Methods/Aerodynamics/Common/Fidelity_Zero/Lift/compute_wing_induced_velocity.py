@@ -11,9 +11,13 @@
 
 # package imports 
 import numpy as np 
+from concurrent.futures import ThreadPoolExecutor
+
+# estimated float32 temporaries per induced velocity value, used to size the blocks of control points
+temporaries_per_velocity = 40
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,memory_budget=None,number_of_threads=1,normal=None):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -21,6 +25,13 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    With a memory budget the control points are evaluated in blocks, so only the velocity matrices themselves 
+    grow with the square of the number of panels. The blocks can be evaluated in threads, the results do not 
+    depend on the blocks.
+    
+    Given the normal of every control point, the velocities of each block are projected onto it and only the 
+    influence coefficient matrix is kept, it is returned in place of C_mn.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,12 +40,18 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     2. VORLAX Source Code
 
     Args: 
-    VD       - vehicle vortex distribution                    [unitless] 
+    VD                - vehicle vortex distribution           [unitless] 
     mach                                                      [unitless] 
+    compute_EW        - compute the VORLAX frame velocities   [boolean] 
+    memory_budget     - bytes of temporaries per block        [bytes] 
+    number_of_threads - threads evaluating the blocks         [-] 
+    normal            - normal of each control point          [unitless] 
     
     Returns:                                
-    C_mn     - total induced velocity matrix                  [unitless] 
+    C_mn     - total induced velocity matrix, or the influence [unitless] 
+               coefficient matrix given the normals 
     s        - semispan of the horshoe vortex                 [m] 
+    EW       - VORLAX frame induced velocities                [unitless] 
     t        - tangent of the horshoe vortex                  [-] 
     CHORD    - chord length for a panel                       [m] 
     RFLAG    - sonic vortex flag                              [boolean] 
@@ -125,94 +142,154 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
     
-    xobar = (xo - xc)
-    yobar = (yo - yc)*costheta + (zo - zc)*sintheta
-    zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
-    
     # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
-    shape   = np.shape(xobar)
-    shape_0 = shape[0]
-    shape_1 = shape[1]
+    shape_0 = np.shape(xo)[0]
+    shape_1 = np.shape(xc)[1]
     s       = np.abs(y1bar)
     t       = x1bar/y1bar  
-    s       = np.repeat(s,shape_0,axis=0)
-    t       = np.repeat(t,shape_0,axis=0)
-    
-    X1 = xobar + t*s # In a planar case XC-XAH
-    Y1 = yobar + s   # In a planar case YC-YAH
-    X2 = xobar - t*s # In a planar case XC-XBH
-    Y2 = yobar - s   # In a planar case YC-YBH
     
     # The cutoff hardcoded into vorlax
     CUTOFF = 0.8
     
-    # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
-    XTY = xobar - t*yobar
-    
     # The notation in this method is flipped from the paper
     B2 = np.atleast_3d(mach**2-1.)
     
-    # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
-    TOL    = s /500.0
-    TOLSQ  = TOL *TOL
-    TOLSQ2 = 2500.0 *TOLSQ
-    ZSQ    = zobar *zobar
-    YSQ1   = Y1 *Y1
-    YSQ2   = Y2 *Y2
-    RTV1   = YSQ1 + ZSQ
-    RTV2   = YSQ2 + ZSQ
-    XSQ1   = X1 *X1
-    XSQ2   = X2 *X2
-    
     # Split the vectors into subsonic and supersonic
-    sub      = (B2<0)[:,0,0]
-    B2_sub   = B2[sub,:,:]
-    RO1_sub  = B2_sub*RTV1
-    RO2_sub  = B2_sub*RTV2
-    
-    # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
-    
-    if np.sum(sub)>0:
-        # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
-        U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
-
-    
-    # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX. some values computed in a preprocessing section in VLM
+    sub         = (B2<0)[:,0,0]
     sup         = (B2>=0)[:,0,0]
-    B2_sup      = B2[sup,:,:]
-    RO1_sup     = B2[sup,:,:]*RTV1
-    RO2_sup     = B2[sup,:,:]*RTV2
     RNMAX       = VD.panels_per_strip
     CHORD       = VD.chord_lengths
-    CHORD       = np.repeat(CHORD,shape_0,axis=0)
     RFLAG       = np.ones((n_mach,shape_1),dtype=np.int8)
     
-    if np.sum(sup)>0:
-        U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
-         
-    
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
-    
-    
+    # The velocities are written into the matrices block by block of control points 
+    if normal is None:
+        C_mn = np.empty((n_mach,shape_0,shape_1,3),dtype=np.float32)
+    else:
+        normal = np.reshape(normal,(shape_0,1,3))
+        C_mn   = np.empty((n_mach,shape_0,shape_1),dtype=np.result_type(np.float32,normal))
     if compute_EW == True:
-        # Calculate the W velocity in the VORLAX frame for later calcs
-        # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
-        WEIGHT = 1
-        
-        EW = (W*COS1-V*SIN1)*WEIGHT
+        EW = np.empty((n_mach,shape_0,shape_1),dtype=np.float32)
     else:
         # Assume that this function is being used outside of VLM, EW is not needed
         EW = np.nan
         
+    def compute_block(first,last):
+        # This is the receiving point, or the control points
+        xobar = (xo[first:last] - xc)
+        yobar = (yo[first:last] - yc)*costheta + (zo[first:last] - zc)*sintheta
+        zobar =-(yo[first:last] - yc)*sintheta + (zo[first:last] - zc)*costheta
+        
+        shape_0 = last - first
+        s_block = np.repeat(s,shape_0,axis=0)
+        t_block = np.repeat(t,shape_0,axis=0)
+        
+        X1 = xobar + t_block*s_block # In a planar case XC-XAH
+        Y1 = yobar + s_block   # In a planar case YC-YAH
+        X2 = xobar - t_block*s_block # In a planar case XC-XBH
+        Y2 = yobar - s_block   # In a planar case YC-YBH
+        
+        # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
+        XTY = xobar - t_block*yobar
+        
+        # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
+        TOL    = s_block /500.0
+        TOLSQ  = TOL *TOL
+        TOLSQ2 = 2500.0 *TOLSQ
+        ZSQ    = zobar *zobar
+        YSQ1   = Y1 *Y1
+        YSQ2   = Y2 *Y2
+        RTV1   = YSQ1 + ZSQ
+        RTV2   = YSQ2 + ZSQ
+        XSQ1   = X1 *X1
+        XSQ2   = X2 *X2
+        
+        # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
+        U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
+        V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
+        W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
+        
+        if np.sum(sub)>0:
+            # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
+            B2_sub   = B2[sub,:,:]
+            RO1_sub  = B2_sub*RTV1
+            RO2_sub  = B2_sub*RTV2
+            U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t_block,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
+        
+        # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX. some values computed in a preprocessing section in VLM
+        if np.sum(sup)>0:
+            B2_sup      = B2[sup,:,:]
+            RO1_sup     = B2[sup,:,:]*RTV1
+            RO2_sup     = B2[sup,:,:]*RTV2
+            CHORD_block = np.repeat(CHORD,shape_0,axis=0)
+            U[sup], V[sup], W[sup], RFLAG_sup = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t_block,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
+                                                        X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD_block,RNMAX,n_cp,TE_ind,LE_ind,first)
+            if first == 0:
+                RFLAG[sup,:] = RFLAG_sup
+        
+        # Rotate into the vehicle frame and pack into the velocity matrix, or project onto the normals
+        if normal is None:
+            C_mn[:,first:last,:,0] = U
+            C_mn[:,first:last,:,1] = V*costheta - W*sintheta
+            C_mn[:,first:last,:,2] = V*sintheta + W*costheta
+        else:
+            C_mn[:,first:last] =   U*normal[first:last,:,0] \
+                                 + (V*costheta - W*sintheta)*normal[first:last,:,1] \
+                                 + (V*sintheta + W*costheta)*normal[first:last,:,2]
+        
+        if compute_EW == True:
+            # Calculate the W velocity in the VORLAX frame for later calcs
+            # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
+            COS1   = np.cos(DL.T[first:last] - DL)
+            SIN1   = np.sin(DL.T[first:last] - DL) 
+            WEIGHT = 1
+            
+            EW[:,first:last] = (W*COS1-V*SIN1)*WEIGHT
+        
+        return
+    
+    # -------------------------------------------------------------------------------------------
+    # Evaluate the control points in blocks that fit the memory budget, optionally in threads
+    # ------------------------------------------------------------------------------------------- 
+    blocks = control_point_blocks(shape_0,shape_1,n_mach,memory_budget)
+    if number_of_threads > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+            list(executor.map(lambda block: compute_block(*block),blocks))
+    else:
+        for block in blocks:
+            compute_block(*block)
+    
+    s = np.repeat(s,shape_0,axis=0)
 
     return C_mn, s, RFLAG, EW
+
+def control_point_blocks(n_points,n_panels,n_mach,memory_budget):
+    """ Splits the control points into the blocks evaluated at once, so that the temporary arrays of each block
+    stay within the memory budget.
+
+    Assumptions: 
+    The temporaries of a block take about temporaries_per_velocity float32 values per induced velocity component
+    At least one control point is evaluated at a time
+
+    Source:  
+    None
+
+    Args: 
+    n_points       number of control points                     [-]
+    n_panels       number of horseshoe vortices                 [-]
+    n_mach         number of Mach numbers                       [-]
+    memory_budget  bytes of temporaries per block, None for all [bytes]
+    
+    Returns:           
+    blocks         first and last control point of each block   [-]
+
+    """  
+    if memory_budget is None:
+        return [(0,n_points)]
+    
+    bytes_per_point = temporaries_per_velocity*4*max(n_mach,1)*max(n_panels,1)
+    block_size      = int(max(1,min(n_points,memory_budget//bytes_per_point)))
+    
+    return [(first,min(first+block_size,n_points)) for first in range(0,n_points,block_size)]
     
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
@@ -283,7 +360,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind, first_point=0):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -319,6 +396,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
+    first_point  index of the first control point of a block  [-]
     
 
     
@@ -419,8 +497,9 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
+    size   = shape[2]
     n_mach = shape[0]    
+    n_rows = shape[1]
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
     T2A = np.zeros((n_mach,size))
@@ -453,7 +532,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.eye(n_rows,n_cp,k=first_point,dtype=np.int8)
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -468,31 +547,53 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # IN FRONT OF AND BEHIND IT.
     
     # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
+    FLAG_bool_rep     = np.broadcast_to(FLAG_bool[:,first_point:first_point+n_rows],shape)
     W[FLAG_bool_rep]  = 0. # Default to zero
 
-    # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
+    # The self velocity goes to 2, as indices into the full matrices of all control points
+    FLAG_ind          = np.array(np.where(FLAG_bool[:,:,0]))
+    FLAG_bool_self    = (FLAG_ind[0]*size + FLAG_ind[1])*size + FLAG_ind[1]
+    set_block_values(W,FLAG_bool_self,2.,first_point,size) # It's own value, -2
     
     # The panels before and after go to -1
     FLAG_bool_bef = FLAG_bool_self - 1
     FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
+    set_block_values(W,FLAG_bool_bef,-1.,first_point,size)
+    set_block_values(W,FLAG_bool_aft,-1.,first_point,size)
 
     return U, V, W, RFLAG
 
 
+def set_block_values(W,indices,value,first_point,size):
+    """  Sets the entries of the full velocity matrix, given by their flat indices, that belong to a block of 
+    control points
+
+    Assumptions: 
+    Negative indices count from the end, as when indexing the full flattened matrix
+
+    Source:  
+    None
+
+    Args: 
+    W            Z velocity of the block of control points    [unitless]
+    indices      flat indices into the full velocity matrix   [-]
+    value        value of the entries                         [unitless]
+    first_point  index of the first control point of a block  [-]
+    size         number of control points and panels          [-]
+    
+    Returns:           
+    None
+
+    """    
+    indices              = np.mod(indices,np.shape(W)[0]*size*size)
+    mach_ind, rest       = np.divmod(indices,size*size)
+    point_ind, panel_ind = np.divmod(rest,size)
+    block                = (point_ind>=first_point) & (point_ind<first_point+np.shape(W)[1])
+    W[mach_ind[block],point_ind[block]-first_point,panel_ind[block]] = value
+    
+    return
+
+
 def supersonic_in_plane(RAD1,RAD2,Y1,Y2,TOL,XTY,CPI):
     """  This computes the induced velocities at each control point 
     in the special case where the vortices lie in the same plane
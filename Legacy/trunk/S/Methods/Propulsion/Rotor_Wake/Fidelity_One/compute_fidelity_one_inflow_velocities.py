@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------
 from Legacy.trunk.S.Core import Data
 from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_tree_wake_induced_velocity import compute_tree_wake_induced_velocity
 
 # package imports
 import numpy as np
@@ -82,7 +83,10 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
         # Compute induced velocities at blade from the helical fixed wake
         VD.Wake_collapsed = WD
         
-        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
+        if wake.wake_settings.induced_velocity_method == 'tree':
+            V_ind   = compute_tree_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i, tolerance=wake.wake_settings.induced_velocity_tolerance)
+        else:
+            V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
         
         # velocities in vehicle frame
         u       = V_ind[:,:,0]   # velocity in vehicle x-frame
@@ -0,0 +1,264 @@
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+# compute_tree_wake_induced_velocity.py
+#
+# Created:  Oct 2026, RCAIDE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from Legacy.trunk.S.Core import Data
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import vortex
+
+# number of filaments in the leaves of the tree
+leaf_size = 32
+
+# number of filament and evaluation point pairs summed directly at once
+batch_size = 2**18
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def compute_tree_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,tolerance=0.2):
+    """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
+    on lifting surface control points with a Barnes-Hut tree code, an approximation of the direct
+    sum of compute_wake_induced_velocity.
+
+    Assumptions:
+    The filaments are sorted into a binary tree of boxes. The velocity induced by a box that is
+    seen under an angle below the tolerance, radius/distance < tolerance, is approximated by the
+    dipole expansion of its filaments about the box center, all other boxes are opened and the
+    filaments of the leaves are summed directly. The error decreases with the tolerance, a tolerance
+    of zero reproduces the direct sum.
+
+    The expansion neglects the regularization of the vortex cores, so boxes are only approximated
+    when the evaluation point is also well outside the core radius, sigma < tolerance*(distance - radius).
+
+    Source:
+    Barnes, J., Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature 324, 1986.
+
+    Inputs:
+    WD        - helical wake distribution points               [Unitless]
+    VD        - vortex distribution points on lifting surfaces [Unitless]
+    cpts      - control points in segment                      [Unitless]
+    sigma     - regularization radius                          [m]
+    tolerance - ratio of box radius to distance                [Unitless]
+
+    Outputs:
+    V_ind     - induced velocity at the control points         [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    # evaluation points
+    points = np.stack([np.ravel(VD.XC),np.ravel(VD.YC),np.ravel(VD.ZC)],axis=-1).astype(np.float64)
+
+    # the bound vortices of the lifting line of the rotor are ignored
+    lifting_line_panels       = np.zeros(np.shape(WD.reshaped_wake.XA1[0]),dtype=bool)
+    lifting_line_panels[...,0] = True
+    lifting_line_panels       = np.reshape(lifting_line_panels,(np.shape(lifting_line_panels)[0],-1))
+
+    V_ind = np.zeros((cpts,len(points),3))
+    for i in range(cpts):
+        A1    = np.stack([WD.XA1[azi_start_idx,i],WD.YA1[azi_start_idx,i],WD.ZA1[azi_start_idx,i]],axis=-1).astype(np.float64)
+        A2    = np.stack([WD.XA2[azi_start_idx,i],WD.YA2[azi_start_idx,i],WD.ZA2[azi_start_idx,i]],axis=-1).astype(np.float64)
+        B1    = np.stack([WD.XB1[azi_start_idx,i],WD.YB1[azi_start_idx,i],WD.ZB1[azi_start_idx,i]],axis=-1).astype(np.float64)
+        B2    = np.stack([WD.XB2[azi_start_idx,i],WD.YB2[azi_start_idx,i],WD.ZB2[azi_start_idx,i]],axis=-1).astype(np.float64)
+        GAMMA = WD.GAMMA[azi_start_idx,i].astype(np.float64)
+
+        # the four filaments of every wake panel: bound, right, bottom and left
+        bound = ~lifting_line_panels[i]
+        start = np.concatenate([A1[bound],B1,B2,A2])
+        end   = np.concatenate([B1[bound],B2,A2,A1])
+        gamma = np.concatenate([GAMMA[bound],GAMMA,GAMMA,GAMMA])
+
+        tree       = build_filament_tree(start,end,gamma)
+        V_ind[i]   = evaluate_filament_tree(tree,points,sigma,tolerance)
+
+    return V_ind
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def build_filament_tree(start,end,gamma):
+    """ Sorts vortex filaments into a binary tree of boxes, splitting each box at the median of the
+    filament centers along its longest side, and computes the moments of each box.
+
+    Assumptions:
+    Each filament is represented by its center and its vector times its strength
+
+    Source:
+    None
+
+    Inputs:
+    start  - start points of the filaments  [m]
+    end    - end points of the filaments    [m]
+    gamma  - strengths of the filaments     [m^2/s]
+
+    Outputs:
+    tree   - filaments sorted by box, box extents, moments and children [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    centers = 0.5*(start + end)
+
+    # split the boxes, the filaments of each box are contiguous in the order
+    order    = np.arange(len(centers))
+    first    = [0]
+    last     = [len(centers)]
+    children = [[-1,-1]]
+    pending  = [0]
+    while pending:
+        node = pending.pop()
+        i0,i1 = first[node],last[node]
+        if i1 - i0 <= leaf_size:
+            continue
+        ids   = order[i0:i1]
+        axis  = np.argmax(np.ptp(centers[ids],axis=0))
+        half  = (i1 - i0)//2
+        order[i0:i1] = ids[np.argpartition(centers[ids,axis],half)]
+        for j0,j1 in [(i0,i0+half),(i0+half,i1)]:
+            children[node][children[node].index(-1)] = len(first)
+            pending.append(len(first))
+            first.append(j0)
+            last.append(j1)
+            children.append([-1,-1])
+
+    start   = start[order]
+    end     = end[order]
+    gamma   = gamma[order]
+    centers = centers[order]
+    first   = np.array(first)
+    last    = np.array(last)
+
+    # moments of the boxes from cumulative sums over the sorted filaments
+    alpha   = gamma[:,None]*(end - start)
+    first_m = np.concatenate([np.zeros((1,3)),np.cumsum(alpha,axis=0)])
+    second  = np.concatenate([np.zeros((1,3,3)),np.cumsum(centers[:,:,None]*alpha[:,None,:],axis=0)])
+    sum_c   = np.concatenate([np.zeros((1,3)),np.cumsum(centers,axis=0)])
+    box_center = (sum_c[last] - sum_c[first])/(last - first)[:,None]
+    A       = first_m[last] - first_m[first]
+    D       = second[last] - second[first] - box_center[:,:,None]*A[:,None,:]
+
+    # radius enclosing every filament of the box
+    radius  = np.zeros(len(first))
+    for node in range(len(first)):
+        i0,i1 = first[node],last[node]
+        radius[node] = np.sqrt(np.max(np.sum(np.square(np.concatenate([start[i0:i1],end[i0:i1]]) - box_center[node]),axis=1)))
+
+    tree          = Data()
+    tree.start    = start
+    tree.end      = end
+    tree.gamma    = gamma
+    tree.first    = first
+    tree.last     = last
+    tree.children = np.array(children)
+    tree.center   = box_center
+    tree.radius   = radius
+    tree.A        = A
+    tree.D        = D
+
+    return tree
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def evaluate_filament_tree(tree,points,sigma,tolerance):
+    """ Evaluates the velocity induced by the filaments of a tree at the evaluation points,
+    traversing the tree for all evaluation points at once.
+
+    Assumptions:
+    See compute_tree_wake_induced_velocity
+
+    Source:
+    None
+
+    Inputs:
+    tree       - filament tree, see build_filament_tree  [Unitless]
+    points     - evaluation points                       [m]
+    sigma      - regularization radius                   [m]
+    tolerance  - ratio of box radius to distance         [Unitless]
+
+    Outputs:
+    V_ind      - induced velocity at the points          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    n_points = len(points)
+    V_ind    = np.zeros((n_points,3))
+
+    # pairs of evaluation points and boxes, starting from the root box
+    target   = np.arange(n_points)
+    box      = np.zeros(n_points,dtype=int)
+    near_t   = []
+    near_b   = []
+    while len(target):
+        r        = points[target] - tree.center[box]
+        distance = np.sqrt(np.sum(r*r,axis=1))
+        radius   = tree.radius[box]
+        far      = (radius < tolerance*distance) & (sigma < tolerance*(distance - radius))
+
+        # approximate the far boxes by their dipole expansion
+        if np.any(far):
+            V_far = dipole_velocity(r[far],distance[far],tree.A[box[far]],tree.D[box[far]])
+            for k in range(3):
+                V_ind[:,k] += np.bincount(target[far],weights=V_far[:,k],minlength=n_points)
+
+        # open the near boxes, the near leaves are summed directly
+        children = tree.children[box[~far]]
+        leaf     = children[:,0] < 0
+        near_t.append(target[~far][leaf])
+        near_b.append(box[~far][leaf])
+        target   = np.repeat(target[~far][~leaf],2)
+        box      = np.ravel(children[~leaf])
+
+    # direct sum over the filaments of the near leaves
+    near_t = np.concatenate(near_t)
+    near_b = np.concatenate(near_b)
+    counts = tree.last[near_b] - tree.first[near_b]
+    bounds = np.concatenate([[0],np.cumsum(counts)])
+    steps  = np.searchsorted(bounds,np.arange(0,bounds[-1],batch_size),side='right') - 1
+    steps  = np.unique(np.concatenate([steps,[len(near_t)]]))
+    for j0,j1 in zip(steps[:-1],steps[1:]):
+        t        = np.repeat(near_t[j0:j1],counts[j0:j1])
+        offsets  = np.arange(bounds[j1] - bounds[j0]) - np.repeat(bounds[j0:j1] - bounds[j0],counts[j0:j1])
+        f        = np.repeat(tree.first[near_b[j0:j1]],counts[j0:j1]) + offsets
+        start    = tree.start[f]
+        end      = tree.end[f]
+        _, V_dir = vortex(points[t,0],points[t,1],points[t,2],start[:,0],start[:,1],start[:,2],
+                          end[:,0],end[:,1],end[:,2],sigma,tree.gamma[f])
+        for k in range(3):
+            V_ind[:,k] += np.bincount(t,weights=V_dir[k],minlength=n_points)
+
+    return V_ind
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def dipole_velocity(r,distance,A,D):
+    """ Velocity induced by a box of vortex filaments from its monopole and dipole moments, the
+    Biot-Savart law expanded about the box center to first order.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    r         - evaluation points relative to the box centers    [m]
+    distance  - distance of the points from the box centers      [m]
+    A         - sum of filament strength times filament vector   [m^3/s]
+    D         - first moment of A about the box center           [m^4/s]
+
+    Outputs:
+    V         - induced velocity                                 [m/s]
+
+    Properties Used:
+    N/A
+    """
+    R3   = distance**3
+    R5   = distance**5
+    w    = np.einsum('nj,nja->na',r,D)
+    t    = np.stack([D[:,2,1] - D[:,1,2],D[:,0,2] - D[:,2,0],D[:,1,0] - D[:,0,1]],axis=-1)
+    V    = (np.cross(A,r)/R3[:,None] - t/R3[:,None] + 3*np.cross(w,r)/R5[:,None])/(4*np.pi)
+
+    return V
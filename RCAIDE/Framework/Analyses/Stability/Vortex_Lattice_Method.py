@@ -39,97 +39,10 @@ class Vortex_Lattice_Method(Stability):
         self.vehicle                                                = Data()  
         self.process                                                = Process()
         self.process.initialize                                     = Process()  
-                   
-        # correction factors           
-        settings                                                    = self.settings
-        settings.fuselage_lift_correction                           = 1.14
-        settings.trim_drag_correction_factor                        = 1.0
-        settings.wing_parasite_drag_form_factor                     = 1.1
-        settings.fuselage_parasite_drag_form_factor                 = 2.3
-        settings.maximum_lift_coefficient_factor                    = 1.0        
-        settings.lift_to_drag_adjustment                            = 0.0  
-        settings.oswald_efficiency_factor                           = None
-        settings.span_efficiency                                    = None
-        settings.viscous_lift_dependent_drag_factor                 = 0.38
-        settings.drag_coefficient_increment                         = 0.0
-        settings.spoiler_drag_increment                             = 0.0
-        settings.maximum_lift_coefficient                           = np.inf 
-        settings.use_surrogate                                      = True
-        settings.recalculate_total_wetted_area                      = False
-        settings.propeller_wake_model                               = False 
-        settings.discretize_control_surfaces                        = True
-        settings.model_fuselage                                     = False 
-        settings.trim_aircraft                                      = False 
-
-        # correction factors
-        settings.supersonic                                         = Data()
-        settings.supersonic.peak_mach_number                        = 1.04  
-        settings.supersonic.begin_drag_rise_mach_number             = 0.95
-        settings.supersonic.end_drag_rise_mach_number               = 1.2
-        settings.supersonic.transonic_drag_multiplier               = 1.25  
-        settings.supersonic.volume_wave_drag_scaling                = 3.2  
-        settings.supersonic.fuselage_parasite_drag_begin_blend_mach = 0.91
-        settings.supersonic.fuselage_parasite_drag_end_blend_mach   = 0.99    
-        settings.supersonic.cross_sectional_area_calculation_type   = 'Fixed'     
-        settings.supersonic.wave_drag_type                          = 'Raymer'    
-    
-        self.settings.number_of_spanwise_vortices                   = 15
-        self.settings.number_of_chordwise_vortices                  = 5
-        self.settings.wing_spanwise_vortices                        = None
-        self.settings.wing_chordwise_vortices                       = None
-        self.settings.fuselage_spanwise_vortices                    = None
-        self.settings.fuselage_chordwise_vortices                   = None  
-        self.settings.spanwise_cosine_spacing                       = True
-        self.settings.vortex_distribution                           = Data()  
-        self.settings.leading_edge_suction_multiplier               = 1.0  
-        self.settings.use_VORLAX_matrix_calculation                 = False
-        self.settings.floating_point_precision                      = np.float32 
-    
-        # conditions used for surrogate model training
-        self.training                                               = Data()
+
+        # settings, training conditions and surrogates shared by every VLM analysis, trained on fewer angles of attack
+        VLM_analysis_defaults(self)
         self.training.angle_of_attack                               = np.array([-5., -2. , 1E-12 , 2.0, 5.0, 8.0, 10.0 , 12., 45.]) * Units.deg 
-        self.training.Mach                                          = np.array([1E-12, 0.1  , 0.2 , 0.3,  0.5,  0.75 , 0.85 , 0.9, 1.3, 1.35 , 1.5 , 2.0, 2.25 , 2.5  , 3.0  , 3.5])               
-                      
-        self.training.subsonic                                      = None
-        self.training.supersonic                                    = None
-        self.training.transonic                                     = None
-                               
-        self.training.sideslip_angle                                = np.array([30  , 10.0 , 1E-12]) * Units.deg
-        self.training.aileron_deflection                            = np.array([30  , 10.0 , 1E-12]) * Units.deg
-        self.training.elevator_deflection                           = np.array([30  , 10.0 , 1E-12]) * Units.deg   
-        self.training.rudder_deflection                             = np.array([30  , 10.0 , 1E-12]) * Units.deg
-        self.training.flap_deflection                               = np.array([30  , 10.0 , 1E-12]) * Units.deg 
-        self.training.slat_deflection                               = np.array([30  , 10.0 , 1E-12]) * Units.deg                      
-        self.training.u                                             = np.array([0.2 , 0.1  , 1E-12])  
-        self.training.v                                             = np.array([0.2 , 0.1  , 1E-12])  
-        self.training.w                                             = np.array([0.2 , 0.1  , 1E-12])    
-        self.training.pitch_rate                                    = np.array([0.3 ,0.15  , 0.0 ])  * Units.rad / Units.sec
-        self.training.roll_rate                                     = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec
-        self.training.yaw_rate                                      = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec 
-    
-        self.reference_values                                       = Data()
-        self.reference_values.S_ref                                 = 0
-        self.reference_values.c_ref                                 = 0
-        self.reference_values.b_ref                                 = 0
-        self.reference_values.X_ref                                 = 0
-        self.reference_values.Y_ref                                 = 0
-        self.reference_values.Z_ref                                 = 0
-        
-        # control surface flags                  
-        self.aileron_flag                                           = False 
-        self.flap_flag                                              = False 
-        self.rudder_flag                                            = False 
-        self.elevator_flag                                          = False 
-        self.slat_flag                                              = False
-                         
-        # blending function                  
-        self.hsub_min                                               = 0.85
-        self.hsub_max                                               = 0.95
-        self.hsup_min                                               = 1.05
-        self.hsup_max                                               = 1.15 
-                     
-        # surrogoate models                 
-        self.surrogates                                             = Data() 
 
         # build the evaluation process
         compute                                    = Process() 
@@ -153,8 +66,6 @@ class Vortex_Lattice_Method(Stability):
         compute.drag.miscellaneous                 = Common.Drag.miscellaneous_drag 
         compute.drag.spoiler                       = Common.Drag.spoiler_drag
         compute.drag.total                         = Common.Drag.total_drag
-        compute.stability                          = Process()
-        compute.stability.dynamic_modes            = RCAIDE.Library.Methods.Stability.Common.compute_dynamic_flight_modes  
         self.process.compute                       = compute
         
     
@@ -177,11 +88,8 @@ class Vortex_Lattice_Method(Stability):
 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            train_VLM_surrogates(self)
-
-            # build surrogate
-            build_VLM_surrogates(self)  
+            # share, load or train the surrogates
+            initialize_VLM_surrogates(self)
     
         # build the evaluation process
         compute   =  self.process.compute                  
@@ -209,6 +117,6 @@ class Vortex_Lattice_Method(Stability):
         """                     
         settings = self.settings
         vehicle  = self.vehicle
-        results  = self.process.compute(state,settings,vehicle)
+        results  = self.process.compute.evaluate(state,settings,vehicle)
 
         return results
\ No newline at end of file
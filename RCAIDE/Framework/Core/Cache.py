@@ -0,0 +1,19 @@
+# RCAIDE/Core/Cache.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+from Legacy.trunk.S.Core import Data
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cache
+# ----------------------------------------------------------------------------------------------------------------------
+class Cache(Data):
+    """ A Data structure holding values that can be recomputed, e.g. the vortex distributions and influence matrices
+        of a VLM analysis. The type marks the structure as a cache, so copies sent to other processes can be left
+        empty, see evaluate_missions.
+    """
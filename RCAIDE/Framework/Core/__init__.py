@@ -12,8 +12,10 @@ from Legacy.trunk.S.Core           import Data
 from Legacy.trunk.S.Core           import DataOrdered
 from Legacy.trunk.S.Core           import Diffed_Data, diff
 from .Container                    import Container 
+from .Cache                        import Cache
 from Legacy.trunk.S.Core           import *
 from Legacy.trunk.S.Core           import Units
+from Legacy.trunk.S.Core           import hash_data, flatten_data, unflatten_data
 from .Utilities                    import interp2d
 from .Utilities                    import orientation_product
 from .Utilities                    import orientation_transpose
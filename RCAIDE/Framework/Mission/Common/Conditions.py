@@ -11,6 +11,13 @@ from RCAIDE.Framework.Core                    import Data
 
 # python imports 
 import numpy as np 
+
+dictget      = dict.get
+dictgetitem  = dict.__getitem__
+dictsetitem  = dict.__setitem__
+dictitems    = dict.items
+objgetattrib = object.__getattribute__
+_missing     = object()
 # ----------------------------------------------------------------------------------------------------------------------
 #  Conditions
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -55,12 +62,15 @@ class Conditions(Data):
         """ 
         return expanded_array(cols, 1)    
     
-    def expand_rows(self,rows: int,override=False):
+    def expand_rows(self,rows: int,override=False,lazy=False):
         """ Makes a 1-D array the right size. Often used after a mission is initialized to size out the vectors to the
             right size. Will not overwrite an array if it already exists, unless override is True.
             
             Assumptions:
-                None
+                All expanded floating point arrays of the data structure become column views of one contiguous
+                (Fortran ordered) buffer, so expanding a Results structure is a single allocation
+                With lazy set, the expanded arrays are only allocated when they are first read, the conditions that
+                hold them become Lazy_Conditions
     
             Source:
                 None
@@ -68,30 +78,184 @@ class Conditions(Data):
             Args:
                 rows (int) : number of rows
                 override (bool):   
+                lazy (bool): defer allocating the expanded arrays
     
             Returns:
                 vector (numpy.ndarray): expanded vector    
         """           
         
-        # store
-        self._size = rows
-        
         # recursively initialize condition and unknown arrays to have given row length 
-        for k,v in self.items():
-            try:
-                rank = v.ndim
-            except:
-                rank = 0 
-            if isinstance(v,Conditions):
-                v.expand_rows(rows,override=override)
-            elif isinstance(v,expanded_array):
-                self[k] = v.resize(rows) 
-            elif rank == 2: # Check if it's already expanded
-                if v.shape[0]<=1 or override:
-                    self[k] = np.resize(v,[rows,v.shape[1]])
+        fields = []
+        collect_expansions(self,rows,override,fields)
+        
+        if lazy:
+            eager = []
+            for D,k,v in fields:
+                if type(D) is Conditions or type(D) is Lazy_Conditions:
+                    D.__class__ = Lazy_Conditions
+                    dictsetitem(D,k,lazy_array(v,rows))
+                else:
+                    eager.append((D,k,v))
+            fields = eager
+        
+        # one buffer for all floating point arrays, one column block per array
+        columns = [v.shape[1] for _,_,v in fields]
+        buffer  = np.empty([rows,sum(columns)],order='F')
+        index   = 0 
+        for (D,k,v),m in zip(fields,columns):
+            view = buffer[:,index:(index+m)]
+            if v.shape[0] == 1:
+                view[:,:] = v
+            else:
+                view[:,:] = np.resize(v,[rows,m])
+            D[k]   = view
+            index += m
         
         return
               
+# ----------------------------------------------------------------------------------------------------------------------
+#  Lazy_Conditions
+# ---------------------------------------------------------------------------------------------------------------------- 
+class Lazy_Conditions(Conditions):
+    """ Conditions holding fields that are allocated on first access, see Conditions.expand_rows. Every way of
+        reading a field allocates it, attribute and key access, get, iteration, copying and pickling, so the
+        placeholders never leave the data structure. Conditions that are expanded eagerly never become
+        Lazy_Conditions and do not pay for these checks
+    """  
+    
+    def __getattribute__(self, k):
+        """ Retrieves an attribute set by a key k, allocating it if it is still a placeholder
+        
+            Assumptions:
+                None
+    
+            Source:
+                None
+        
+            Args:
+                k      (str) : key  
+    
+            Returns:
+                value  (Any) : whatever is found by k  
+        """     
+        v = dictget(self,k,_missing)
+        if v is _missing:
+            return objgetattrib(self,k)
+        if type(v) is lazy_array:
+            v = v()
+            dictsetitem(self,k,v)
+        return v
+    
+    def __getitem__(self, k):
+        """ Retrieves the value of a key k, allocating it if it is still a placeholder
+        
+            Assumptions:
+                None
+    
+            Source:
+                None
+        
+            Args:
+                k      (str) : key  
+    
+            Returns:
+                value  (Any) : value of k  
+        """     
+        v = dictgetitem(self,k)
+        if type(v) is lazy_array:
+            v = v()
+            dictsetitem(self,k,v)
+        return v
+    
+    def get(self, k, default=None):
+        """ Retrieves the value of a key k if it exists, allocating it if it is still a placeholder
+        
+            Assumptions:
+                None
+    
+            Source:
+                None
+        
+            Args:
+                k       (str) : key  
+                default (Any) : value returned if k does not exist  
+    
+            Returns:
+                value   (Any) : value of k  
+        """     
+        v = dictget(self,k,_missing)
+        if v is _missing:
+            return default
+        if type(v) is lazy_array:
+            v = v()
+            dictsetitem(self,k,v)
+        return v
+    
+    def items(self):
+        """ Returns the keys and values, allocating every placeholder. Pickling and copying go through items, so
+            they never see a placeholder either
+        
+            Assumptions:
+                None
+    
+            Source:
+                None
+        
+            Args:
+                None
+    
+            Returns:
+                items  (list) : (key, value) pairs  
+        """     
+        return [(k,self[k]) for k in dict.keys(self)]
+    
+# ----------------------------------------------------------------------------------------------------------------------
+#  collect_expansions
+# ---------------------------------------------------------------------------------------------------------------------- 
+def collect_expansions(conditions,rows,override,fields):
+    """ Sets the size of a conditions data structure and lists the arrays that need to be expanded. Arrays that are
+        not floating point or are empty are expanded in place with np.resize.
+    
+        Assumptions:
+            None
+
+        Source:
+            None
+
+        Args:
+            conditions (Conditions): data structure to expand                 [-]
+            rows       (int): number of rows                                  [-]
+            override   (bool): expand arrays that are already expanded        [-]
+            fields     (list): (data, key, array) of each array to expand     [-]
+
+        Returns:
+            None
+    """   
+    
+    # store
+    conditions._size = rows
+    
+    for k,v in dictitems(conditions):
+        try:
+            rank = v.ndim
+        except:
+            rank = 0 
+        if isinstance(v,Conditions):
+            collect_expansions(v,rows,override,fields)
+        elif isinstance(v,lazy_array):
+            if v.rows<=1 or override:
+                fields.append((conditions,k,v.value))
+        elif isinstance(v,expanded_array):
+            conditions[k] = v.resize(rows) 
+        elif rank == 2: # Check if it's already expanded
+            if v.shape[0]<=1 or override:
+                if v.dtype == np.float64 and v.size > 0:
+                    fields.append((conditions,k,v))
+                else:
+                    conditions[k] = np.resize(v,[rows,v.shape[1]])
+    
+    return
+
 class expanded_array(Data):
     """ This is an array that will expand later when the mission is initialized. It is called specifically by conditions  
     """  
@@ -201,6 +365,49 @@ class expanded_array(Data):
         
         self._array = np.resize(A,[1,1])
         
-        return self    
+        return self
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  lazy_array
+# ---------------------------------------------------------------------------------------------------------------------- 
+class lazy_array(object):
+    """ An expanded array that has not been allocated yet. It keeps the row that is repeated to fill the array, see
+        Conditions.expand_rows
+    """  
+    __slots__ = ('value','rows')
+    
+    def __init__(self, value, rows: int):
+        """ Initialization that stores the value to be expanded
         
-    
\ No newline at end of file
+            Assumptions:
+                None
+        
+            Source:
+                None
+        
+            Args:
+                value (numpy.ndarray): array before expansion          [-]
+                rows  (int): number of rows of the expanded array       [-]
+        
+            Returns:
+                None 
+        """          
+        self.value = value
+        self.rows  = rows
+        
+    def __call__(self):
+        """ Allocates the expanded array
+        
+            Assumptions:
+                None
+        
+            Source:
+                None
+        
+            Args:
+                self
+
+            Returns:
+                array (numpy.ndarray): expanded array   
+        """           
+        return np.resize(self.value,[self.rows,self.value.shape[1]])
@@ -29,12 +29,17 @@ class Numerics(Conditions):
         """           
         self.tag                              = 'numerics' 
         self.number_of_control_points         = 16
+        self.number_of_cases                  = 1
+        self.lazy_conditions                  = False
         self.discretization_method            = chebyshev_data 
         self.solver_jacobian                  = "none"
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
+        self.iterations                       = None
+        self.function_evaluations             = 0
+        self.residual_history                 = np.empty(0)
         
         self.dimensionless                    = Conditions()
         self.dimensionless.control_points     = np.empty([0,0])
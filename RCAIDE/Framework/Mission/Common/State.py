@@ -9,7 +9,7 @@
 
 # RCAIDE imports
 from RCAIDE.Framework.Core import Data
-from .Conditions           import Conditions
+from .Conditions           import Conditions, lazy_array
 from .Residuals            import Residuals
 from .Numerics             import Numerics   
 
@@ -39,7 +39,7 @@ class State(Conditions):
         self.conditions = Conditions()
         self.residuals  = Residuals()
         
-    def expand_rows(self,rows,override=False):
+    def expand_rows(self,rows,override=False,lazy=False):
         """ Makes a 1-D array the right size. Often used after a mission is initialized to size out the vectors to the
             right size. Will not overwrite an array if it already exists, unless override is True.
         
@@ -51,6 +51,8 @@ class State(Conditions):
       
             Args:
                 rows (int): number of rows
+                override (bool): expand arrays that are already expanded
+                lazy (bool): allocate the conditions on first access, see Conditions.expand_rows
 
             Returns:
                 None 
@@ -68,6 +70,8 @@ class State(Conditions):
             if k in ('initials','numerics'):
                 continue 
             # recursion
+            elif k == 'conditions' and isinstance(v,Conditions):
+                v.expand_rows(rows,override=override,lazy=lazy)
             elif isinstance(v,Conditions):
                 v.expand_rows(rows,override=override)
             # need arrays here
@@ -93,7 +97,10 @@ class Container(State):
         """ Combines the states of multiple segments
     
             Assumptions:
-                None
+                Every array is stacked in one pass over the segments, so merging is linear in the number of segments
+                Conditions that were expanded lazily and never accessed in any segment are left out, conditions that
+                were accessed in at least one segment are allocated in all segments. A single segment is merged the
+                same way
     
             Source:
                 None
@@ -107,37 +114,86 @@ class Container(State):
         
         state_out = State()
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        sub_states = list(self.segments.values())
+        if len(sub_states) == 0:
+            return state_out
+        
+        merge_lazy_conditions([sub_state.conditions for sub_state in sub_states])
+        
+        for key in ['unknowns','conditions','residuals']:
+            state_out[key] = stack_arrays([sub_state[key] for sub_state in sub_states],state_out[key].__class__)
             
         return state_out
         
 State.Container = Container 
         
 # ----------------------------------------------------------------------------------------------------------------------
-# append_array
+# stack_arrays
 # ---------------------------------------------------------------------------------------------------------------------- 
-def append_array(A,B=None):
-    """ A stacking operation used by merged to put together data structures
+def stack_arrays(data,klass):
+    """ A stacking operation used by merged to put together data structures. Each array is stacked once from the
+        arrays of all segments, rather than appending the segments one by one
 
         Assumptions:
+            The fields of the first data structure are kept, fields that are not arrays take the value of the first
+            An array field that is not an array in every data structure that has it is dropped, unless only the first
+            has it
+            Fields that are still lazy placeholders are dropped, see merge_lazy_conditions
+
+        Source:
             None
 
+        Args:
+            data  (list): data structures of each segment
+            klass (type): class of the stacked data structures
+
+        Returns:
+            result (Data): stacked data structure
+    """       
+    result = klass()
+    for k,a in dict.items(data[0]):
+        if k.startswith('_') or isinstance(a,lazy_array):
+            continue
+        values = [a] + [dict.get(D,k) for D in data[1:] if isinstance(D,Data) and k in D]
+        if isinstance(a,Data):
+            result[k] = stack_arrays([v for v in values if isinstance(v,Data)],klass)
+        elif len(values) == 1 or not isinstance(a,np.ndarray):
+            result[k] = a
+        elif all(isinstance(v,np.ndarray) for v in values):
+            result[k] = np.vstack(values)
+    return result
+
+# ----------------------------------------------------------------------------------------------------------------------
+# merge_lazy_conditions
+# ---------------------------------------------------------------------------------------------------------------------- 
+def merge_lazy_conditions(conditions):
+    """ Makes the conditions of a set of segments consistent before they are merged, conditions that are allocated in
+        one segment are allocated in all
+
+        Assumptions:
+            Conditions that were never accessed in any segment are left lazy, stack_arrays skips them
+
         Source:
             None
 
         Args:
-            A (float): np.array 
-            B (float): np.array 
+            conditions (list): Conditions of each segment
 
         Returns:
-             (float): np.array
+            None
     """       
-    if isinstance(A,np.ndarray) and isinstance(B,np.ndarray):
-        return np.vstack([A,B])
-    else:
-        return None
\ No newline at end of file
+    keys = []
+    for C in conditions:
+        for k in C.keys():
+            if k not in keys:
+                keys.append(k)
+    
+    for k in keys:
+        values = [dict.get(C,k) for C in conditions]
+        if any(isinstance(v,Conditions) for v in values):
+            merge_lazy_conditions([v for v in values if isinstance(v,Conditions)])
+        elif any(isinstance(v,lazy_array) for v in values) and not all(isinstance(v,lazy_array) for v in values if v is not None):
+            for C in conditions:
+                if k in C:
+                    C[k] = getattr(C,k)
+    return 
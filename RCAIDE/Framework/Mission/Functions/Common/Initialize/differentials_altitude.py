@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
 
 # package imports 
 import numpy as np
@@ -32,16 +34,16 @@ def differentials_altitude(segment):
     r = segment.state.conditions.frames.inertial.position_vector
     v = segment.state.conditions.frames.inertial.velocity_vector
 
-    dz = r[-1,2] - r[0,2]
+    dz = case_rows(r,-1,segment)[:,2,None] - case_rows(r,0,segment)[:,2,None]
     
     # get overall time step
-    dt = np.dot( I[-1,:] * dz , 1/v[:,2])
+    dt = case_rows(np.dot(I, dz/v[:,2,None]),-1,segment)
 
     # rescale operators
     t = t * dt
 
     # pack
-    t_initial = segment.state.conditions.frames.inertial.time[0,0]
+    t_initial = case_rows(segment.state.conditions.frames.inertial.time,0,segment)[:,0]
     segment.state.conditions.frames.inertial.time[:,0] = t_initial + t[:,0]
 
     return
\ No newline at end of file
@@ -9,6 +9,9 @@
 # RCAIDE Imports 
 from RCAIDE.Framework.Core.Arrays  import atleast_2d_col 
 
+# Package imports 
+import numpy as np
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Differentials
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -34,6 +37,13 @@ def differentials_dimensionless(segment):
     x,D,I = discretization_method(N,**numerics)
     x = atleast_2d_col(x)
     
+    # batched cases are stacked along the rows and do not interact
+    n_cases = numerics.number_of_cases
+    if n_cases > 1:
+        x = np.tile(x,(n_cases,1))
+        D = np.kron(np.eye(n_cases),D)
+        I = np.kron(np.eye(n_cases),I)
+    
     # pack
     numerics.dimensionless.control_points = x
     numerics.dimensionless.differentiate  = D
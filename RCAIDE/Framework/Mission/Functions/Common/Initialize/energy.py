@@ -6,9 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
-
 # RCAIDE imports 
 import RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  energy
@@ -42,14 +42,14 @@ def energy(segment):
                         else:                   
                             battery_conditions.battery_discharge_flag           = True             
                         battery_conditions.pack.maximum_initial_energy          = battery_initials.pack.maximum_initial_energy 
-                        battery_conditions.pack.energy[:,0]                     = battery_initials.pack.energy[-1,0]
-                        battery_conditions.pack.temperature[:,0]                = battery_initials.pack.temperature[-1,0]
-                        battery_conditions.cell.temperature[:,0]                = battery_initials.cell.temperature[-1,0]
+                        battery_conditions.pack.energy[:,0]                     = case_rows(battery_initials.pack.energy,-1,segment)[:,0]
+                        battery_conditions.pack.temperature[:,0]                = case_rows(battery_initials.pack.temperature,-1,segment)[:,0]
+                        battery_conditions.cell.temperature[:,0]                = case_rows(battery_initials.cell.temperature,-1,segment)[:,0]
                         battery_conditions.cell.cycle_in_day                    = battery_initials.cell.cycle_in_day      
-                        battery_conditions.cell.charge_throughput[:,0]          = battery_initials.cell.charge_throughput[-1,0]
+                        battery_conditions.cell.charge_throughput[:,0]          = case_rows(battery_initials.cell.charge_throughput,-1,segment)[:,0]
                         battery_conditions.cell.resistance_growth_factor        = battery_initials.cell.resistance_growth_factor 
                         battery_conditions.cell.capacity_fade_factor            = battery_initials.cell.capacity_fade_factor 
-                        battery_conditions.cell.state_of_charge[:,0]            = battery_initials.cell.state_of_charge[-1,0]
+                        battery_conditions.cell.state_of_charge[:,0]            = case_rows(battery_initials.cell.state_of_charge,-1,segment)[:,0]
     
                     if 'battery_cell_temperature' in segment:       
                         battery_conditions.pack.temperature[:,0]       = segment.battery_cell_temperature 
@@ -61,7 +61,7 @@ def energy(segment):
                     fuel_tank_conditions   = conditions[fuel_line.tag][fuel_tank.tag] 
                     if segment.state.initials:  
                         fuel_tank_initials = segment.state.initials.conditions.energy[fuel_line.tag][fuel_tank.tag] 
-                        fuel_tank_conditions.mass[:,0]   = fuel_tank_initials.mass[-1,0]
+                        fuel_tank_conditions.mass[:,0]   = case_rows(fuel_tank_initials.mass,-1,segment)[:,0]
                     else: 
                         fuel_tank_conditions.mass[:,0]   = segment.analyses.energy.vehicle.networks[network.tag].fuel_lines[fuel_line.tag].fuel_tanks[fuel_tank.tag].fuel.mass_properties.mass    
                     
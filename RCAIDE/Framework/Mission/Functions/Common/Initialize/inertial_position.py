@@ -3,6 +3,12 @@
 # 
 # Created: Jul 2024, RCAIDE Team
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Inertial Position
 # ----------------------------------------------------------------------------------------------------------------------
@@ -19,19 +25,19 @@ def inertial_position(segment):
             None 
     """      
     if segment.state.initials:
-        r_initial = segment.state.initials.conditions.frames.inertial.position_vector
+        r_initial = case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)
         r_current = segment.state.conditions.frames.inertial.position_vector
-        R_initial = segment.state.initials.conditions.frames.inertial.aircraft_range
+        R_initial = case_rows(segment.state.initials.conditions.frames.inertial.aircraft_range,-1,segment)
         R_current = segment.state.conditions.frames.inertial.aircraft_range
         
         if 'altitude' in segment.keys() and segment.altitude is not None:
-            r_initial[-1,None,-1] = -segment.altitude
+            r_initial[:,-1] = -segment.altitude
         elif 'altitude_start' in segment.keys() and segment.altitude_start is not None:
-            r_initial[-1,None,-1] = -segment.altitude_start
+            r_initial[:,-1] = -segment.altitude_start
         else:
             assert('Altitude not set')
             
-        segment.state.conditions.frames.inertial.position_vector[:,:] = r_current + (r_initial[-1,None,:] - r_current[0,None,:])
-        segment.state.conditions.frames.inertial.aircraft_range[:,:]  = R_current + (R_initial[-1,None,:] - R_current[0,None,:])
+        segment.state.conditions.frames.inertial.position_vector[:,:] = r_current + (r_initial - case_rows(r_current,0,segment))
+        segment.state.conditions.frames.inertial.aircraft_range[:,:]  = R_current + (R_initial - case_rows(R_current,0,segment))
         
     return 
\ No newline at end of file
@@ -3,6 +3,12 @@
 # 
 # Created: Jul 2024, RCAIDE Team
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Planet Position
 # ----------------------------------------------------------------------------------------------------------------------
@@ -20,8 +26,8 @@ def planet_position(segment):
     """        
     
     if segment.state.initials:
-        longitude_initial = segment.state.initials.conditions.frames.planet.longitude[-1,0]
-        latitude_initial  = segment.state.initials.conditions.frames.planet.latitude[-1,0] 
+        longitude_initial = case_rows(segment.state.initials.conditions.frames.planet.longitude,-1,segment)[:,0]
+        latitude_initial  = case_rows(segment.state.initials.conditions.frames.planet.latitude,-1,segment)[:,0]
     elif 'latitude' in segment:
         longitude_initial = segment.longitude
         latitude_initial  = segment.latitude      
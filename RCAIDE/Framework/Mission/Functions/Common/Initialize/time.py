@@ -3,6 +3,12 @@
 # 
 # Created: Jun 2024, RCAIDE Team
  
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Time
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -22,7 +28,7 @@ def time(segment):
     if segment.state.initials:
         t_initial = segment.state.initials.conditions.frames.inertial.time
         t_current = segment.state.conditions.frames.inertial.time 
-        segment.state.conditions.frames.inertial.time[:,:] = t_current + (t_initial[-1,0] - t_current[0,0])
+        segment.state.conditions.frames.inertial.time[:,:] = t_current + (case_rows(t_initial,-1,segment) - case_rows(t_current,0,segment))
         
     else:
         t_initial = segment.state.conditions.frames.inertial.time[0,0]
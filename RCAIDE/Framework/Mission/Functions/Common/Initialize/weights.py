@@ -4,6 +4,12 @@
 # Created: Jun 2024, RCAIDE Team
  
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Weights
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -12,6 +18,7 @@ def weights(segment):
     
         Assumptions:   
             Uses max takeoff weight if no weight analysis is performed 
+            Batched segments accept one takeoff weight per case 
             
         Args: 
             segment  : flight segment        [-] 
@@ -21,15 +28,15 @@ def weights(segment):
     """      
  
     if segment.state.initials:
-        m_initial = segment.state.initials.conditions.weights.total_mass[-1,0] 
+        m_initial = case_rows(segment.state.initials.conditions.weights.total_mass,-1,segment)
     else: 
         if segment.analyses.weights != None: 
-            m_initial = segment.analyses.weights.vehicle.mass_properties.takeoff
+            m_initial = expand_cases(segment.analyses.weights.vehicle.mass_properties.takeoff,segment)
         else: 
-            m_initial = segment.analyses.energy.vehicle.networks[list(segment.analyses.energy.vehicle.networks.keys())[0]].mass_properties.mass
+            m_initial = expand_cases(segment.analyses.energy.vehicle.networks[list(segment.analyses.energy.vehicle.networks.keys())[0]].mass_properties.mass,segment)
 
     m_current = segment.state.conditions.weights.total_mass
     
-    segment.state.conditions.weights.total_mass[:,:] = m_current + (m_initial - m_current[0,0])
+    segment.state.conditions.weights.total_mass[:,:] = m_current + (m_initial - case_rows(m_current,0,segment))
         
     return 
\ No newline at end of file
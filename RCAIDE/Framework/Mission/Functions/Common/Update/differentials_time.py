@@ -3,6 +3,12 @@
 # 
 # Created: Jul 2024, RCAIDE Team
  
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Update Differentials Time
 # ----------------------------------------------------------------------------------------------------------------------
@@ -31,7 +37,7 @@ def differentials_time(segment):
     
     # rescale time
     time = segment.state.conditions.frames.inertial.time
-    T    = time[-1] - time[0]
+    T    = case_rows(time,-1,segment) - case_rows(time,0,segment)
     t    = x * T
     
     # rescale operators
@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
 
 # Package imports 
 import numpy as np
@@ -32,9 +34,9 @@ def inertial_horizontal_position(segment):
 
     conditions = segment.state.conditions
     psi        = segment.true_course       # sign convetion is clockwise positive
-    cpts       = int(segment.state.numerics.number_of_control_points)
-    x0         = conditions.frames.inertial.position_vector[0,None,0:1+1]
-    R0         = conditions.frames.inertial.aircraft_range[0,None,0:1+1]
+    cpts       = int(segment.state.numerics.number_of_control_points*segment.state.numerics.number_of_cases)
+    x0         = case_rows(conditions.frames.inertial.position_vector,0,segment)[:,0:1+1]
+    R0         = case_rows(conditions.frames.inertial.aircraft_range,0,segment)[:,0:1+1]
     vx         = conditions.frames.inertial.velocity_vector[:,0:1+1]
     I          = segment.state.numerics.time.integrate  
     trajectory = np.repeat( np.atleast_2d(np.array([np.cos(psi),np.sin(psi)])),cpts , axis = 0) 
@@ -45,6 +47,6 @@ def inertial_horizontal_position(segment):
     
     # pack
     conditions.frames.inertial.position_vector[:,0:1+1] = x0 + x[:,:]*trajectory
-    conditions.frames.inertial.aircraft_range[:,0]      = R0 + x[:,0]  
+    conditions.frames.inertial.aircraft_range[:,0]      = R0[:,0] + x[:,0]  
     
     return
\ No newline at end of file
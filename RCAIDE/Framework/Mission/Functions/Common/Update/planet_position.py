@@ -6,9 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
-
 # RCAIDE imports 
 from RCAIDE.Framework.Core  import Units 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
 
 # package imports 
 import numpy as np
@@ -65,8 +65,8 @@ def planet_position(segment):
     phi       = np.array([[np.cos(psi),-np.sin(psi),0],[np.sin(psi),np.cos(psi),0],[0,0,1]])
 
     # Pack 
-    lat                                           = conditions.frames.planet.latitude[0,0]
-    lon                                           = conditions.frames.planet.longitude[0,0]
+    lat                                           = case_rows(conditions.frames.planet.latitude,0,segment)
+    lon                                           = case_rows(conditions.frames.planet.longitude,0,segment)
     conditions.frames.planet.latitude             = lat + lamda
     conditions.frames.planet.longitude            = lon + mu 
     conditions.frames.planet.true_course          = np.tile(phi[None,:,:],(len(V),1,1))    
@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  Imports
 # ---------------------------------------------------------------------------------------------------------------------- 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -33,7 +35,7 @@ def weights(segment):
     # unpack
     conditions   = segment.state.conditions
     I            = segment.state.numerics.time.integrate  
-    m0           = conditions.weights.total_mass[0,0]
+    m0           = case_rows(conditions.weights.total_mass,0,segment)
     mdot_fuel    = conditions.weights.vehicle_mass_rate
     g            = conditions.freestream.gravity   
     
@@ -43,7 +45,7 @@ def weights(segment):
             for fuel_line in network.fuel_lines:  
                 fuel_line_results   = conditions.energy[fuel_line.tag] 
                 for fuel_tank in fuel_line.fuel_tanks: 
-                    fuel_line_results[fuel_tank.tag].mass[:,0]  =  fuel_line_results[fuel_tank.tag].mass[0,0]  + np.dot(I, -fuel_line_results[fuel_tank.tag].mass_flow_rate[:,0])   
+                    fuel_line_results[fuel_tank.tag].mass[:,0]  =  case_rows(fuel_line_results[fuel_tank.tag].mass,0,segment)[:,0]  + np.dot(I, -fuel_line_results[fuel_tank.tag].mass_flow_rate[:,0])   
             
     # calculate
     m = m0 + np.dot(I, -mdot_fuel )
@@ -14,4 +14,5 @@ from .   import Unpack_Unknowns
 from .   import Update
 
 from .compute_point_to_point_geospatial_data import compute_point_to_point_geospatial_data
+from .batch_cases                            import extract_case, case_rows, expand_cases, require_single_case
  
\ No newline at end of file
@@ -0,0 +1,139 @@
+# RCAIDE/Framework/Mission/Functions/Common/batch_cases.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Mission.Common import Conditions
+
+# Package imports
+from copy import deepcopy
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# extract_case
+# ----------------------------------------------------------------------------------------------------------------------
+def extract_case(segment, index):
+    """Extracts the conditions of one case of a batched segment. A segment with state.numerics.number_of_cases
+    greater than one solves all cases at once, stacked case by case along the rows of every array, i.e. case k
+    occupies rows k*N to (k+1)*N where N is the number of control points.
+
+    Assumptions:
+        Arrays with a number of rows other than the number of cases times the number of control points are shared
+        by all cases and copied as is
+
+    Source:
+        None
+
+    Args:
+        segment (Data): converged batched flight segment                                       [-]
+        index   (int): case to extract                                                         [-]
+
+    Returns:
+        case    (Conditions): conditions of the case, sized by the number of control points    [-]
+    """
+
+    numerics = segment.state.numerics
+    n_cases  = numerics.number_of_cases
+    n_points = numerics.number_of_control_points
+    if not -n_cases <= index < n_cases:
+        raise IndexError('case ' + str(index) + ' out of range for ' + str(n_cases) + ' cases')
+    rows     = slice((index % n_cases)*n_points,(index % n_cases + 1)*n_points)
+
+    def do_extract(A):
+        B = A.__class__()
+        for k,v in A.items():
+            if isinstance(v,Conditions):
+                B[k] = do_extract(v)
+            elif isinstance(v,np.ndarray) and v.ndim > 0 and v.shape[0] == n_cases*n_points:
+                B[k] = np.copy(v[rows])
+            else:
+                B[k] = deepcopy(v)
+        return B
+
+    return do_extract(segment.state.conditions)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def case_rows(array, index, segment):
+    """Picks one row of every case of an array, e.g. the first (0) or the last (-1) control point, and repeats it
+    over the control points of the segment. With a single case this is array[index,None], so expressions such as
+    r_current + (r_initial[-1,None,:] - r_current[0,None,:]) hold for any number of cases.
+
+    Assumptions:
+        The array is stacked case by case along its rows, it may come from another segment (e.g. the initials)
+        with a different number of control points
+
+    Source:
+        None
+
+    Args:
+        array   (numpy.ndarray): stacked array                                                 [-]
+        index   (int): row within each case                                                    [-]
+        segment (Data): flight segment the result is sized for                                 [-]
+
+    Returns:
+        rows    (numpy.ndarray): selected rows, one per control point of the segment           [-]
+    """
+    numerics = segment.state.numerics
+    n_cases  = numerics.number_of_cases
+    if n_cases == 1:
+        return array[index,None]
+    if len(array) % n_cases:
+        raise ValueError(str(len(array)) + ' rows can not be split into ' + str(n_cases) + ' cases')
+    cases = np.reshape(array,(n_cases,-1) + np.shape(array)[1:])
+    return np.repeat(cases[:,index],numerics.number_of_control_points,axis=0)
+
+def expand_cases(values, segment):
+    """Spreads per case inputs (e.g. one takeoff mass per case) over the control points of a batched segment. A
+    single value is shared by all cases.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        values  (float or array_like): one value, or one value per case                        [-]
+        segment (Data): flight segment                                                         [-]
+
+    Returns:
+        column  (numpy.ndarray): values as a column, (1,1) or one row per control point        [-]
+    """
+    numerics = segment.state.numerics
+    values   = np.reshape(np.asarray(values,dtype=float),(-1,1))
+    if len(values) == 1:
+        return values
+    elif len(values) != numerics.number_of_cases:
+        raise ValueError(str(len(values)) + ' values given for ' + str(numerics.number_of_cases) + ' cases')
+    return np.repeat(values,numerics.number_of_control_points,axis=0)
+
+def require_single_case(segment):
+    """Stops segments whose functions are only written for a single case from being batched. These read the first
+    or the last control point of the whole segment, or solve for values shared by the whole segment, which mixes the
+    cases when several are stacked along the rows.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        segment (Data): flight segment                                                         [-]
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: the segment has more than one case
+    """
+    n_cases = segment.state.numerics.number_of_cases
+    if n_cases != 1:
+        raise ValueError(segment.__class__.__name__ + ' segments solve a single case, ' + str(n_cases) + ' cases given')
+    return
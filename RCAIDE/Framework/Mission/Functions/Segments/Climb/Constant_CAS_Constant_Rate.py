@@ -9,6 +9,7 @@
 # RCAIDE 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
 from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -43,10 +44,10 @@ def initialize_conditions(segment):
     """         
     
     # unpack
-    climb_rate = segment.climb_rate
+    climb_rate = expand_cases(segment.climb_rate,segment)
     CAS        = segment.calibrated_air_speed   
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end
+    altf       = expand_cases(segment.altitude_end,segment)
     beta       = segment.sideslip_angle
     t_nondim   = segment.state.numerics.dimensionless.control_points
     conditions = segment.state.conditions  
@@ -54,19 +55,22 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0 
 
     if CAS is None:
         if not segment.state.initials: raise AttributeError('initial equivalent airspeed not set')
-        v_mag =  np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])    
+        v_mag =  np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]    
     else:  
         # determine airspeed from calibrated airspeed
         atmosphere(segment) # get density for airspeed
-        density   = conditions.freestream.density[:,0]  
-        pressure  = conditions.freestream.pressure[:,0]
+        density   = conditions.freestream.density  
+        pressure  = conditions.freestream.pressure
+        CAS       = expand_cases(CAS,segment)
         
         # compute sea level properties 
         MSL_data  = segment.analyses.atmosphere.compute_values(0.0,0.0) 
@@ -85,9 +89,9 @@ def initialize_conditions(segment):
     v_y   = np.sin(beta)*v_xy 
     
     # pack conditions    
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0]  
     conditions.freestream.altitude[:,0]             = alt[:,0]  
     
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -44,32 +45,32 @@ def initialize_conditions_unpack_unknowns(segment):
     """           
     
     # unpack
-    climb_angle = segment.climb_angle
+    climb_angle = expand_cases(segment.climb_angle,segment)
     q           = segment.dynamic_pressure
     alt0        = segment.altitude_start  
     conditions  = segment.state.conditions
     beta        = segment.sideslip_angle
-    rho         = conditions.freestream.density[:,0]  
+    rho         = conditions.freestream.density  
     
     # unpack unknowns  
     alts     = conditions.frames.inertial.position_vector[:,2]
 
     # Update freestream to get density
     atmosphere(segment)
-    rho = conditions.freestream.density[:,0]   
+    rho = conditions.freestream.density   
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2] 
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
 
     # check for initial velocity
     if q is None: 
         if not segment.state.initials: raise AttributeError('dynamic pressure not set')
-        v_mag = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])
+        v_mag = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
     else:  
         # process velocity vector
-        v_mag = np.sqrt(2*q/rho)
+        v_mag = np.sqrt(2*expand_cases(q,segment)/rho)
         
     v_x   = np.cos(beta)*v_mag * np.cos(climb_angle)
     v_y   = np.sin(beta)*v_mag * np.cos(climb_angle)
@@ -77,9 +78,9 @@ def initialize_conditions_unpack_unknowns(segment):
     
     # pack conditions    
     conditions.freestream.altitude[:,0]             =  -alts      
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z   
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]   
     
 def residual_altitude(segment):
     """Computes the altitude residual
@@ -105,7 +106,7 @@ def residual_altitude(segment):
     # Unpack results 
     alt_in  = segment.state.unknowns.altitude[:,0]
     alt_out = segment.state.conditions.freestream.altitude[:,0]  
-    segment.state.residuals.altitude[:,0] = (alt_in - alt_out)/alt_out[-1]
+    segment.state.residuals.altitude[:,0] = (alt_in - alt_out)/case_rows(alt_out,-1,segment)
 
     return
 
@@ -142,18 +143,20 @@ def update_differentials(segment):
     I          = numerics.dimensionless.integrate  
     v          = segment.state.conditions.frames.inertial.velocity_vector
     alt0       = segment.altitude_start
-    altf       = segment.altitude_end    
+    altf       = expand_cases(segment.altitude_end,segment)    
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
         
     dz = altf - alt0
     vz = -v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = (dz/np.dot(I,vz))[-1]
+    dt = case_rows(dz/np.dot(I,vz),-1,segment)
 
     # rescale operators
     x = x * dt
@@ -164,11 +167,11 @@ def update_differentials(segment):
     alt = np.dot(I,vz) + alt0
     
     # pack
-    t_initial                                       = segment.state.conditions.frames.inertial.time[0,0]
+    t_initial                                       = case_rows(segment.state.conditions.frames.inertial.time,0,segment)[:,0]
     numerics.time.control_points                    = x
     numerics.time.differentiate                     = D
     numerics.time.integrate                         = I
-    conditions.frames.inertial.time[1:,0]           = t_initial + x[1:,0]
+    conditions.frames.inertial.time[:,0]            = t_initial + x[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0]  
     conditions.freestream.altitude[:,0]             =  alt[:,0]  
 
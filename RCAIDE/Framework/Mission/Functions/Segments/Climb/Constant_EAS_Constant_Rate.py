@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -41,18 +42,20 @@ def initialize_conditions(segment):
     """         
     
     # unpack
-    climb_rate = segment.climb_rate
+    climb_rate = expand_cases(segment.climb_rate,segment)
     eas        = segment.equivalent_air_speed    
     beta       = segment.sideslip_angle
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end
+    altf       = expand_cases(segment.altitude_end,segment)
     t_nondim   = segment.state.numerics.dimensionless.control_points
     conditions = segment.state.conditions  
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -60,13 +63,13 @@ def initialize_conditions(segment):
     # check for initial velocity vector
     if eas is None:
         if not segment.state.initials: raise AttributeError('initial equivalent airspeed not set')
-        air_speed  = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])  
+        air_speed  = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]  
     else: 
         # determine airspeed from equivalent airspeed
         atmosphere(segment) # get density for airspeed
-        density   = conditions.freestream.density[:,0]   
+        density   = conditions.freestream.density   
         MSL_data  = segment.analyses.atmosphere.compute_values(0.0,0.0)
-        air_speed = eas/np.sqrt(density/MSL_data.density[0])    
+        air_speed = expand_cases(eas,segment)/np.sqrt(density/MSL_data.density[0])    
     
     # process velocity vector
     v_mag  = air_speed
@@ -77,7 +80,7 @@ def initialize_conditions(segment):
     
     # pack conditions    
     conditions.freestream.altitude[:,0]             =  alt[:,0]  
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
\ No newline at end of file
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # import RCAIDE 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # package imports 
 import numpy as np
@@ -39,8 +40,9 @@ def initialize_conditions(segment):
 
 
     """       
+    
     # unpack User Inputs
-    climb_angle = segment.climb_angle
+    climb_angle = expand_cases(segment.climb_angle,segment)
     mach_number = segment.mach_number
     alt0        = segment.altitude_start 
     beta        = segment.sideslip_angle 
@@ -49,19 +51,19 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2] 
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
 
     # check for initial velocity
     if mach_number is None: 
         if not segment.state.initials: raise AttributeError('mach not set')
-        v_mag  = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])*segment.state.ones_row(1)   
+        v_mag  = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]*segment.state.ones_row(1)   
     else: 
         # Update freestream to get speed of sound
         atmosphere(segment)
         a = conditions.freestream.speed_of_sound    
         
         # process velocity vector
-        v_mag = mach_number * a
+        v_mag = expand_cases(mach_number,segment) * a
     v_xy  = v_mag * np.cos(climb_angle)
     v_z   = -v_mag * np.sin(climb_angle)
     v_x   = np.cos(beta)*v_xy
@@ -81,7 +83,7 @@ def altitude_residual(segment):
     # Unpack results   
     alt_in  = segment.state.unknowns.altitude[:,0] 
     alt_out = segment.state.conditions.freestream.altitude[:,0]     
-    segment.state.residuals.altitude[:,0] = (alt_in - alt_out)/alt_out[-1]
+    segment.state.residuals.altitude[:,0] = (alt_in - alt_out)/case_rows(alt_out,-1,segment)
 
     return    
 
@@ -118,18 +120,20 @@ def update_differentials(segment):
     r          = segment.state.conditions.frames.inertial.position_vector
     v          = segment.state.conditions.frames.inertial.velocity_vector
     alt0       = segment.altitude_start
-    altf       = segment.altitude_end    
+    altf       = expand_cases(segment.altitude_end,segment)    
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
         
     dz = altf - alt0
     vz = -v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = (dz/np.dot(I,vz))[-1]
+    dt = case_rows(dz/np.dot(I,vz),-1,segment)
 
     # rescale operators
     x = x * dt
@@ -140,11 +144,11 @@ def update_differentials(segment):
     alt = np.dot(I,vz) + alt0
     
     # pack
-    t_initial                                       = segment.state.conditions.frames.inertial.time[0,0]
+    t_initial                                       = case_rows(segment.state.conditions.frames.inertial.time,0,segment)[:,0]
     numerics.time.control_points                    = x
     numerics.time.differentiate                     = D
     numerics.time.integrate                         = I
-    conditions.frames.inertial.time[1:,0]           = t_initial + x[1:,0]
+    conditions.frames.inertial.time[:,0]            = t_initial + x[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0]  
     conditions.freestream.altitude[:,0]             =  alt[:,0]  
 
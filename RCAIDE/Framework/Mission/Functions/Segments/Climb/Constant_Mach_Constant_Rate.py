@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -41,10 +42,10 @@ def initialize_conditions(segment):
     """     
     
     # unpack 
-    climb_rate  = segment.climb_rate
+    climb_rate  = expand_cases(segment.climb_rate,segment)
     mach_number = segment.mach_number
     alt0        = segment.altitude_start 
-    altf        = segment.altitude_end
+    altf        = expand_cases(segment.altitude_end,segment)
     beta        = segment.sideslip_angle
     t_nondim    = segment.state.numerics.dimensionless.control_points
     conditions  = segment.state.conditions  
@@ -52,7 +53,9 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -64,10 +67,10 @@ def initialize_conditions(segment):
     # check for initial velocity
     if mach_number is None: 
         if not segment.state.initials: raise AttributeError('mach not set')
-        v_mag = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])   
+        v_mag = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]   
     else: 
         # process velocity vector
-        v_mag = mach_number * a
+        v_mag = expand_cases(mach_number,segment) * a
     v_z   = -climb_rate 
     v_xy  = np.sqrt( v_mag**2 - v_z**2 )
     v_x   = np.cos(beta)*v_xy
@@ -77,6 +80,6 @@ def initialize_conditions(segment):
     conditions.freestream.altitude[:,0]             =  alt[:,0]
     conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
     conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     conditions.freestream.altitude[:,0]             =  alt[:,0] 
\ No newline at end of file
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -42,8 +43,8 @@ def initialize_conditions(segment):
     
     # unpack
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end
-    xf         = segment.distance
+    altf       = expand_cases(segment.altitude_end,segment)
+    xf         = expand_cases(segment.distance,segment)
     mach       = segment.mach_number
     beta       = segment.sideslip_angle
     conditions = segment.state.conditions  
@@ -52,7 +53,9 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
         
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0      
@@ -60,12 +63,12 @@ def initialize_conditions(segment):
     # check for initial velocity
     if mach is None: 
         if not segment.state.initials: raise AttributeError('mach not set')
-        air_speed = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])   
+        air_speed = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]   
     else: 
         # Update freestream to get speed of sound
         atmosphere(segment)
         a          = conditions.freestream.speed_of_sound    
-        air_speed    = mach * a   
+        air_speed    = expand_cases(mach,segment) * a   
         
     climb_angle  = np.arctan((altf-alt0)/xf)
     v_x          = np.cos(beta)*np.cos(climb_angle)*air_speed
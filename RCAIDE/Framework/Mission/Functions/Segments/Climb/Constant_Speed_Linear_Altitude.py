@@ -7,6 +7,9 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
 # Package imports  
 import numpy as np
  
@@ -39,8 +42,8 @@ def initialize_conditions(segment):
     
     # unpack
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end
-    xf         = segment.distance
+    altf       = expand_cases(segment.altitude_end,segment)
+    xf         = expand_cases(segment.distance,segment)
     air_speed  = segment.air_speed    
     beta       = segment.sideslip_angle    
     conditions = segment.state.conditions 
@@ -48,12 +51,16 @@ def initialize_conditions(segment):
     # check for initial velocity
     if air_speed is None: 
         if not segment.state.initials: raise AttributeError('airspeed not set')
-        air_speed = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])
+        air_speed = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
+    else:
+        air_speed = expand_cases(air_speed,segment)
         
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
      
     climb_angle  = np.arctan((altf-alt0)/xf)
     v_x          = np.cos(beta)*np.cos(climb_angle)*air_speed
@@ -67,6 +74,6 @@ def initialize_conditions(segment):
     # pack
     conditions.freestream.altitude[:,0]             = alt[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0]  
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = -v_z  
\ No newline at end of file
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = -v_z[:,0]  
\ No newline at end of file
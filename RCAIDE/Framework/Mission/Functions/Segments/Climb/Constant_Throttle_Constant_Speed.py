@@ -7,6 +7,9 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
 # Package imports  
 import numpy as np
  
@@ -64,17 +67,17 @@ def initialize_conditions(segment):
     """         
     
     # unpack 
-    air_speed  = segment.air_speed   
+    air_speed  = expand_cases(segment.air_speed,segment)   
     alt0       = segment.altitude_start 
     conditions = segment.state.conditions  
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
 
     # pack conditions   
-    conditions.frames.inertial.velocity_vector[:,0] = air_speed # start up value
+    conditions.frames.inertial.velocity_vector[:,0] = air_speed[:,0] # start up value
 
 def update_differentials_altitude(segment):
     """On each iteration creates the differentials and integration funcitons from knowns about the problem. Sets the time at each point. Must return in dimensional time, with t[0] = 0
@@ -105,19 +108,21 @@ def update_differentials_altitude(segment):
     
     # Unpack segment initials
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end    
+    altf       = expand_cases(segment.altitude_end,segment)    
     conditions = segment.state.conditions  
     v          = segment.state.conditions.frames.inertial.velocity_vector
     
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]    
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
     
     # get overall time step
     vz = -v[:,2,None] # Inertial velocity is z down
     dz = altf- alt0    
-    dt = dz / np.dot(I[-1,:],vz)[-1] # maintain column array
+    dt = dz / case_rows(np.dot(I,vz),-1,segment) # maintain column array
     
     # Integrate vz to get altitudes
     alt = alt0 + np.dot(I*dt,vz)
@@ -126,7 +131,7 @@ def update_differentials_altitude(segment):
     t = t * dt
 
     # pack 
-    segment.state.conditions.frames.inertial.time[:,0] = segment.state.conditions.frames.inertial.time[0,0] + t[:,0]
+    segment.state.conditions.frames.inertial.time[:,0] = case_rows(segment.state.conditions.frames.inertial.time,0,segment)[:,0] + t[:,0]
     conditions.frames.inertial.position_vector[:,2]    = -alt[:,0] 
     conditions.freestream.altitude[:,0]                =  alt[:,0]     
 
@@ -140,7 +145,7 @@ def update_velocity_vector_from_wind_angle(segment):
     
     # unpack
     conditions = segment.state.conditions 
-    v_mag      = segment.air_speed 
+    v_mag      = expand_cases(segment.air_speed,segment) 
     beta       = segment.sideslip_angle
     alpha      = segment.state.unknowns.wind_angle[:,0][:,None]
     theta      = segment.state.unknowns.body_angle[:,0][:,None]
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # Package imports  
 import numpy as np
@@ -42,11 +43,11 @@ def initialize_conditions(segment):
     """          
     
     # unpack
-    climb_rate = segment.climb_rate
+    climb_rate = expand_cases(segment.climb_rate,segment)
     M0         = segment.mach_number_start
-    Mf         = segment.mach_number_end
+    Mf         = expand_cases(segment.mach_number_end,segment)
     alt0       = segment.altitude_start 
-    altf       = segment.altitude_end 
+    altf       = expand_cases(segment.altitude_end,segment) 
     beta       = segment.sideslip_angle
     t_nondim   = segment.state.numerics.dimensionless.control_points
     conditions = segment.state.conditions
@@ -54,7 +55,9 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0 
@@ -66,7 +69,9 @@ def initialize_conditions(segment):
     # check for initial velocity
     if M0 is None: 
         if not segment.state.initials: raise AttributeError('airspeed not set')
-        M0 = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])/ a
+        M0 = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]/ a
+    else:
+        M0 = expand_cases(M0,segment)
          
     # process velocity vector
     mach_number = (Mf-M0)*t_nondim + M0
@@ -79,6 +84,6 @@ def initialize_conditions(segment):
     # pack conditions     
     conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
     conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     conditions.freestream.altitude[:,0]             =  alt[:,0]     
\ No newline at end of file
@@ -6,6 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
 # Package imports 
 import numpy as np
  
@@ -40,23 +43,27 @@ def initialize_conditions(segment):
     # unpack
     alt        = segment.altitude 
     v0         = segment.air_speed_start
-    vf         = segment.air_speed_end
-    ax         = segment.acceleration    
+    vf         = expand_cases(segment.air_speed_end,segment)
+    ax         = expand_cases(segment.acceleration,segment)    
     beta       = segment.sideslip_angle
     conditions = segment.state.conditions 
     
     # check for initial altitude
     if alt is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt = expand_cases(alt,segment)
     
     # check for initial velocity
     if v0 is None: 
         if not segment.state.initials: raise AttributeError('airspeed not set')
-        v0 = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])
+        v0 = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
+    else:
+        v0 = expand_cases(v0,segment)
         
     # dimensionalize time
-    t_initial = conditions.frames.inertial.time[0,0]
+    t_initial = case_rows(conditions.frames.inertial.time,0,segment)
     t_final   = (vf-v0)/ax + t_initial
     t_nondim  = segment.state.numerics.dimensionless.control_points
     time      = t_nondim * (t_final-t_initial) + t_initial 
@@ -65,8 +72,8 @@ def initialize_conditions(segment):
     v_y       = np.sin(beta)*v_mag
     
     # pack
-    segment.state.conditions.freestream.altitude[:,0]             = alt
-    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt 
+    segment.state.conditions.freestream.altitude[:,0]             = alt[:,0]
+    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     segment.state.conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
     segment.state.conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
     segment.state.conditions.frames.inertial.time[:,0]            = time[:,0] 
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases    import case_rows, expand_cases
 
 # Package imports 
 import numpy as np
@@ -40,30 +41,32 @@ def initialize_conditions(segment):
     
     # unpack
     alt        = segment.altitude
-    xf         = segment.distance
+    xf         = expand_cases(segment.distance,segment)
     q          = segment.dynamic_pressure
     beta       = segment.sideslip_angle
     conditions = segment.state.conditions   
     
     # Update freestream to get density
     atmosphere(segment)
-    rho        = conditions.freestream.density[:,0]   
+    rho        = conditions.freestream.density   
     
     # check for initial altitude
     if alt is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]      
+        alt = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]      
+    else:
+        alt = expand_cases(alt,segment)
     
     # check for initial velocity
     if q is None: 
         if not segment.state.initials: raise AttributeError('dynamic pressure not set')
-        air_speed = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])
+        air_speed = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
     else: 
         # compute speed, constant with constant altitude
-        air_speed = np.sqrt(q/(rho*0.5))
+        air_speed = np.sqrt(expand_cases(q,segment)/(rho*0.5))
     
     # dimensionalize time
-    t_initial = conditions.frames.inertial.time[0,0]
+    t_initial = case_rows(conditions.frames.inertial.time,0,segment)
     t_final   = xf / air_speed + t_initial
     t_nondim  = segment.state.numerics.dimensionless.control_points
     time      = t_nondim * (t_final-t_initial) + t_initial
@@ -71,8 +74,8 @@ def initialize_conditions(segment):
     v_y       = np.sin(beta)*air_speed 
     
     # pack
-    segment.state.conditions.freestream.altitude[:,0]             = alt
-    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt 
-    segment.state.conditions.frames.inertial.velocity_vector[:,0] = v_x
-    segment.state.conditions.frames.inertial.velocity_vector[:,1] = v_y
+    segment.state.conditions.freestream.altitude[:,0]             = alt[:,0]
+    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
+    segment.state.conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    segment.state.conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
     segment.state.conditions.frames.inertial.time[:,0]            = time[:,0]
\ No newline at end of file
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases    import case_rows, expand_cases
 
 # Package imports 
 import numpy as np
@@ -40,7 +41,7 @@ def initialize_conditions(segment):
     
     # unpack
     alt        = segment.altitude
-    final_time = segment.time
+    final_time = expand_cases(segment.time,segment)
     mach       = segment.mach_number
     beta       = segment.sideslip_angle
     conditions = segment.state.conditions   
@@ -48,8 +49,10 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]  
-    segment.state.conditions.freestream.altitude[:,0] = alt
+        alt = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]  
+    else:
+        alt = expand_cases(alt,segment)
+    segment.state.conditions.freestream.altitude[:,0] = alt[:,0]
         
     # Update freestream to get speed of sound
     atmosphere(segment)  
@@ -58,13 +61,13 @@ def initialize_conditions(segment):
     # check for initial velocity
     if mach is None: 
         if not segment.state.initials: raise AttributeError('airspeed not set')
-        air_speed = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1])
+        air_speed = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
         
     else: # compute speed, constant with constant altitude
-        air_speed = mach * a
+        air_speed = expand_cases(mach,segment) * a
     
     # dimensionalize time
-    t_initial = conditions.frames.inertial.time[0,0]
+    t_initial = case_rows(conditions.frames.inertial.time,0,segment)
     t_final   = final_time + t_initial
     t_nondim  = segment.state.numerics.dimensionless.control_points
     time      = t_nondim * (t_final-t_initial) + t_initial
@@ -72,8 +75,8 @@ def initialize_conditions(segment):
     v_y       = np.sin(beta)*air_speed 
     
     # pack
-    segment.state.conditions.freestream.altitude[:,0]             = alt
-    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt 
+    segment.state.conditions.freestream.altitude[:,0]             = alt[:,0]
+    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     segment.state.conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
     segment.state.conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
     segment.state.conditions.frames.inertial.time[:,0]            = time[:,0]
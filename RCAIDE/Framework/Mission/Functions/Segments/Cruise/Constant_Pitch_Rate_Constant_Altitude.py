@@ -2,6 +2,15 @@
 # (c) Copyright 2023 Aerospace Research Community LLC
 # 
 # Created: Jun 2024, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
+# Package imports
+import numpy as np
  
 # ----------------------------------------------------------------------------------------------------------------------
 #  Initialize Conditions
@@ -33,23 +42,26 @@ def initialize_conditions(segment):
     # unpack
     alt        = segment.altitude 
     T0         = segment.pitch_initial
-    Tf         = segment.pitch_final 
-    theta_dot  = segment.pitch_rate   
+    Tf         = expand_cases(segment.pitch_final,segment) 
+    theta_dot  = expand_cases(segment.pitch_rate,segment)   
     conditions = segment.state.conditions 
     state      = segment.state
     
     # check for initial altitude
     if alt is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt = expand_cases(alt,segment)
         
     # check for initial pitch
     if T0 is None:
-        T0  =  state.initials.conditions.frames.body.inertial_rotations[-1,1]
+        T0  =  np.reshape(state.initials.conditions.frames.body.inertial_rotations[:,1],(state.numerics.number_of_cases,-1))[:,-1]
         segment.pitch_initial = T0
+    T0 = expand_cases(T0,segment)
     
     # dimensionalize time
-    t_initial = conditions.frames.inertial.time[0,0]
+    t_initial = case_rows(conditions.frames.inertial.time,0,segment)
     t_final   = (Tf-T0)/theta_dot + t_initial
     t_nondim  = state.numerics.dimensionless.control_points
     time      = t_nondim * (t_final-t_initial) + t_initial
@@ -59,8 +71,8 @@ def initialize_conditions(segment):
     
     # pack 
     segment.state.conditions.frames.body.inertial_rotations[:,1] = body_angle[:,0]     
-    segment.state.conditions.freestream.altitude[:,0]             = alt
-    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt 
+    segment.state.conditions.freestream.altitude[:,0]             = alt[:,0]
+    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     segment.state.conditions.frames.inertial.time[:,0]            = time[:,0]
     
     
\ No newline at end of file
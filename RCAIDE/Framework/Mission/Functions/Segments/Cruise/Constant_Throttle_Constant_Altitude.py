@@ -6,6 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 # Package imports 
 import numpy as np
  
@@ -87,6 +90,8 @@ def initialize_conditions(segment):
 
 
     """    
+    
+    require_single_case(segment)
     # unpack inputs
     alt      = segment.altitude 
     v0       = segment.air_speed_start
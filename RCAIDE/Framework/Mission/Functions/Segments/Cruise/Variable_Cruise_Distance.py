@@ -3,6 +3,12 @@
 # 
 # Created: Jun 2024, RCAIDE Team
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 # ----------------------------------------------------------------------------------------------------------------------
 # Initialize - for cruise distance
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -24,6 +30,10 @@ def initialize_cruise_distance(segment):
     state.unknowns.cruise_distance  [meters] 
     """         
     
+    # the residuals read the end of the last segment
+    for sub_segment in segment.segments.values():
+        require_single_case(sub_segment)
+    
     # unpack
     cruise_tag = segment.cruise_tag
     distance   = segment.segments[cruise_tag].distance
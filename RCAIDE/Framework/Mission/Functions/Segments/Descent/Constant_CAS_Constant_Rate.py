@@ -9,6 +9,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
 from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # package imports 
 import numpy as np
@@ -42,10 +43,10 @@ def initialize_conditions(segment):
     """       
     
     # unpack
-    descent_rate = segment.descent_rate
+    descent_rate = expand_cases(segment.descent_rate,segment)
     cas          = segment.calibrated_air_speed   
     alt0         = segment.altitude_start 
-    altf         = segment.altitude_end
+    altf         = expand_cases(segment.altitude_end,segment)
     beta         = segment.sideslip_angle
     t_nondim     = segment.state.numerics.dimensionless.control_points
     conditions   = segment.state.conditions  
@@ -53,7 +54,9 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -62,15 +65,16 @@ def initialize_conditions(segment):
     atmosphere(segment)  
 
     alt_data  = segment.analyses.atmosphere.compute_values(alt,segment.temperature_deviation)
-    density   = alt_data.density[:,0]  
-    pressure  = alt_data.pressure[:,0]  
+    density   = alt_data.density  
+    pressure  = alt_data.pressure  
     MSL_data  = segment.analyses.atmosphere.compute_values(0.0,segment.temperature_deviation)
     pressure0 = MSL_data.pressure[0]
     
     if cas is None:
         if not segment.state.initials: raise AttributeError('initial equivalent airspeed not set')
-        air_speed =  np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])    
+        air_speed =  np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]    
     else:  
+        cas       = expand_cases(cas,segment)
         kcas      = cas / Units.knots
         delta     = pressure / pressure0  
         mach      = 2.236*((((1+4.575e-7*kcas**2)**3.5-1)/delta + 1)**0.2857 - 1)**0.5 
@@ -86,8 +90,8 @@ def initialize_conditions(segment):
     v_y   = np.sin(beta)*v_xy
     
     # pack conditions    
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     conditions.freestream.altitude[:,0]             =  alt[:,0] 
\ No newline at end of file
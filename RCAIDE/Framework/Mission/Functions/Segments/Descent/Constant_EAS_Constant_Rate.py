@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # package imports 
 import numpy as np
@@ -41,10 +42,10 @@ def initialize_conditions(segment):
     """       
     
     # unpack
-    descent_rate = segment.descent_rate
+    descent_rate = expand_cases(segment.descent_rate,segment)
     eas          = segment.equivalent_air_speed   
     alt0         = segment.altitude_start 
-    altf         = segment.altitude_end 
+    altf         = expand_cases(segment.altitude_end,segment) 
     beta         = segment.sideslip_angle
     t_nondim     = segment.state.numerics.dimensionless.control_points
     conditions   = segment.state.conditions  
@@ -52,7 +53,9 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
 
 
     # discretize on altitude
@@ -62,15 +65,15 @@ def initialize_conditions(segment):
     conditions.freestream.altitude[:,0]             =  alt[:,0]     
     # determine airspeed from equivalent airspeed
     atmosphere(segment)  
-    density   = conditions.freestream.density[:,0]   
+    density   = conditions.freestream.density   
     MSL_data  = segment.analyses.atmosphere.compute_values(0.0,0.0)
 
     # check for initial velocity vector
     if eas is None:
         if not segment.state.initials: raise AttributeError('initial equivalent airspeed not set')
-        air_speed  = np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])  
+        air_speed  = np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]  
     else: 
-        air_speed  = eas/np.sqrt(density/MSL_data.density[0])    
+        air_speed  = expand_cases(eas,segment)/np.sqrt(density/MSL_data.density[0])    
     
     # process velocity vector
     v_mag = air_speed
@@ -80,7 +83,7 @@ def initialize_conditions(segment):
     v_y   = np.sin(beta)*v_xy
     
     # pack conditions    
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
@@ -7,6 +7,9 @@
 #  IMPORT 
 # ----------------------------------------------------------------------------------------------------------------------  
 # package imports 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
+
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------  
@@ -38,10 +41,10 @@ def initialize_conditions(segment):
     """        
     
     # unpack
-    descent_angle= segment.descent_angle
+    descent_angle= expand_cases(segment.descent_angle,segment)
     air_speed    = segment.air_speed   
     alt0         = segment.altitude_start 
-    altf         = segment.altitude_end 
+    altf         = expand_cases(segment.altitude_end,segment) 
     beta         = segment.sideslip_angle
     t_nondim     = segment.state.numerics.dimensionless.control_points
     conditions   = segment.state.conditions  
@@ -49,12 +52,16 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
     
     # check for initial velocity vector
     if air_speed is None:
         if not segment.state.initials: raise AttributeError('initial airspeed not set')
-        air_speed  =  np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])     
+        air_speed  =  np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]
+    else:
+        air_speed  = expand_cases(air_speed,segment)
             
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -66,8 +73,8 @@ def initialize_conditions(segment):
     v_z   = -v_mag * np.sin(-descent_angle)
     
     # pack conditions    
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,1] = v_y
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
+    conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     conditions.freestream.altitude[:,0]             =  alt[:,0] 
\ No newline at end of file
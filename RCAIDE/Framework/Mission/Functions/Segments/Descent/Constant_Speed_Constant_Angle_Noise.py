@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Units 
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
 
 # package imports 
 import numpy as np
@@ -77,6 +78,8 @@ def initialize_conditions(segment):
 
     """     
     
+    require_single_case(segment)
+    
     
     # unpack
     descent_angle= segment.descent_angle
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports  
 from RCAIDE.Framework.Mission.Functions.Common.Update.atmosphere import atmosphere
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows, expand_cases
 
 # package imports 
 import numpy as np
@@ -43,11 +44,11 @@ def initialize_conditions(segment):
     """      
     
     # unpack
-    descent_rate = segment.descent_rate
+    descent_rate = expand_cases(segment.descent_rate,segment)
     M0           = segment.mach_number_start
-    Mf           = segment.mach_number_end
+    Mf           = expand_cases(segment.mach_number_end,segment)
     alt0         = segment.altitude_start 
-    altf         = segment.altitude_end 
+    altf         = expand_cases(segment.altitude_end,segment) 
     beta         = segment.sideslip_angle    
     t_nondim     = segment.state.numerics.dimensionless.control_points
     conditions   = segment.state.conditions  
@@ -59,12 +60,16 @@ def initialize_conditions(segment):
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 * case_rows(segment.state.initials.conditions.frames.inertial.position_vector,-1,segment)[:,2,None]
+    else:
+        alt0 = expand_cases(alt0,segment)
     
     # check for initial velocity vector
     if M0 is None:
         if not segment.state.initials: raise AttributeError('initial mach number not set')
-        M0  =  np.linalg.norm(segment.state.initials.conditions.frames.inertial.velocity_vector[-1,:])/a[0,:]         
+        M0  =  np.linalg.norm(case_rows(segment.state.initials.conditions.frames.inertial.velocity_vector,-1,segment),axis=1)[:,None]/case_rows(a,0,segment)         
+    else:
+        M0  = expand_cases(M0,segment)
         
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -81,6 +86,6 @@ def initialize_conditions(segment):
     conditions.freestream.altitude[:,0]             =  alt[:,0]   
     conditions.frames.inertial.velocity_vector[:,0] = v_x[:,0]
     conditions.frames.inertial.velocity_vector[:,1] = v_y[:,0]
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
+    conditions.frames.inertial.velocity_vector[:,2] = v_z[:,0]
     conditions.frames.inertial.position_vector[:,2] = -alt[:,0] 
     conditions.freestream.altitude[:,0]             =  alt[:,0]  
@@ -2,7 +2,13 @@
 # (c) Copyright 2023 Aerospace Research Community LLC
 # 
 # Created: Jul 2024, RCAIDE Team
- 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 # ----------------------------------------------------------------------------------------------------------------------  
 #  Initialize Conditions
 # ----------------------------------------------------------------------------------------------------------------------    
@@ -24,6 +30,8 @@ def initialize_conditions(segment):
 
 
     """    
+    require_single_case(segment)
+    
     t_nondim   = segment.state.numerics.dimensionless.control_points
     conditions = segment.state.conditions   
     
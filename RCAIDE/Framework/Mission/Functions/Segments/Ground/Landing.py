@@ -7,6 +7,9 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE Imports  
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 import numpy as np 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -31,6 +34,8 @@ def initialize_conditions(segment):
 
 
     """      
+    
+    require_single_case(segment)
      
     # unpack inputs
     alt      = segment.altitude 
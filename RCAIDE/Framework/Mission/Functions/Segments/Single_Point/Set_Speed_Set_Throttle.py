@@ -7,6 +7,9 @@
 #  Initialize Conditions
 # ----------------------------------------------------------------------------------------------------------------------  
 
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------  
@@ -38,6 +41,8 @@ def initialize_conditions(segment):
 
     """      
     
+    require_single_case(segment)
+    
     # unpack
     alt              = segment.altitude
     air_speed        = segment.air_speed
@@ -6,6 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 #  Initialize Conditions
 # ----------------------------------------------------------------------------------------------------------------------  
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------  
@@ -37,6 +40,8 @@ def initialize_conditions(segment):
 
     """      
     
+    require_single_case(segment)
+    
     # unpack
     alt0        = segment.altitude_start 
     altf        = segment.altitude_end 
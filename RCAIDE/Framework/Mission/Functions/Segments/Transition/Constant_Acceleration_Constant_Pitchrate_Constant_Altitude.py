@@ -6,6 +6,9 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # IMPORTS 
 # ----------------------------------------------------------------------------------------------------------------------   
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 # Package imports 
 import numpy as np
 
@@ -37,6 +40,8 @@ def initialize_conditions(segment):
 
     """      
     
+    require_single_case(segment)
+    
     # unpack
     alt = segment.altitude 
     v0  = segment.air_speed_start
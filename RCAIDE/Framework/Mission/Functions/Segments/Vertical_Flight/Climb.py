@@ -2,7 +2,13 @@
 # (c) Copyright 2023 Aerospace Research Community LLC
 # 
 # Created: Jun 2024, RCAIDE Team
- 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import require_single_case
+
 # ----------------------------------------------------------------------------------------------------------------------  
 #  Initialize Conditions
 # ----------------------------------------------------------------------------------------------------------------------   
@@ -31,6 +37,8 @@ def initialize_conditions(segment):
 
     """       
     
+    require_single_case(segment)
+    
     # unpack
     climb_rate = segment.climb_rate
     alt0       = segment.altitude_start 
@@ -7,7 +7,12 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
-from .converge_root import converge_root
-from .expand_state  import expand_state
-from .optimize      import converge_opt
+from .converge_root           import converge_root
+from .compute_sparse_jacobian import compute_sparse_jacobian
+from .compile_pack_array      import compile_pack_array, pack_compiled, unpack_compiled
+from .root_finders            import root_finders, newton, newton_krylov, levenberg_marquardt
+from .warm_start              import warm_start, store_solution
+from .evaluate_missions       import evaluate_missions
+from .expand_state            import expand_state
+from .optimize                import converge_opt
  
\ No newline at end of file
@@ -0,0 +1,155 @@
+# RCAIDE/Framework/Mission/Functions/Solver/compile_pack_array.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data, array_type, matrix_type
+
+# Package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# compile_pack_array
+# ----------------------------------------------------------------------------------------------------------------------
+def compile_pack_array(data):
+    """Compiles the layout of Data.pack_array for a data structure whose layout does not change, e.g. the unknowns
+    and residuals of a segment during a converge. The offsets of every leaf are computed once and every array leaf
+    is replaced by a view into one flat buffer, so packing and unpacking become a single copy of the buffer instead
+    of a walk through the tree.
+
+    Assumptions:
+        The packed vector is identical to Data.pack_array(output='vector')
+        Leaves may be reassigned between calls (e.g. a residual computed as a new array), they are copied into the
+        buffer and replaced by a view when packed
+        Scalars are kept as scalars and packed one by one
+
+    Source:
+        None
+
+    Args:
+        data   (Data): data structure to pack, e.g. segment.state.unknowns                      [-]
+
+    Returns:
+        schema (Data): compiled layout, used by pack_compiled and unpack_compiled               [-]
+            .data    (Data): the data structure                                                 [-]
+            .buffer  (numpy.ndarray): flat buffer backing the array leaves                      [-]
+            .arrays  (list): (container, key, view, shape, start, stop) of each array leaf      [-]
+            .scalars (list): (container, key, index) of each scalar leaf                        [-]
+            .valid   (bool): False if the layout could not be compiled                          [-]
+    """
+
+    valid_types = (int,float,array_type)
+    leaves      = []
+    index       = [0]
+    valid       = [True]
+
+    def do_compile(D):
+        for k,v in D.items():
+            if isinstance(v,dict):
+                do_compile(v)
+                continue
+            elif isinstance(v,matrix_type):
+                valid[0] = False
+                continue
+            elif not isinstance(v,valid_types):
+                continue
+            rank = np.ndim(v)
+            if rank > 2:
+                continue
+            size = int(np.size(v))
+            leaves.append((D,k,rank,np.shape(v),index[0],index[0] + size))
+            index[0] += size
+
+    do_compile(data)
+
+    schema         = Data()
+    schema.data    = data
+    schema.buffer  = np.empty(index[0])
+    schema.arrays  = []
+    schema.scalars = []
+    schema.valid   = valid[0]
+    if not schema.valid:
+        return schema
+
+    for D,k,rank,shape,start,stop in leaves:
+        if rank == 0:
+            schema.buffer[start] = D[k]
+            schema.scalars.append((D,k,start))
+        else:
+            view                = np.reshape(schema.buffer[start:stop],shape,order='F')
+            view[...]           = D[k]
+            D[k]                = view
+            schema.arrays.append((D,k,view,shape,start,stop))
+
+    return schema
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def pack_compiled(schema):
+    """Packs a data structure with a compiled layout, see compile_pack_array.
+
+    Assumptions:
+        Falls back to Data.pack_array if a leaf changed shape
+
+    Source:
+        None
+
+    Args:
+        schema (Data): compiled layout                                                          [-]
+
+    Returns:
+        vector (numpy.ndarray): packed values, a copy of the buffer                             [-]
+    """
+    if not schema.valid:
+        return schema.data.pack_array()
+
+    buffer = schema.buffer
+    for entry in schema.arrays:
+        D,k,view,shape,start,stop = entry
+        value = D[k]
+        if value is view:
+            continue
+        elif np.shape(value) != shape:
+            schema.valid = False
+            return schema.data.pack_array()
+        view[...] = value
+        D[k]      = view
+    for D,k,index in schema.scalars:
+        buffer[index] = D[k]
+
+    return np.copy(buffer)
+
+def unpack_compiled(schema, vector):
+    """Unpacks a vector into a data structure with a compiled layout, see compile_pack_array.
+
+    Assumptions:
+        Array leaves that were reassigned since the layout was compiled are bound to the buffer again
+
+    Source:
+        None
+
+    Args:
+        schema (Data): compiled layout                                                          [-]
+        vector (numpy.ndarray): packed values                                                   [-]
+
+    Returns:
+        None
+    """
+    if not schema.valid:
+        schema.data.unpack_array(vector)
+        return
+
+    buffer    = schema.buffer
+    buffer[:] = vector
+    for D,k,view,shape,start,stop in schema.arrays:
+        if D[k] is not view:
+            D[k] = view
+    for D,k,index in schema.scalars:
+        D[k] = buffer[index]
+
+    return
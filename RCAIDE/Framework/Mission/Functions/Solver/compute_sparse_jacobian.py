@@ -0,0 +1,267 @@
+# RCAIDE/Framework/Mission/Functions/Solver/compute_sparse_jacobian.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import array_type, matrix_type
+
+# Package imports
+import numpy as np
+import scipy.sparse as sp
+
+# ----------------------------------------------------------------------------------------------------------------------
+# compute_sparse_jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_sparse_jacobian(function, unknowns, residuals, sparsity, colors, args=(), step_size=None):
+    """Computes a finite difference Jacobian of the segment residuals using a column coloring of the sparsity
+    pattern. All columns sharing a color are perturbed in one function evaluation, so the cost of a Jacobian is
+    the number of colors rather than the number of unknowns.
+
+    Assumptions:
+        Columns sharing a color never have a nonzero in the same row (see color_jacobian_columns)
+
+    Source:
+        Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+        IMA Journal of Applied Mathematics, 1974
+
+    Args:
+        function   (function): residual function, function(unknowns,*args)             [-]
+        unknowns   (numpy.ndarray): packed unknowns at which the Jacobian is taken       [-]
+        residuals  (numpy.ndarray): packed residuals evaluated at unknowns               [-]
+        sparsity   (scipy.sparse.csc_matrix): boolean sparsity pattern of the Jacobian   [-]
+        colors     (numpy.ndarray): color of each column of the Jacobian                 [-]
+        args       (tuple): extra arguments passed to function                           [-]
+        step_size  (float): relative step, same meaning as epsfcn in scipy.optimize.fsolve [-]
+
+    Returns:
+        jacobian   (scipy.sparse.csc_matrix): Jacobian of residuals w.r.t. unknowns      [-]
+    """
+
+    h            = finite_difference_steps(unknowns,step_size)
+    pattern      = sparsity.tocoo()
+    rows         = pattern.row
+    cols         = pattern.col
+    entry_colors = colors[cols]
+    values       = np.zeros(len(rows))
+
+    for color in range(np.max(colors,initial=-1) + 1):
+        perturbed           = np.copy(unknowns)
+        group               = colors == color
+        perturbed[group]   += h[group]
+        df                  = function(perturbed,*args) - residuals
+        entries             = entry_colors == color
+        values[entries]     = df[rows[entries]]/h[cols[entries]]
+
+    jacobian = sp.csc_matrix((values,(rows,cols)),shape=sparsity.shape)
+
+    return jacobian
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_jacobian_sparsity(function, unknowns, residuals, unknowns_data, residuals_data, args=(), step_size=None,
+                              number_of_cases=1):
+    """Determines the block sparsity pattern of the segment Jacobian and a column coloring for it.
+
+    Every column of every unknown array is a block of control points. Each block is probed once by perturbing its
+    first and last control point together. A residual block that only responds at those two control points is
+    taken to depend on the unknown point by point (diagonal block), any other response makes the whole block dense,
+    which covers the Chebyshev differentiation and integration couplings.
+
+    Batched segments stack independent cases along the rows of every array. Only the first case of each block is
+    probed and, as long as the response stays within the first case, the pattern is repeated for every case so the
+    Jacobian is block diagonal and its coloring does not grow with the number of cases.
+
+    Assumptions:
+        Point by point dependence observed at the end points holds for the interior points
+        Batched cases share the sparsity pattern of the first case
+
+    Source:
+        None
+
+    Args:
+        function       (function): residual function, function(unknowns,*args)        [-]
+        unknowns       (numpy.ndarray): packed unknowns                                [-]
+        residuals      (numpy.ndarray): packed residuals evaluated at unknowns         [-]
+        unknowns_data  (Data): segment.state.unknowns                                  [-]
+        residuals_data (Data): segment.state.residuals                                 [-]
+        args           (tuple): extra arguments passed to function                     [-]
+        step_size      (float): relative step, see compute_sparse_jacobian             [-]
+        number_of_cases (int): number of batched cases, see state.numerics             [-]
+
+    Returns:
+        sparsity       (scipy.sparse.csc_matrix): boolean sparsity pattern             [-]
+        colors         (numpy.ndarray): color of each column                           [-]
+        evaluations    (int): number of function evaluations used                     [-]
+    """
+
+    unknown_blocks  = packed_blocks(unknowns_data)
+    residual_blocks = packed_blocks(residuals_data)
+    h               = finite_difference_steps(unknowns,step_size)
+
+    rows = []
+    cols = []
+    for u_start,u_size in unknown_blocks:
+        u_case     = u_size//number_of_cases if u_size % number_of_cases == 0 else u_size
+        probe      = np.unique([u_start,u_start + u_case - 1])
+        perturbed  = np.copy(unknowns)
+        perturbed[probe] += h[probe]
+        df         = function(perturbed,*args) - residuals
+
+        for r_start,r_size in residual_blocks:
+            response = np.nonzero(df[r_start:r_start + r_size])[0]
+            r_case   = r_size//number_of_cases if r_size % number_of_cases == 0 else r_size
+            if len(response) == 0:
+                continue
+            elif u_case < u_size and r_case < r_size and np.all(response < r_case):
+                n_cases,r_block,u_block = number_of_cases,r_case,u_case
+            else:
+                n_cases,r_block,u_block = 1,r_size,u_size
+            block_rows,block_cols = block_pattern(response,r_block,u_block)
+            for case in range(n_cases):
+                rows.append(r_start + case*r_block + block_rows)
+                cols.append(u_start + case*u_block + block_cols)
+
+    n_rows = len(residuals)
+    n_cols = len(unknowns)
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = np.zeros(0,dtype=int)
+        cols = np.zeros(0,dtype=int)
+    sparsity = sp.csc_matrix((np.ones(len(rows),dtype=bool),(rows,cols)),shape=(n_rows,n_cols))
+    colors   = color_jacobian_columns(sparsity)
+
+    return sparsity, colors, len(unknown_blocks)
+
+def block_pattern(response, r_size, u_size):
+    """Sparsity pattern of one residual block with respect to one unknown block, given the rows that responded to
+    perturbing the first and last control point of the unknown block.
+
+    Assumptions:
+        See compute_jacobian_sparsity
+
+    Source:
+        None
+
+    Args:
+        response (numpy.ndarray): rows of the residual block that changed                [-]
+        r_size   (int): size of the residual block                                        [-]
+        u_size   (int): size of the unknown block                                         [-]
+
+    Returns:
+        rows     (numpy.ndarray): row of each nonzero, relative to the block              [-]
+        cols     (numpy.ndarray): column of each nonzero, relative to the block           [-]
+    """
+    if u_size == r_size and u_size > 2 and np.all(np.isin(response,[0,u_size - 1])):
+        return np.arange(r_size), np.arange(u_size)
+
+    block_rows,block_cols = np.meshgrid(np.arange(r_size),np.arange(u_size),indexing='ij')
+
+    return block_rows.ravel(), block_cols.ravel()
+
+def color_jacobian_columns(sparsity):
+    """Greedy coloring of the column intersection graph of a sparsity pattern. Two columns may only share a color
+    if they do not have a nonzero in the same row. Columns are visited from the most to the least populated.
+
+    Assumptions:
+        None
+
+    Source:
+        Coleman, T. F., and More, J. J., "Estimation of Sparse Jacobian Matrices and Graph Coloring Problems",
+        SIAM Journal on Numerical Analysis, 1983
+
+    Args:
+        sparsity (scipy.sparse.csc_matrix): boolean sparsity pattern [-]
+
+    Returns:
+        colors   (numpy.ndarray): color of each column               [-]
+    """
+
+    sparsity     = sp.csc_matrix(sparsity)
+    n_rows,n_col = sparsity.shape
+    colors       = np.zeros(n_col,dtype=int)
+    used_rows    = []
+    order        = np.argsort(-np.diff(sparsity.indptr),kind='stable')
+
+    for col in order:
+        col_rows = sparsity.indices[sparsity.indptr[col]:sparsity.indptr[col+1]]
+        for color,rows_taken in enumerate(used_rows):
+            if not np.any(rows_taken[col_rows]):
+                break
+        else:
+            color = len(used_rows)
+            used_rows.append(np.zeros(n_rows,dtype=bool))
+        used_rows[color][col_rows] = True
+        colors[col]                = color
+
+    return colors
+
+def finite_difference_steps(unknowns, step_size=None):
+    """Forward difference step for each unknown, scaled by the magnitude of the unknown.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        unknowns  (numpy.ndarray): packed unknowns                                      [-]
+        step_size (float): relative step, machine precision when None                   [-]
+
+    Returns:
+        h         (numpy.ndarray): step for each unknown                                [-]
+    """
+    if step_size is None:
+        step_size = np.finfo(float).eps
+    return np.sqrt(max(step_size,np.finfo(float).eps)) * np.maximum(np.abs(unknowns),1.)
+
+def packed_blocks(data):
+    """Lists the (start, size) of every column packed by Data.pack_array, in packing order. Scalars are blocks of
+    size one and 2D arrays contribute one block per column.
+
+    Assumptions:
+        Matches the 'vector' output of Data.pack_array
+
+    Source:
+        None
+
+    Args:
+        data   (Data): data structure that is packed                   [-]
+
+    Returns:
+        blocks (list): (start, size) of each packed block              [-]
+    """
+    valid_types = (int,float,array_type,matrix_type)
+    blocks      = []
+    index       = [0]
+
+    def do_blocks(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_blocks(v)
+                continue
+            elif not isinstance(v,valid_types):
+                continue
+            rank = np.ndim(v)
+            if rank > 2:
+                continue
+            elif rank == 2:
+                n,m = np.shape(v)
+                for _ in range(m):
+                    blocks.append((index[0],n))
+                    index[0] += n
+            else:
+                n = np.size(v)
+                blocks.append((index[0],n))
+                index[0] += n
+
+    do_blocks(data)
+
+    return blocks
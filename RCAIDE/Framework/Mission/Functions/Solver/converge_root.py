@@ -6,15 +6,24 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from .root_finders       import root_finders
+from .compile_pack_array import compile_pack_array, pack_compiled, unpack_compiled
+from RCAIDE.Framework.Core import Data
+
 # Package imports 
-import scipy.optimize
 import numpy as np 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # converge root
 # ---------------------------------------------------------------------------------------------------------------------- 
 def converge_root(segment):
-    """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder, either with
+    a function that has the call signature of scipy.optimize.fsolve or with the name of one of the solvers in
+    root_finders: "fsolve", "newton", "newton_krylov" or "levenberg_marquardt". Setting
+    state.numerics.solver_jacobian to "sparse" builds the Jacobian of the Newton type solvers from a colored
+    finite difference, and makes "newton" the default solver. The layout of the unknowns and residuals is compiled
+    once per converge so every solver callback packs and unpacks them with a single copy.
 
     Assumptions:
     None
@@ -26,29 +35,50 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [unitless]
+    state.numerics.solver_jacobian     [string]
 
     Returns:
-    state.unknowns                     [Any]
-    segment.state.numerics.converged   [unitless]
+    state.unknowns                               [Any]
+    segment.state.numerics.converged             [unitless]
+    segment.state.numerics.iterations            [unitless]
+    segment.state.numerics.function_evaluations  [unitless]
+    segment.state.numerics.residual_history      [unitless]
 
 
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    schema           = Data()
+    schema.unknowns  = compile_pack_array(segment.state.unknowns)
+    schema.residuals = compile_pack_array(segment.state.residuals)
+    unknowns         = pack_compiled(schema.unknowns)
+    numerics         = segment.state.numerics
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
-        root_finder = scipy.optimize.fsolve 
+        if numerics.solver_jacobian == "sparse":
+            root_finder = 'newton'
+        else:
+            root_finder = 'fsolve'
+    if isinstance(root_finder,str):
+        root_finder = root_finders[root_finder]
     
     unknowns,infodict,ier,msg = root_finder( iterate,
                                          unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
+                                         args = (segment,schema),
+                                         xtol = numerics.tolerance_solution,
+                                         maxfev = numerics.max_evaluations,
+                                         epsfcn = numerics.step_size,
                                          full_output = 1)
     
+    # solver statistics, fsolve does not report its iterations or residual history
+    numerics.function_evaluations = infodict.get('nfev',0)
+    numerics.iterations           = infodict.get('nit',None)
+    if 'residual_history' in infodict:
+        numerics.residual_history = infodict['residual_history']
+    else:
+        numerics.residual_history = np.atleast_1d(np.linalg.norm(infodict.get('fvec',np.nan)))
+    
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
         print("Error Message:\n" + msg)
@@ -63,7 +93,7 @@ def converge_root(segment):
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Helper Functions
 # ----------------------------------------------------------------------------------------------------------------------  
-def iterate(unknowns, segment):
+def iterate(unknowns, segment, schema=None):
     
     """Runs one iteration of of all analyses for the mission.
 
@@ -76,19 +106,26 @@ def iterate(unknowns, segment):
     Args:
     state.unknowns                [Data]
     segment.process.iterate       [Data]
+    schema                        [Data] compiled layouts of the unknowns and residuals, see compile_pack_array
 
     Returns:
     residuals                     [unitless]
 
 
     """       
-    if isinstance(unknowns,np.ndarray):
+    if schema is not None and isinstance(unknowns,np.ndarray):
+        unpack_compiled(schema.unknowns,unknowns)
+    elif isinstance(unknowns,np.ndarray):
         segment.state.unknowns.unpack_array(unknowns)
     else:
         segment.state.unknowns = unknowns
+        schema = None
         
     segment.process.iterate.evaluate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    if schema is not None:
+        residuals = pack_compiled(schema.residuals)
+    else:
+        residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals
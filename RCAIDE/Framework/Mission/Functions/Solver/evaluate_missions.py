@@ -0,0 +1,126 @@
+# RCAIDE/Framework/Mission/Functions/Solver/evaluate_missions.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data, Cache
+
+# Package imports
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import io
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+# evaluate_missions
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_missions(missions, state=None, number_of_workers=1):
+    """Evaluates a set of independent missions and collects the results in the order of the missions. With more than
+    one worker a copy of every mission, including its already initialized analyses (e.g. trained surrogates), is sent
+    to a process pool, evaluated there and a copy of the evaluated mission is sent back. The caches held by the
+    missions, i.e. every Cache such as the vortex distributions and influence matrices of a VLM analysis, arrive empty
+    in each copy, see dump_mission, so only what a mission needs to be evaluated crosses between processes.
+
+    In parallel the results are therefore new mission objects: the missions passed in are left unevaluated, with
+    their caches untouched, and the returned missions no longer share their analyses with them or with each other.
+    Serially each mission is evaluated in place and returned as it is.
+
+    Assumptions:
+        Missions do not share any state that is modified during evaluation
+        Missions and their analyses can be pickled
+        Entries without an evaluate method (e.g. the tag) are skipped
+
+    Source:
+        None
+
+    Args:
+        missions          (dict): container of missions                                         [-]
+        state             (Data): state passed to each mission                                  [-]
+        number_of_workers (int): number of worker processes, None for one per core              [-]
+
+    Returns:
+        results           (Data): evaluated missions, keyed as in missions                      [-]
+    """
+
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count() or 1
+    keys              = [key for key,mission in missions.items() if callable(getattr(mission,'evaluate',None))]
+    number_of_workers = max(1,min(int(number_of_workers),len(keys)))
+
+    results = Data()
+    if number_of_workers == 1:
+        for key in keys:
+            results[key] = missions[key].evaluate(state)
+        return results
+
+    payloads = [dump_mission(missions[key]) for key in keys]
+    with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+        evaluated = executor.map(evaluate_mission,payloads,[state]*len(keys))
+        for key,payload in zip(keys,evaluated):
+            results[key] = pickle.loads(payload)
+
+    return results
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_mission(payload, state=None):
+    """Evaluates a single mission inside a worker process.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        payload (bytes): mission to evaluate, see dump_mission                                  [-]
+        state   (Data): state passed to the mission                                             [-]
+
+    Returns:
+        payload (bytes): evaluated mission, see dump_mission                                    [-]
+    """
+    mission = pickle.loads(payload)
+    mission = mission.evaluate(state)
+    return dump_mission(mission)
+
+def dump_mission(mission):
+    """Pickles a mission with every Cache it holds replaced by an empty one. Only the pickled copy is emptied, the
+    caches of the mission itself keep their values.
+
+    Assumptions:
+        Caches only hold values that can be recomputed
+
+    Source:
+        None
+
+    Args:
+        mission (Data): mission to pickle                                                       [-]
+
+    Returns:
+        payload (bytes): pickled mission                                                        [-]
+    """
+    stream = io.BytesIO()
+    Cache_Stripping_Pickler(stream,pickle.HIGHEST_PROTOCOL).dump(mission)
+    return stream.getvalue()
+
+class Cache_Stripping_Pickler(pickle.Pickler):
+    """ Pickler that writes every Cache as an empty Cache of the same type, see dump_mission.
+    """
+
+    def reducer_override(self, obj):
+        """ Reduces a Cache to a call of its type without arguments, everything else is pickled as usual.
+
+        Assumptions:
+            None
+
+        Source:
+            None
+        """
+        if isinstance(obj,Cache):
+            return type(obj), ()
+        return NotImplemented
@@ -18,6 +18,8 @@ def expand_state(segment):
 
     Args:
     state.numerics.number_of_control_points  [unitless]
+    state.numerics.number_of_cases           [unitless]
+    state.numerics.lazy_conditions           [-]
 
     Returns:
     None
@@ -26,8 +28,9 @@ def expand_state(segment):
     """       
 
     n_points = segment.state.numerics.number_of_control_points
+    n_cases  = segment.state.numerics.number_of_cases
     
-    segment.state.expand_rows(n_points)
+    segment.state.expand_rows(n_points*n_cases,lazy=segment.state.numerics.lazy_conditions)
     
     return
     
\ No newline at end of file
@@ -0,0 +1,419 @@
+# RCAIDE/Framework/Mission/Functions/Solver/root_finders.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from .compute_sparse_jacobian import compute_sparse_jacobian, compute_jacobian_sparsity, color_jacobian_columns
+
+# Package imports
+import scipy.optimize
+import scipy.sparse as sp
+import scipy.sparse.linalg
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Newton
+# ----------------------------------------------------------------------------------------------------------------------
+def newton(func, x0, args=(), xtol=1.49012e-08, maxfev=0, epsfcn=None, full_output=0):
+    """Line search Newton method that keeps the LU factorization of the Jacobian for as long as the residuals
+    keep contracting, and only rebuilds it when a step stalls. When the step of a freshly built sparse Jacobian
+    stalls, its sparsity pattern is widened (see jacobian_function) before giving up. Has the same call signature
+    as scipy.optimize.fsolve so it can be used as segment.settings.root_finder.
+
+    Assumptions:
+        A full step that more than halves the residual norm means the factorized Jacobian is still good enough
+
+    Source:
+        Dennis, J. E., and Schnabel, R. B., "Numerical Methods for Unconstrained Optimization and Nonlinear
+        Equations", SIAM, 1996
+
+    Args:
+        func        (function): residual function, func(x,*args)                             [-]
+        x0          (numpy.ndarray): initial guess                                          [-]
+        args        (tuple): extra arguments, the segment (and packing schema) from converge_root [-]
+        xtol        (float): relative tolerance on the step                                  [-]
+        maxfev      (int): maximum number of function evaluations, 0 for 200*(n+1)           [-]
+        epsfcn      (float): relative finite difference step                                 [-]
+        full_output (bool): return infodict, ier and msg as well                             [-]
+
+    Returns:
+        x           (numpy.ndarray): solution                                                [-]
+        infodict    (dict): nfev, njev, nit, residual_history and fvec                      [-]
+        ier         (int): 1 if converged                                                    [-]
+        msg         (string): termination message                                            [-]
+    """
+
+    fun,counter = evaluation_counter(func,args,maxfev,len(x0))
+    x        = np.array(x0,dtype=float)
+    history  = []
+    njev     = 0
+    nit      = 0
+
+    try:
+        f        = fun(x)
+        fnorm    = np.linalg.norm(f)
+        history.append(fnorm)
+        jacobian,widen = jacobian_function(fun,x,f,args,epsfcn)
+        lu             = None
+
+        while True:
+            if fnorm == 0.:
+                ier, msg = 1, 'The residuals are zero.'
+                break
+
+            fresh = lu is None
+            if fresh:
+                lu    = factorize(jacobian(x,f))
+                njev += 1
+            dx = lu(-f)
+
+            # backtrack until the residual norm decreases
+            t = 1.
+            while t > 1e-4:
+                x_new  = x + t*dx
+                f_new  = fun(x_new)
+                if np.linalg.norm(f_new) <= (1. - 1e-4*t)*fnorm:
+                    break
+                t *= 0.5
+            else:
+                if not fresh:
+                    lu = None
+                    continue
+                if np.linalg.norm(dx) <= xtol*(np.linalg.norm(x) + xtol):
+                    ier, msg = 1, 'The relative error between two consecutive iterates is at most %e' % xtol
+                elif widen(x,f):
+                    lu = None
+                    continue
+                else:
+                    ier, msg = 5, 'The line search could not reduce the residuals.'
+                break
+
+            fnorm_new = np.linalg.norm(f_new)
+            if t < 1. or fnorm_new > 0.5*fnorm:
+                lu = None
+            x, f, fnorm = x_new, f_new, fnorm_new
+            nit += 1
+            history.append(fnorm)
+
+            if np.linalg.norm(t*dx) <= xtol*(np.linalg.norm(x) + xtol):
+                ier, msg = 1, 'The relative error between two consecutive iterates is at most %e' % xtol
+                break
+    except EvaluationLimit:
+        ier, msg = 2, 'The number of calls to function has reached maxfev = %d.' % counter['maxfev']
+
+    f = finalize(fun,counter,x)
+    infodict = dict(nfev=counter['nfev'],njev=njev,nit=nit,residual_history=np.array(history),fvec=f)
+
+    if full_output:
+        return x, infodict, ier, msg
+    return x
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Levenberg-Marquardt
+# ----------------------------------------------------------------------------------------------------------------------
+def levenberg_marquardt(func, x0, args=(), xtol=1.49012e-08, maxfev=0, epsfcn=None, full_output=0):
+    """Levenberg-Marquardt method that reuses the Jacobian between rebuilds through Broyden rank-one updates.
+    The finite difference Jacobian is only rebuilt when two consecutive steps are rejected, and its sparsity
+    pattern is widened (see jacobian_function) before giving up. Has the same call signature as
+    scipy.optimize.fsolve.
+
+    Assumptions:
+        None
+
+    Source:
+        Marquardt, D. W., "An Algorithm for Least-Squares Estimation of Nonlinear Parameters", SIAM Journal on
+        Applied Mathematics, 1963
+
+        Broyden, C. G., "A Class of Methods for Solving Nonlinear Simultaneous Equations", Mathematics of
+        Computation, 1965
+
+    Args:
+        see newton
+
+    Returns:
+        see newton
+    """
+
+    fun,counter = evaluation_counter(func,args,maxfev,len(x0))
+    x        = np.array(x0,dtype=float)
+    history  = []
+    njev     = 0
+    nit      = 0
+    damping  = 1e-3
+
+    try:
+        f        = fun(x)
+        fnorm    = np.linalg.norm(f)
+        history.append(fnorm)
+        jacobian,widen = jacobian_function(fun,x,f,args,epsfcn)
+        J              = None
+        rejected       = 0
+
+        while True:
+            if fnorm == 0.:
+                ier, msg = 1, 'The residuals are zero.'
+                break
+
+            fresh = J is None
+            if fresh:
+                J        = jacobian(x,f).toarray()
+                njev    += 1
+                rejected = 0
+
+            JTJ  = np.dot(J.T,J)
+            diag = np.maximum(np.diag(JTJ),np.finfo(float).eps)
+            dx   = np.linalg.solve(JTJ + damping*np.diag(diag),-np.dot(J.T,f))
+
+            x_new  = x + dx
+            f_new  = fun(x_new)
+
+            # rank one update of the Jacobian with the secant information of this step
+            dxdx = np.dot(dx,dx)
+            if dxdx > 0.:
+                J = J + np.outer(f_new - f - np.dot(J,dx),dx)/dxdx
+
+            fnorm_new = np.linalg.norm(f_new)
+            if fnorm_new < fnorm:
+                x, f, fnorm = x_new, f_new, fnorm_new
+                damping     = max(damping/3.,1e-12)
+                rejected    = 0
+                nit        += 1
+                history.append(fnorm)
+                if np.linalg.norm(dx) <= xtol*(np.linalg.norm(x) + xtol):
+                    ier, msg = 1, 'The relative error between two consecutive iterates is at most %e' % xtol
+                    break
+            else:
+                damping  *= 2.
+                rejected += 1
+                if np.linalg.norm(dx) <= xtol*(np.linalg.norm(x) + xtol):
+                    if fresh:
+                        ier, msg = 1, 'The relative error between two consecutive iterates is at most %e' % xtol
+                        break
+                    J = None
+                elif rejected >= 2:
+                    J = None
+                if damping > 1e16:
+                    if not widen(x,f):
+                        ier, msg = 5, 'The iteration is not making good progress.'
+                        break
+                    damping, J = 1e-3, None
+    except EvaluationLimit:
+        ier, msg = 2, 'The number of calls to function has reached maxfev = %d.' % counter['maxfev']
+
+    f = finalize(fun,counter,x)
+    infodict = dict(nfev=counter['nfev'],njev=njev,nit=nit,residual_history=np.array(history),fvec=f)
+
+    if full_output:
+        return x, infodict, ier, msg
+    return x
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Newton-Krylov
+# ----------------------------------------------------------------------------------------------------------------------
+def newton_krylov(func, x0, args=(), xtol=1.49012e-08, maxfev=0, epsfcn=None, full_output=0):
+    """Jacobian-free Newton-Krylov method. The Jacobian is never formed, GMRES only needs Jacobian-vector
+    products, each of which costs one function evaluation. Has the same call signature as scipy.optimize.fsolve.
+
+    Assumptions:
+        None
+
+    Source:
+        Knoll, D. A., and Keyes, D. E., "Jacobian-free Newton-Krylov methods: a survey of approaches and
+        applications", Journal of Computational Physics, 2004
+
+    Args:
+        see newton
+
+    Returns:
+        see newton
+    """
+
+    fun,counter = evaluation_counter(func,args,maxfev,len(x0))
+    x        = np.array(x0,dtype=float)
+    history  = []
+
+    def callback(x,f):
+        history.append(np.linalg.norm(f))
+
+    rdiff = None if epsfcn is None else np.sqrt(max(epsfcn,np.finfo(float).eps))
+    try:
+        history.append(np.linalg.norm(fun(x)))
+        x        = scipy.optimize.newton_krylov(fun,x,rdiff=rdiff,method='lgmres',x_rtol=xtol,callback=callback)
+        ier, msg = 1, 'The relative error between two consecutive iterates is at most %e' % xtol
+    except scipy.optimize.NoConvergence as exception:
+        x        = np.array(exception.args[0],dtype=float)
+        ier, msg = 5, 'The iteration is not making good progress.'
+    except EvaluationLimit:
+        ier, msg = 2, 'The number of calls to function has reached maxfev = %d.' % counter['maxfev']
+
+    f = finalize(fun,counter,x)
+    infodict = dict(nfev=counter['nfev'],njev=0,nit=len(history)-1,residual_history=np.array(history),fvec=f)
+
+    if full_output:
+        return x, infodict, ier, msg
+    return x
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Registry
+# ----------------------------------------------------------------------------------------------------------------------
+root_finders = {'fsolve'              : scipy.optimize.fsolve,
+                'newton'              : newton,
+                'newton_krylov'       : newton_krylov,
+                'levenberg_marquardt' : levenberg_marquardt}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+class EvaluationLimit(Exception):
+    """Raised when a root finder exceeds its allowed number of function evaluations
+    """
+    pass
+
+def evaluation_counter(func, args, maxfev, n):
+    """Wraps the residual function to count evaluations, remember the last evaluation and stop once maxfev is
+    exceeded.
+
+    Assumptions:
+        maxfev of 0 means 200*(n+1), as in scipy.optimize.fsolve
+
+    Source:
+        None
+
+    Args:
+        func    (function): residual function, func(x,*args)             [-]
+        args    (tuple): extra arguments                                 [-]
+        maxfev  (int): maximum number of function evaluations            [-]
+        n       (int): number of unknowns                                [-]
+
+    Returns:
+        fun     (function): counted function, fun(x)                     [-]
+        counter (dict): nfev, maxfev and the last evaluated x and f      [-]
+    """
+    if not isinstance(args,tuple):
+        args = (args,)
+    maxfev  = int(maxfev)
+    if maxfev <= 0:
+        maxfev = 200*(n + 1)
+    counter = dict(nfev=0,maxfev=maxfev,x=None,f=None)
+
+    def fun(x):
+        if counter['nfev'] >= counter['maxfev']:
+            raise EvaluationLimit()
+        counter['nfev'] += 1
+        f            = np.asarray(func(x,*args),dtype=float)
+        counter['x'] = np.copy(x)
+        counter['f'] = f
+        return f
+
+    return fun, counter
+
+def jacobian_function(fun, x, f, args, epsfcn):
+    """Returns a function that builds the finite difference Jacobian. When called from converge_root with
+    state.numerics.solver_jacobian set to "sparse" the Jacobian is colored (see compute_sparse_jacobian),
+    otherwise every column is perturbed on its own.
+
+    The sparsity pattern is detected at the initial guess. The returned widen function is called when a step of the
+    root finder fails to reduce the residuals: it detects the pattern again at the current unknowns and adds it to
+    the old one, and if that finds no new nonzeros it falls back to the dense Jacobian.
+
+    Assumptions:
+        Couplings seen at any iterate are kept, a pattern only grows
+
+    Source:
+        None
+
+    Args:
+        fun      (function): counted residual function, fun(x)       [-]
+        x        (numpy.ndarray): unknowns                           [-]
+        f        (numpy.ndarray): residuals at x                     [-]
+        args     (tuple): extra arguments, the segment               [-]
+        epsfcn   (float): relative finite difference step            [-]
+
+    Returns:
+        jacobian (function): jacobian(x,f) as a sparse matrix        [-]
+        widen    (function): widen(x,f), False once the Jacobian is dense [-]
+    """
+    if not isinstance(args,tuple):
+        args = (args,)
+    segment = args[0] if args else None
+
+    try:
+        sparse = segment.state.numerics.solver_jacobian == "sparse"
+    except AttributeError:
+        sparse = False
+
+    def detect(x,f):
+        sparsity,_,_ = compute_jacobian_sparsity(lambda x,*_: fun(x),x,f,segment.state.unknowns,
+                                                 segment.state.residuals,step_size=epsfcn,
+                                                 number_of_cases=segment.state.numerics.number_of_cases)
+        return sparsity
+
+    pattern = dict(sparsity=sp.csc_matrix(np.ones((len(f),len(x)),dtype=bool)),colors=np.arange(len(x)),dense=True)
+    if sparse:
+        pattern['sparsity'] = detect(x,f)
+        pattern['colors']   = color_jacobian_columns(pattern['sparsity'])
+        pattern['dense']    = False
+
+    def jacobian(x,f):
+        return compute_sparse_jacobian(fun,x,f,pattern['sparsity'],pattern['colors'],step_size=epsfcn)
+
+    def widen(x,f):
+        if pattern['dense']:
+            return False
+        sparsity = sp.csc_matrix((detect(x,f) + pattern['sparsity']).astype(bool))
+        if sparsity.nnz == pattern['sparsity'].nnz:
+            sparsity         = sp.csc_matrix(np.ones((len(f),len(x)),dtype=bool))
+            pattern['dense'] = True
+        pattern['sparsity'] = sparsity
+        pattern['colors']   = color_jacobian_columns(sparsity)
+        return True
+
+    return jacobian, widen
+
+def factorize(jacobian):
+    """LU factorization of a sparse Jacobian, falling back to least squares when it is singular or not square.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        jacobian (scipy.sparse.csc_matrix): Jacobian                  [-]
+
+    Returns:
+        solve    (function): solve(b) returns the solution of J x = b  [-]
+    """
+    try:
+        return scipy.sparse.linalg.splu(sp.csc_matrix(jacobian)).solve
+    except (RuntimeError,ValueError):
+        dense = jacobian.toarray()
+        return lambda b: np.linalg.lstsq(dense,b,rcond=None)[0]
+
+def finalize(fun, counter, x):
+    """Makes sure the last evaluation of the residual function was at the returned unknowns, so the segment
+    conditions correspond to the solution. This evaluation is allowed past maxfev.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        fun     (function): counted residual function                  [-]
+        counter (dict): evaluation counter of fun                      [-]
+        x       (numpy.ndarray): returned unknowns                     [-]
+
+    Returns:
+        f       (numpy.ndarray): residuals at x                        [-]
+    """
+    if counter['x'] is not None and np.array_equal(counter['x'],x):
+        return counter['f']
+    counter['maxfev'] = counter['nfev'] + 1
+    return fun(x)
@@ -0,0 +1,175 @@
+# RCAIDE/Framework/Mission/Functions/Solver/warm_start.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core        import Data
+from RCAIDE.Framework.Core.Arrays import atleast_2d_col
+from RCAIDE.Framework.Mission.Functions.Common.batch_cases import case_rows
+
+# Package imports
+from copy import deepcopy
+import numpy as np
+
+# assigned control variable that provides the initial guess of each unknown
+control_variables = {'body_angle'     : 'body_angle',
+                     'bank_angle'     : 'bank_angle',
+                     'wind_angle'     : 'wind_angle',
+                     'velocity'       : 'velocity',
+                     'acceleration'   : 'acceleration',
+                     'throttle_'      : 'throttle',
+                     'elevator_'      : 'elevator_deflection',
+                     'rudder_'        : 'rudder_deflection',
+                     'flap_'          : 'flap_deflection',
+                     'slat_'          : 'slat_deflection',
+                     'aileron_'       : 'aileron_deflection',
+                     'thrust_vector_' : 'thrust_vector_angle'}
+
+# ----------------------------------------------------------------------------------------------------------------------
+# warm_start
+# ----------------------------------------------------------------------------------------------------------------------
+def warm_start(segment, previous_segment=None, previous_solution=True):
+    """Seeds the unknowns of a segment before it is converged. If the segment has been converged before, e.g. when a
+    mission is evaluated again with perturbed inputs, its previous solution is resampled onto the current control
+    points. Otherwise the unknowns that the previous segment also solved for are set to the converged values at the
+    end of the previous segment.
+
+    Assumptions:
+        Unknowns with a user supplied initial guess are not seeded from the previous segment
+        The elapsed time of a segment is never seeded from the previous segment
+
+    Source:
+        None
+
+    Args:
+        segment           (Data): flight segment, after expand_state                    [-]
+        previous_segment  (Data): converged segment flown before, None to skip            [-]
+        previous_solution (bool): reuse the last converged solution of this segment      [-]
+
+    Returns:
+        None
+    """
+
+    unknowns = segment.state.unknowns
+    numerics = segment.state.numerics
+
+    if previous_solution and 'warm_start' in numerics:
+        solution = numerics.warm_start
+        x_old    = solution.control_points[:,0]
+        x_new    = atleast_2d_col(numerics.discretization_method(numerics.number_of_control_points,**numerics)[0])[:,0]
+        x_new    = np.tile(x_new,numerics.number_of_cases)
+        for key,value in solution.unknowns.items():
+            if key in unknowns:
+                unknowns[key] = resample(value,unknowns[key],x_old,x_new)
+        return
+
+    if previous_segment is None or not previous_segment.state.numerics.converged:
+        return
+
+    previous = previous_segment.state.unknowns
+    for key in unknowns.keys():
+        if key not in previous or not isinstance(unknowns[key],np.ndarray) or not isinstance(previous[key],np.ndarray):
+            continue
+        if key == 'elapsed_time' or user_initial_guess(segment,key) or np.shape(previous[key])[1:] != np.shape(unknowns[key])[1:]:
+            continue
+        if previous_segment.state.numerics.number_of_cases != numerics.number_of_cases:
+            continue
+        unknowns[key] = np.ones_like(unknowns[key]) * case_rows(previous[key],-1,segment)
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def store_solution(segment):
+    """Keeps a copy of the converged unknowns and control points of a segment to warm start the next evaluation.
+
+    Assumptions:
+        Only converged solutions are kept
+
+    Source:
+        None
+
+    Args:
+        segment (Data): converged flight segment                                          [-]
+
+    Returns:
+        None
+    """
+    numerics = segment.state.numerics
+    if not numerics.converged:
+        return
+
+    numerics.warm_start                = Data()
+    numerics.warm_start.control_points = np.copy(numerics.dimensionless.control_points)
+    numerics.warm_start.unknowns       = deepcopy(segment.state.unknowns)
+
+    return
+
+def resample(old, new, x_old, x_new):
+    """Linearly interpolates an unknown from the control points of a previous solution onto the current ones.
+    Arrays with fewer rows than control points (e.g. the ground velocity) are aligned with the last control points.
+
+    Assumptions:
+        Scalars are reused as is
+        Batched solutions are only reused on identical control points
+
+    Source:
+        None
+
+    Args:
+        old    (numpy.ndarray): unknown of the previous solution                          [-]
+        new    (numpy.ndarray): unknown as currently initialized                          [-]
+        x_old  (numpy.ndarray): dimensionless control points of the previous solution     [-]
+        x_new  (numpy.ndarray): dimensionless control points of the current solution      [-]
+
+    Returns:
+        value  (numpy.ndarray): resampled unknown, new if the shapes are incompatible     [-]
+    """
+    if not isinstance(old,np.ndarray) or not isinstance(new,np.ndarray):
+        return deepcopy(old) if np.ndim(old) == np.ndim(new) == 0 else new
+    if old.ndim != 2 or new.ndim != 2 or old.shape[1] != new.shape[1]:
+        return new
+    if old.shape == new.shape and np.array_equal(x_old,x_new):
+        return np.copy(old)
+    if np.any(np.diff(x_old) < 0) or np.any(np.diff(x_new) < 0):
+        return new
+
+    offset_old = len(x_old) - old.shape[0]
+    offset_new = len(x_new) - new.shape[0]
+    if offset_old != offset_new or offset_old < 0:
+        return new
+
+    value = np.empty_like(new)
+    for j in range(new.shape[1]):
+        value[:,j] = np.interp(x_new[offset_new:],x_old[offset_old:],old[:,j])
+
+    return value
+
+def user_initial_guess(segment, key):
+    """Checks if the user supplied an initial guess for the assigned control variable behind an unknown.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        segment (Data): flight segment                                                    [-]
+        key     (str): name of the unknown                                                [-]
+
+    Returns:
+        (bool): True if an initial guess was given                                        [-]
+    """
+    for prefix,control in control_variables.items():
+        if key == prefix or (prefix.endswith('_') and key.startswith(prefix)):
+            try:
+                return segment.assigned_control_variables[control].initial_guess is not None
+            except (AttributeError,KeyError):
+                return False
+    return False
@@ -7,7 +7,8 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports         
-from RCAIDE.Framework.Core import Container 
+from RCAIDE.Framework.Core                     import Container 
+from RCAIDE.Framework.Mission.Functions.Solver import evaluate_missions
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Functions
@@ -45,6 +46,26 @@ class Missions(Container):
          """         
         
         self.append(mission)
-        return        
+        return
+
+    def evaluate(self,state=None,number_of_workers=1):
+        """ Evaluates all missions, optionally in parallel worker processes. In parallel the results are new
+            mission objects that no longer share their analyses with the missions appended here, see evaluate_missions.
+    
+            Assumptions:
+                Missions are independent of each other
+    
+            Source:
+                None
     
-     
\ No newline at end of file
+            Args:
+                self              (dict): Functions data structure of containing process [-]
+                state             (dict): RCAIDE data structure passed to each mission   [-]
+                number_of_workers (int): worker processes, None for one per core         [-]
+    
+            Returns:
+                results           (dict): evaluated missions, in the order they were appended [-]
+         """         
+        
+        results = evaluate_missions(self,state,number_of_workers)
+        return results
@@ -10,7 +10,7 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -51,13 +51,13 @@ class Constant_Dynamic_Pressure_Constant_Angle(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------   
         initialize                         = self.process.initialize
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.initialize_conditions_unpack_unknowns
+        initialize.conditions              = Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.initialize_conditions_unpack_unknowns
         iterate                            = self.process.iterate 
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
-        iterate.unknowns.kinematics        = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.initialize_conditions_unpack_unknowns
-        iterate.conditions.differentials   = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.update_differentials
+        iterate.unknowns.kinematics        = Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.initialize_conditions_unpack_unknowns
+        iterate.conditions.differentials   = Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.update_differentials
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
-        iterate.residuals.altitude         = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.residual_altitude
+        iterate.residuals.altitude         = Segments.Climb.Constant_Dynamic_Pressure_Constant_Angle.residual_altitude
         return
        
\ No newline at end of file
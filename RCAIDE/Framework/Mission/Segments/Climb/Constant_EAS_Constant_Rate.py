@@ -10,7 +10,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -44,7 +44,7 @@ class Constant_EAS_Constant_Rate(Evaluate):
         # --------------------------------------------------------------------------------------------------------------    
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_EAS_Constant_Rate.initialize_conditions
+        initialize.conditions              = Segments.Climb.Constant_EAS_Constant_Rate.initialize_conditions
         iterate                            = self.process.iterate
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
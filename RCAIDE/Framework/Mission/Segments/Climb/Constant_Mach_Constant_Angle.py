@@ -10,7 +10,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -52,14 +52,14 @@ class Constant_Mach_Constant_Angle(Evaluate):
         # --------------------------------------------------------------------------------------------------------------   
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Mach_Constant_Angle.initialize_conditions
+        initialize.conditions              = Segments.Climb.Constant_Mach_Constant_Angle.initialize_conditions
         iterate                            = self.process.iterate
-        iterate.residuals.flight_altitude  = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Mach_Constant_Angle.altitude_residual
+        iterate.residuals.flight_altitude  = Segments.Climb.Constant_Mach_Constant_Angle.altitude_residual
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
-        iterate.conditions.differentials   = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Mach_Constant_Angle.update_differentials
+        iterate.conditions.differentials   = Segments.Climb.Constant_Mach_Constant_Angle.update_differentials
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
-        iterate.unknowns.kinematics        = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Mach_Constant_Angle.initialize_conditions
+        iterate.unknowns.kinematics        = Segments.Climb.Constant_Mach_Constant_Angle.initialize_conditions
 
         return
 
@@ -10,7 +10,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -45,12 +45,12 @@ class Constant_Throttle_Constant_Speed(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------      
         initialize                         = self.process.initialize  
-        initialize.velocities              = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Throttle_Constant_Speed.update_velocity_vector_from_wind_angle
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Throttle_Constant_Speed.initialize_conditions
+        initialize.velocities              = Segments.Climb.Constant_Throttle_Constant_Speed.update_velocity_vector_from_wind_angle
+        initialize.conditions              = Segments.Climb.Constant_Throttle_Constant_Speed.initialize_conditions
         iterate                            = self.process.iterate
-        iterate.unknowns.mission           = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Throttle_Constant_Speed.unpack_body_angle
-        iterate.differentials_altitude     = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Throttle_Constant_Speed.update_differentials_altitude
-        iterate.velocities                 = RCAIDE.Framework.Mission.Mission.Segments.Climb.Constant_Throttle_Constant_Speed.update_velocity_vector_from_wind_angle
+        iterate.unknowns.mission           = Segments.Climb.Constant_Throttle_Constant_Speed.unpack_body_angle
+        iterate.differentials_altitude     = Segments.Climb.Constant_Throttle_Constant_Speed.update_differentials_altitude
+        iterate.velocities                 = Segments.Climb.Constant_Throttle_Constant_Speed.update_velocity_vector_from_wind_angle
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
         return
 
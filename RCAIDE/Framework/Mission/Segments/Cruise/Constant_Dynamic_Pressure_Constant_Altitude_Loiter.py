@@ -10,7 +10,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Mission.Segments.Evaluate   import Evaluate 
 from RCAIDE.Framework.Core                                 import Units   
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -42,7 +42,7 @@ class Constant_Dynamic_Pressure_Constant_Altitude_Loiter(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------    
         initialize                         = self.process.initialize  
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Dynamic_Pressure_Constant_Altitude_Loiter.initialize_conditions
+        initialize.conditions              = Segments.Cruise.Constant_Dynamic_Pressure_Constant_Altitude_Loiter.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
@@ -10,7 +10,7 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
 from RCAIDE.Framework.Core                       import Units
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 # ----------------------------------------------------------------------------------------------------------------------
 #  Constant_Pitch_Rate_Constant_Altitude
 # ----------------------------------------------------------------------------------------------------------------------  
@@ -42,7 +42,7 @@ class Constant_Pitch_Rate_Constant_Altitude(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------       
         initialize                         = self.process.initialize  
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Pitch_Rate_Constant_Altitude.initialize_conditions
+        initialize.conditions              = Segments.Cruise.Constant_Pitch_Rate_Constant_Altitude.initialize_conditions
         iterate                            = self.process.iterate 
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude  
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
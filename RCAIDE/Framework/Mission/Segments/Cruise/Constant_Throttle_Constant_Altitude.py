@@ -11,7 +11,7 @@
 from RCAIDE.Framework.Mission.Segments.Evaluate   import Evaluate 
 from RCAIDE.Framework.Core                        import Units   
 from RCAIDE.Framework.Analyses                    import Process  
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -43,13 +43,13 @@ class Constant_Throttle_Constant_Altitude(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------    
         initialize                         = self.process.initialize  
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Throttle_Constant_Altitude.initialize_conditions
+        initialize.conditions              = Segments.Cruise.Constant_Throttle_Constant_Altitude.initialize_conditions
         iterate                            = self.process.iterate             
 
         # Update Conditions
         iterate.conditions = Process()
         iterate.conditions.differentials   = Common.Update.differentials_time 
-        iterate.conditions.velocity        = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Throttle_Constant_Altitude.integrate_velocity
+        iterate.conditions.velocity        = Segments.Cruise.Constant_Throttle_Constant_Altitude.integrate_velocity
         iterate.conditions.acceleration    = Common.Update.acceleration   
         iterate.conditions.altitude        = Common.Update.altitude
         iterate.conditions.atmosphere      = Common.Update.atmosphere
@@ -64,8 +64,8 @@ class Constant_Throttle_Constant_Altitude(Evaluate):
         iterate.conditions.moments         = Common.Update.moments
         iterate.conditions.planet_position = Common.Update.planet_position
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
-        iterate.residuals.velocity         = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Throttle_Constant_Altitude.solve_velocity
+        iterate.residuals.velocity         = Segments.Cruise.Constant_Throttle_Constant_Altitude.solve_velocity
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude  
-        iterate.unknowns.acceleration      = RCAIDE.Framework.Mission.Mission.Segments.Cruise.Constant_Throttle_Constant_Altitude.unpack_unknowns
+        iterate.unknowns.acceleration      = Segments.Cruise.Constant_Throttle_Constant_Altitude.unpack_unknowns
 
         return
\ No newline at end of file
@@ -10,7 +10,7 @@
 # RCAIDE imports
 from RCAIDE.Framework.Core                       import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -42,7 +42,7 @@ class Constant_CAS_Constant_Rate(Evaluate):
         # --------------------------------------------------------------------------------------------------------------  
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Descent.Constant_CAS_Constant_Rate.initialize_conditions
+        initialize.conditions              = Segments.Descent.Constant_CAS_Constant_Rate.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude        
@@ -10,7 +10,7 @@
 # RCAIDE imports
 from RCAIDE.Framework.Core                       import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -51,7 +51,7 @@ class Constant_Speed_Constant_Angle(Evaluate):
         # -------------------------------------------------------------------------------------------------------------- 
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Descent.Constant_Speed_Constant_Angle.initialize_conditions
+        initialize.conditions              = Segments.Descent.Constant_Speed_Constant_Angle.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude          
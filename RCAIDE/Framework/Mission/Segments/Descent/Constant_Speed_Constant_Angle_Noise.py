@@ -11,7 +11,7 @@
 import RCAIDE
 from RCAIDE.Framework.Core                       import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -50,8 +50,8 @@ class Constant_Speed_Constant_Angle_Noise(Evaluate):
         # --------------------------------------------------------------------------------------------------------------  
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.expand_state            = RCAIDE.Framework.Mission.Mission.Segments.Descent.Constant_Speed_Constant_Angle_Noise.expand_state
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Descent.Constant_Speed_Constant_Angle_Noise.initialize_conditions
+        initialize.expand_state            = Segments.Descent.Constant_Speed_Constant_Angle_Noise.expand_state
+        initialize.conditions              = Segments.Descent.Constant_Speed_Constant_Angle_Noise.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude          
@@ -9,7 +9,7 @@
  
 from RCAIDE.Framework.Core                       import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -44,7 +44,7 @@ class Linear_Mach_Constant_Rate(Evaluate):
         # -------------------------------------------------------------------------------------------------------------- 
         initialize                         = self.process.initialize  
         initialize.differentials_altitude  = Common.Initialize.differentials_altitude
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Descent.Linear_Mach_Constant_Rate.initialize_conditions
+        initialize.conditions              = Segments.Descent.Linear_Mach_Constant_Rate.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.unknowns.mission           = Common.Unpack_Unknowns.attitude
         iterate.unknowns.controls          = Common.Unpack_Unknowns.control_surfaces
@@ -9,6 +9,7 @@
 
 # RCAIDE imports
 from RCAIDE.Framework.Mission.Segments.Evaluate       import Evaluate    
+from RCAIDE.Framework.Mission.Functions          import Segments
 from RCAIDE.Framework.Core                            import Units
 from RCAIDE.Library.Methods.skip                      import skip
 
@@ -41,7 +42,7 @@ class Battery_Discharge(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------       
         initialize                         = self.process.initialize 
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Ground.Battery_Charge_Discharge.initialize_conditions
+        initialize.conditions              = Segments.Ground.Battery_Charge_Discharge.initialize_conditions
         iterate                            = self.process.iterate 
         iterate.unknowns.mission           = skip
         iterate.conditions.aerodynamics    = skip
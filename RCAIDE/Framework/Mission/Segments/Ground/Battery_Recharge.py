@@ -9,6 +9,7 @@
 
 # RCAIDE imports
 from RCAIDE.Framework.Mission.Segments.Evaluate       import Evaluate
+from RCAIDE.Framework.Mission.Functions          import Segments
 from RCAIDE.Framework.Core                                     import Units
 from RCAIDE.Library.Methods.skip                             import skip 
 
@@ -38,7 +39,7 @@ class Battery_Recharge(Evaluate):
         self.true_course                   = 0.0 * Units.degrees  
          
         initialize                         = self.process.initialize  
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Ground.Battery_Charge_Discharge.initialize_conditions
+        initialize.conditions              = Segments.Ground.Battery_Charge_Discharge.initialize_conditions
         iterate                            = self.process.iterate 
         iterate.unknowns.mission           = skip
         iterate.conditions.aerodynamics    = skip
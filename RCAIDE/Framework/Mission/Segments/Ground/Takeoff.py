@@ -9,6 +9,7 @@
 
 # RCAIDE imports 
 from RCAIDE.Framework.Mission.Segments.Evaluate       import Evaluate
+from RCAIDE.Framework.Mission.Functions          import Segments
 from RCAIDE.Framework.Core                            import Units, Data
 from RCAIDE.Framework.Mission.Functions.Common import Unpack_Unknowns, Update, Residuals
 
@@ -67,7 +68,7 @@ class Takeoff(Evaluate):
         #  Functions specific processes
         # --------------------------------------------------------------------------------------------------------------  
         initialize                         = self.process.initialize
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Ground.Takeoff.initialize_conditions
+        initialize.conditions              = Segments.Ground.Takeoff.initialize_conditions
         iterate                            = self.process.iterate   
         iterate.conditions.forces_ground   = Update.ground_forces
         iterate.unknowns.mission           = Unpack_Unknowns.ground
@@ -10,7 +10,7 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 from RCAIDE.Library.Methods.skip                     import skip
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -46,7 +46,7 @@ class Set_Speed_Set_Altitude(Evaluate):
         initialize                               = self.process.initialize 
         initialize.expand_state                  = skip
         initialize.differentials                 = skip
-        initialize.conditions                    = RCAIDE.Framework.Mission.Mission.Segments.Single_Point.Set_Speed_Set_Altitude.initialize_conditions
+        initialize.conditions                    = Segments.Single_Point.Set_Speed_Set_Altitude.initialize_conditions
         iterate                                  = self.process.iterate 
         iterate.initials.energy                  = skip
         iterate.unknowns.controls                = Common.Unpack_Unknowns.control_surfaces
@@ -11,7 +11,7 @@
 from RCAIDE.Library.Methods                          import skip   
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -47,7 +47,7 @@ class Set_Speed_Set_Altitude_No_Propulsion(Evaluate):
         initialize                         = self.process.initialize 
         initialize.expand_state            = skip
         initialize.differentials           = skip
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Single_Point.Set_Speed_Set_Altitude_No_Propulsion.initialize_conditions
+        initialize.conditions              = Segments.Single_Point.Set_Speed_Set_Altitude_No_Propulsion.initialize_conditions
         iterate                            = self.process.iterate
         iterate.conditions.differentials   = skip 
         iterate.conditions.weights         = Common.Update.weights
@@ -11,7 +11,7 @@
 from RCAIDE.Library.Methods.skip                     import skip 
 from RCAIDE.Framework.Core                           import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate      import Evaluate
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -47,10 +47,10 @@ class Set_Speed_Set_Throttle(Evaluate):
         initialize                               = self.process.initialize 
         initialize.expand_state                  = skip
         initialize.differentials                 = skip
-        initialize.conditions                    = RCAIDE.Framework.Mission.Mission.Segments.Single_Point.Set_Speed_Set_Throttle.initialize_conditions
+        initialize.conditions                    = Segments.Single_Point.Set_Speed_Set_Throttle.initialize_conditions
         iterate                                  = self.process.iterate 
         iterate.initials.energy                  = skip    
-        iterate.unknowns.mission                 = RCAIDE.Framework.Mission.Mission.Segments.Single_Point.Set_Speed_Set_Throttle.unpack_unknowns
+        iterate.unknowns.mission                 = Segments.Single_Point.Set_Speed_Set_Throttle.unpack_unknowns
         iterate.conditions.differentials         = skip 
         iterate.conditions.planet_position       = skip    
         iterate.conditions.acceleration          = skip
@@ -10,7 +10,7 @@
 # RCAIDE imports 
 from RCAIDE.Framework.Core                       import Units 
 from RCAIDE.Framework.Mission.Segments.Evaluate  import Evaluate 
-from RCAIDE.Framework.Mission.Functions import Common
+from RCAIDE.Framework.Mission.Functions import Common, Segments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -44,7 +44,7 @@ class Descent(Evaluate):
         # --------------------------------------------------------------------------------------------------------------  
         initialize                         = self.process.initialize
         iterate                            = self.process.iterate 
-        initialize.conditions              = RCAIDE.Framework.Mission.Mission.Segments.Vertical_Flight.Descent.initialize_conditions
+        initialize.conditions              = Segments.Vertical_Flight.Descent.initialize_conditions
         iterate.residuals.flight_dynamics  = Common.Residuals.flight_dynamics
         return
        
\ No newline at end of file
@@ -9,6 +9,8 @@
 # RCAIDE imports   
 import RCAIDE
 from RCAIDE.Framework.Mission.Functions.Initialize import  aerodynamics,stability,energy,set_residuals_and_unknowns
+from RCAIDE.Framework.Mission.Functions.Solver     import  warm_start, store_solution, evaluate_missions
+from RCAIDE.Framework.Core                     import Data
 from RCAIDE.Framework.Core                     import Container as ContainerBase
 from RCAIDE.Framework.Analyses                 import Process 
 from . import Segments
@@ -41,6 +43,11 @@ class Sequential_Segments(Segments.Segment.Container):
 
         #   Converge 
         self.process.converge    = self.converge
+        
+        #   Warm Start
+        self.settings.warm_start                   = Data()
+        self.settings.warm_start.previous_segment  = False
+        self.settings.warm_start.previous_solution = False 
          
         #   Iterate     
         del self.process.iterate  
@@ -69,14 +76,42 @@ class Sequential_Segments(Segments.Segment.Container):
         return self     
     
     def converge(self,mission):   
+        """ Converges each segment in order, starting each one from the final state of the one before. With
+            settings.warm_start the unknowns are seeded from the previous segment and from the last converged
+            solution of the segment, see Solver.warm_start
+    
+            Assumptions:
+                None
+    
+            Source:
+                None
+    
+            Args:
+                mission  (dict): RCAIDE data structure of containing process [-]
+    
+            Returns:
+                None
+        """
+        settings = mission.settings.warm_start
         last_tag = None
         for tag,segment in mission.segments.items(): 
+            previous_segment = None
             if last_tag:
-                segment.state.initials = mission.segments[last_tag].state
+                previous_segment       = mission.segments[last_tag]
+                segment.state.initials = previous_segment.state
             last_tag = tag        
             
             segment.process.initialize.expand_state(segment) 
+            
+            if settings.previous_segment or settings.previous_solution:
+                if not settings.previous_segment:
+                    previous_segment = None
+                warm_start(segment,previous_segment,previous_solution=settings.previous_solution)
+                
             segment.evaluate()    
+            
+            if settings.previous_solution:
+                store_solution(segment)
         
     
 # ----------------------------------------------------------------------
@@ -86,26 +121,25 @@ class Container(ContainerBase):
     """ Container for mission.
     """    
     
-    def evaluate(self,state=None):
-        """ Go through the missions, run through them, save the results 
+    def evaluate(self,state=None,number_of_workers=1):
+        """ Go through the missions, run through them, save the results. In parallel the results are new mission
+            objects that no longer share their analyses with the missions in the container, see evaluate_missions.
     
             Assumptions:
-                None
+                Missions are independent of each other
     
             Source:
                 None
     
             Args:
-                self  (dict): RCAIDE data structure of containing process [-]
+                self              (dict): RCAIDE data structure of containing process     [-]
+                state             (dict): RCAIDE data structure passed to each mission    [-]
+                number_of_workers (int): worker processes, None for one per core          [-]
     
             Returns:
-                self  (dict): RCAIDE data structure of containing process [-]
+                results           (dict): evaluated missions, in the order of the container [-]
         """   
-        results = RCAIDE.Framework.Core.Data()
-        
-        for key,mission in self.items():
-            result = mission.evaluate(state)
-            results[key] = result
+        results = evaluate_missions(self,state,number_of_workers)
             
         return results 
 
@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 import RCAIDE
 from RCAIDE.Framework.Plots.Geometry.Common.contour_surface_slice import contour_surface_slice
-from RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil import cached_airfoil_geometry
 from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series 
 
 import numpy as np  
@@ -152,7 +152,7 @@ def generate_3d_BOR_nacelle_points(nac,tessellation = 24 ,number_of_airfoil_poin
         zpts         = np.repeat(np.atleast_2d(a_geo.y_coordinates).T,tessellation,axis = 1)*nac.length  
     
     elif naf.coordinate_file != None: 
-        a_geo        = import_airfoil_geometry(naf.coordinate_file,num_nac_segs)
+        a_geo        = cached_airfoil_geometry(naf.coordinate_file,num_nac_segs)
         xpts         = np.repeat(np.atleast_2d(np.take(a_geo.x_coordinates,axis=0)).T,tessellation,axis = 1)*nac.length
         zpts         = np.repeat(np.atleast_2d(np.take(a_geo.y_coordinates,axis=0)).T,tessellation,axis = 1)*nac.length 
 
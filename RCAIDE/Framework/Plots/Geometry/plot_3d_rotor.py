@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 from RCAIDE.Framework.Core import Data
 from RCAIDE.Framework.Plots.Geometry.Common.contour_surface_slice import contour_surface_slice
-from RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil import cached_airfoil_geometry
 from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series
 
 # python imports 
@@ -142,7 +142,7 @@ def generate_3d_blade_points(rotor,n_points,dim,i,aircraftRefFrame=True):
         zpts  = np.zeros((dim,n_points))
         max_t = np.zeros(dim)
         for af_idx,airfoil in enumerate(airfoils):
-            geometry     = import_airfoil_geometry(airfoil.coordinate_file,n_points)
+            geometry     = cached_airfoil_geometry(airfoil.coordinate_file,n_points)
             locs         = np.where(np.array(a_loc) == af_idx)
             xpts[locs]   = geometry.x_coordinates  
             zpts[locs]   = geometry.y_coordinates  
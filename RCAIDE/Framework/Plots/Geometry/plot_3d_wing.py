@@ -9,7 +9,7 @@
 import RCAIDE
 from RCAIDE.Framework.Core import Data
 from RCAIDE.Framework.Plots.Geometry.Common.contour_surface_slice import contour_surface_slice
-from RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil import cached_airfoil_geometry
 from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series 
 import numpy as np     
 
@@ -124,7 +124,7 @@ def generate_3d_wing_points(wing,n_points,dim):
                 if type(airfoil[af_tag]) == RCAIDE.Library.Components.Airfoils.NACA_4_Series_Airfoil:
                     geometry = compute_naca_4series(airfoil[af_tag].NACA_4_Series_code,n_points)
                 elif type(airfoil[af_tag]) == RCAIDE.Library.Components.Airfoils.Airfoil: 
-                    geometry     = import_airfoil_geometry(airfoil[af_tag].coordinate_file,n_points)
+                    geometry     = cached_airfoil_geometry(airfoil[af_tag].coordinate_file,n_points)
             else:
                 geometry = compute_naca_4series('0012',n_points)  
             
@@ -205,7 +205,7 @@ def generate_3d_wing_points(wing,n_points,dim):
             if type(airfoil[af_tag]) == RCAIDE.Library.Components.Airfoils.NACA_4_Series_Airfoil:
                 geometry = compute_naca_4series(airfoil[af_tag].NACA_4_Series_code,n_points)
             elif type(airfoil[af_tag]) == RCAIDE.Library.Components.Airfoils.Airfoil: 
-                geometry     = import_airfoil_geometry(airfoil[af_tag].coordinate_file,n_points)
+                geometry     = cached_airfoil_geometry(airfoil[af_tag].coordinate_file,n_points)
         else:
             geometry = compute_naca_4series('0012',n_points)
             
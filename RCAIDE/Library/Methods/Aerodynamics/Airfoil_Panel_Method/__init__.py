@@ -10,9 +10,11 @@
 
 from .aero_coeff                        import aero_coeff    
 from .airfoil_analysis                  import airfoil_analysis 
+from .boundary_layer_march              import boundary_layer_march 
 from .heads_method                      import heads_method       
 from .hess_smith                        import hess_smith               
 from .infl_coeff                        import infl_coeff       
 from .panel_geometry                    import panel_geometry   
+from .surface_stations                  import surface_stations 
 from .thwaites_method                   import thwaites_method    
 from .velocity_distribution             import velocity_distribution 
\ No newline at end of file
@@ -9,9 +9,9 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Data
 from .hess_smith           import hess_smith
-from .thwaites_method      import thwaites_method 
-from .heads_method         import heads_method 
+from .boundary_layer_march import boundary_layer_march 
 from .aero_coeff           import aero_coeff  
+from .surface_stations     import surface_stations, gather_stations
 
 # package imports  
 import numpy as np  
@@ -19,7 +19,7 @@ import numpy as np
 # ----------------------------------------------------------------------------------------------------------------------
 # airfoil_analysis 
 # ----------------------------------------------------------------------------------------------------------------------
-def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil_stations = [0],initial_momentum_thickness=1E-5,tolerance = 1E0,H_wake = 1.05,Ue_wake = 0.99):
+def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil_stations = [0],initial_momentum_thickness=1E-5,tolerance = 1E0,H_wake = 1.05,Ue_wake = 0.99,shared_geometry = True):
     """This computes the aerodynamic polars as well as the boundary layer properties of 
     an airfoil at a defined set of reynolds numbers and angle of attacks
 
@@ -47,6 +47,9 @@ def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil
          Re_L               (numpy.ndarray): Reynolds numbers                   [unitless]
          airfoil_stations            (list): airfoil stations                   [-]
          batch_analysis              (bool): boolean for running batch analysis [boolean]                  
+         shared_geometry             (bool): factorize the influence matrix of  [boolean]
+                                             the airfoil once for all cases of 
+                                             a batch analysis 
     
     Returns:  
          airfoil_properties.AoA        (numpy.ndarray): angle of attack                                                   [radians
@@ -81,6 +84,12 @@ def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil
         npanel       = len(x_coord)-1  
         x_coord_3d   = np.tile(x_coord[:,None,None],(1,ncases,ncpts))  
         y_coord_3d   = np.tile(y_coord[:,None,None],(1,ncases,ncpts))   
+        if shared_geometry:
+            x_coord_geo = x_coord[:,None,None]
+            y_coord_geo = y_coord[:,None,None]
+        else:
+            x_coord_geo = x_coord_3d
+            y_coord_geo = y_coord_3d
         
     else:
         nairfoil = len(airfoil_stations)  
@@ -88,10 +97,12 @@ def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil
             raise AssertionError('Dimension of angle of attacks,Reynolds numbers and airfoil stations must all be equal')      
         x_coord_3d = np.repeat(x_coord[:,:,np.newaxis],ncpts, axis = 2)
         y_coord_3d = np.repeat(y_coord[:,:,np.newaxis],ncpts, axis = 2)
+        x_coord_geo = x_coord_3d
+        y_coord_geo = y_coord_3d
         
 
     # Solving for velocity distribution  
-    X,Y,vt,normals = hess_smith(ncases,ncpts,x_coord_3d,y_coord_3d,alpha,Re_L,npanel)  
+    X,Y,vt,normals = hess_smith(x_coord_geo,y_coord_geo,alpha,Re_L,npanel)  
     
     # Reynolds number 
     RE_L_VALS = Re_L.T 
@@ -131,112 +142,6 @@ def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil
     # x - location of stagnation point 
     L_BOT                          = X_BOT[-1,:,:]    
         
-    # laminar boundary layer properties using thwaites method  
-    BOT_T_RESULTS  = thwaites_method(npanel,ncases,ncpts, L_BOT , RE_L_VALS, X_BOT, VE_BOT, DVE_BOT,tolerance,
-                                     THETA_0=initial_momentum_thickness)
-    
-    X_T_BOT          = BOT_T_RESULTS.X_T      
-    THETA_T_BOT      = BOT_T_RESULTS.THETA_T     
-    DELTA_STAR_T_BOT = BOT_T_RESULTS.DELTA_STAR_T  
-    H_T_BOT          = BOT_T_RESULTS.H_T         
-    CF_T_BOT         = BOT_T_RESULTS.CF_T   
-    RE_THETA_T_BOT   = BOT_T_RESULTS.RE_THETA_T    
-    RE_X_T_BOT       = BOT_T_RESULTS.RE_X_T      
-    DELTA_T_BOT      = BOT_T_RESULTS.DELTA_T      
-     
-    # transition location  
-    TR_CRIT_BOT      = RE_THETA_T_BOT - 1.174*(1 + 22400/RE_X_T_BOT)*RE_X_T_BOT**0.46  
-    CRITERION_BOT    = np.ma.masked_greater(TR_CRIT_BOT,0 )  
-    mask_count       = np.ma.count(CRITERION_BOT,axis = 0)  
-    mask_count[mask_count == npanel] = npanel-1 
-    transition_panel = list(mask_count.flatten()) 
-    aoas             = list(np.repeat(np.arange(ncases),ncpts))
-    res              = list(np.tile(np.arange(ncpts),ncases))
-        
-    X_TR_BOT          = X_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts)
-    DELTA_STAR_TR_BOT = DELTA_STAR_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts)
-    THETA_TR_BOT      = THETA_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts)    
-    DELTA_TR_BOT      = DELTA_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts) 
-    CF_TR_BOT         = CF_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts)
-    H_TR_BOT          = H_T_BOT[transition_panel,aoas,res].reshape(ncases,ncpts) 
-    TURBULENT_SURF    = L_BOT.data
-    TURBULENT_COORD   = np.ma.masked_less(X_BOT.data  - X_TR_BOT,0) 
-    
-    # turbulent boundary layer properties using heads method  
-    BOT_H_RESULTS     = heads_method(npanel,ncases,ncpts, DELTA_TR_BOT, THETA_TR_BOT , DELTA_STAR_TR_BOT, 
-                                         CF_TR_BOT, H_TR_BOT, RE_L_VALS, TURBULENT_COORD, VE_BOT, DVE_BOT, TURBULENT_SURF, tolerance)
-    
-    X_H_BOT          = BOT_H_RESULTS.X_H      
-    THETA_H_BOT      = BOT_H_RESULTS.THETA_H   
-    DELTA_STAR_H_BOT = BOT_H_RESULTS.DELTA_STAR_H
-    H_H_BOT          = BOT_H_RESULTS.H_H       
-    CF_H_BOT         = BOT_H_RESULTS.CF_H    
-    RE_THETA_H_BOT   = BOT_H_RESULTS.RE_THETA_H 
-    RE_X_H_BOT       = BOT_H_RESULTS.RE_X_H         
-    DELTA_H_BOT      = BOT_H_RESULTS.DELTA_H   
-    
-    # Apply Masks to surface vectors  
-    X_T_BOT          = np.ma.array(X_T_BOT , mask = CRITERION_BOT.mask)
-    THETA_T_BOT      = np.ma.array(THETA_T_BOT , mask = CRITERION_BOT.mask)   
-    DELTA_STAR_T_BOT = np.ma.array(DELTA_STAR_T_BOT , mask = CRITERION_BOT.mask)
-    H_T_BOT          = np.ma.array(H_T_BOT , mask = CRITERION_BOT.mask)       
-    CF_T_BOT         = np.ma.array(CF_T_BOT , mask = CRITERION_BOT.mask)      
-    RE_THETA_T_BOT   = np.ma.array(RE_THETA_T_BOT , mask = CRITERION_BOT.mask) 
-    RE_X_T_BOT       = np.ma.array(RE_X_T_BOT  , mask = CRITERION_BOT.mask)   
-    DELTA_T_BOT      = np.ma.array(DELTA_T_BOT , mask = CRITERION_BOT.mask)    
-                       
-    X_H_BOT          = np.ma.array(X_H_BOT , mask = ~CRITERION_BOT.mask)       
-    THETA_H_BOT      = np.ma.array(THETA_H_BOT , mask = ~CRITERION_BOT.mask)   
-    DELTA_STAR_H_BOT = np.ma.array(DELTA_STAR_H_BOT , mask = ~CRITERION_BOT.mask)
-    H_H_BOT          = np.ma.array(H_H_BOT  , mask = ~CRITERION_BOT.mask)      
-    CF_H_BOT         = np.ma.array(CF_H_BOT , mask = ~CRITERION_BOT.mask)  
-    RE_THETA_H_BOT   = np.ma.array(RE_THETA_H_BOT  , mask = ~CRITERION_BOT .mask)    
-    RE_X_H_BOT       = np.ma.array(RE_X_H_BOT  , mask = ~CRITERION_BOT .mask)        
-    DELTA_H_BOT      = np.ma.array(DELTA_H_BOT , mask = ~CRITERION_BOT.mask)   
-        
-    
-    # Concatenate vectors
-    X_H_BOT_MOD = X_H_BOT.data + X_TR_BOT.data
-    X_H_BOT_MOD = np.ma.array(X_H_BOT_MOD, mask = X_H_BOT.mask)
-    
-    X_BOT_SURF           = np.ma.concatenate([X_T_BOT, X_H_BOT_MOD], axis = 0 ) 
-    THETA_BOT_SURF       = np.ma.concatenate([THETA_T_BOT,THETA_H_BOT ], axis = 0)
-    DELTA_STAR_BOT_SURF  = np.ma.concatenate([DELTA_STAR_T_BOT,DELTA_STAR_H_BOT], axis = 0)
-    H_BOT_SURF           = np.ma.concatenate([H_T_BOT,H_H_BOT], axis = 0)
-    CF_BOT_SURF          = np.ma.concatenate([CF_T_BOT,CF_H_BOT], axis = 0)
-    RE_THETA_BOT_SURF    = np.ma.concatenate([RE_THETA_T_BOT,RE_THETA_H_BOT], axis = 0)
-    RE_X_BOT_SURF        = np.ma.concatenate([RE_X_T_BOT,RE_X_H_BOT], axis = 0)    
-    DELTA_BOT_SURF       = np.ma.concatenate([DELTA_T_BOT,DELTA_H_BOT], axis = 0) 
-    
-    # Flatten array to extract values 
-    X_BOT_SURF_1          = X_BOT_SURF.flatten('F')
-    THETA_BOT_SURF_1      = THETA_BOT_SURF.flatten('F') 
-    DELTA_STAR_BOT_SURF_1 = DELTA_STAR_BOT_SURF.flatten('F') 
-    H_BOT_SURF_1          = H_BOT_SURF.flatten('F')
-    CF_BOT_SURF_1         = CF_BOT_SURF.flatten('F')
-    RE_THETA_BOT_SURF_1   = RE_THETA_BOT_SURF.flatten('F') 
-    RE_X_BOT_SURF_1       = RE_X_BOT_SURF.flatten('F')
-    DELTA_BOT_SURF_1      = DELTA_BOT_SURF.flatten('F')  
-    
-    # Extract values that are not masked 
-    X_BOT_SURF_2           = X_BOT_SURF_1.data[~X_BOT_SURF_1.mask]
-    THETA_BOT_SURF_2       = THETA_BOT_SURF_1.data[~THETA_BOT_SURF_1.mask] 
-    DELTA_STAR_BOT_SURF_2  = DELTA_STAR_BOT_SURF_1.data[~DELTA_STAR_BOT_SURF_1.mask]
-    H_BOT_SURF_2           = H_BOT_SURF_1.data[~H_BOT_SURF_1.mask]
-    CF_BOT_SURF_2          = CF_BOT_SURF_1.data[~CF_BOT_SURF_1.mask]
-    RE_THETA_BOT_SURF_2    = RE_THETA_BOT_SURF_1.data[~RE_THETA_BOT_SURF_1.mask] 
-    RE_X_BOT_SURF_2        = RE_X_BOT_SURF_1.data[~RE_X_BOT_SURF_1.mask]
-    DELTA_BOT_SURF_2       = DELTA_BOT_SURF_1.data[~DELTA_BOT_SURF_1.mask]
-    
-    X_BOT_SURF           = X_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')   
-    THETA_BOT_SURF       = THETA_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    DELTA_STAR_BOT_SURF  = DELTA_STAR_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    H_BOT_SURF           = H_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')
-    CF_BOT_SURF          = CF_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')
-    RE_THETA_BOT_SURF    = RE_THETA_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    RE_X_BOT_SURF        = RE_X_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    DELTA_BOT_SURF       = DELTA_BOT_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')          
-    
     
     # ------------------------------------------------------------------------------------------------------
     # Top surface of airfoil 
@@ -275,121 +180,24 @@ def airfoil_analysis(airfoil_geometry,alpha,Re_L, batch_analysis = True, airfoil
     # x - location of stagnation point 
     L_TOP                          = X_TOP[-1,:,:]    
 
-    # laminar boundary layer properties using thwaites method 
-    TOP_T_RESULTS    = thwaites_method(npanel,ncases,ncpts, L_TOP , RE_L_VALS,X_TOP,VE_TOP, DVE_TOP,tolerance,
-                                     THETA_0=initial_momentum_thickness) 
-    X_T_TOP          = TOP_T_RESULTS.X_T      
-    THETA_T_TOP      = TOP_T_RESULTS.THETA_T     
-    DELTA_STAR_T_TOP = TOP_T_RESULTS.DELTA_STAR_T  
-    H_T_TOP          = TOP_T_RESULTS.H_T         
-    CF_T_TOP         = TOP_T_RESULTS.CF_T      
-    RE_THETA_T_TOP   = TOP_T_RESULTS.RE_THETA_T    
-    RE_X_T_TOP       = TOP_T_RESULTS.RE_X_T      
-    DELTA_T_TOP      = TOP_T_RESULTS.DELTA_T      
-
-    # transition location  
-    TR_CRIT_TOP       = RE_THETA_T_TOP - 1.174*(1 + 22400/RE_X_T_TOP)*(RE_X_T_TOP**0.46)  
-    CRITERION_TOP     = np.ma.masked_greater(TR_CRIT_TOP,0 ) 
-    mask_count        = np.ma.count(CRITERION_TOP,axis = 0)  
-    mask_count[mask_count == npanel] = npanel-1  
-    transition_panel  = list(mask_count.flatten()) 
-    aoas              = list(np.repeat(np.arange(ncases),ncpts))
-    res               = list(np.tile(np.arange(ncpts),ncases) )
-  
-    X_TR_TOP          = X_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)
-    DELTA_STAR_TR_TOP = DELTA_STAR_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)
-    THETA_TR_TOP      = THETA_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)    
-    DELTA_TR_TOP      = DELTA_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)
-    CF_TR_TOP         = CF_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)
-    H_TR_TOP          = H_T_TOP[transition_panel,aoas,res].reshape(ncases,ncpts)
-   
-    TURBULENT_SURF    = L_TOP.data
-    TURBULENT_COORD   = np.ma.masked_less( X_TOP.data  - X_TR_TOP,0)
-
-    # turbulent boundary layer properties using heads method  
-    TOP_H_RESULTS     = heads_method(npanel,ncases,ncpts, DELTA_TR_TOP, THETA_TR_TOP , DELTA_STAR_TR_TOP, 
-                                         CF_TR_TOP, H_TR_TOP, RE_L_VALS, TURBULENT_COORD, VE_TOP, DVE_TOP, TURBULENT_SURF, tolerance)
-
-    X_H_TOP          = TOP_H_RESULTS.X_H      
-    THETA_H_TOP      = TOP_H_RESULTS.THETA_H   
-    DELTA_STAR_H_TOP = TOP_H_RESULTS.DELTA_STAR_H
-    H_H_TOP          = TOP_H_RESULTS.H_H       
-    CF_H_TOP         = TOP_H_RESULTS.CF_H        
-    RE_THETA_H_TOP   = TOP_H_RESULTS.RE_THETA_H  
-    RE_X_H_TOP       = TOP_H_RESULTS.RE_X_H     
-    DELTA_H_TOP      = TOP_H_RESULTS.DELTA_H 
-    
-    # Apply Masks to surface vectors  
-    X_T_TOP          = np.ma.array(X_T_TOP , mask = CRITERION_TOP.mask)
-    THETA_T_TOP      = np.ma.array(THETA_T_TOP , mask = CRITERION_TOP.mask)   
-    DELTA_STAR_T_TOP = np.ma.array(DELTA_STAR_T_TOP , mask = CRITERION_TOP.mask)
-    H_T_TOP          = np.ma.array(H_T_TOP , mask = CRITERION_TOP.mask)       
-    CF_T_TOP         = np.ma.array(CF_T_TOP , mask = CRITERION_TOP.mask)      
-    RE_THETA_T_TOP   = np.ma.array(RE_THETA_T_TOP , mask = CRITERION_TOP.mask) 
-    RE_X_T_TOP       = np.ma.array(RE_X_T_TOP  , mask = CRITERION_TOP.mask)   
-    DELTA_T_TOP      = np.ma.array(DELTA_T_TOP , mask = CRITERION_TOP.mask)    
-                       
-    X_H_TOP          = np.ma.array(X_H_TOP , mask = ~CRITERION_TOP.mask)       
-    THETA_H_TOP      = np.ma.array(THETA_H_TOP , mask = ~CRITERION_TOP.mask)   
-    DELTA_STAR_H_TOP = np.ma.array(DELTA_STAR_H_TOP , mask = ~CRITERION_TOP.mask)
-    H_H_TOP          = np.ma.array(H_H_TOP  , mask = ~CRITERION_TOP.mask)      
-    CF_H_TOP         = np.ma.array(CF_H_TOP , mask = ~CRITERION_TOP.mask)    
-    RE_THETA_H_TOP   = np.ma.array(RE_THETA_H_TOP , mask = ~CRITERION_TOP.mask)    
-    RE_X_H_TOP       = np.ma.array(RE_X_H_TOP , mask = ~CRITERION_TOP.mask)    
-    DELTA_H_TOP      = np.ma.array(DELTA_H_TOP , mask = ~CRITERION_TOP.mask)   
-    
-    # Concatenate laminar and turbulent vectors
-    X_H_TOP_MOD          = X_H_TOP.data + X_TR_TOP.data
-    X_H_TOP_MOD          = np.ma.array(X_H_TOP_MOD, mask = X_H_TOP.mask)
-    
-    X_TOP_SURF           = np.ma.concatenate([X_T_TOP, X_H_TOP_MOD], axis = 0 ) 
-    THETA_TOP_SURF       = np.ma.concatenate([THETA_T_TOP,THETA_H_TOP ], axis = 0)
-    DELTA_STAR_TOP_SURF  = np.ma.concatenate([DELTA_STAR_T_TOP,DELTA_STAR_H_TOP], axis = 0)
-    H_TOP_SURF           = np.ma.concatenate([H_T_TOP,H_H_TOP], axis = 0)
-    CF_TOP_SURF          = np.ma.concatenate([CF_T_TOP,CF_H_TOP], axis = 0)
-    RE_THETA_TOP_SURF    = np.ma.concatenate([RE_THETA_T_TOP,RE_THETA_H_TOP], axis = 0)
-    RE_X_TOP_SURF        = np.ma.concatenate([RE_X_T_TOP,RE_X_H_TOP], axis = 0)
-    DELTA_TOP_SURF       = np.ma.concatenate([DELTA_T_TOP,DELTA_H_TOP], axis = 0) 
-    
-    # Flatten array to extract values 
-    X_TOP_SURF_1          = X_TOP_SURF.flatten('F')
-    THETA_TOP_SURF_1      = THETA_TOP_SURF.flatten('F') 
-    DELTA_STAR_TOP_SURF_1 = DELTA_STAR_TOP_SURF.flatten('F') 
-    H_TOP_SURF_1          = H_TOP_SURF.flatten('F')
-    CF_TOP_SURF_1         = CF_TOP_SURF.flatten('F')
-    RE_THETA_TOP_SURF_1   = RE_THETA_TOP_SURF.flatten('F') 
-    RE_X_TOP_SURF_1       = RE_X_TOP_SURF.flatten('F')
-    DELTA_TOP_SURF_1      = DELTA_TOP_SURF.flatten('F')  
-    
-    # Extract values that are not masked 
-    X_TOP_SURF_2           = X_TOP_SURF_1.data[~X_TOP_SURF_1.mask]
-    THETA_TOP_SURF_2       = THETA_TOP_SURF_1.data[~THETA_TOP_SURF_1.mask] 
-    DELTA_STAR_TOP_SURF_2  = DELTA_STAR_TOP_SURF_1.data[~DELTA_STAR_TOP_SURF_1.mask]
-    H_TOP_SURF_2           = H_TOP_SURF_1.data[~H_TOP_SURF_1.mask]
-    CF_TOP_SURF_2          = CF_TOP_SURF_1.data[~CF_TOP_SURF_1.mask]
-    RE_THETA_TOP_SURF_2    = RE_THETA_TOP_SURF_1.data[~RE_THETA_TOP_SURF_1.mask] 
-    RE_X_TOP_SURF_2        = RE_X_TOP_SURF_1.data[~RE_X_TOP_SURF_1.mask]
-    DELTA_TOP_SURF_2       = DELTA_TOP_SURF_1.data[~DELTA_TOP_SURF_1.mask]
-    
-    X_TOP_SURF           = X_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F') 
-    THETA_TOP_SURF       = THETA_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')   
-    DELTA_STAR_TOP_SURF  = DELTA_STAR_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F') 
-    H_TOP_SURF           = H_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')
-    CF_TOP_SURF          = CF_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')
-    RE_THETA_TOP_SURF    = RE_THETA_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    RE_X_TOP_SURF        = RE_X_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F')  
-    DELTA_TOP_SURF       = DELTA_TOP_SURF_2.reshape((npanel,ncases,ncpts),order = 'F') 
+    # ------------------------------------------------------------------------------------------------------
+    # boundary layers of both surfaces, marched at once and switching to the turbulent model at transition
+    # ------------------------------------------------------------------------------------------------------ 
+    BL_RESULTS = boundary_layer_march(npanel,2*ncases,ncpts,np.ma.concatenate([L_BOT,L_TOP],axis = 0),np.tile(RE_L_VALS,(2,1)),
+                                      np.ma.concatenate([X_BOT,X_TOP],axis = 1),np.ma.concatenate([VE_BOT,VE_TOP],axis = 1),
+                                      np.ma.concatenate([DVE_BOT,DVE_TOP],axis = 1),tolerance,THETA_0=initial_momentum_thickness)
+    BOT,TOP    = slice(0,ncases),slice(ncases,2*ncases)
     
     # ------------------------------------------------------------------------------------------------------
     # concatenate lower and upper surfaces   
     # ------------------------------------------------------------------------------------------------------ 
-    THETA      = concatenate_surfaces(X_BOT,X_TOP,THETA_BOT_SURF,THETA_TOP_SURF,npanel,ncases,ncpts)
-    DELTA_STAR = concatenate_surfaces(X_BOT,X_TOP,DELTA_STAR_BOT_SURF,DELTA_STAR_TOP_SURF,npanel,ncases,ncpts) 
-    H          = concatenate_surfaces(X_BOT,X_TOP,H_BOT_SURF,H_TOP_SURF,npanel,ncases,ncpts)  
-    CF         = concatenate_surfaces(X_BOT,X_TOP,CF_BOT_SURF,CF_TOP_SURF,npanel,ncases,ncpts) 
-    RE_THETA   = concatenate_surfaces(X_BOT,X_TOP,RE_THETA_BOT_SURF,RE_THETA_TOP_SURF,npanel,ncases,ncpts)  
-    RE_X       = concatenate_surfaces(X_BOT,X_TOP,RE_X_BOT_SURF,RE_X_TOP_SURF,npanel,ncases,ncpts) 
-    DELTA      = concatenate_surfaces(X_BOT,X_TOP,DELTA_BOT_SURF,DELTA_TOP_SURF,npanel,ncases,ncpts)   
+    THETA      = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.THETA[:,BOT],BL_RESULTS.THETA[:,TOP],npanel,ncases,ncpts)
+    DELTA_STAR = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.DELTA_STAR[:,BOT],BL_RESULTS.DELTA_STAR[:,TOP],npanel,ncases,ncpts) 
+    H          = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.H[:,BOT],BL_RESULTS.H[:,TOP],npanel,ncases,ncpts)  
+    CF         = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.CF[:,BOT],BL_RESULTS.CF[:,TOP],npanel,ncases,ncpts) 
+    RE_THETA   = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.RE_THETA[:,BOT],BL_RESULTS.RE_THETA[:,TOP],npanel,ncases,ncpts)  
+    RE_X       = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.RE_X[:,BOT],BL_RESULTS.RE_X[:,TOP],npanel,ncases,ncpts) 
+    DELTA      = concatenate_surfaces(X_BOT,X_TOP,BL_RESULTS.DELTA[:,BOT],BL_RESULTS.DELTA[:,TOP],npanel,ncases,ncpts)   
      
     VE_VALS    = np.ma.concatenate([np.flip(VE_BOT,axis = 0),VE_TOP ], axis = 0)
     DVE_VALS   = np.ma.concatenate([np.flip(DVE_BOT,axis = 0),DVE_TOP], axis = 0)    
@@ -517,10 +325,15 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Returns:                                           
         FUNC           (numpy.ndarray): airfoil property in user specified discretization on entire surface of airfoil [multiple units] 
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))   
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
+    # the unmasked bottom stations in reverse followed by the unmasked top stations of every case
+    BOT_STATIONS = surface_stations(np.ma.getmaskarray(X_BOT))
+    TOP_STATIONS = surface_stations(np.ma.getmaskarray(X_TOP))
+    bot_func     = gather_stations(BOT_STATIONS,FUNC_BOT_SURF,0.)
+    top_func     = gather_stations(TOP_STATIONS,FUNC_TOP_SURF,0.)
+    n_bot        = BOT_STATIONS.n[None,:]
+    panel        = np.arange(npanel)[:,None]
+    bot_idx      = np.clip(n_bot - 1 - panel,0,npanel-1)
+    top_idx      = np.clip(panel - n_bot,0,npanel-1)
+    FUNC         = np.where(panel < n_bot,np.take_along_axis(bot_func,bot_idx,axis = 0),np.take_along_axis(top_func,top_idx,axis = 0))
+    FUNC         = FUNC.reshape(npanel,ncases,ncpts)
     return FUNC
@@ -0,0 +1,184 @@
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/boundary_layer_march.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+from .surface_stations     import surface_stations, gather_stations, place_stations
+from .thwaites_method      import replace_unconverged, getH as thwaites_getH, getcf as thwaites_getcf
+from .heads_method         import RK4, getH as heads_getH
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# boundary_layer_march
+# ----------------------------------------------------------------------------------------------------------------------
+def boundary_layer_march(npanel,ncases,ncpts,L,RE_L,X_I,VE_I,DVE_I,tol,THETA_0):
+    """ Marches the boundary layer of every case along the surface in a single pass, using Thwaites' method up to
+    the transition of the case and Head's method downstream of it. The laminar solution is only used up to the
+    transition station and the turbulent solution is only computed from it.
+
+    Source:
+        Thwaites, Bryan. "Approximate calculation of the laminar boundary layer."
+        Aeronautical Quarterly 1.3 (1949): 245-280.
+
+        Head, M. R., and P. Bandyopadhyay. "New aspects of turbulent boundary-layer structure."
+        Journal of fluid mechanics 107 (1981): 297-338.
+
+    Assumptions:
+        Michel criteria used for transition, the first station of a case that meets it is turbulent
+        The slope of Thwaites' equation does not depend on the momentum thickness, so its Runge-Kutta steps reduce
+        to a cumulative sum along the surface
+        The turbulent state of a station only depends on the previous station, so Head's method is evaluated once
+        per station
+
+    Args:
+       npanel                   (int): number of points on surface                                                 [unitless]
+       ncases                   (int): number of cases (angle of attacks)                                          [unitless]
+       ncpts                    (int): number of control points (reynolds numbers)                                 [unitless]
+       L              (numpy.ndarray): normalized length of surface                                                [unitless]
+       RE_L           (numpy.ndarray): Reynolds number                                                             [unitless]
+       X_I            (numpy.ndarray): x coordinate on surface of airfoil                                          [unitless]
+       VE_I           (numpy.ndarray): boundary layer velocity at all panels                                       [m/s]
+       DVE_I          (numpy.ndarray): derivative of boundary layer velocity at all panels                         [m/s-m]
+       tol                    (float): boundary layer error correction tolerance                                   [unitless]
+       THETA_0                (float): initial momentum thickness                                                  [m]
+
+    Returns:
+        RESULTS.X          (numpy.ndarray): distance along airfoil surface                                         [unitless]
+        RESULTS.THETA      (numpy.ndarray): momentum thickness                                                     [m]
+        RESULTS.DELTA_STAR (numpy.ndarray): displacement thickness                                                 [m]
+        RESULTS.H          (numpy.ndarray): shape factor                                                           [unitless]
+        RESULTS.CF         (numpy.ndarray): friction coefficient                                                   [unitless]
+        RESULTS.RE_THETA   (numpy.ndarray): Reynolds number as a function of momentum thickness                    [unitless]
+        RESULTS.RE_X       (numpy.ndarray): Reynolds number as a function of distance                              [unitless]
+        RESULTS.DELTA      (numpy.ndarray): boundary layer thickness                                               [m]
+        RESULTS.X_TR       (numpy.ndarray): distance of the transition along the surface, the length of the        [unitless]
+                                            surface if the boundary layer stays laminar
+    """
+    # order the stations of every case first along the surface to march all cases at once
+    shape          = (npanel,ncases,ncpts)
+    STATIONS       = surface_stations(np.ma.getmaskarray(X_I))
+    valid          = STATIONS.valid
+    n              = STATIONS.n
+    x_i            = gather_stations(STATIONS,X_I,None)
+    Ve_i           = gather_stations(surface_stations(np.ma.getmaskarray(VE_I)),VE_I,1.)
+    dVe_i          = gather_stations(surface_stations(np.ma.getmaskarray(DVE_I)),DVE_I,0.)
+    L              = np.ma.getdata(L)
+    nu             = (L/RE_L).reshape(-1)
+    Re_L           = np.broadcast_to(RE_L,L.shape).reshape(-1)
+    l              = L.reshape(-1)
+    turbulent      = l != 0.0
+    l              = np.where(turbulent,l,1.)
+    dx_i           = np.diff(x_i,axis = 0)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # laminar boundary layer using Thwaites' method
+    # ------------------------------------------------------------------------------------------------------------------
+    # (Theta**2)*(Ve**6) integrated along the surface, masked stations hold the last value of their case
+    theta2_Ve6     = np.empty_like(x_i)
+    theta2_Ve6[0]  = (THETA_0**2)*Ve_i[0]**6
+    theta2_Ve6[1:] = 0.45*nu*(Ve_i[:-1]**5)*dx_i
+    np.cumsum(theta2_Ve6,axis = 0,out = theta2_Ve6)
+
+    # momentum thickness, values that do not converge are replaced with their neighbor
+    Theta          = np.sqrt(theta2_Ve6/Ve_i**6)
+    Theta          = replace_unconverged(Theta,valid,tol)
+
+    # Thwaites separation criteria and shape factor
+    lambda_val     = Theta**2*dVe_i/nu
+    H              = thwaites_getH(lambda_val)
+    H[H<0]         = 1E-6
+    H              = replace_unconverged(H,valid,tol)
+
+    # Reynolds numbers, skin friction and thicknesses
+    Re_theta       = Ve_i*Theta/nu
+    Re_x           = Ve_i*x_i/nu
+    cf             = abs(thwaites_getcf(lambda_val,Re_theta))
+    delta_star     = H*Theta
+    delta          = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]       = 0
+    Re_x[0]        = 1E-5
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # transition
+    # ------------------------------------------------------------------------------------------------------------------
+    # the first station of every case past the Michel criteria, n if the case stays laminar
+    tr_crit        = Re_theta - 1.174*(1 + 22400/Re_x)*Re_x**0.46
+    transition     = (tr_crit > 0)*valid
+    k              = np.where(np.any(transition,axis = 0),np.argmax(transition,axis = 0),n)
+    columns        = np.arange(len(n))
+    x_tr           = x_i[np.minimum(k,n-1),columns]
+    X_TR           = np.where(k < n,x_tr,x_i[n-1,columns])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # turbulent boundary layer using Head's method
+    # ------------------------------------------------------------------------------------------------------------------
+    # the turbulent state starts from the laminar state at the transition station and overwrites the laminar
+    # solution downstream of it
+    march          = np.flatnonzero((k < n)*turbulent)
+    k_m            = k[march]
+    n_m            = n[march]
+    H1             = np.zeros_like(x_i)
+    VeThetaH1      = np.zeros_like(x_i)
+    H1_0           = (delta[k_m,march] - delta_star[k_m,march])/Theta[k_m,march]
+    H1[k_m,march]  = np.where(H1_0 < 3.3,3.417285,H1_0)
+    VeThetaH1[k_m,march] = Ve_i[k_m,march]*Theta[k_m,march]*H1[k_m,march]
+
+    nmax = np.max(n_m) if len(march) else 0
+    for i in range(1,nmax):
+        # the cases that are turbulent upstream of this station and still have stations to march
+        active = march[(k_m < i)*(i < n_m)]
+        if len(active) == 0:
+            continue
+        Ve_0   = Ve_i[i-1:i,active]
+        dVe_0  = dVe_i[i-1:i,active]
+        H_0    = H[i-1:i,active]
+        cf_0   = cf[i-1:i,active]
+
+        def dTheta_by_dx(index, X, THETA, VETHETAH1):
+            return 0.5*cf_0[index] - (THETA/Ve_0[index])*(2+H_0[index])*(dVe_0[index])
+
+        def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
+            return Ve_0[index]*0.0306*(((VETHETAH1/(Ve_0[index]*THETA))-3)**-0.6169)
+
+        Theta_i, VeThetaH1_i = RK4(0,dx_i[i-1:i,active],x_i[i-1:i,active],Theta[i-1:i,active],VeThetaH1[i-1:i,active],
+                                   dTheta_by_dx,dVeThetaH1_by_dx)
+        VeThetaH1_i          = np.where(np.isnan(VeThetaH1_i),VeThetaH1[i-1,active],VeThetaH1_i)
+        Theta[i,active]      = Theta_i
+        VeThetaH1[i,active]  = VeThetaH1_i
+        H1[i,active]         = VeThetaH1_i/(Ve_i[i,active]*Theta_i)
+        H[i,active]          = heads_getH(H1[i,active])
+        cf[i,active]         = 0.246*(10**(-0.678*H[i,active]))*(((Re_L[active]/l[active])*Ve_i[i,active]*Theta_i)**-0.268)
+
+    # turbulent properties downstream of the transition, cases without a turbulent surface have none
+    stations             = np.arange(npanel)[:,None]
+    downstream           = (stations >= k[None,:])*valid
+    x_t                  = x_i - x_tr[None,:]
+    Theta                = np.where(downstream*~turbulent,0.,Theta)
+    H                    = np.where(downstream*~turbulent,0.,H)
+    cf                   = np.where(downstream*~turbulent,0.,cf)
+    delta_star           = np.where(downstream,H*Theta,delta_star)
+    Re_theta             = np.where(downstream,(Re_L/l)*Ve_i*Theta,Re_theta)
+    Re_x                 = np.where(downstream,(Ve_i*x_t)/(l/Re_L)*turbulent,Re_x)
+    delta                = np.where(downstream,(Theta*H1) + delta_star,delta)
+
+    # Store results at the unmasked stations
+    RESULTS = Data(
+        X          = place_stations(STATIONS,x_i,shape),
+        THETA      = place_stations(STATIONS,Theta,shape),
+        DELTA_STAR = place_stations(STATIONS,delta_star,shape),
+        H          = place_stations(STATIONS,H,shape),
+        CF         = place_stations(STATIONS,cf,shape),
+        RE_THETA   = place_stations(STATIONS,Re_theta,shape),
+        RE_X       = place_stations(STATIONS,Re_x,shape),
+        DELTA      = place_stations(STATIONS,delta,shape),
+        X_TR       = X_TR.reshape(ncases,ncpts),
+    )
+
+    return RESULTS
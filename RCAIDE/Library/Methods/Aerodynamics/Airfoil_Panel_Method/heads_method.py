@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports    
 from RCAIDE.Framework.Core import Data 
+from .surface_stations     import surface_stations, gather_stations, place_stations
 
 # package imports  
 import numpy as np 
@@ -69,125 +70,107 @@ def heads_method(npanel: int,
         RESULTS.RE_X_H       (numpy.ndarray): Reynolds number as a function of distance           [unitless]
         RESULTS.DELTA_H      (numpy.ndarray): boundary layer thickness                            [m] 
     """    
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)      
+    # order the stations of every case first along the surface to march all cases at once, cases without
+    # a turbulent surface have no stations
+    shape          = (npanel,ncases,ncpts)
+    l              = np.ma.getdata(TURBULENT_SURF).reshape(-1)
+    turbulent      = l != 0.0
+    STATIONS       = surface_stations(np.ma.getmaskarray(TURBULENT_COORD) | ~turbulent.reshape(1,ncases,ncpts))
+    n              = STATIONS.n
+    x_i            = gather_stations(STATIONS,TURBULENT_COORD,None)
+    Ve_i           = gather_stations(STATIONS,VE_I,1.)
+    dVe_i          = gather_stations(STATIONS,DVE_I,0.)
+    l              = np.where(turbulent,l,1.)
+    Re_L           = RE_L.reshape(-1)
+    nu             = l/Re_L 
+    dx             = np.diff(x_i,axis = 0) 
     
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of turbulent surface
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                def getcf(ind, H, THETA):
-                    ReTheta = (Re_L/l)*Ve_i[ind]*THETA
-                    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268)
-                    return cf_var 
-
-                def getH(H1_var):
-                    if H1_var < 3.3:
-                        H_var = 3.0
-                    elif H1_var < 5.39142:
-                        H_var = 0.6778 + 1.153793*(H1_var-3.3)**-0.32637
-                    elif H1_var >= 5.39142:
-                        H_var = 1.1 + 0.8598636*(H1_var - 3.3)**-0.777
-                    return H_var 
-             
-                # define RK4 slope function for Theta
-                def dTheta_by_dx(index, X, THETA, VETHETAH1):
-                    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
-                
-                # define RK4 slope function for VeThetaH1
-                def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
-                    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
-                
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L 
-                n            = len(x_i)
-                dx           = np.diff(x_i) 
-                H            = np.zeros(n) 
-                H[0]         = ShapeFactor_0[case,cpt]
-                Theta        = np.zeros(n)
-                Theta[0]     = THETA_0[case,cpt]
-                H1           = np.zeros(n) 
-                H1[0]        = (DEL_0[case,cpt] - DELTA_STAR_0[case,cpt])/THETA_0[case,cpt]
-                if H1[0] < 3.3:
-                    H1[0] = 3.417285
-                
-                cf           = np.zeros(n)
-                cf[0]        = CF_0[case,cpt] 
-                VeThetaH1    = np.zeros(n)
-                VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
-                
-                for i in range(1, n):
-                    # initialise the variable values at the current grid point using previous grid points (to define the error functions)
-                    H_er     = H[i-1]
-                    cf_er    = cf[i-1]
-                    H1_er    = H1[i-1]
-                    Theta_er = Theta[i-1]
-                    
-                    # assign previous grid point values of H and Cf to start RK4
-                    H[i]  = H[i-1]
-                    cf[i] = cf[i-1]
-                    
-                    #assume some error values
-                    erH = erH1 = erTheta = ercf = ERR_0
-                    
-                    # iterate to get the variables at the grid point
-
-                    while any(error > TOL for error in [erH, erH1, erTheta, ercf]):
-                        
-                        # get Theta and VeThetaH1
-                        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
-                        if np.isnan(VeThetaH1[i]):
-                            VeThetaH1[i] = VeThetaH1[i-1]
-                       
-                        # get H1
-                        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
-                        
-                        # get H
-                        H[i] = getH(H1[i])
-                        
-                        # get skin friction
-                        cf[i] = getcf(i, H[i], Theta[i])
-                        
-                        # define errors
-                        erH     = (H[i]-H_er)/H[i]
-                        erH1    = (H1[i]-H1_er)/H1[i]
-                        erTheta = (Theta[i]-Theta_er)/Theta[i]
-                        ercf    = (cf[i]-cf_er)/cf[i]
-                        
-                        # assign current iteration variable values to the Var_er
-                        H_er     = H[i]
-                        H1_er    = H1[i]
-                        Theta_er = Theta[i]
-                        cf_er    = cf[i]
-                
-                
-                delta_star   = H*Theta
-                Re_theta     = (Re_L/l)*Ve_i*Theta
-                Re_x         = (Ve_i*x_i)/nu
-                delta        = (Theta*H1) + delta_star
-                
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,Theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,delta_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta)
+    def getcf(ind, H, THETA):
+        ReTheta = (Re_L/l)*Ve_i[ind]*THETA
+        cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268)
+        return cf_var 
+ 
+    # define RK4 slope function for Theta
+    def dTheta_by_dx(index, X, THETA, VETHETAH1):
+        return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
+    
+    # define RK4 slope function for VeThetaH1
+    def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
+        return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
+    
+    H            = np.zeros_like(x_i) 
+    H[0]         = ShapeFactor_0.reshape(-1)
+    Theta        = np.zeros_like(x_i)
+    Theta[0]     = THETA_0.reshape(-1)
+    H1           = np.zeros_like(x_i) 
+    H1[0]        = ((DEL_0 - DELTA_STAR_0)/THETA_0).reshape(-1)
+    H1[0]        = np.where(H1[0] < 3.3,3.417285,H1[0])
+    cf           = np.zeros_like(x_i)
+    cf[0]        = CF_0.reshape(-1)
+    VeThetaH1    = np.zeros_like(x_i)
+    VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
+    
+    for i in range(1, len(x_i)):
+        # initialise the variable values at the current grid point using previous grid points (to define the error functions)
+        H_er     = H[i-1]
+        cf_er    = cf[i-1]
+        H1_er    = H1[i-1]
+        Theta_er = Theta[i-1]
+        
+        # assign previous grid point values of H and Cf to start RK4
+        H[i]  = H[i-1]
+        cf[i] = cf[i-1]
+        
+        #assume some error values
+        erH = erH1 = erTheta = ercf = np.full_like(H_er,ERR_0)
+        
+        # iterate to get the variables at the grid point of every case that has not converged 
+        iterate = (i < n)*(ERR_0 > TOL)
+        while np.any(iterate):
+            
+            # get Theta and VeThetaH1
+            Theta_i, VeThetaH1_i = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
+            VeThetaH1_i          = np.where(np.isnan(VeThetaH1_i),VeThetaH1[i-1],VeThetaH1_i)
+            Theta[i]             = np.where(iterate,Theta_i,Theta[i])
+            VeThetaH1[i]         = np.where(iterate,VeThetaH1_i,VeThetaH1[i])
+           
+            # get H1
+            H1[i] = np.where(iterate,VeThetaH1[i]/(Ve_i[i]*Theta[i]),H1[i])
+            
+            # get H
+            H[i] = np.where(iterate,getH(H1[i]),H[i])
+            
+            # get skin friction
+            cf[i] = np.where(iterate,getcf(i, H[i], Theta[i]),cf[i])
+            
+            # define errors
+            erH     = np.where(iterate,(H[i]-H_er)/H[i],erH)
+            erH1    = np.where(iterate,(H1[i]-H1_er)/H1[i],erH1)
+            erTheta = np.where(iterate,(Theta[i]-Theta_er)/Theta[i],erTheta)
+            ercf    = np.where(iterate,(cf[i]-cf_er)/cf[i],ercf)
+            
+            # assign current iteration variable values to the Var_er
+            H_er     = H[i].copy()
+            H1_er    = H1[i].copy()
+            Theta_er = Theta[i].copy()
+            cf_er    = cf[i].copy()
+            
+            iterate  = iterate*((erH > TOL) | (erH1 > TOL) | (erTheta > TOL) | (ercf > TOL))
+    
+    delta_star   = H*Theta
+    Re_theta     = (Re_L/l)*Ve_i*Theta
+    Re_x         = (Ve_i*x_i)/nu
+    delta        = (Theta*H1) + delta_star
+    
+    # Store results at the unmasked stations
+    X_H          = place_stations(STATIONS,x_i,shape)
+    THETA_H      = place_stations(STATIONS,Theta,shape)
+    DELTA_STAR_H = place_stations(STATIONS,delta_star,shape)
+    H_H          = place_stations(STATIONS,H,shape)
+    CF_H         = place_stations(STATIONS,cf,shape)
+    RE_THETA_H   = place_stations(STATIONS,Re_theta,shape)
+    RE_X_H       = place_stations(STATIONS,Re_x,shape)
+    DELTA_H      = place_stations(STATIONS,delta,shape)
 
     RESULTS = Data(
             X_H          = X_H,      
@@ -203,6 +186,30 @@ def heads_method(npanel: int,
     return  RESULTS
 
 
+def getH(H1_var):
+    """ Computes the shape factor, H, from the shape factor of the entrainment, H1
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args: 
+        H1_var (numpy.ndarray): shape factor of the entrainment [unitless]
+
+    Returns:  
+        H_var  (numpy.ndarray): shape factor                    [unitless] 
+    """       
+    H_var       = np.full_like(H1_var,np.nan)
+    idx1        = H1_var < 3.3
+    idx2        = (H1_var >= 3.3)*(H1_var < 5.39142)
+    idx3        = H1_var >= 5.39142
+    H_var[idx1] = 3.0
+    H_var[idx2] = 0.6778 + 1.153793*(H1_var[idx2]-3.3)**-0.32637
+    H_var[idx3] = 1.1 + 0.8598636*(H1_var[idx3] - 3.3)**-0.777
+    return H_var 
+
 def RK4(ind, dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
     """4th Order Runge Kutta integration        
 
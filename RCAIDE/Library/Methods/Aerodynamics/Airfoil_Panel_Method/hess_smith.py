@@ -13,6 +13,7 @@ from .velocity_distribution import velocity_distribution
 
 # package imports  
 import numpy as np  
+from scipy.linalg import lu_factor, lu_solve
  
 # ----------------------------------------------------------------------------------------------------------------------
 # hess_smith
@@ -32,6 +33,9 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
         alpha    (numpy.ndarray):  Angle of attack                         [radians] 
         Re       (numpy.ndarray):  Reynold's number                        [radians] 
         npanel             (int):  Number of panels on the airfoil.        [unitess]  
+        
+        A case axis of the coordinates of length one shares the geometry between all cases on that axis, its 
+        matrix of influence coefficients is then factorized once for the angles of attack of all these cases.
                                                                            
     Outputs                                                                   
         xbar    (numpy.ndarray):  Vector of x coordinates of the surface nodes    [unitless]           
@@ -41,13 +45,14 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     """       
     ncases    = len(alpha[0,:])
     ncpts     = len(Re) 
+    ngeo      = np.shape(x_coord)[1:] # cases of the geometry, each either one or all of the cases 
     alpha_2d  = np.repeat(alpha.T[np.newaxis,:, :], npanel, axis=0) 
     
     # generate panel geometry data for later use   
     l,st,ct,xbar,ybar,norm = panel_geometry(x_coord,y_coord,npanel,ncases,ncpts) 
     
     # compute matrix of aerodynamic influence coefficients
-    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ncases,ncpts) # ncases x ncpts x npanel+1 x npanel+1 
+    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ngeo[0],ngeo[1]) # ngeo x npanel+1 x npanel+1 
     
     # compute right hand side vector for the specified angle of attack 
     b_2d          = np.zeros((npanel+1,ncases, ncpts))
@@ -55,10 +60,20 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
       
     # solve matrix system for vector of q_i and gamma  
-    qg_T          = np.linalg.solve(ainfl,np.swapaxes(b_2d.T,0,1))
-    qg            = np.swapaxes(qg_T.T,1,2) 
+    if ngeo == (ncases,ncpts):
+        qg_T      = np.linalg.solve(ainfl,np.swapaxes(b_2d.T,0,1))
+        qg        = np.swapaxes(qg_T.T,1,2) 
+    else:
+        # factorize the matrix of each geometry once and back substitute the right hand sides of all its cases 
+        qg        = np.zeros_like(b_2d)
+        for case,cpt in np.ndindex(ngeo):
+            cases     = (slice(None),slice(None) if ngeo[0] == 1 else case,slice(None) if ngeo[1] == 1 else cpt)
+            b_cases   = b_2d[cases]
+            qg[cases] = lu_solve(lu_factor(ainfl[case,cpt],check_finite=False),b_cases.reshape(npanel+1,-1),check_finite=False).reshape(b_cases.shape)
     
     # compute the tangential velocity distribution at the midpoint of panels 
     vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts)
+    xbar          = np.broadcast_to(xbar,vt.shape).copy()
+    ybar          = np.broadcast_to(ybar,vt.shape).copy()
     
     return  xbar,ybar,vt,norm 
\ No newline at end of file
@@ -0,0 +1,90 @@
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/surface_stations.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# surface_stations
+# ----------------------------------------------------------------------------------------------------------------------
+def surface_stations(MASK):
+    """Orders the unmasked stations of every case first along the surface so that the boundary layer of all cases
+    can be marched at once. Each case keeps the order of its own stations, the masked stations follow them.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        MASK (numpy.ndarray): mask of the stations on the surface, (npanel,ncases,ncpts)                 [boolean]
+
+    Returns:
+        STATIONS.order (numpy.ndarray): panel index of every ordered station, (npanel,ncases*ncpts)    [unitless]
+        STATIONS.n     (numpy.ndarray): number of unmasked stations of every case, (ncases*ncpts)      [unitless]
+        STATIONS.valid (numpy.ndarray): true where an ordered station is unmasked, (npanel,ncases*ncpts) [boolean]
+    """
+    npanel   = MASK.shape[0]
+    MASK     = MASK.reshape(npanel,-1)
+    STATIONS = Data(
+        order = np.argsort(MASK,axis = 0,kind = 'stable'),
+        n     = np.count_nonzero(~MASK,axis = 0),
+        )
+    STATIONS.valid = np.arange(npanel)[:,None] < STATIONS.n[None,:]
+    return STATIONS
+
+def gather_stations(STATIONS,FUNC,fill):
+    """Orders the values of a surface property like the stations of every case. Masked stations take the
+    value of the last unmasked station of their case, or fill if the case has none.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        STATIONS       (Data): ordered stations, see surface_stations                         [-]
+        FUNC  (numpy.ndarray): property on the surface, (npanel,ncases,ncpts)                 [multiple units]
+        fill          (float): value of the masked stations, None to hold the last unmasked value [multiple units]
+
+    Returns:
+        FUNC  (numpy.ndarray): property at the ordered stations, (npanel,ncases*ncpts)        [multiple units]
+    """
+    FUNC  = np.take_along_axis(np.ma.getdata(FUNC).reshape(len(STATIONS.order),-1),STATIONS.order,axis = 0)
+    if fill is None:
+        last = np.take_along_axis(FUNC,np.maximum(STATIONS.n - 1,0)[None,:],axis = 0)
+        FUNC = np.where(STATIONS.valid,FUNC,last)
+    else:
+        FUNC = np.where(STATIONS.valid,FUNC,fill)
+    return FUNC
+
+def place_stations(STATIONS,FUNC,shape):
+    """Puts the values at the ordered stations back on the surface. Masked stations are zero.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        STATIONS      (Data): ordered stations, see surface_stations                  [-]
+        FUNC (numpy.ndarray): property at the ordered stations, (npanel,ncases*ncpts) [multiple units]
+        shape        (tuple): shape of the surface, (npanel,ncases,ncpts)             [unitless]
+
+    Returns:
+        SURF (numpy.ndarray): property on the surface, (npanel,ncases,ncpts)          [multiple units]
+    """
+    SURF = np.zeros_like(FUNC)
+    np.put_along_axis(SURF,STATIONS.order,np.where(STATIONS.valid,FUNC,0),axis = 0)
+    return SURF.reshape(shape)
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Data 
+from .surface_stations     import surface_stations, gather_stations, place_stations
 
 # package imports  
 import numpy as np
@@ -48,86 +49,70 @@ def thwaites_method(npanel,ncases,nRe,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
         RESULTS.RE_X_T       (numpy.ndarray): Reynolds number as a function of distance                            [unitless]
         RESULTS.DELTA_T      (numpy.ndarray): boundary layer thickness                                             [m]  
     """ 
-    # Initialize vectors
-    X_T          = np.zeros((npanel,ncases,nRe))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(nRe): 
-            def dy_by_dx(index, X, Y):
-                return 0.45*nu*Ve_i[index]**5  
-            l              = L[case,cpt]
-            theta_0        = THETA_0 
-            Re_L           = RE_L[case,cpt]
-            nu             = l/Re_L    
-            x_i            = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i           = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i          = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False]
-            n              = len(x_i)
-            dx_i           = np.diff(x_i)
-            theta2_Ve6     = np.zeros(n)
-            theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
-            
-            # determine (Theta**2)*(Ve**6)
-            for i in range(1,n):
-                theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
-            
-            # Compute momentum thickness
-            theta       = np.sqrt(theta2_Ve6/Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-                
-            # Thwaites separation criteria 
-            lambda_val  = theta**2*dVe_i/nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) > tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i*theta/nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i*x_i/nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val, Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # order the stations of every case first along the surface to march all cases at once
+    shape          = (npanel,ncases,nRe)
+    STATIONS       = surface_stations(np.ma.getmaskarray(X_I))
+    valid          = STATIONS.valid
+    x_i            = gather_stations(STATIONS,X_I,None)
+    Ve_i           = gather_stations(surface_stations(np.ma.getmaskarray(VE_I)),VE_I,1.)
+    dVe_i          = gather_stations(surface_stations(np.ma.getmaskarray(DVE_I)),DVE_I,0.)
+    nu             = (np.ma.getdata(L)/RE_L).reshape(-1)
+    dx_i           = np.diff(x_i,axis = 0)
+    
+    def dy_by_dx(index, X, Y):
+        return 0.45*nu*Ve_i[index]**5
+    
+    theta2_Ve6     = np.zeros_like(x_i)
+    theta2_Ve6[0]  = (THETA_0**2)*Ve_i[0]**6
+    
+    # determine (Theta**2)*(Ve**6), masked stations hold the last value of their case
+    for i in range(1,len(x_i)):
+        theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
+    
+    # Compute momentum thickness
+    theta       = np.sqrt(theta2_Ve6/Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta       = replace_unconverged(theta,valid,tol)
+        
+    # Thwaites separation criteria 
+    lambda_val  = theta**2*dVe_i/nu 
+    
+    # Compute H 
+    H           = getH(lambda_val)
+    H[H<0]      = 1E-6   # H cannot be negative 
+    
+    # find H values that do not converge and replace them with neighbor
+    H           = replace_unconverged(H,valid,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta    = Ve_i*theta/nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x        = Ve_i*x_i/nu
+    
+    # Compute skin friction 
+    cf          = abs(getcf(lambda_val, Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star    = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
+    
+    # Store results at the unmasked stations
+    X_T          = place_stations(STATIONS,x_i,shape)
+    THETA_T      = place_stations(STATIONS,theta,shape)
+    DELTA_STAR_T = place_stations(STATIONS,del_star,shape)
+    H_T          = place_stations(STATIONS,H,shape)
+    CF_T         = place_stations(STATIONS,cf,shape)
+    RE_THETA_T   = place_stations(STATIONS,Re_theta,shape)
+    RE_X_T       = place_stations(STATIONS,Re_x,shape)
+    DELTA_T      = place_stations(STATIONS,delta,shape)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -142,6 +127,29 @@ def thwaites_method(npanel,ncases,nRe,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     
     return RESULTS 
 
+def replace_unconverged(FUNC,valid,tol): 
+    """ Replaces the values of a case that change by more than the tolerance from their upstream neighbor 
+    with that neighbor, if the case has more than one of them 
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args: 
+        FUNC  (numpy.ndarray): boundary layer property at the ordered stations [multiple units]
+        valid (numpy.ndarray): true where an ordered station is unmasked       [boolean]
+        tol           (float): boundary layer error correction tolerance       [unitless]
+
+    Returns:  
+        FUNC  (numpy.ndarray): boundary layer property at the ordered stations [multiple units]
+    """     
+    unconverged = (abs((FUNC[1:] - FUNC[:-1])/FUNC[:-1]) > tol)*valid[1:]
+    replace     = unconverged*(np.count_nonzero(unconverged,axis = 0) > 1)
+    FUNC[1:]    = np.where(replace,FUNC[:-1],FUNC[1:])
+    return FUNC
+
 def getH(lambda_val): 
     """ Computes the shape factor, H
 
@@ -37,10 +37,8 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     """   
     # flow tangency boundary condition - source distribution  
     vt_2d = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
-    gamma = np.repeat(qg[-1,:,:][np.newaxis,:,:],npanel, axis = 0)  
     
     # convert 1d matrices to 2d 
-    qg_2d                = np.repeat(qg[:-1,:,:][np.newaxis,:,:,:],npanel, axis = 0) 
     x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     y_2d                 = np.repeat(np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     xbar_2d              = np.repeat(np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3)
@@ -60,18 +58,16 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # attenuate numerical noise     
     betaij               = np.real(anglesign*np.arccos(r_ratio)) 
-    for i in range(ncases):
-        for j in range(ncpts):
-            np.fill_diagonal(betaij[i,j,:,:], np.pi)   
+    diag_indices         = np.arange(npanel)
+    betaij[:,:,diag_indices,diag_indices] = np.pi 
     
-    # swap axes 
-    sti_minus_j_2d  = np.swapaxes(np.swapaxes(sti_minus_j,0,2),1,3) 
-    betaij_2d       = np.swapaxes(np.swapaxes(betaij,0,2),1,3) 
-    cti_minus_j_2d  = np.swapaxes(np.swapaxes(cti_minus_j,0,2),1,3) 
-    rij_2d          = np.swapaxes(np.swapaxes(rij,0,2),1,3) 
-    rij_plus_1_2d   = np.swapaxes(np.swapaxes(rij_plus_1,0,2),1,3) 
-     
-    vt_2d += np.sum(qg_2d/2/np.pi*(sti_minus_j_2d*betaij_2d - cti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d)),1)  + \
-             np.sum(gamma/2/np.pi*(sti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d) + cti_minus_j_2d*betaij_2d),1)
+    # influence of the source strengths and of the vortex strength, once for each geometry
+    log_r_ratio          = np.log(rij_plus_1/rij)
+    source_infl          = (sti_minus_j*betaij - cti_minus_j*log_r_ratio)/2/np.pi 
+    vortex_infl          = np.sum(sti_minus_j*log_r_ratio + cti_minus_j*betaij,axis = 3)/2/np.pi
+    
+    # apply them to the strengths of all cases of the geometry
+    q_2d   = np.moveaxis(qg[:-1,:,:],0,-1)[:,:,:,np.newaxis]
+    vt_2d += np.moveaxis(np.matmul(source_infl,q_2d)[:,:,:,0],-1,0) + np.moveaxis(vortex_infl,-1,0)*qg[-1,:,:] 
     
     return  vt_2d
@@ -0,0 +1,142 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_analysis_defaults.py
+#
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import  Data, Cache, Units
+
+# package imports
+import numpy                                                     as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM_analysis_defaults
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def VLM_analysis_defaults(aerodynamics):
+    """Sets the settings, training conditions, reference values and surrogates every VLM analysis starts from. The
+    training conditions are those of the aerodynamics analysis, an analysis with other defaults overrides them.
+
+    Assumptions:
+        Analyses only share surrogates when their training inputs match, see VLM_surrogate_registry
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis          [unitless]
+
+    Returns:
+        None
+    """
+    # correction factors
+    settings                                                    = aerodynamics.settings
+    settings.fuselage_lift_correction                           = 1.14
+    settings.trim_drag_correction_factor                        = 1.0
+    settings.wing_parasite_drag_form_factor                     = 1.1
+    settings.fuselage_parasite_drag_form_factor                 = 2.3
+    settings.maximum_lift_coefficient_factor                    = 1.0
+    settings.lift_to_drag_adjustment                            = 0.0
+    settings.oswald_efficiency_factor                           = None
+    settings.span_efficiency                                    = None
+    settings.viscous_lift_dependent_drag_factor                 = 0.38
+    settings.drag_coefficient_increment                         = 0.0
+    settings.spoiler_drag_increment                             = 0.0
+    settings.maximum_lift_coefficient                           = np.inf
+    settings.use_surrogate                                      = True
+    settings.recalculate_total_wetted_area                      = False
+    settings.propeller_wake_model                               = False
+    settings.discretize_control_surfaces                        = True
+    settings.model_fuselage                                     = False
+    settings.trim_aircraft                                      = False
+
+    # correction factors
+    settings.supersonic                                         = Data()
+    settings.supersonic.peak_mach_number                        = 1.04
+    settings.supersonic.begin_drag_rise_mach_number             = 0.95
+    settings.supersonic.end_drag_rise_mach_number               = 1.2
+    settings.supersonic.transonic_drag_multiplier               = 1.25
+    settings.supersonic.volume_wave_drag_scaling                = 3.2
+    settings.supersonic.fuselage_parasite_drag_begin_blend_mach = 0.91
+    settings.supersonic.fuselage_parasite_drag_end_blend_mach   = 0.99
+    settings.supersonic.cross_sectional_area_calculation_type   = 'Fixed'
+    settings.supersonic.wave_drag_type                          = 'Raymer'
+
+    settings.number_of_spanwise_vortices                        = 15
+    settings.number_of_chordwise_vortices                       = 5
+    settings.wing_spanwise_vortices                             = None
+    settings.wing_chordwise_vortices                            = None
+    settings.fuselage_spanwise_vortices                         = None
+    settings.fuselage_chordwise_vortices                        = None
+    settings.spanwise_cosine_spacing                            = True
+    settings.vortex_distribution                                = Data()
+    settings.vortex_distribution_cache                          = Cache()
+    settings.vortex_distribution_cache_size                     = 16
+    settings.influence_matrix_cache                             = Cache()
+    settings.influence_matrix_cache_memory                      = 256 * 2**20
+    settings.number_of_training_workers                         = 1
+    settings.training_cache_directory                           = None
+    settings.induced_velocity_memory_budget                     = None
+    settings.induced_velocity_threads                           = 1
+    settings.linear_solver                                      = 'direct'
+    settings.linear_solver_tolerance                            = 1e-8
+    settings.gmres_restart                                      = 30
+    settings.gmres_maximum_cycles                               = 50
+    settings.adaptive_training                                  = False
+    settings.adaptive_training_tolerance                        = 1e-2
+    settings.adaptive_training_levels                           = 3
+    settings.leading_edge_suction_multiplier                    = 1.0
+    settings.use_VORLAX_matrix_calculation                      = False
+    settings.floating_point_precision                           = np.float32
+
+    # conditions for surrogate model training
+    training                                                    = Data()
+    training.angle_of_attack                                    = np.array([-5., -2. , 1E-12 , 2.0, 5.0, 8.0, 10.0 , 12., 45., 75.]) * Units.deg
+    training.Mach                                               = np.array([1E-12, 0.1  , 0.2 , 0.3,  0.5,  0.75 , 0.85 , 0.9, 1.3, 1.35 , 1.5 , 2.0, 2.25 , 2.5  , 3.0  , 3.5])
+
+    training.subsonic                                           = None
+    training.supersonic                                         = None
+    training.transonic                                          = None
+
+    training.sideslip_angle                                     = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.aileron_deflection                                 = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.elevator_deflection                                = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.rudder_deflection                                  = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.flap_deflection                                    = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.slat_deflection                                    = np.array([30  , 10.0 , 1E-12]) * Units.deg
+    training.u                                                  = np.array([0.2 , 0.1  , 1E-12])
+    training.v                                                  = np.array([0.2 , 0.1  , 1E-12])
+    training.w                                                  = np.array([0.2 , 0.1  , 1E-12])
+    training.pitch_rate                                         = np.array([0.3 ,0.15  , 0.0 ])  * Units.rad / Units.sec
+    training.roll_rate                                          = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec
+    training.yaw_rate                                           = np.array([0.3 ,0.15  , 0.0])  * Units.rad / Units.sec
+    aerodynamics.training                                       = training
+
+    # control surface flags
+    aerodynamics.aileron_flag                                   = False
+    aerodynamics.flap_flag                                      = False
+    aerodynamics.rudder_flag                                    = False
+    aerodynamics.elevator_flag                                  = False
+    aerodynamics.slat_flag                                      = False
+
+    reference_values                                            = Data()
+    reference_values.S_ref                                      = 0
+    reference_values.c_ref                                      = 0
+    reference_values.b_ref                                      = 0
+    reference_values.X_ref                                      = 0
+    reference_values.Y_ref                                      = 0
+    reference_values.Z_ref                                      = 0
+    aerodynamics.reference_values                               = reference_values
+
+    # blending function
+    aerodynamics.hsub_min                                       = 0.85
+    aerodynamics.hsub_max                                       = 0.95
+    aerodynamics.hsup_min                                       = 1.05
+    aerodynamics.hsup_max                                       = 1.15
+
+    # surrogoate models
+    aerodynamics.surrogates                                     = Data()
+
+    return
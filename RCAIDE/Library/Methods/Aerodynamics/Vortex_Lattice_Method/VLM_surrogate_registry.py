@@ -0,0 +1,108 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_surrogate_registry.py
+#
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import  Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_training_cache import training_grids
+
+# surrogates shared by all VLM analyses of this process, keyed by VLM_training_key
+registry                           = Data()
+registry.surrogates                = Data()
+registry.maximum_surrogates        = 8
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_shared_VLM_surrogates
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def load_shared_VLM_surrogates(aerodynamics, key):
+    """References the training data and surrogates of another VLM analysis of this process, e.g. the aerodynamics
+    analysis of the configuration a stability analysis is attached to, if it has the same vehicle, training
+    conditions and settings.
+
+    Assumptions:
+        Shared training data and surrogates are never modified after they are built
+        The vortex distribution and influence matrix caches of the analysis are its own, they are not shared
+        Control surfaces are reset as train_VLM_surrogates does
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis                            [unitless]
+        key          : training key, see VLM_training_key      [unitless]
+
+    Returns:
+        loaded       : True if the surrogates were shared      [unitless]
+    """
+    if key not in registry.surrogates:
+        return False
+
+    shared                         = registry.surrogates[key]
+    aerodynamics.training.subsonic   = shared.training.subsonic
+    aerodynamics.training.supersonic = shared.training.supersonic
+    aerodynamics.training.transonic  = shared.training.transonic
+    for grid,value in shared.grids.items():
+        aerodynamics.training[grid]  = value
+    aerodynamics.surrogates.subsonic   = shared.surrogates.subsonic
+    aerodynamics.surrogates.supersonic = shared.surrogates.supersonic
+    aerodynamics.surrogates.transonic  = shared.surrogates.transonic
+    for name,value in shared.reference_values.items():
+        aerodynamics.reference_values[name] = value
+    for flag,value in shared.flags.items():
+        aerodynamics[flag] = value
+    for wing in aerodynamics.vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+
+    return True
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  share_VLM_surrogates
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def share_VLM_surrogates(aerodynamics, key):
+    """Registers the training data and surrogates of a VLM analysis so that other analyses with the same vehicle,
+    training conditions and settings reference them instead of training again.
+
+    Assumptions:
+        The oldest surrogates are dropped from the registry once registry.maximum_surrogates are kept, the analyses
+        that use them keep them
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis, after build_VLM_surrogates  [unitless]
+        key          : training key, see VLM_training_key        [unitless]
+
+    Returns:
+        None
+    """
+    shared                     = Data()
+    shared.training            = Data()
+    shared.training.subsonic   = aerodynamics.training.subsonic
+    shared.training.supersonic = aerodynamics.training.supersonic
+    shared.training.transonic  = aerodynamics.training.transonic
+    shared.grids               = Data()
+    for grid in training_grids:
+        shared.grids[grid]     = aerodynamics.training[grid]
+    shared.surrogates          = Data()
+    shared.surrogates.subsonic   = aerodynamics.surrogates.subsonic
+    shared.surrogates.supersonic = aerodynamics.surrogates.supersonic
+    shared.surrogates.transonic  = aerodynamics.surrogates.transonic
+    shared.reference_values    = Data()
+    for name,value in aerodynamics.reference_values.items():
+        shared.reference_values[name] = value
+    shared.flags               = Data()
+    for flag in ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']:
+        shared.flags[flag] = aerodynamics[flag]
+
+    while len(registry.surrogates) and len(registry.surrogates) >= registry.maximum_surrogates:
+        del registry.surrogates[next(iter(registry.surrogates.keys()))]
+    registry.surrogates[key] = shared
+
+    return
@@ -0,0 +1,189 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_training_cache.py
+#
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core import  Data, hash_data, flatten_data, unflatten_data
+
+# package imports
+import numpy                                                     as np
+import os
+import tempfile
+
+# version of the stored training data, changed whenever the training itself changes
+training_cache_version = 'VLM training 2'
+
+# settings that do not change the training data
+runtime_settings       = ['vortex_distribution_cache','vortex_distribution_cache_size','influence_matrix_cache',
+                          'influence_matrix_cache_memory','number_of_training_workers','training_cache_directory',
+                          'induced_velocity_memory_budget','induced_velocity_threads']
+
+# data stored with the training
+control_surface_flags  = ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']
+training_grids         = ['angle_of_attack','Mach']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM_training_key
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def VLM_training_key(aerodynamics):
+    """Computes a content hash of everything the VLM training depends on: the vehicle, the training conditions and the
+    analysis settings.
+
+    Assumptions:
+        Settings that only control caching and parallelism are left out, as is the vortex distribution stored on the
+        vehicle
+        The key does not depend on the analysis class or on the order settings are defined in, so aerodynamics and
+        stability analyses share their training
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis          [unitless]
+
+    Returns:
+        key          : hex digest            [unitless]
+    """
+    vehicle  = Data()
+    for key,value in aerodynamics.vehicle.items():
+        if key != 'vortex_distribution':
+            vehicle[key] = value
+    settings = Data()
+    for key in sorted(aerodynamics.settings.keys()):
+        if key not in runtime_settings:
+            settings[key] = aerodynamics.settings[key]
+    training = Data()
+    for key in sorted(aerodynamics.training.keys()):
+        if key not in ['subsonic','supersonic','transonic']:
+            training[key] = aerodynamics.training[key]
+
+    return hash_data([training_cache_version,vehicle,training,settings,
+                      aerodynamics.hsub_min,aerodynamics.hsub_max,aerodynamics.hsup_min,aerodynamics.hsup_max])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_VLM_training
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def load_VLM_training(aerodynamics, filename):
+    """Loads the training data of a VLM analysis from its training cache file, if an analysis with the same vehicle,
+    training conditions and settings has been trained before.
+
+    Assumptions:
+        Any change to the inputs changes the file name, so stale training data is never loaded
+        The training grids are restored as they were trained, after any adaptation
+        Control surfaces are reset as train_VLM_surrogates does
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis                           [unitless]
+        filename     : training cache file, see VLM_training_file  [unitless]
+
+    Returns:
+        loaded       : True if the training data was loaded  [unitless]
+    """
+    if filename is None or not os.path.isfile(filename):
+        return False
+
+    try:
+        with np.load(filename,allow_pickle=False) as arrays:
+            stored = unflatten_data(arrays)
+    except (OSError,ValueError,KeyError):
+        return False
+
+    training            = aerodynamics.training
+    training.subsonic   = stored.subsonic
+    training.supersonic = stored.supersonic
+    training.transonic  = stored.transonic
+    for grid in training_grids:
+        training[grid]  = stored.grids[grid]
+    for key,value in stored.reference_values.items():
+        aerodynamics.reference_values[key] = value
+    for flag in control_surface_flags:
+        aerodynamics[flag] = bool(stored.flags[flag])
+    for wing in aerodynamics.vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+
+    return True
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  save_VLM_training
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def save_VLM_training(aerodynamics, filename):
+    """Stores the training data of a VLM analysis as a compressed numpy archive.
+
+    Assumptions:
+        The file is written to a temporary file first and then renamed, so concurrent processes never read a
+        partial file
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis                                [unitless]
+        filename     : training cache file, see VLM_training_file  [unitless]
+
+    Returns:
+        None
+    """
+    if filename is None:
+        return
+
+    stored                  = Data()
+    stored.subsonic         = aerodynamics.training.subsonic
+    stored.supersonic       = aerodynamics.training.supersonic
+    stored.transonic        = aerodynamics.training.transonic
+    stored.reference_values = aerodynamics.reference_values
+    stored.grids            = Data()
+    for grid in training_grids:
+        stored.grids[grid]  = aerodynamics.training[grid]
+    stored.flags            = Data()
+    for flag in control_surface_flags:
+        stored.flags[flag] = aerodynamics[flag]
+
+    directory = os.path.dirname(filename)
+    os.makedirs(directory,exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory,suffix='.npz')
+    try:
+        with os.fdopen(handle,'wb') as file:
+            np.savez_compressed(file,**flatten_data(stored))
+        os.replace(temporary,filename)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM_training_file
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def VLM_training_file(aerodynamics, key):
+    """Names the file in settings.training_cache_directory that holds the training data of an analysis. The key must
+    be computed before training, since training resets the control surface deflections of the vehicle.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis                                 [unitless]
+        key          : training key, see VLM_training_key           [unitless]
+
+    Returns:
+        filename     : training cache file, None without a directory [unitless]
+    """
+    directory = aerodynamics.settings.training_cache_directory if 'training_cache_directory' in aerodynamics.settings else None
+    if directory is None:
+        return None
+    return os.path.join(os.path.expanduser(directory),key + '.npz')
@@ -17,8 +17,14 @@ from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix              import compute_RHS_matrix 
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity   import compute_wing_induced_velocity 
 from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution    import generate_vortex_distribution
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_vortex_distribution      import cached_vortex_distribution
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_influence_matrices       import cached_influence_matrices, solve_influence_matrices
  
 from .train_VLM_surrogates                    import train_VLM_surrogates
 from .build_VLM_surrogates                    import build_VLM_surrogates  
+from .VLM_training_cache                      import VLM_training_file, VLM_training_key, load_VLM_training, save_VLM_training
+from .VLM_surrogate_registry                  import load_shared_VLM_surrogates, share_VLM_surrogates
+from .VLM_analysis_defaults                   import VLM_analysis_defaults
+from .initialize_VLM_surrogates               import initialize_VLM_surrogates
 from .evaluate_VLM import *  
 
@@ -0,0 +1,50 @@
+## @ingroup  Library-Methods-Aerodynamics-Vortex_Lattice_Method
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/initialize_VLM_surrogates.py
+#
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from .train_VLM_surrogates   import train_VLM_surrogates
+from .build_VLM_surrogates   import build_VLM_surrogates
+from .VLM_training_cache     import VLM_training_file, VLM_training_key, load_VLM_training, save_VLM_training
+from .VLM_surrogate_registry import load_shared_VLM_surrogates, share_VLM_surrogates
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  initialize_VLM_surrogates
+# ----------------------------------------------------------------------------------------------------------------------
+## @ingroup Library-Methods-Aerodynamics-Vortex_Lattice_Method
+def initialize_VLM_surrogates(aerodynamics):
+    """Gives a VLM analysis its training data and surrogates. They are shared with another analysis of this process
+    with the same training inputs, e.g. the aerodynamics and stability analyses of a configuration, loaded from the
+    training cache, or trained and stored, in that order.
+
+    Assumptions:
+        The surrogates never solve the VLM, so the factorizations of a training are released once it is done
+
+    Source:
+        None
+
+    Args:
+        aerodynamics : VLM analysis          [unitless]
+
+    Returns:
+        None
+    """
+    training_key = VLM_training_key(aerodynamics)
+    if load_shared_VLM_surrogates(aerodynamics,training_key):
+        return
+
+    # sample training data, unless this analysis has been trained before
+    training_file = VLM_training_file(aerodynamics,training_key)
+    if not load_VLM_training(aerodynamics,training_file):
+        train_VLM_surrogates(aerodynamics)
+        save_VLM_training(aerodynamics,training_file)
+        aerodynamics.settings.influence_matrix_cache.clear()
+
+    # build surrogate
+    build_VLM_surrogates(aerodynamics)
+    share_VLM_surrogates(aerodynamics,training_key)
+
+    return
@@ -11,6 +11,20 @@ from RCAIDE.Framework.Core import  Data
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method   import  VLM
 # package imports
 import numpy                                                     as np 
+from concurrent.futures                                          import ProcessPoolExecutor
+import os
+
+# positions in the angle of attack grid train_model takes values from, the angle of attack derivatives are taken
+# between the derivative points and the other perturbations relative to the zero angle of attack
+alpha_training_points            = Data()
+alpha_training_points.derivative = [0,1]
+alpha_training_points.zero       = 2
+
+# coefficients of the angle of attack sweep, in the order evaluate_VLM returns them
+sweep_coefficients               = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+
+# samples of a coefficient further from its median than this many spreads are singular, they are not measured
+singular_spreads                 = 1e3
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -23,6 +37,11 @@ def train_VLM_surrogates(aerodynamics):
         (1) p is defined as negative (see line 260)
         (2) delta_a is defined as negative only for CL_d_a (see line 495)
         (3) delta_r is defined as negative only for CN_d_r (see line 610)
+        (4) With settings.number_of_training_workers greater than one, the Mach numbers of each regime are split in
+            blocks that are trained in a process pool and merged back in order. Every Mach number is trained
+            independently, so the training data does not depend on the number of workers
+        (5) With settings.adaptive_training the angle of attack and Mach number grids are adapted to the vehicle
+            first, see adapt_training_grids. The angle of attack sweep of the adaptation is reused by the training
         
     Source:
         None
@@ -34,19 +53,297 @@ def train_VLM_surrogates(aerodynamics):
         None    
     """
  
+    alpha_sweep = None
+    if 'adaptive_training' in aerodynamics.settings and aerodynamics.settings.adaptive_training:
+        alpha_sweep = adapt_training_grids(aerodynamics)
+ 
     Mach          = aerodynamics.training.Mach 
     training      = aerodynamics.training  
     sub_len       = int(sum(Mach<1.))  
     sub_Mach      = Mach[:sub_len] 
     sup_Mach      = Mach[sub_len:] 
     
-    training.subsonic    =  train_model(aerodynamics, sub_Mach)  
-    training.supersonic  =  train_model(aerodynamics, sup_Mach)
+    number_of_workers = aerodynamics.settings.number_of_training_workers if 'number_of_training_workers' in aerodynamics.settings else 1
+    if number_of_workers is None:
+        number_of_workers = os.cpu_count() or 1
+        
+    if number_of_workers <= 1: 
+        training.subsonic    =  train_model(aerodynamics, sub_Mach, alpha_sweep)  
+        training.supersonic  =  train_model(aerodynamics, sup_Mach, alpha_sweep)
+    else:
+        training.subsonic, training.supersonic = train_models_in_parallel(aerodynamics,sub_Mach,sup_Mach,int(number_of_workers),alpha_sweep)
     training.transonic   =  train_trasonic_model(aerodynamics, training.subsonic,training.supersonic,sub_Mach, sup_Mach) 
     return 
+
+def adapt_training_grids(aerodynamics): 
+    """Adapts the angle of attack and Mach number training grids to the vehicle. Points of the initial grids that
+    their neighbours interpolate to within settings.adaptive_training_tolerance are dropped, then every interval
+    whose midpoint the surrogate misses by more than the tolerance is halved, at most
+    settings.adaptive_training_levels times. 
     
-def train_model(aerodynamics, Mach): 
-    """Sub function that call methods to run VLM for sample point evaluation. 
+    Assumptions:
+        (1) The error is the largest error of the linearly interpolated coefficients of the angle of attack sweep
+            over the whole other grid. Each coefficient is measured relative to its range on the initial grids, at
+            least the tolerance times the largest range, so that coefficients the sweep does not excite are not
+            refined on their noise
+        (2) Samples further than singular_spreads interquartile spreads from the median of a coefficient, such as
+            CX and CZ at 45 degrees where their transformation from the body frame is singular, are not measured and
+            do not count towards its range
+        (3) The points of alpha_training_points, the angles of attack before them and the last one are kept, and
+            only intervals above the zero angle of attack are refined
+        (4) The first and last Mach numbers of the subsonic and supersonic regimes are kept, and intervals are only
+            refined within a regime
+        (5) Both grids are strictly increasing
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless] 
+        
+    Returns: 
+        alpha_sweep        : angle of attack sweep over the adapted grids, see sample_alpha_sweep [unitless] 
+    """    
+    settings  = aerodynamics.settings
+    tolerance = settings.adaptive_training_tolerance
+    levels    = settings.adaptive_training_levels
+    AoA       = np.array(aerodynamics.training.angle_of_attack,dtype=float)
+    Mach      = np.array(aerodynamics.training.Mach,dtype=float)
+    if np.any(np.diff(AoA) <= 0) or np.any(np.diff(Mach) <= 0):
+        raise ValueError('The angle of attack and Mach number training grids must be strictly increasing to be adapted')
+    
+    # reset control surfaces, as train_model does
+    for wing in aerodynamics.vehicle.wings: 
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+    
+    # every sample is kept, so that the training reuses the sweep over the adapted grids
+    sweep     = sample_alpha_sweep(aerodynamics,AoA,Mach)
+    samples   = {}
+    n         = len(sweep_coefficients)
+    initial   = sweep.values[:,:,:n]
+    median    = np.median(initial,axis=(0,1))
+    spread    = np.percentile(initial,75,axis=(0,1)) - np.percentile(initial,25,axis=(0,1))
+    singular  = lambda values: np.abs(values - median) > singular_spreads*spread
+    regular   = np.where(singular(initial),np.nan,initial)
+    scale     = np.nanmax(regular,axis=(0,1)) - np.nanmin(regular,axis=(0,1))
+    scale     = np.maximum(scale,tolerance*np.max(scale))
+    scale[scale == 0] = 1.
+    
+    def measure(sweep):
+        for i,a in enumerate(sweep.angle_of_attack):
+            for j,m in enumerate(sweep.Mach):
+                samples[(a,m)] = sweep.values[i,j]
+        values = sweep.values[:,:,:n]
+        return np.where(singular(values),np.nan,values/scale)
+    
+    values    = measure(sweep)
+    sample    = lambda AoA,Mach: measure(sample_alpha_sweep(aerodynamics,AoA,Mach))
+    
+    # drop the points that are not needed
+    kept      = alpha_training_points.derivative + [alpha_training_points.zero]
+    fixed     = np.zeros(len(AoA),dtype=bool)
+    fixed[:max(kept)+1] = True
+    fixed[-1] = True 
+    keep      = leave_one_out(AoA,values,fixed,tolerance)
+    AoA       = AoA[keep]
+    values    = values[keep]
+    
+    fixed     = np.zeros(len(Mach),dtype=bool)
+    for regime in [Mach < 1., Mach >= 1.]:
+        if np.any(regime):
+            fixed[np.where(regime)[0][[0,-1]]] = True 
+    keep      = leave_one_out(Mach,values.transpose(1,0,2),fixed,tolerance)
+    Mach      = Mach[keep]
+    values    = values[:,keep]
+    
+    # halve the intervals the surrogate misses
+    AoA_intervals  = [(AoA[i],AoA[i+1]) for i in range(alpha_training_points.zero,len(AoA)-1)]
+    Mach_intervals = [(Mach[i],Mach[i+1]) for i in range(len(Mach)-1) if (Mach[i] < 1.) == (Mach[i+1] < 1.)]
+    for level in range(levels):
+        AoA, values, AoA_intervals    = refine_intervals(AoA,values,AoA_intervals,tolerance,
+                                                         lambda points: sample(points,Mach))
+        values                        = values.transpose(1,0,2)
+        Mach, values, Mach_intervals  = refine_intervals(Mach,values,Mach_intervals,tolerance,
+                                                         lambda points: sample(AoA,points).transpose(1,0,2))
+        values                        = values.transpose(1,0,2)
+        if not len(AoA_intervals) and not len(Mach_intervals):
+            break
+        
+    aerodynamics.training.angle_of_attack = AoA
+    aerodynamics.training.Mach            = Mach 
+    
+    # every point of the adapted grids has been sampled along with the grid it was added to
+    sweep.angle_of_attack = AoA
+    sweep.Mach            = Mach
+    sweep.values          = np.array([[samples[(a,m)] for m in Mach] for a in AoA])
+    
+    return sweep
+
+def sample_alpha_sweep(aerodynamics, AoA, Mach): 
+    """Runs the VLM over a grid of angles of attack and Mach numbers, the angle of attack sweep of train_model. 
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless] 
+        AoA                : angles of attack      [radians] 
+        Mach               : Mach numbers          [unitless] 
+        
+    Returns: 
+        alpha_sweep.
+          angle_of_attack  : angles of attack      [radians] 
+          Mach             : Mach numbers          [unitless] 
+          values           : sweep_coefficients, then the lift and the drag coefficients of each wing, indexed by 
+                             angle of attack, Mach number and coefficient  [unitless] 
+          reference_values : reference values of the vehicle  [unitless] 
+    """    
+    geometry   = aerodynamics.vehicle
+    len_Mach   = len(Mach)
+    len_AoA    = len(AoA)
+    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
+    Machs      = np.atleast_2d(np.repeat(Mach,len_AoA)).T        
+    
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
+    
+    results    = evaluate_VLM(conditions,aerodynamics.settings,geometry)
+    Clift_wing = results[14]
+    Cdrag_wing = results[15]
+    values     = [results[i] for i in range(len(sweep_coefficients))]
+    values    += [Clift_wing[wing.tag] for wing in geometry.wings] + [Cdrag_wing[wing.tag] for wing in geometry.wings]
+    
+    alpha_sweep                  = Data()
+    alpha_sweep.angle_of_attack  = AoA
+    alpha_sweep.Mach             = Mach
+    alpha_sweep.values           = np.stack([np.reshape(value,(len_Mach,len_AoA)).T for value in values],axis=-1)
+    alpha_sweep.reference_values = Data()
+    for i,name in enumerate(['S_ref','b_ref','c_ref','X_ref','Y_ref','Z_ref']):
+        alpha_sweep.reference_values[name] = results[8 + i]
+    
+    return alpha_sweep
+
+def leave_one_out(points, values, fixed, tolerance): 
+    """Selects the points of a grid that can not be left out, a point is left out if its neighbours interpolate
+    it to within the tolerance. The neighbours of a point that is left out are kept. 
+    
+    Assumptions:
+        Linear interpolation
+        Values that are not a number are not measured
+        
+    Source:
+        None
+
+    Args:
+        points             : grid points                                   [unitless] 
+        values             : values, indexed by grid point along axis 0    [unitless] 
+        fixed              : points that are always kept                   [unitless] 
+        tolerance          : largest interpolation error                   [unitless] 
+        
+    Returns: 
+        keep               : points that are kept                          [unitless] 
+    """    
+    keep = np.ones(len(points),dtype=bool)
+    for i in range(1,len(points)-1):
+        if fixed[i] or not keep[i-1]:
+            continue
+        weight = (points[i+1] - points[i])/(points[i+1] - points[i-1])
+        error  = np.abs(values[i] - weight*values[i-1] - (1 - weight)*values[i+1])
+        keep[i] = np.max(np.nan_to_num(error,nan=0.)) > tolerance
+    return keep
+
+def refine_intervals(points, values, intervals, tolerance, sample): 
+    """Samples the midpoint of each interval and inserts it into the grid if linear interpolation misses it by
+    more than the tolerance. 
+    
+    Assumptions:
+        The grid points are strictly increasing
+        Values that are not a number are not measured
+        
+    Source:
+        None
+
+    Args:
+        points             : grid points                                   [unitless] 
+        values             : values, indexed by grid point along axis 0    [unitless] 
+        intervals          : intervals to check                            [unitless] 
+        tolerance          : largest interpolation error                   [unitless] 
+        sample             : function returning the values at points       [unitless] 
+        
+    Returns: 
+        points             : refined grid points                           [unitless] 
+        values             : values at the refined grid points             [unitless] 
+        intervals          : intervals to check next                       [unitless] 
+    """    
+    if not len(intervals):
+        return points, values, intervals
+    
+    midpoints = np.array([0.5*(lower + upper) for lower,upper in intervals])
+    samples   = sample(midpoints)
+    refined   = []
+    for (lower,upper),midpoint,value in zip(intervals,midpoints,samples):
+        i     = np.searchsorted(points,lower)
+        error = np.abs(value - 0.5*(values[i] + values[i+1]))
+        if np.max(np.nan_to_num(error,nan=0.)) > tolerance:
+            points  = np.insert(points,i+1,midpoint)
+            values  = np.insert(values,i+1,value,axis=0)
+            refined = refined + [(lower,midpoint),(midpoint,upper)]
+    
+    return points, values, refined
+
+def train_models_in_parallel(aerodynamics, sub_Mach, sup_Mach, number_of_workers, alpha_sweep = None): 
+    """Trains the subsonic and supersonic models with blocks of Mach numbers distributed over a process pool. 
+    
+    Assumptions:
+        The reference values and control surface flags set by train_model are copied back from the workers
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                    [unitless] 
+        sub_Mach           : subsonic Mach numbers           [unitless] 
+        sup_Mach           : supersonic Mach numbers         [unitless] 
+        number_of_workers  : number of worker processes      [unitless] 
+        alpha_sweep        : angle of attack sweep to reuse  [unitless] 
+        
+    Returns: 
+        training_subsonic   : subsonic training data         [unitless] 
+        training_supersonic : supersonic training data       [unitless] 
+    """    
+
+    # reset control surfaces for building surrogates, as train_model does in the workers 
+    for wing in aerodynamics.vehicle.wings: 
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+            
+    # split each regime in blocks, a regime without Mach numbers is trained as is  
+    blocks = []
+    for Mach in [sub_Mach,sup_Mach]:
+        n_blocks = max(1,min(number_of_workers,len(Mach)))
+        blocks.append([block for block in np.array_split(Mach,n_blocks) if len(block) or len(Mach) == 0])
+        
+    tasks = blocks[0] + blocks[1]
+    with ProcessPoolExecutor(max_workers=min(number_of_workers,len(tasks))) as executor:
+        results = list(executor.map(train_model_block,[aerodynamics]*len(tasks),tasks,[alpha_sweep]*len(tasks)))
+        
+    aerodynamics.reference_values = results[0][1]
+    for _,_,flags in results:
+        for flag,value in flags.items():
+            aerodynamics[flag] = aerodynamics[flag] or value
+            
+    training_subsonic   = merge_training_blocks([training for training,_,_ in results[:len(blocks[0])]])
+    training_supersonic = merge_training_blocks([training for training,_,_ in results[len(blocks[0]):]])
+    
+    return training_subsonic, training_supersonic
+
+def train_model_block(aerodynamics, Mach, alpha_sweep = None): 
+    """Trains a block of Mach numbers inside a worker process. 
     
     Assumptions:
         None
@@ -56,6 +353,59 @@ def train_model(aerodynamics, Mach):
 
     Args:
         aerodynamics       : VLM analysis          [unitless] 
+        Mach               : Mach numbers          [unitless] 
+        alpha_sweep        : angle of attack sweep to reuse [unitless] 
+        
+    Returns: 
+        training           : training data         [unitless] 
+        reference_values   : reference values      [unitless] 
+        flags              : control surface flags [unitless] 
+    """    
+    training = train_model(aerodynamics, Mach, alpha_sweep)
+    flags    = Data()
+    for flag in ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']:
+        flags[flag] = aerodynamics[flag]
+    return training, aerodynamics.reference_values, flags
+
+def merge_training_blocks(blocks): 
+    """Concatenates the training data of consecutive blocks of Mach numbers, every array is indexed by Mach number
+    along its last axis. 
+    
+    Assumptions:
+        Values that are not arrays are taken from the first block
+        
+    Source:
+        None
+
+    Args:
+        blocks             : training data of each block  [unitless] 
+        
+    Returns: 
+        training           : training data                [unitless] 
+    """    
+    training = Data()
+    for key,value in blocks[0].items():
+        if isinstance(value,Data):
+            training[key] = merge_training_blocks([block[key] for block in blocks])
+        elif isinstance(value,np.ndarray) and len(blocks) > 1:
+            training[key] = np.concatenate([block[key] for block in blocks],axis=-1)
+        else:
+            training[key] = value
+    return training
+    
+def train_model(aerodynamics, Mach, alpha_sweep = None): 
+    """Sub function that call methods to run VLM for sample point evaluation. 
+    
+    Assumptions:
+        An angle of attack sweep that is given holds every Mach number, it is not solved again
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                    [unitless] 
+        Mach               : Mach numbers                    [unitless] 
+        alpha_sweep        : angle of attack sweep to reuse, see sample_alpha_sweep [unitless] 
         
     Returns: 
         None    
@@ -94,50 +444,41 @@ def train_model(aerodynamics, Mach):
     # Alpha
     # --------------------------------------------------------------------------------------------------------------
             
-    # Setup new array shapes for vectorization 
-    # stakcing 9x9 matrices into one horizontal line(81)  
-    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
-    Machs      = np.atleast_2d(np.repeat(Mach,len_AoA)).T        
-    
-    # reset conditions  
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
+    if alpha_sweep is None:
+        alpha_sweep = sample_alpha_sweep(aerodynamics,AoA,Mach)
+    values        = alpha_sweep.values[:,np.searchsorted(alpha_sweep.Mach,Mach)]
     
-    Clift_res_alpha,Cdrag_res_alpha,CX_res_alpha,CY_res_alpha,CZ_res_alpha,CL_res_alpha,CM_res_alpha,CN_res_alpha, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_= evaluate_VLM(conditions,settings,geometry)
-    
-    Clift_alpha   = np.reshape(Clift_res_alpha,(len_Mach,len_AoA)).T 
-    Cdrag_alpha   = np.reshape(Cdrag_res_alpha,(len_Mach,len_AoA)).T 
-    CX_alpha      = np.reshape(CX_res_alpha,(len_Mach,len_AoA)).T 
-    CY_alpha      = np.reshape(CY_res_alpha,(len_Mach,len_AoA)).T 
-    CZ_alpha      = np.reshape(CZ_res_alpha,(len_Mach,len_AoA)).T 
-    CL_alpha      = np.reshape(CL_res_alpha,(len_Mach,len_AoA)).T 
-    CM_alpha      = np.reshape(CM_res_alpha,(len_Mach,len_AoA)).T 
-    CN_alpha      = np.reshape(CN_res_alpha,(len_Mach,len_AoA)).T  
+    Clift_alpha   = values[:,:,0]
+    Cdrag_alpha   = values[:,:,1]
+    CX_alpha      = values[:,:,2]
+    CY_alpha      = values[:,:,3]
+    CZ_alpha      = values[:,:,4]
+    CL_alpha      = values[:,:,5]
+    CM_alpha      = values[:,:,6]
+    CN_alpha      = values[:,:,7]
     
     # Angle of Attack at 0 Degrees 
-    Clift_alpha_0   =  np.tile(Clift_alpha[2][None,:],(3,1))
-    Cdrag_alpha_0   =  np.tile(Cdrag_alpha[2][None,:],(3,1))
-    CX_alpha_0      =  np.tile(CX_alpha[2][None,:],(3, 1)) 
-    CY_alpha_0      =  np.tile(CY_alpha[2][None,:],(3, 1)) 
-    CZ_alpha_0      =  np.tile(CZ_alpha[2][None,:],(3, 1)) 
-    CL_alpha_0      =  np.tile(CL_alpha[2][None,:],(3, 1)) 
-    CM_alpha_0      =  np.tile(CM_alpha[2][None,:],(3, 1)) 
-    CN_alpha_0      =  np.tile(CN_alpha[2][None,:],(3, 1))  
+    zero            =  alpha_training_points.zero
+    Clift_alpha_0   =  np.tile(Clift_alpha[zero][None,:],(3,1))
+    Cdrag_alpha_0   =  np.tile(Cdrag_alpha[zero][None,:],(3,1))
+    CX_alpha_0      =  np.tile(CX_alpha[zero][None,:],(3, 1)) 
+    CY_alpha_0      =  np.tile(CY_alpha[zero][None,:],(3, 1)) 
+    CZ_alpha_0      =  np.tile(CZ_alpha[zero][None,:],(3, 1)) 
+    CL_alpha_0      =  np.tile(CL_alpha[zero][None,:],(3, 1)) 
+    CM_alpha_0      =  np.tile(CM_alpha[zero][None,:],(3, 1)) 
+    CN_alpha_0      =  np.tile(CN_alpha[zero][None,:],(3, 1))  
 
-    aerodynamics.reference_values.S_ref = S_ref
-    aerodynamics.reference_values.b_ref = b_ref
-    aerodynamics.reference_values.c_ref = c_ref
-    aerodynamics.reference_values.X_ref = X_ref
-    aerodynamics.reference_values.Y_ref = Y_ref
-    aerodynamics.reference_values.Z_ref = Z_ref
-    aerodynamics.reference_values.aspect_ratio = (b_ref ** 2) / S_ref
+    for name,value in alpha_sweep.reference_values.items():
+        aerodynamics.reference_values[name] = value
+    aerodynamics.reference_values.aspect_ratio = (alpha_sweep.reference_values.b_ref ** 2) / alpha_sweep.reference_values.S_ref
     
+    n_coefficients   = len(sweep_coefficients)
+    n_wings          = len(geometry.wings)
     Clift_wing_alpha = Data()
     Cdrag_wing_alpha = Data() 
-    for wing in  geometry.wings: 
-        Clift_wing_alpha[wing.tag] = np.reshape(Clift_wing_res[wing.tag],(len_Mach,len_AoA)).T    
-        Cdrag_wing_alpha[wing.tag] = np.reshape(Cdrag_wing_res[wing.tag],(len_Mach,len_AoA)).T
+    for i,wing in enumerate(geometry.wings): 
+        Clift_wing_alpha[wing.tag] = values[:,:,n_coefficients + i]    
+        Cdrag_wing_alpha[wing.tag] = values[:,:,n_coefficients + n_wings + i]
         
          
     # --------------------------------------------------------------------------------------------------------------
@@ -379,7 +720,8 @@ def train_model(aerodynamics, Mach):
       
             
     # STABILITY DERIVATIVES 
-    training.dClift_dalpha = (Clift_alpha[0,:] - Clift_alpha[1,:]) / (AoA[0] - AoA[1])
+    i_0, i_1               = alpha_training_points.derivative
+    training.dClift_dalpha = (Clift_alpha[i_0,:] - Clift_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])
     training.dClift_dbeta = (Clift_beta[0,:] - Clift_beta[1,:]) / (Beta[0] - Beta[1])
     training.dClift_du = (Clift_u[0,:] - Clift_u[1,:]) / (u[0] - u[1])            
     training.dClift_dv = (Clift_v[0,:] - Clift_v[1,:]) / (v[0] - v[1])          
@@ -387,7 +729,7 @@ def train_model(aerodynamics, Mach):
     training.dClift_dp = (Clift_p[0,:] - Clift_p[1,:]) / (roll_rate[0]-roll_rate[1])            
     training.dClift_dq = (Clift_q[0,:] - Clift_q[1,:]) / (pitch_rate[0]-pitch_rate[1])        
     training.dClift_dr = (Clift_r[0,:] - Clift_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                
-    training.dCdrag_dalpha = (Cdrag_alpha[0,:] - Cdrag_alpha[1,:]) / (AoA[0] - AoA[1])    
+    training.dCdrag_dalpha = (Cdrag_alpha[i_0,:] - Cdrag_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])    
     training.dCdrag_dbeta = (Cdrag_beta[0,:] - Cdrag_beta[1,:]) / (Beta[0] - Beta[1])
                 
     training.dCdrag_du = (Cdrag_u[0,:] - Cdrag_u[1,:]) / (u[0] - u[1])                     
@@ -396,7 +738,7 @@ def train_model(aerodynamics, Mach):
     training.dCdrag_dp = (Cdrag_p[0,:] - Cdrag_p[1,:]) / (roll_rate[0]-roll_rate[1])             
     training.dCdrag_dq = (Cdrag_q[0,:] - Cdrag_q[1,:]) / (pitch_rate[0]-pitch_rate[1])         
     training.dCdrag_dr = (Cdrag_r[0,:] - Cdrag_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                 
-    training.dCX_dalpha = (CX_alpha[0,:] - CX_alpha[1,:]) / (AoA[0] - AoA[1])            
+    training.dCX_dalpha = (CX_alpha[i_0,:] - CX_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])            
     training.dCX_dbeta = (CX_beta[0,:] - CX_beta[1,:]) / (Beta[0] - Beta[1]) 
                 
     training.dCX_du = (CX_u[0,:] - CX_u[1,:]) / (u[0] - u[1])                                 
@@ -405,7 +747,7 @@ def train_model(aerodynamics, Mach):
     training.dCX_dp = (CX_p[0,:] - CX_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCX_dq = (CX_q[0,:] - CX_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCX_dr = (CX_r[0,:] - CX_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCY_dalpha = (CY_alpha[0,:] - CY_alpha[1,:]) / (AoA[0] - AoA[1])         
+    training.dCY_dalpha = (CY_alpha[i_0,:] - CY_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])         
     training.dCY_dbeta = (CY_beta[1,:] - CY_beta[2,:]) / (Beta[1] - Beta[2]) 
             
                 
@@ -415,7 +757,7 @@ def train_model(aerodynamics, Mach):
     training.dCY_dp = (CY_p[0,:] - CY_p[1,:]) / (roll_rate[0]-roll_rate[1])                 
     training.dCY_dq = (CY_q[0,:] - CY_q[1,:]) / (pitch_rate[0]-pitch_rate[1])             
     training.dCY_dr = (CY_r[0,:] - CY_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                     
-    training.dCZ_dalpha = (CZ_alpha[0,:] - CZ_alpha[1,:]) / (AoA[0] - AoA[1])             
+    training.dCZ_dalpha = (CZ_alpha[i_0,:] - CZ_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])             
     training.dCZ_dbeta = (CZ_beta[0,:] - CZ_beta[1,:]) / (Beta[0] - Beta[1])
     
                       
@@ -425,7 +767,7 @@ def train_model(aerodynamics, Mach):
     training.dCZ_dp = (CZ_p[0,:] - CZ_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCZ_dq = (CZ_q[0,:] - CZ_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCZ_dr = (CZ_r[0,:] - CZ_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCL_dalpha = (CL_alpha[0,:] - CL_alpha[1,:]) / (AoA[0] - AoA[1])         
+    training.dCL_dalpha = (CL_alpha[i_0,:] - CL_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])         
     training.dCL_dbeta =-((CL_beta[0,:] - CL_beta[1,:]) / (Beta[0] - Beta[1]))                
                 
                 
@@ -435,7 +777,7 @@ def train_model(aerodynamics, Mach):
     training.dCL_dp = (CL_p[0,:] - CL_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCL_dq = (CL_q[0,:] - CL_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCL_dr = (CL_r[0,:] - CL_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCM_dalpha = (CM_alpha[0,:] - CM_alpha[1,:]) / (AoA[0] - AoA[1])          
+    training.dCM_dalpha = (CM_alpha[i_0,:] - CM_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])          
     training.dCM_dbeta = (CM_beta[0,:] - CM_beta[1,:]) / (Beta[0] - Beta[1])  
                 
     training.dCM_du = (CM_u[0,:] - CM_u[1,:]) / (u[0] - u[1])                                               
@@ -444,7 +786,7 @@ def train_model(aerodynamics, Mach):
     training.dCM_dp = (CM_p[0,:] - CM_p[1,:]) / (roll_rate[0]-roll_rate[1])                 
     training.dCM_dq = (CM_q[0,:] - CM_q[1,:]) / (pitch_rate[0]-pitch_rate[1])        
     training.dCM_dr = (CM_r[0,:] - CM_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                     
-    training.dCN_dalpha = (CN_alpha[0,:] - CN_alpha[1,:]) / (AoA[0] - AoA[1])          
+    training.dCN_dalpha = (CN_alpha[i_0,:] - CN_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])          
     training.dCN_dbeta = (CN_beta[0,:] - CN_beta[1,:]) / (Beta[0] - Beta[1]) 
                      
     training.dCN_du = (CN_u[0,:] - CN_u[1,:]) / (u[0] - u[1])                                               
@@ -959,7 +1301,8 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
       
             
     # STABILITY DERIVATIVES 
-    training.dClift_dalpha = (Clift_alpha[0,:] - Clift_alpha[1,:]) / (AoA[0] - AoA[1])
+    i_0, i_1               = alpha_training_points.derivative
+    training.dClift_dalpha = (Clift_alpha[i_0,:] - Clift_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])
     training.dClift_dbeta  = (Clift_beta[0,:] - Clift_beta[1,:]) / (Beta[0] - Beta[1]) 
     training.dClift_du     = (Clift_u[0,:] - Clift_u[1,:]) / (u[0] - u[1])            
     training.dClift_dv     = (Clift_v[0,:] - Clift_v[1,:]) / (v[0] - v[1])          
@@ -967,7 +1310,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dClift_dp     = (Clift_p[0,:] - Clift_p[1,:]) / (roll_rate[0]-roll_rate[1])            
     training.dClift_dq     = (Clift_q[0,:] - Clift_q[1,:]) / (pitch_rate[0]-pitch_rate[1])        
     training.dClift_dr     = (Clift_r[0,:] - Clift_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                
-    training.dCdrag_dalpha = (Cdrag_alpha[0,:] - Cdrag_alpha[1,:]) / (AoA[0] - AoA[1])    
+    training.dCdrag_dalpha = (Cdrag_alpha[i_0,:] - Cdrag_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])    
     training.dCdrag_dbeta  = (Cdrag_beta[0,:] - Cdrag_beta[1,:]) / (Beta[0] - Beta[1])
                 
     training.dCdrag_du     = (Cdrag_u[0,:] - Cdrag_u[1,:]) / (u[0] - u[1])                     
@@ -976,7 +1319,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCdrag_dp     = (Cdrag_p[0,:] - Cdrag_p[1,:]) / (roll_rate[0]-roll_rate[1])             
     training.dCdrag_dq     = (Cdrag_q[0,:] - Cdrag_q[1,:]) / (pitch_rate[0]-pitch_rate[1])         
     training.dCdrag_dr     = (Cdrag_r[0,:] - Cdrag_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                 
-    training.dCX_dalpha    = (CX_alpha[0,:] - CX_alpha[1,:]) / (AoA[0] - AoA[1])            
+    training.dCX_dalpha    = (CX_alpha[i_0,:] - CX_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])            
     training.dCX_dbeta     = (CX_beta[0,:] - CX_beta[1,:]) / (Beta[0] - Beta[1]) 
                 
     training.dCX_du        = (CX_u[0,:] - CX_u[1,:]) / (u[0] - u[1])                                 
@@ -985,7 +1328,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCX_dp        = (CX_p[0,:] - CX_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCX_dq        = (CX_q[0,:] - CX_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCX_dr        = (CX_r[0,:] - CX_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCY_dalpha    = (CY_alpha[0,:] - CY_alpha[1,:]) / (AoA[0] - AoA[1])         
+    training.dCY_dalpha    = (CY_alpha[i_0,:] - CY_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])         
     training.dCY_dbeta     = (CY_beta[0,:] - CY_beta[1,:]) / (Beta[0] - Beta[1]) 
             
                 
@@ -995,7 +1338,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCY_dp     = (CY_p[0,:] - CY_p[1,:]) / (roll_rate[0]-roll_rate[1])                 
     training.dCY_dq     = (CY_q[0,:] - CY_q[1,:]) / (pitch_rate[0]-pitch_rate[1])             
     training.dCY_dr     = (CY_r[0,:] - CY_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                     
-    training.dCZ_dalpha = (CZ_alpha[0,:] - CZ_alpha[1,:]) / (AoA[0] - AoA[1])             
+    training.dCZ_dalpha = (CZ_alpha[i_0,:] - CZ_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])             
     training.dCZ_dbeta  = (CZ_beta[0,:] - CZ_beta[1,:]) / (Beta[0] - Beta[1])
     
                       
@@ -1005,7 +1348,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCZ_dp     = (CZ_p[0,:] - CZ_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCZ_dq     = (CZ_q[0,:] - CZ_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCZ_dr     = (CZ_r[0,:] - CZ_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCL_dalpha = (CL_alpha[0,:] - CL_alpha[1,:]) / (AoA[0] - AoA[1])         
+    training.dCL_dalpha = (CL_alpha[i_0,:] - CL_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])         
     training.dCL_dbeta  = (CL_beta[0,:] - CL_beta[1,:]) / (Beta[0] - Beta[1])                
                 
                 
@@ -1015,7 +1358,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCL_dp     = (CL_p[0,:] - CL_p[1,:]) / (roll_rate[0]-roll_rate[1])                
     training.dCL_dq     = (CL_q[0,:] - CL_q[1,:]) / (pitch_rate[0]-pitch_rate[1])            
     training.dCL_dr     = (CL_r[0,:] - CL_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                    
-    training.dCM_dalpha = (CM_alpha[0,:] - CM_alpha[1,:]) / (AoA[0] - AoA[1])          
+    training.dCM_dalpha = (CM_alpha[i_0,:] - CM_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])          
     training.dCM_dbeta  = (CM_beta[0,:] - CM_beta[1,:]) / (Beta[0] - Beta[1])  
                 
     training.dCM_du     = (CM_u[0,:] - CM_u[1,:]) / (u[0] - u[1])                                               
@@ -1024,7 +1367,7 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
     training.dCM_dp     = (CM_p[0,:] - CM_p[1,:]) / (roll_rate[0]-roll_rate[1])                 
     training.dCM_dq     = (CM_q[0,:] - CM_q[1,:]) / (pitch_rate[0]-pitch_rate[1])             
     training.dCM_dr     = (CM_r[0,:] - CM_r[1,:]) / (yaw_rate[0]-yaw_rate[1])                     
-    training.dCN_dalpha = (CN_alpha[0,:] - CN_alpha[1,:]) / (AoA[0] - AoA[1])          
+    training.dCN_dalpha = (CN_alpha[i_0,:] - CN_alpha[i_1,:]) / (AoA[i_0] - AoA[i_1])          
     training.dCN_dbeta  = (CN_beta[0,:] - CN_beta[1,:]) / (Beta[0] - Beta[1]) 
                      
     training.dCN_du = (CN_u[0,:] - CN_u[1,:]) / (u[0] - u[1])                                               
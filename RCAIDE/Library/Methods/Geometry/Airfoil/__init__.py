@@ -9,7 +9,9 @@
 # ---------------------------------------------------------------------------------------------------------------------- 
 from .compute_naca_4series           import compute_naca_4series 
 from .compute_airfoil_properties     import compute_airfoil_properties
+from .airfoil_polar_database         import airfoil_polar_key
 from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import import_airfoil_geometry  as import_airfoil_geometry 
+from .cached_airfoil_geometry        import cached_airfoil_geometry, clear_airfoil_geometry_cache
 from .import_airfoil_polars          import import_airfoil_polars
 from .convert_airfoil_to_meshgrid    import convert_airfoil_to_meshgrid
 from .generate_interpolated_airfoils import generate_interpolated_airfoils 
\ No newline at end of file
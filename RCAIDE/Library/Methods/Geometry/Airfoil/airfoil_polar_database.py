@@ -0,0 +1,139 @@
+# RCAIDE/Library/Methods/Geometry/Two_Dimensional/Airfoil/airfoil_polar_database.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import hash_data, flatten_data, unflatten_data
+
+# python imports
+import numpy as np
+import os
+import tempfile
+
+# version of the stored polars, changed whenever the analysis or the extension of the polars changes
+airfoil_polar_version = 'airfoil polars 2'
+
+# ----------------------------------------------------------------------------------------------------------------------
+# airfoil_polar_key
+# ----------------------------------------------------------------------------------------------------------------------
+def airfoil_polar_key(airfoil_geometry, airfoil_polar_files = None, use_pre_stall_data = True):
+    """Computes a content hash of everything the polars of compute_airfoil_properties depend on: the airfoil
+    geometry, the contents of the polar files and the analysis settings.
+
+    Assumptions:
+        The polar files are hashed by their contents, so moved or renamed files keep their key
+        The angle of attack and Reynolds number sweeps are part of the version of the polars
+
+    Source:
+        None
+
+    Args:
+        airfoil_geometry     (Data): airfoil geometry, None for the NACA 0012 [-]
+        airfoil_polar_files  (list): list of strings                          [-]
+        use_pre_stall_data   (bool): use the polar data before stall          [boolean]
+
+    Returns:
+        key                   (str): hex digest                               [-]
+    """
+    polars = None
+    if airfoil_polar_files != None:
+        polars = []
+        for polar_file in airfoil_polar_files:
+            with open(polar_file,'rb') as file:
+                polars.append(file.read())
+
+    return hash_data([airfoil_polar_version,airfoil_geometry,polars,bool(use_pre_stall_data)])
+
+# ----------------------------------------------------------------------------------------------------------------------
+# airfoil_polar_file
+# ----------------------------------------------------------------------------------------------------------------------
+def airfoil_polar_file(polar_database_directory, key):
+    """Names the file of the polar database that holds the polars of a key.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        polar_database_directory  (str): directory of the polar database, None for no database [-]
+        key                       (str): polar key, see airfoil_polar_key                      [-]
+
+    Returns:
+        filename                  (str): polar file, None without a directory                  [-]
+    """
+    if polar_database_directory == None:
+        return None
+    return os.path.join(os.path.expanduser(polar_database_directory),key + '.npz')
+
+# ----------------------------------------------------------------------------------------------------------------------
+# load_airfoil_polars
+# ----------------------------------------------------------------------------------------------------------------------
+def load_airfoil_polars(filename):
+    """Loads the polars and boundary layer properties of an airfoil from the polar database, if they have been
+    computed before.
+
+    Assumptions:
+        Any change to the inputs changes the file name, so stale polars are never loaded
+
+    Source:
+        None
+
+    Args:
+        filename        (str): polar file, see airfoil_polar_file   [-]
+
+    Returns:
+        Airfoil_Data   (Data): airfoil polars, None if not stored   [-]
+    """
+    if filename == None or not os.path.isfile(filename):
+        return None
+
+    try:
+        with np.load(filename,allow_pickle=False) as arrays:
+            Airfoil_Data = unflatten_data(arrays)
+    except (OSError,ValueError,KeyError):
+        return None
+
+    return Airfoil_Data
+
+# ----------------------------------------------------------------------------------------------------------------------
+# save_airfoil_polars
+# ----------------------------------------------------------------------------------------------------------------------
+def save_airfoil_polars(Airfoil_Data, filename):
+    """Stores the polars and boundary layer properties of an airfoil in the polar database as a compressed numpy
+    archive.
+
+    Assumptions:
+        The file is written to a temporary file first and then renamed, so concurrent processes never read a
+        partial file
+
+    Source:
+        None
+
+    Args:
+        Airfoil_Data   (Data): airfoil polars, see compute_airfoil_properties [-]
+        filename        (str): polar file, see airfoil_polar_file             [-]
+
+    Returns:
+        None
+    """
+    if filename == None:
+        return
+
+    directory = os.path.dirname(filename)
+    os.makedirs(directory,exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory,suffix='.npz')
+    try:
+        with os.fdopen(handle,'wb') as file:
+            np.savez_compressed(file,**flatten_data(Airfoil_Data))
+        os.replace(temporary,filename)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return
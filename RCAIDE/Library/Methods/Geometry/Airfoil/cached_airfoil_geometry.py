@@ -0,0 +1,66 @@
+# RCAIDE/Library/Methods/Geometry/Two_Dimensional/Airfoil/cached_airfoil_geometry.py
+# (c) Copyright 2023 Aerospace Research Community LLC
+#
+# Created: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from Legacy.trunk.S.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import import_airfoil_geometry
+
+# python imports
+from copy import deepcopy
+import functools
+import os
+
+# number of parsed airfoils kept in memory
+airfoil_geometry_cache_size = 256
+
+# ----------------------------------------------------------------------------------------------------------------------
+# cached_airfoil_geometry
+# ----------------------------------------------------------------------------------------------------------------------
+def cached_airfoil_geometry(airfoil_geometry_file, npoints = 201, surface_interpolation = 'cubic'):
+    """Imports an airfoil geometry like import_airfoil_geometry, but parses and resamples every coordinate file
+    only once per process. Later calls with the same file and discretization return a copy of the stored geometry.
+
+    Assumptions:
+        A file is parsed again once its modification time or size changes
+        Every call returns its own copy, so callers may change the geometry
+
+    Source:
+        None
+
+    Args:
+        airfoil_geometry_file  (str): airfoil coordinate file                   [-]
+        npoints                (int): number of points of the airfoil           [unitless]
+        surface_interpolation  (str): interpolation of the surfaces, see scipy  [-]
+
+    Returns:
+        geometry              (Data): airfoil geometry, see import_airfoil_geometry [-]
+    """
+    path  = os.path.abspath(os.path.expanduser(airfoil_geometry_file))
+    stat  = os.stat(path)
+    return deepcopy(_import_airfoil_geometry(path,stat.st_mtime_ns,stat.st_size,npoints,surface_interpolation))
+
+def clear_airfoil_geometry_cache():
+    """Drops all airfoil geometries kept in memory by cached_airfoil_geometry.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    _import_airfoil_geometry.cache_clear()
+    return
+
+@functools.lru_cache(maxsize = airfoil_geometry_cache_size)
+def _import_airfoil_geometry(path, mtime, size, npoints, surface_interpolation):
+    # mtime and size are part of the key only, so that changed files are parsed again
+    return import_airfoil_geometry(path,npoints,surface_interpolation)
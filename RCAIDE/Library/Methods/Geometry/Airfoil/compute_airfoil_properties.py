@@ -13,6 +13,7 @@ from RCAIDE.Framework.Core
 from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis      import airfoil_analysis
 from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_polars                  import import_airfoil_polars 
 from RCAIDE.Library.Methods.Geometry.Airfoil.compute_naca_4series                   import compute_naca_4series  
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_polar_database                 import airfoil_polar_key, airfoil_polar_file, load_airfoil_polars, save_airfoil_polars
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.pre_stall_coefficients             import pre_stall_coefficients
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.post_stall_coefficients            import post_stall_coefficients
 
@@ -22,7 +23,7 @@ import numpy as np
 # ----------------------------------------------------------------------------------------------------------------------
 #  compute_airfoil_properties
 # ----------------------------------------------------------------------------------------------------------------------    
-def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True):
+def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True,polar_database_directory = None):
     """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
     characterstics and AERODAS formation for post stall characteristics. This is useful for 
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
@@ -39,6 +40,11 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     airfoil_polar_files                     <string>
     boundary_layer_files                    <string>
     use_pre_stall_data                      [Boolean]
+    polar_database_directory                <string>
+    
+    If a polar database directory is given, the polars are looked up by a hash of the airfoil geometry, 
+    the polar files and the settings, and are only computed and stored if they are not found.
+    
     Returns:
     airfoil_data.
         cl_polars                           [unitless]
@@ -67,6 +73,16 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     
 
     """     
+    # ----------------------------------------------------------------------------------------
+    # Look up polars computed before 
+    # ----------------------------------------------------------------------------------------   
+    filename       = None 
+    if polar_database_directory != None: 
+        filename     = airfoil_polar_file(polar_database_directory,airfoil_polar_key(airfoil_geometry,airfoil_polar_files,use_pre_stall_data))
+        Airfoil_Data = load_airfoil_polars(filename)
+        if Airfoil_Data is not None:
+            return Airfoil_Data
+        
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -120,6 +136,8 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Airfoil_Data.angle_of_attacks    = AoA_sweep_rad 
     Airfoil_Data.lift_coefficients   = CL 
     Airfoil_Data.drag_coefficients   = CD    
+    
+    save_airfoil_polars(Airfoil_Data,filename)
         
     return Airfoil_Data
  
@@ -189,7 +207,10 @@ def compute_extended_polars(airfoil_cl,airfoil_cd,airfoil_aoa,AoA_sweep_deg,geom
     # Setup data structures for this run
     ones                                                      = np.ones_like(AoA_sweep_radians)
     settings.section_zero_lift_angle_of_attack                = A0
-    state.conditions.aerodynamics.angle_of_attack             = AoA_sweep_radians* ones  
+    state.conditions.aerodynamics.angles                      = Data()
+    state.conditions.aerodynamics.angles.alpha                = AoA_sweep_radians* ones  
+    state.conditions.aerodynamics.pre_stall_coefficients[geometry.tag]  = Data()
+    state.conditions.aerodynamics.post_stall_coefficients[geometry.tag] = Data()
     geometry.section.angle_attack_max_prestall_lift           = ACL1 * ones 
     geometry.pre_stall_maximum_drag_coefficient_angle         = ACD1 * ones 
     geometry.pre_stall_maximum_lift_coefficient               = CL1max * ones 
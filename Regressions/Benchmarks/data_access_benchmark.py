@@ -0,0 +1,139 @@
+# data_access_benchmark.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" Benchmark of Data attribute access on a regression mission. The cruise of the Closed_Form_Transport regression
+    vehicle is converged with the exception-free attribute reads and writes of Data and with the try/except lookups
+    they replaced. Both have to give the same mission. The timings, the number of attribute accesses per converge and
+    the most a __slots__ backed container could save on them are only printed, the difference between the lookups is
+    within the run to run spread of a converge.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+from RCAIDE.Framework.Core import Data, Units
+
+# python imports
+import numpy as np
+import timeit
+import sys
+
+# local imports
+sys.path.append('../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup
+
+dictgetitem          = dict.__getitem__
+objgetattrib         = object.__getattribute__
+exception_free_get   = Data.__getattribute__
+exception_free_set   = Data.__setattr__
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    repeats  = 5
+    analyses = analyses_setup(vehicle_setup())
+    converge = lambda: mission_setup(analyses,8000. * Units.m).evaluate().segments.cruise
+
+    # the same mission with either lookup, the lookups of Data are restored even if a converge fails
+    timings  = Data()
+    segments = Data()
+    try:
+        for case in ['try_except','exception_free']:
+            use_lookups(case)
+            segments[case] = converge()
+            timings[case]  = min(timeit.repeat(converge,number=1,repeat=repeats))
+    finally:
+        use_lookups('exception_free')
+
+    reference = segments.try_except
+    segment   = segments.exception_free
+    assert(segment.state.numerics.converged and reference.state.numerics.converged)
+    assert(segment.state.numerics.function_evaluations == reference.state.numerics.function_evaluations)
+    assert(np.array_equal(segment.state.conditions.weights.total_mass,reference.state.conditions.weights.total_mass))
+    assert(np.array_equal(segment.state.unknowns.pack_array(),reference.state.unknowns.pack_array()))
+
+    # the attribute accesses of one converge
+    try:
+        use_lookups('counted')
+        converge()
+    finally:
+        use_lookups('exception_free')
+
+    # the most a fixed __slots__ schema could save, every access made as cheap as a slot access
+    slots_saving = counts.reads*(access_time(Data,'read') - access_time(Slots,'read')) + \
+                   counts.writes*(access_time(Data,'write') - access_time(Slots,'write'))
+
+    print('Cruise converge, ' + str(segment.state.numerics.function_evaluations) + ' function evaluations, milliseconds')
+    print('  try/except lookups    : %8.1f' % (timings.try_except*1E3))
+    print('  exception-free lookups: %8.1f' % (timings.exception_free*1E3))
+    print('  ratio                 : %8.2f' % (timings.try_except/timings.exception_free))
+    print('Attribute accesses per converge')
+    print('  reads                 : %8d' % counts.reads)
+    print('  writes                : %8d' % counts.writes)
+    print('  __slots__ saving bound: %8.1f milliseconds' % (slots_saving*1E3))
+    assert(counts.reads > 0 and counts.writes > 0)
+
+    return timings
+
+# ----------------------------------------------------------------------
+#   Lookups
+# ----------------------------------------------------------------------
+
+counts = Data()
+
+def try_except_get(self, k):
+    """ The attribute read Data used before it was made exception-free """
+    try:
+        return dictgetitem(self,k)
+    except:
+        return objgetattrib(self,k)
+
+def try_except_set(self, k, v):
+    """ The attribute write Data used before it was made exception-free """
+    try:
+        objgetattrib(self, k)
+    except:
+        self[k] = v
+    else:
+        object.__setattr__(self, k, v)
+
+def counted_get(self, k):
+    dict.__setitem__(counts,'reads',dictgetitem(counts,'reads') + 1)
+    return exception_free_get(self,k)
+
+def counted_set(self, k, v):
+    dict.__setitem__(counts,'writes',dictgetitem(counts,'writes') + 1)
+    return exception_free_set(self,k,v)
+
+class Slots(object):
+    """ A fixed schema of one field, as a __slots__ backed Conditions would have """
+    __slots__ = ['velocity_vector']
+
+def access_time(container,access):
+    """ Seconds per attribute read or write of a field of container """
+    instance                 = container()
+    instance.velocity_vector = np.zeros((8,3))
+    if access == 'read':
+        step = lambda: instance.velocity_vector
+    else:
+        step = lambda: setattr(instance,'velocity_vector',None)
+    return min(timeit.repeat(step,number=100000,repeat=5))/100000
+
+def use_lookups(case):
+    """ Sets the attribute lookups of Data, and of every subclass that does not override them """
+    lookups = {'try_except'     : (try_except_get,try_except_set),
+               'exception_free' : (exception_free_get,exception_free_set),
+               'counted'        : (counted_get,counted_set)}
+    if case == 'counted':
+        dict.__setitem__(counts,'reads',0)
+        dict.__setitem__(counts,'writes',0)
+    Data.__getattribute__,Data.__setattr__ = lookups[case]
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# boundary_layer_march_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the boundary layer marches of the airfoil panel method, see thwaites_method and heads_method. All
+    angles of attack and Reynolds numbers are marched at once and have to give the boundary layer of each case run
+    on its own.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method import airfoil_analysis, surface_stations
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.surface_stations import gather_stations, place_stations
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the stations of every case are ordered first and put back where they were
+    MASK          = np.zeros((6,2,1),dtype = bool)
+    MASK[:2,0,0]  = True
+    MASK[3,1,0]   = True
+    FUNC          = np.ma.array(np.arange(12.).reshape(6,2,1),mask = MASK)
+    STATIONS      = surface_stations(MASK)
+    ordered       = gather_stations(STATIONS,FUNC,None)
+    assert(np.all(STATIONS.n == [4,5]))
+    assert(np.all(ordered[:,0] == [4,6,8,10,10,10]))
+    assert(np.all(ordered[:,1] == [1,3,5,9,11,11]))
+    assert(np.all(place_stations(STATIONS,ordered,MASK.shape) == np.where(MASK,0,FUNC.data)))
+
+    # a batch of cases marches every case like it is run on its own
+    airfoil_geometry = compute_naca_4series('4412',npoints = 101)
+    AoA_sweep        = np.array([-4,0,4,8])*Units.degrees
+    Re_sweep         = np.array([1,5,10])*1E5
+    AoA              = np.tile(AoA_sweep[None,:],(len(Re_sweep),1))
+    Re               = np.tile(Re_sweep[:,None],(1,len(AoA_sweep)))
+    batch            = airfoil_analysis(airfoil_geometry,AoA,Re)
+    for i in range(len(Re_sweep)):
+        for j in range(len(AoA_sweep)):
+            single = airfoil_analysis(airfoil_geometry,AoA[i:i+1,j:j+1],Re[i:i+1,j:j+1])
+            for name in ['theta','delta_star','delta','H','cf','Re_theta']:
+                assert(np.allclose(batch[name][i,j],single[name][0,0],rtol = 1E-10,atol = 1E-14))
+            assert(np.isclose(batch.cd_visc[i,j],single.cd_visc[0,0],rtol = 1E-10))
+
+    # truth values
+    cd_visc_truth   = np.array([[0.01179127,0.01051564,0.01285159,0.0191518 ],
+                                [0.00788198,0.00691059,0.0069033 ,0.01185789],
+                                [0.00690024,0.0064368 ,0.00627054,0.0110808 ]])
+    error           = Data()
+    error.cd_visc   = np.max(np.abs(batch.cd_visc - cd_visc_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# shared_geometry_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the Hess-Smith solve of a geometry shared between cases, see shared_geometry of airfoil_analysis.
+    The influence matrix of the airfoil is factorized once for all angles of attack and has to give the velocities
+    and polars of the matrices built for every case.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method import airfoil_analysis, hess_smith
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    airfoil_geometry = compute_naca_4series('2412',npoints = 101)
+    x_coord          = airfoil_geometry.x_coordinates
+    y_coord          = airfoil_geometry.y_coordinates
+    npanel           = len(x_coord) - 1
+    AoA_sweep        = np.array([-2,0,3,6,9])*Units.degrees
+    Re_sweep         = np.array([2,8])*1E5
+    AoA              = np.tile(AoA_sweep[None,:],(len(Re_sweep),1))
+    Re               = np.tile(Re_sweep[:,None],(1,len(AoA_sweep)))
+    shape            = (len(x_coord),len(AoA_sweep),len(Re_sweep))
+
+    # a geometry shared along one or both case axes solves like a geometry for every case
+    x_3d             = np.broadcast_to(x_coord[:,None,None],shape)
+    y_3d             = np.broadcast_to(y_coord[:,None,None],shape)
+    X,Y,vt,normals   = hess_smith(x_3d,y_3d,AoA,Re,npanel)
+    for x_geo,y_geo in [(x_coord[:,None,None],y_coord[:,None,None]),(x_3d[:,:,:1],y_3d[:,:,:1]),(x_3d[:,:1],y_3d[:,:1])]:
+        X_geo,Y_geo,vt_geo,normals_geo = hess_smith(x_geo,y_geo,AoA,Re,npanel)
+        assert(np.all(X_geo == X) and np.all(Y_geo == Y) and np.all(normals_geo == normals))
+        assert(np.allclose(vt_geo,vt,rtol = 0,atol = 1E-12))
+
+    # the polars of the shared factorization are those of a matrix for every case
+    shared   = airfoil_analysis(airfoil_geometry,AoA,Re)
+    per_case = airfoil_analysis(airfoil_geometry,AoA,Re,shared_geometry = False)
+    for name in ['cl_invisc','cd_invisc','cm_invisc','cd_visc']:
+        assert(np.allclose(shared[name],per_case[name],rtol = 1E-9,atol = 1E-12))
+    for name in ['Ue_Vinf','theta','H','cf']:
+        assert(np.allclose(shared[name],per_case[name],rtol = 1E-8,atol = 1E-12))
+
+    # truth values
+    cl_invisc_truth = np.array([0.00311191,0.22702264,0.5623896,0.89631518,1.22785325])
+    error           = Data()
+    error.cl_invisc = np.max(np.abs(shared.cl_invisc[0] - cl_invisc_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# transition_march_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the single pass boundary layer march of the airfoil panel method, see boundary_layer_march. Every
+    case is laminar up to its transition and turbulent downstream of it, and has to give the boundary layer of
+    Thwaites' and Head's methods run one after the other, on a flat plate and in the analysis of a NACA airfoil.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Geometry.Airfoil import compute_naca_4series
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method import airfoil_analysis, boundary_layer_march, thwaites_method, heads_method
+
+# python imports
+import numpy as np
+import sys
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # flat plates at two Reynolds numbers, the second case starts 10 stations later
+    npanel         = 101
+    ncases         = 2
+    ncpts          = 2
+    THETA_0        = 1E-5
+    tol            = 1E0
+    MASK           = np.zeros((npanel,ncases,ncpts),dtype = bool)
+    MASK[:10,1,:]  = True
+    X              = np.zeros((npanel,ncases,ncpts))
+    X[:,0,:]       = np.linspace(0,1,npanel)[:,None]
+    X[10:,1,:]     = np.linspace(0,1,npanel-10)[:,None]
+    X_I            = np.ma.array(X,mask = MASK)
+    VE_I           = np.ma.array(np.ones_like(X),mask = MASK)
+    DVE_I          = np.ma.array(np.zeros_like(X),mask = MASK)
+    L              = np.ones((ncases,ncpts))
+    RE_L           = np.tile(np.array([[1E6,5E6]]),(ncases,1))
+    RESULTS        = boundary_layer_march(npanel,ncases,ncpts,L,RE_L,X_I,VE_I,DVE_I,tol,THETA_0)
+
+    # the laminar boundary layer of a flat plate grows with the square root of the distance
+    laminar        = RESULTS.X <= RESULTS.X_TR[None,:,:]
+    theta_plate    = np.sqrt(THETA_0**2 + 0.45*X*L/RE_L)
+    assert(np.allclose(RESULTS.THETA[laminar*~MASK],theta_plate[laminar*~MASK],rtol = 1E-10))
+    assert(np.all(RESULTS.THETA[MASK] == 0))
+
+    # the low Reynolds number stays laminar, the high one turns turbulent at the same distance in both cases
+    assert(np.all(RESULTS.X_TR[:,0] == 1.))
+    assert(RESULTS.X_TR[0,1] < 1.)
+    assert(np.isclose(RESULTS.X_TR[0,1],RESULTS.X_TR[1,1],atol = 1./(npanel-11)))
+
+    # upstream of the transition the march is Thwaites' method, downstream of it Head's method
+    T_RESULTS      = thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I,DVE_I,tol,THETA_0)
+    upstream       = (RESULTS.X < RESULTS.X_TR[None,:,:])*~MASK
+    for name,T_name in [('THETA','THETA_T'),('H','H_T'),('CF','CF_T'),('DELTA','DELTA_T')]:
+        assert(np.allclose(RESULTS[name][upstream],T_RESULTS[T_name][upstream],rtol = 1E-10))
+
+    transition     = np.argmax(np.ma.getdata(X_I) >= RESULTS.X_TR[None,:,:],axis = 0)
+    start          = lambda FUNC: np.take_along_axis(FUNC,transition[None,:,:],axis = 0)[0]
+    H_RESULTS      = heads_method(npanel,ncases,ncpts,start(T_RESULTS.DELTA_T),start(T_RESULTS.DELTA_STAR_T),start(T_RESULTS.CF_T),
+                                  start(T_RESULTS.H_T),start(T_RESULTS.THETA_T),L,RE_L,
+                                  np.ma.masked_less(X - RESULTS.X_TR[None,:,:],0),VE_I,DVE_I)
+    downstream     = (RESULTS.X >= RESULTS.X_TR[None,:,:])*~MASK*(RESULTS.X_TR < 1.)[None,:,:]
+    for name,H_name in [('THETA','THETA_H'),('H','H_H'),('CF','CF_H'),('DELTA','DELTA_H'),('RE_X','RE_X_H')]:
+        assert(np.allclose(RESULTS[name][downstream],H_RESULTS[H_name][downstream],rtol = 1E-10))
+
+    # the analysis of a NACA airfoil gives the boundary layer and polars of the two methods run one after the other
+    airfoil_geometry = compute_naca_4series('4412',npoints = 101)
+    AoA_sweep        = np.array([-4,0,4,8])*Units.degrees
+    Re_sweep         = np.array([1,5,20])*1E5
+    AoA              = np.tile(AoA_sweep[None,:],(len(Re_sweep),1))
+    Re               = np.tile(Re_sweep[:,None],(1,len(AoA_sweep)))
+    single_pass      = airfoil_analysis(airfoil_geometry,AoA,Re)
+    analysis_module  = sys.modules[airfoil_analysis.__module__]
+    two_pass_results = []
+    def two_pass(*args,**kwargs):
+        two_pass_results.append(two_pass_march(*args,**kwargs))
+        return two_pass_results[-1]
+    analysis_module.boundary_layer_march = two_pass
+    try:
+        two_pass_polar = airfoil_analysis(airfoil_geometry,AoA,Re)
+    finally:
+        analysis_module.boundary_layer_march = boundary_layer_march
+    surface_length   = np.ma.getdata(np.ma.max(two_pass_results[0].X,axis = 0))
+    assert(np.any(two_pass_results[0].X_TR < surface_length) and np.any(two_pass_results[0].X_TR == surface_length))
+    for name in ['theta','delta_star','delta','H','cf','Re_theta','Re_x','cd_visc','cp']:
+        assert(np.allclose(single_pass[name],two_pass_polar[name],rtol = 1E-8,atol = 1E-12))
+
+    # truth values
+    theta_truth     = np.array([0.00067089,0.00122528])
+    error           = Data()
+    error.theta     = np.max(np.abs(RESULTS.THETA[-1,0,:] - theta_truth))
+    error.X_TR      = np.abs(RESULTS.X_TR[0,1] - 0.33)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def two_pass_march(npanel,ncases,ncpts,L,RE_L,X_I,VE_I,DVE_I,tol,THETA_0):
+    """ The boundary layer of Thwaites' method over the whole surface, then of Head's method from the first station
+        that meets the Michel criteria, with the arguments and results of boundary_layer_march
+    """
+    T_RESULTS  = thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I,DVE_I,tol,THETA_0)
+    surface    = ~np.ma.getmaskarray(X_I)
+    X          = np.ma.getdata(T_RESULTS.X_T)
+    with np.errstate(divide = 'ignore',invalid = 'ignore'):
+        TR_CRIT = T_RESULTS.RE_THETA_T - 1.174*(1 + 22400/T_RESULTS.RE_X_T)*T_RESULTS.RE_X_T**0.46
+    met        = (TR_CRIT > 0)*surface
+    turbulent  = np.any(met,axis = 0)
+    last       = npanel - 1 - np.argmax(surface[::-1],axis = 0)
+    transition = np.where(turbulent,np.argmax(met,axis = 0),last)
+    start      = lambda FUNC: np.take_along_axis(np.ma.getdata(FUNC),transition[None,:,:],axis = 0)[0]
+    X_TR       = start(X)
+    H_RESULTS  = heads_method(npanel,ncases,ncpts,start(T_RESULTS.DELTA_T),start(T_RESULTS.DELTA_STAR_T),start(T_RESULTS.CF_T),
+                              start(T_RESULTS.H_T),start(T_RESULTS.THETA_T),np.ma.getdata(L),RE_L,
+                              np.ma.masked_less(X - X_TR[None,:,:],0),VE_I,DVE_I)
+    downstream = (np.arange(npanel)[:,None,None] >= transition[None,:,:])*turbulent[None,:,:]
+    RESULTS    = Data(X = T_RESULTS.X_T, X_TR = X_TR)
+    for name in ['THETA','DELTA_STAR','H','CF','RE_THETA','RE_X','DELTA']:
+        RESULTS[name] = np.where(downstream,H_RESULTS[name + '_H'],T_RESULTS[name + '_T'])
+    return RESULTS
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# polar_database_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the airfoil polar database, see polar_database_directory of compute_airfoil_properties. Polars
+    computed before are looked up by a hash of the airfoil, its polar files and the settings, and have to be the
+    polars computed from scratch.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Geometry.Airfoil import compute_airfoil_properties, import_airfoil_geometry, airfoil_polar_key
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_polar_database import airfoil_polar_file
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    airfoil_file     = '../../Vehicles/Airfoils/NACA_4412.txt'
+    polar_files      = ['../../Vehicles/Airfoils/Polars/NACA_4412_polar_Re_' + Re + '.txt' for Re in ['50000','100000','200000','500000','1000000']]
+    airfoil_geometry = import_airfoil_geometry(airfoil_file,npoints = 101)
+    directory        = tempfile.mkdtemp()
+
+    try:
+        # without a database the polars are computed
+        computed = compute_airfoil_properties(airfoil_geometry,polar_files)
+
+        # the first lookup computes and stores the polars, the second one loads them
+        tic    = time.time()
+        stored = compute_airfoil_properties(airfoil_geometry,polar_files,polar_database_directory = directory)
+        t_computed = time.time() - tic
+        tic    = time.time()
+        loaded = compute_airfoil_properties(airfoil_geometry,polar_files,polar_database_directory = directory)
+        t_loaded = time.time() - tic
+        print('computed in %.3f s, loaded in %.3f s' % (t_computed,t_loaded))
+        assert(len(os.listdir(directory)) == 1)
+        for data in [stored,loaded]:
+            assert(np.all(data.lift_coefficients == computed.lift_coefficients))
+            assert(np.all(data.drag_coefficients == computed.drag_coefficients))
+            assert(np.all(data.angle_of_attacks == computed.angle_of_attacks))
+            assert(np.all(data.reynolds_numbers == computed.reynolds_numbers))
+            assert(np.all(data.boundary_layer.theta_lower_surface == computed.boundary_layer.theta_lower_surface))
+
+        # the key depends on the airfoil, the polar files and the settings, not on where the files are
+        key = airfoil_polar_key(airfoil_geometry,polar_files)
+        assert(airfoil_polar_key(import_airfoil_geometry(airfoil_file,npoints = 101),polar_files) == key)
+        moved = [shutil.copy(polar_file,directory) for polar_file in polar_files]
+        assert(airfoil_polar_key(airfoil_geometry,moved) == key)
+        for f in moved:
+            os.remove(f)
+        assert(airfoil_polar_key(import_airfoil_geometry(airfoil_file,npoints = 121),polar_files) != key)
+        assert(airfoil_polar_key(airfoil_geometry,polar_files[:-1]) != key)
+        assert(airfoil_polar_key(airfoil_geometry,polar_files,use_pre_stall_data = False) != key)
+        assert(airfoil_polar_key(airfoil_geometry) != key)
+
+        # a damaged file is computed again and replaced
+        filename = airfoil_polar_file(directory,key)
+        with open(filename,'wb') as file:
+            file.write(b'damaged')
+        repaired = compute_airfoil_properties(airfoil_geometry,polar_files,polar_database_directory = directory)
+        assert(np.all(repaired.lift_coefficients == computed.lift_coefficients))
+        assert(os.path.getsize(filename) > len(b'damaged'))
+    finally:
+        shutil.rmtree(directory)
+
+    # truth values
+    CL_truth   = np.array([0.003,1.1122,0.96684614])
+    CD_truth   = np.array([0.01638,0.01444,0.37477003])
+    error      = Data()
+    error.CL   = np.max(np.abs(loaded.lift_coefficients[2,[10,20,40]] - CL_truth))
+    error.CD   = np.max(np.abs(loaded.drag_coefficients[2,[10,20,40]] - CD_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# column_buffer_conditions_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of segment conditions expanded into one contiguous column buffer, see Conditions.expand_rows. The
+    expanded fields have to hold the values np.resize gave them before, as columns of a single Fortran ordered
+    buffer, while integer, empty and ones_row_m1 fields keep their own arrays.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core            import Data
+from RCAIDE.Framework.Mission.Common  import State, Conditions, Results
+
+# python imports
+import numpy as np
+import copy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_control_points = 16
+
+    # the same conditions expanded field by field with np.resize
+    state                                    = State()
+    state.conditions.update(Results())
+    state.conditions.frames.inertial.time    = 2. * np.ones((1,1))
+    state.conditions.custom                  = Conditions()
+    state.conditions.custom.flags            = np.ones((1,3),dtype=int)
+    state.conditions.custom.empty            = np.zeros((1,0))
+    state.conditions.custom.expanded         = np.array([[1.,2.],[3.,4.],[5.,6.]])
+    state.conditions.custom.differences      = state.conditions.ones_row_m1(2)
+    reference                                = copy.deepcopy(state)
+    resize_rows(reference.conditions,number_of_control_points)
+
+    state.expand_rows(number_of_control_points)
+
+    # every field holds the value np.resize gave it
+    fields     = flatten_arrays(state.conditions)
+    references = flatten_arrays(reference.conditions)
+    assert(sorted(fields.keys()) == sorted(references.keys()))
+    for key,value in fields.items():
+        assert(value.shape == references[key].shape)
+        assert(np.all(value == references[key]))
+
+    # the floating point fields are column views of one Fortran ordered buffer
+    buffer  = state.conditions.frames.inertial.time.base
+    columns = 0
+    for key,value in fields.items():
+        if key in ['custom.flags','custom.empty','custom.differences','custom.expanded']:
+            assert(not np.shares_memory(value,buffer))
+            continue
+        assert(value.base is buffer)
+        assert(value.flags.f_contiguous)
+        columns += value.shape[1]
+    assert(buffer.flags.f_contiguous)
+    assert(buffer.shape == (number_of_control_points,columns))
+    assert(state.conditions.custom.differences.shape[0] == number_of_control_points - 1)
+    assert(state.conditions.custom.flags.dtype == int)
+
+    # fields do not overlap, writing one leaves the others unchanged
+    state.conditions.frames.inertial.time[:,0] = np.linspace(0.,1.,number_of_control_points)
+    for key,value in flatten_arrays(state.conditions).items():
+        if key != 'frames.inertial.time':
+            assert(np.all(value == references[key]))
+
+    # a reassigned field stops sharing the buffer
+    state.conditions.freestream.density = 1.225 * np.ones((number_of_control_points,1))
+    assert(not np.shares_memory(state.conditions.freestream.density,buffer))
+
+    # expanded fields are kept unless overridden
+    state.expand_rows(number_of_control_points)
+    assert(state.conditions.frames.inertial.time.base is buffer)
+    state.expand_rows(number_of_control_points,override=True)
+    assert(state.conditions.frames.inertial.time.base is not buffer)
+    assert(np.all(state.conditions.frames.inertial.time[:,0] == np.linspace(0.,1.,number_of_control_points)))
+
+    # truth values
+    time_truth   = 8.0
+    time         = np.sum(state.conditions.frames.inertial.time)
+    error        = Data()
+    error.time   = np.abs(time - time_truth)
+    print('buffer columns: ' + str(columns))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-12)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def resize_rows(conditions,rows):
+    """ Expands the conditions one field at a time, as expand_rows did before the column buffer """
+    conditions._size = rows
+    for k,v in dict.items(conditions):
+        if isinstance(v,Conditions):
+            resize_rows(v,rows)
+        elif hasattr(v,'resize') and not isinstance(v,np.ndarray):
+            conditions[k] = v.resize(rows)
+        elif isinstance(v,np.ndarray) and v.ndim == 2 and v.shape[0] <= 1:
+            conditions[k] = np.resize(v,[rows,v.shape[1]])
+    return
+
+def flatten_arrays(conditions,prefix=''):
+    """ Lists the two dimensional arrays of the conditions, the only ones that are expanded """
+    arrays = {}
+    for k,v in dict.items(conditions):
+        if isinstance(v,dict):
+            arrays.update(flatten_arrays(v,prefix + k + '.'))
+        elif isinstance(v,np.ndarray) and v.ndim == 2:
+            arrays[prefix + k] = v
+    return arrays
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# lazy_conditions_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of lazily expanded segment conditions, see Conditions.expand_rows """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                       import Data
+from RCAIDE.Framework.Mission.Common             import State, Conditions, Results
+from RCAIDE.Framework.Mission.Common.Conditions  import lazy_array, Lazy_Conditions
+
+# python imports
+import numpy as np
+import pickle
+import copy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_control_points = 8
+
+    # eager and lazy expansion of the same conditions
+    eager = segment_state(number_of_control_points,lazy=False)
+    lazy  = segment_state(number_of_control_points,lazy=True)
+
+    eager_fields       = count_arrays(eager.conditions)
+    lazy_fields        = count_placeholders(lazy.conditions)
+    eager_placeholders = count_placeholders(eager.conditions)
+    print('expanded fields   : ' + str(eager_fields))
+    print('lazy placeholders : ' + str(lazy_fields))
+
+    # every expanded field starts as a placeholder, eager conditions have none and no lazy overrides
+    assert(lazy_fields == eager_fields)
+    assert(eager_placeholders == 0)
+    assert(type(eager.conditions.frames.inertial) is Conditions)
+    assert(type(lazy.conditions.frames.inertial) is Lazy_Conditions)
+
+    # every way of reading a field allocates it with the value of the eager expansion
+    reads                = Data()
+    reads.attribute_read = lazy.conditions.frames.inertial.time
+    reads.key_read       = lazy.conditions.frames.inertial['position_vector']
+    reads.get_read       = lazy.conditions.frames.inertial.get('velocity_vector')
+    reads.items_read     = dict(lazy.conditions.freestream.items())['density']
+    reads.values_read    = list(lazy.conditions.weights.values())[0]
+    for name,value in reads.items():
+        assert(isinstance(value,np.ndarray))
+        assert(value.shape[0] == number_of_control_points)
+    assert(np.all(reads.attribute_read == eager.conditions.frames.inertial.time))
+
+    # packing, recursion, copying and pickling never hand out placeholders
+    for name,function in [['pack_array' , lambda conditions: conditions.pack_array()],
+                          ['do_recursive', lambda conditions: conditions.do_recursive(lambda a: a)],
+                          ['deepcopy'    , copy.deepcopy],
+                          ['pickle'      , lambda conditions: pickle.loads(pickle.dumps(conditions))]]:
+        conditions = segment_state(number_of_control_points,lazy=True).conditions
+        result     = function(conditions)
+        if isinstance(result,Data):
+            assert(count_placeholders(result) == 0)
+        assert(count_placeholders(conditions) == 0)
+        print(name + ' allocates every placeholder')
+    packed_lazy  = segment_state(number_of_control_points,lazy=True).conditions.pack_array()
+    packed_eager = eager.conditions.pack_array()
+    assert(np.all(packed_lazy == packed_eager))
+
+    # merging one or several segments keeps the same fields, untouched fields are left out
+    merged = Data()
+    for number_of_segments in [1,2]:
+        container = State.Container()
+        for i in range(number_of_segments):
+            state = segment_state(number_of_control_points,lazy=True)
+            state.conditions.frames.inertial.time[:,0] = np.linspace(0,1,number_of_control_points) + i
+            container.segments['segment_' + str(i)] = state
+        merged[str(number_of_segments)] = container.merged()
+    for number_of_segments,state in merged.items():
+        time = state.conditions.frames.inertial.time
+        assert(time.shape[0] == int(number_of_segments)*number_of_control_points)
+        assert('density' not in state.conditions.freestream)
+        assert(count_placeholders(state.conditions) == 0)
+    assert(sorted(flatten_keys(merged['1'].conditions)) == sorted(flatten_keys(merged['2'].conditions)))
+
+    # eager merging of a single segment keeps every field
+    container            = State.Container()
+    container.segments.a = segment_state(number_of_control_points,lazy=False)
+    assert('density' in container.merged().conditions.freestream)
+
+    # truth values
+    fields_truth        = 226
+    merged_time_truth   = 8.0
+    merged_time         = np.sum(merged['2'].conditions.frames.inertial.time[number_of_control_points:]) - np.sum(merged['1'].conditions.frames.inertial.time)
+    error               = Data()
+    error.fields        = np.abs(eager_fields - fields_truth)
+    error.merged_time   = np.abs(merged_time - merged_time_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-12)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def segment_state(number_of_control_points,lazy):
+    state = State()
+    state.conditions.update(Results())
+    state.expand_rows(number_of_control_points,lazy=lazy)
+    return state
+
+def count_placeholders(conditions):
+    count = 0
+    for k,v in dict.items(conditions):
+        if isinstance(v,dict):
+            count += count_placeholders(v)
+        elif isinstance(v,lazy_array):
+            count += 1
+    return count
+
+def count_arrays(conditions):
+    count = 0
+    for k,v in dict.items(conditions):
+        if isinstance(v,Conditions):
+            count += count_arrays(v)
+        elif isinstance(v,np.ndarray) and v.ndim == 2 and v.dtype == np.float64 and v.size > 0:
+            count += 1
+    return count
+
+def flatten_keys(conditions,prefix=''):
+    keys = []
+    for k,v in dict.items(conditions):
+        if isinstance(v,dict):
+            keys += flatten_keys(v,prefix + k + '.')
+        else:
+            keys.append(prefix + k)
+    return keys
+
+if __name__ == '__main__':
+    main()
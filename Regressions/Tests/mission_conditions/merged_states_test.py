@@ -0,0 +1,130 @@
+# merged_states_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of merged segment states, see State.Container.merged. The states of several segments stacked in one
+    pass have to match the segments appended one by one, field for field and container class for container class.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                    import Data
+from RCAIDE.Framework.Mission.Common          import State
+from RCAIDE.Framework.Mission.Segments.Climb  import Constant_Speed_Constant_Rate
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_control_points = 16
+    number_of_segments       = 4
+    generator                = np.random.default_rng(0)
+
+    # segments with random conditions, fields that only some segments have and a scalar
+    container = State.Container()
+    for i in range(number_of_segments):
+        state = Constant_Speed_Constant_Rate().state
+        state.expand_rows(number_of_control_points)
+        fill(state.conditions,generator)
+        state.conditions.frames.inertial.time[:,0] = np.linspace(0.,1.,number_of_control_points) + i
+        state.unknowns.throttle_0                  = generator.random((number_of_control_points,1))
+        state.residuals.force_x                    = generator.random((number_of_control_points,1))
+        if i == 0:
+            state.conditions.first_only  = generator.random((number_of_control_points,1))
+            state.conditions.tag         = 'first'
+        if i == 2:
+            state.conditions.third_only  = generator.random((number_of_control_points,1))
+        container.segments['segment_' + str(i)] = state
+
+    merged    = container.merged()
+    reference = append_merged(container)
+
+    # every array and container class matches the segments appended one by one, the fields that are not arrays
+    # take the value of the first segment
+    first = container.segments.segment_0
+    for key in ['unknowns','conditions','residuals']:
+        fields           = flatten(merged[key])
+        reference_fields = flatten(reference[key])
+        first_fields     = flatten(first[key])
+        assert(type(merged[key]) is type(reference[key]))
+        assert([name for name in fields.keys() if name in reference_fields] == list(reference_fields.keys()))
+        for name,value in fields.items():
+            if isinstance(value,np.ndarray):
+                assert(np.all(value == reference_fields[name]))
+            elif name in reference_fields:
+                assert(value == reference_fields[name])
+            else:
+                assert(value is first_fields[name])
+    assert(merged.conditions.frames.inertial.time.shape[0] == number_of_segments*number_of_control_points)
+    assert('third_only' not in merged.conditions)
+    assert(merged.conditions.first_only.shape[0] == number_of_control_points)
+    assert(merged.conditions.tag == 'first')
+
+    # a single segment is copied and no segment gives an empty state
+    single            = State.Container()
+    single.segments.a = container.segments.segment_0
+    assert(np.all(single.merged().conditions.frames.inertial.time == container.segments.segment_0.conditions.frames.inertial.time))
+    assert(len(State.Container().merged().conditions) == 0)
+
+    # truth values
+    time_truth   = 128.0
+    time         = np.sum(merged.conditions.frames.inertial.time)
+    error        = Data()
+    error.time   = np.abs(time - time_truth)/time_truth
+    print('merged time: ' + str(time))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-12)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def append_merged(container):
+    """ Merges the segments by appending them one by one, as State.Container.merged did before stack_arrays """
+    state_out = State()
+    for i,sub_state in enumerate(container.segments.values()):
+        for key in ['unknowns','conditions','residuals']:
+            if i == 0:
+                state_out[key].update(sub_state[key])
+            else:
+                state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+    return state_out
+
+def append_array(A,B=None):
+    if isinstance(A,np.ndarray) and isinstance(B,np.ndarray):
+        return np.vstack([A,B])
+    else:
+        return None
+
+def fill(data,generator):
+    for k,v in data.items():
+        if isinstance(v,Data):
+            fill(v,generator)
+        elif isinstance(v,np.ndarray) and v.ndim == 2 and v.size > 0:
+            data[k] = generator.random(v.shape)
+    return
+
+def flatten(data,prefix=''):
+    fields = {}
+    for k,v in data.items():
+        if isinstance(v,Data):
+            fields[prefix + k] = type(v).__name__
+            fields.update(flatten(v,prefix + k + '.'))
+        else:
+            fields[prefix + k] = v
+    return fields
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# batched_cases_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of batched segment cases, see state.numerics.number_of_cases. Two cruise altitudes, and two climbs and
+    descents, solved as one segment are compared with the same segments solved one at a time.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                      import Units, Data
+from RCAIDE.Framework.Mission.Functions.Common  import extract_case
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup, cruise_segment_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analyses  = analyses_setup(vehicle_setup())
+    altitudes = [8000. * Units.m, 10000. * Units.m]
+
+    # one case at a time, the follow-on cruise starts from the end of the first one
+    singles = []
+    for altitude in altitudes:
+        cruise   = mission_setup(analyses,altitude).evaluate().segments.cruise
+        cruise_2 = follow_on_setup(analyses,cruise).evaluate().segments.cruise_2
+        singles.append([cruise,cruise_2])
+
+    # both cases at once
+    cruise   = mission_setup(analyses,altitudes,number_of_cases=2).evaluate().segments.cruise
+    cruise_2 = follow_on_setup(analyses,cruise).evaluate().segments.cruise_2
+
+    # every case of the batch matches its single case run
+    assert_equal_cases([cruise,cruise_2],singles)
+
+    # a climb at two climb rates, a constant angle climb at two climb angles and a descent, one case at a time and
+    # both cases at once
+    climb_rates  = [8. * Units['m/s'], 12. * Units['m/s']]
+    climb_angles = [2. * Units.deg, 3. * Units.deg]
+    singles      = [climb_descent_setup(analyses,climb_rate,climb_angle) for climb_rate,climb_angle in zip(climb_rates,climb_angles)]
+    batched      = climb_descent_setup(analyses,climb_rates,climb_angles,number_of_cases=2)
+    assert_equal_cases(batched,singles)
+
+    # segments written for a single case refuse to be batched
+    takeoff                                     = RCAIDE.Framework.Mission.Segments.Ground.Takeoff()
+    takeoff.state.numerics.number_of_cases      = 2
+    try:
+        takeoff.process.initialize.conditions(takeoff)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a single case segment was batched')
+
+    # truth values
+    final_mass_truth_1   = 68509.07658818176
+    final_mass_truth_2   = 68632.0564827274
+    final_mass_1         = extract_case(cruise,0).weights.total_mass[-1,0]
+    final_mass_2         = extract_case(cruise,1).weights.total_mass[-1,0]
+    descent_mass_truth_1 = 69106.97720299182
+    descent_mass_truth_2 = 69273.27211400257
+    descent_mass_1       = extract_case(batched[-1],0).weights.total_mass[-1,0]
+    descent_mass_2       = extract_case(batched[-1],1).weights.total_mass[-1,0]
+    print('final mass, case 1: ' + str(final_mass_1))
+    print('final mass, case 2: ' + str(final_mass_2))
+    print('descent final mass, case 1: ' + str(descent_mass_1))
+    print('descent final mass, case 2: ' + str(descent_mass_2))
+
+    error                = Data()
+    error.final_mass_1   = np.abs(final_mass_1 - final_mass_truth_1)/final_mass_truth_1
+    error.final_mass_2   = np.abs(final_mass_2 - final_mass_truth_2)/final_mass_truth_2
+    error.descent_mass_1 = np.abs(descent_mass_1 - descent_mass_truth_1)/descent_mass_truth_1
+    error.descent_mass_2 = np.abs(descent_mass_2 - descent_mass_truth_2)/descent_mass_truth_2
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def follow_on_setup(analyses,previous_segment):
+    """ A cruise that takes its altitude, speed, time and mass from the end of another segment """
+    mission                = RCAIDE.Framework.Mission.Sequential_Segments()
+    segment                = cruise_segment_setup(analyses,'cruise_2',previous_segment.state.numerics.number_of_cases)
+    segment.distance       = 200. * Units.km
+    segment.state.initials = previous_segment.state
+    mission.append_segment(segment)
+    return mission
+
+def climb_descent_setup(analyses,climb_rate,climb_angle,number_of_cases=1):
+    """ A constant rate climb, a constant angle climb and a constant rate descent, each flown as its own mission from
+        the end of the segment before it
+    """
+    climb                           = flight_segment_setup(RCAIDE.Framework.Mission.Segments.Climb.Constant_Speed_Constant_Rate(),analyses,'climb',number_of_cases)
+    climb.altitude_start            = 3000. * Units.m
+    climb.altitude_end              = 7000. * Units.m
+    climb.air_speed                 = 180.  * Units['m/s']
+    climb.climb_rate                = climb_rate
+
+    climb_2                         = flight_segment_setup(RCAIDE.Framework.Mission.Segments.Climb.Constant_Mach_Constant_Angle(),analyses,'climb_2',number_of_cases)
+    climb_2.altitude_end            = 9000. * Units.m
+    climb_2.mach_number             = 0.7
+    climb_2.climb_angle             = climb_angle
+    climb_2.state.unknowns.altitude = climb_2.state.ones_row(1) * 8000. * Units.m
+
+    descent                         = flight_segment_setup(RCAIDE.Framework.Mission.Segments.Descent.Constant_Speed_Constant_Rate(),analyses,'descent',number_of_cases)
+    descent.altitude_end            = 4000. * Units.m
+    descent.air_speed               = 200.  * Units['m/s']
+    descent.descent_rate            = 10.   * Units['m/s']
+
+    segments = []
+    for segment in [climb,climb_2,descent]:
+        mission = RCAIDE.Framework.Mission.Sequential_Segments()
+        if segments:
+            segment.state.initials = segments[-1].state
+        mission.append_segment(segment)
+        segments.append(mission.evaluate().segments[segment.tag])
+    return segments
+
+def flight_segment_setup(segment,analyses,tag,number_of_cases):
+    """ A segment trimmed in x and z with the throttle and the body angle """
+    segment.tag                                                       = tag
+    segment.analyses.extend(analyses)
+    segment.state.numerics.number_of_control_points                   = 8
+    segment.state.numerics.number_of_cases                            = number_of_cases
+    segment.flight_dynamics.force_x                                   = True
+    segment.flight_dynamics.force_z                                   = True
+    segment.assigned_control_variables.throttle.active                = True
+    segment.assigned_control_variables.throttle.assigned_propulsors   = [['engine']]
+    segment.assigned_control_variables.body_angle.active              = True
+    return segment
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_equal_cases(batched_segments,singles):
+    """ Compares every case of batched segments with the segments of its single case run """
+    for index,single in enumerate(singles):
+        for batched_segment,single_segment in zip(batched_segments,single):
+            assert(batched_segment.state.numerics.converged and single_segment.state.numerics.converged)
+            case       = extract_case(batched_segment,index)
+            conditions = single_segment.state.conditions
+            assert(np.allclose(case.freestream.altitude,conditions.freestream.altitude,rtol=0,atol=1e-9))
+            assert(np.allclose(case.frames.inertial.time,conditions.frames.inertial.time,rtol=0,atol=1e-9))
+            assert(np.allclose(case.frames.inertial.position_vector,conditions.frames.inertial.position_vector,rtol=0,atol=1e-6))
+            assert(np.allclose(case.frames.body.inertial_rotations,conditions.frames.body.inertial_rotations,rtol=0,atol=1e-9))
+            assert(np.allclose(case.weights.total_mass,conditions.weights.total_mass,rtol=1e-10,atol=0))
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# parallel_missions_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of missions evaluated over a process pool, see evaluate_missions. Two cruise missions evaluated by two
+    workers are compared with the same missions evaluated in this process.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units, Data, Cache
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    altitudes = [8000. * Units.m, 10000. * Units.m]
+
+    results = Data()
+    for number_of_workers in [1,2]:
+        missions = missions_setup(altitudes)
+
+        # a filled cache arrives empty in the copies sent to the workers
+        for key in ['low_cruise','high_cruise']:
+            missions[key].segments.cruise.analyses.aerodynamics.settings.polar_cache.polar = np.ones((1000,1000))
+
+        results[str(number_of_workers)] = missions.evaluate(number_of_workers=number_of_workers)
+
+    # the parallel evaluation returns new missions, leaves the caches of the inputs filled and matches the serial one
+    for key in ['low_cruise','high_cruise']:
+        serial   = results['1'][key].segments.cruise
+        parallel = results['2'][key].segments.cruise
+        assert(results['2'][key] is not missions[key])
+        assert(missions[key].segments.cruise.analyses.aerodynamics.settings.polar_cache.polar.shape == (1000,1000))
+        assert(len(parallel.analyses.aerodynamics.settings.polar_cache) == 0)
+        assert(np.all(serial.state.conditions.weights.total_mass == parallel.state.conditions.weights.total_mass))
+        assert(np.all(serial.state.conditions.frames.inertial.time == parallel.state.conditions.frames.inertial.time))
+        assert(np.all(serial.state.unknowns.throttle_0 == parallel.state.unknowns.throttle_0))
+
+    # truth values
+    final_mass_truth_1  = 68509.07658818176
+    final_mass_truth_2  = 68632.0564827274
+    final_mass_1        = results['2'].low_cruise.segments.cruise.state.conditions.weights.total_mass[-1,0]
+    final_mass_2        = results['2'].high_cruise.segments.cruise.state.conditions.weights.total_mass[-1,0]
+    print('final mass, low cruise : ' + str(final_mass_1))
+    print('final mass, high cruise: ' + str(final_mass_2))
+
+    error               = Data()
+    error.final_mass_1  = np.abs(final_mass_1 - final_mass_truth_1)/final_mass_truth_1
+    error.final_mass_2  = np.abs(final_mass_2 - final_mass_truth_2)/final_mass_truth_2
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Missions Setup
+# ----------------------------------------------------------------------
+
+def missions_setup(altitudes):
+    missions = RCAIDE.Framework.Mission.Missions()
+    for tag,altitude in zip(['low_cruise','high_cruise'],altitudes):
+        analyses = analyses_setup(vehicle_setup())
+        analyses.aerodynamics.settings.polar_cache = Cache()
+        missions.append(mission_setup(analyses,altitude,tag))
+    return missions
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# compiled_pack_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the compiled pack layout of the unknowns and residuals, see Solver.compile_pack_array. Compiled
+    packing and unpacking have to match Data.pack_array and Data.unpack_array, including after leaves are reassigned
+    or change shape, and an iteration of a segment has to give the same residuals with and without a layout.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                                    import Units, Data
+from RCAIDE.Framework.Mission.Common                          import Conditions
+from RCAIDE.Framework.Mission.Functions.Solver                import compile_pack_array, pack_compiled, unpack_compiled
+from RCAIDE.Framework.Mission.Functions.Solver.converge_root  import iterate
+
+# python imports
+import numpy as np
+import copy
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_control_points = 8
+
+    # packing and unpacking a compiled layout matches the tree walk of Data
+    data      = unknowns_setup(number_of_control_points)
+    reference = copy.deepcopy(data)
+    schema    = compile_pack_array(data)
+    assert(schema.valid)
+    assert(len(schema.arrays) == 4 and len(schema.scalars) == 2)
+    assert(np.all(pack_compiled(schema) == reference.pack_array()))
+
+    vector = np.linspace(-1.,1.,len(schema.buffer))
+    unpack_compiled(schema,vector)
+    reference.unpack_array(vector)
+    assert(np.all(data.pack_array() == reference.pack_array()))
+    assert(np.all(data.controls.throttle_0 == reference.controls.throttle_0))
+    assert(data.elapsed_time == reference.elapsed_time)
+
+    # array leaves are views into the buffer, a reassigned leaf is copied into it and bound again
+    assert(np.shares_memory(data.body_angle,schema.buffer))
+    data.body_angle = 2. * data.body_angle
+    assert(np.all(pack_compiled(schema) == data.pack_array()))
+    assert(np.shares_memory(data.body_angle,schema.buffer))
+    data.controls.throttle_0 = np.ones((number_of_control_points,1))
+    unpack_compiled(schema,vector)
+    assert(np.shares_memory(data.controls.throttle_0,schema.buffer))
+    assert(np.all(data.controls.throttle_0[:,0] == vector[schema.arrays[1][4]:schema.arrays[1][5]]))
+
+    # a leaf that changes shape falls back to Data.pack_array
+    data.wind = np.zeros((number_of_control_points + 1,1))
+    assert(np.all(pack_compiled(schema) == data.pack_array()))
+    assert(not schema.valid)
+
+    # matrices are not compiled
+    matrix_data   = Data()
+    matrix_data.a = np.matrix(np.ones((2,2)))
+    assert(not compile_pack_array(matrix_data).valid)
+
+    # one iteration of a converged segment gives the same residuals with and without a layout
+    segment          = mission_setup(analyses_setup(vehicle_setup()),8000. * Units.m).evaluate().segments.cruise
+    unknowns         = segment.state.unknowns.pack_array()
+    residuals        = iterate(unknowns,segment)
+    schema           = Data()
+    schema.unknowns  = compile_pack_array(segment.state.unknowns)
+    schema.residuals = compile_pack_array(segment.state.residuals)
+    compiled         = iterate(unknowns,segment,schema)
+    assert(np.all(residuals == compiled))
+
+    # truth values
+    final_mass_truth  = 68509.07658818176
+    final_mass        = segment.state.conditions.weights.total_mass[-1,0]
+    print('final mass: ' + str(final_mass))
+
+    error             = Data()
+    error.final_mass  = np.abs(final_mass - final_mass_truth)/final_mass_truth
+    error.residuals   = np.max(np.abs(compiled))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def unknowns_setup(number_of_control_points):
+    """ Unknowns with column and row arrays, nested containers and scalars """
+    ones                       = np.ones((number_of_control_points,1))
+    data                       = Conditions()
+    data.body_angle            = 0.03 * ones
+    data.controls              = Conditions()
+    data.controls.throttle_0   = 0.5 * ones
+    data.controls.elevator     = np.zeros((number_of_control_points,2))
+    data.elapsed_time          = 100.
+    data.wind                  = np.arange(number_of_control_points)[:,None] * 1.
+    data.count                 = 3
+    data.tag                   = 'unknowns'
+    return data
+
+if __name__ == '__main__':
+    main()
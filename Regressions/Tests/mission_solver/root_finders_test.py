@@ -0,0 +1,78 @@
+# root_finders_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the segment root finders, see Solver.root_finders and segment.settings.root_finder """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                      import Units, Data
+from RCAIDE.Framework.Mission.Functions.Solver  import root_finders
+
+# python imports
+import numpy as np
+import scipy.optimize
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analyses = analyses_setup(vehicle_setup())
+
+    # every registered solver, the Newton type ones also with the colored sparse Jacobian, and a user callable
+    solvers = [[name,'none'] for name in root_finders.keys()]
+    solvers += [['newton','sparse'],['levenberg_marquardt','sparse'],[scipy.optimize.fsolve,'none']]
+
+    segments = []
+    for root_finder,solver_jacobian in solvers:
+        mission = mission_setup(analyses,8000. * Units.m)
+        segment = mission.segments.cruise
+        segment.settings.root_finder           = root_finder
+        segment.state.numerics.solver_jacobian = solver_jacobian
+        segment = mission.evaluate().segments.cruise
+        name    = root_finder if isinstance(root_finder,str) else 'callable'
+        print('%-20s %-7s evaluations: %4d' % (name,solver_jacobian,segment.state.numerics.function_evaluations))
+        assert(segment.state.numerics.converged)
+        assert(segment.state.numerics.function_evaluations > 0)
+        assert(len(segment.state.numerics.residual_history) > 0)
+        segments.append([name,segment])
+
+    # every solver reaches the same trim
+    reference = segments[0][1].state.conditions
+    for name,segment in segments:
+        conditions = segment.state.conditions
+        assert(np.allclose(conditions.weights.total_mass,reference.weights.total_mass,rtol=1e-9,atol=0))
+        assert(np.allclose(conditions.frames.body.inertial_rotations,reference.frames.body.inertial_rotations,rtol=0,atol=1e-8))
+
+    # the Newton method reports its iterations and its residuals fall at every one of them
+    newton   = segments[[name for name,segment in segments].index('newton')][1].state.numerics
+    history  = newton.residual_history
+    assert(newton.iterations == len(history) - 1)
+    assert(np.all(np.diff(history) < 0))
+
+    # truth values
+    final_mass_truth    = 68509.07658818176
+    final_mass          = segments[[name for name,segment in segments].index('newton')][1].state.conditions.weights.total_mass[-1,0]
+    print('final mass: ' + str(final_mass))
+
+    error               = Data()
+    error.final_mass    = np.abs(final_mass - final_mass_truth)/final_mass_truth
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
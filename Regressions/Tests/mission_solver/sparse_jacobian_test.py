@@ -0,0 +1,161 @@
+# sparse_jacobian_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the colored sparse Jacobian, see compute_sparse_jacobian and state.numerics.solver_jacobian. The
+    detected sparsity pattern has to cover every nonzero of the full Jacobian, and the Newton method has to widen a
+    pattern that misses couplings once its steps stall.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                                              import Units, Data
+from RCAIDE.Framework.Mission.Functions.Solver                          import compute_sparse_jacobian
+from RCAIDE.Framework.Mission.Functions.Solver.converge_root            import converge_root, iterate
+from RCAIDE.Framework.Mission.Functions.Solver.compute_sparse_jacobian  import compute_jacobian_sparsity, finite_difference_steps
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analyses = analyses_setup(vehicle_setup())
+
+    # the same cruise solved with fsolve and with the sparse Newton method
+    segments = Data()
+    for solver_jacobian in ['none','sparse']:
+        mission = mission_setup(analyses,8000. * Units.m)
+        mission.segments.cruise.state.numerics.solver_jacobian = solver_jacobian
+        segments[solver_jacobian] = mission.evaluate().segments.cruise
+
+    dense  = segments.none
+    sparse = segments.sparse
+    assert(sparse.state.numerics.converged)
+    assert(sparse.state.numerics.iterations > 0)
+    assert(np.allclose(sparse.state.conditions.weights.total_mass,dense.state.conditions.weights.total_mass,rtol=1e-9,atol=0))
+    assert(np.allclose(sparse.state.conditions.frames.body.inertial_rotations,dense.state.conditions.frames.body.inertial_rotations,rtol=0,atol=1e-9))
+
+    # the colored Jacobian matches a column by column finite difference at the solution
+    unknowns  = sparse.state.unknowns.pack_array()
+    residuals = iterate(unknowns,sparse)
+    sparsity, colors, evaluations = compute_jacobian_sparsity(iterate,unknowns,residuals,sparse.state.unknowns,
+                                                              sparse.state.residuals,args=(sparse,))
+    jacobian  = compute_sparse_jacobian(iterate,unknowns,residuals,sparsity,colors,args=(sparse,)).toarray()
+    reference = dense_jacobian(iterate,unknowns,residuals,sparse)
+    assert(np.allclose(jacobian,reference,rtol=1e-6,atol=1e-6*np.max(np.abs(reference))))
+    assert(np.all(sparsity.toarray()[reference != 0]))
+
+    # the pattern of a climb, whose time is integrated over the segment, covers the full Jacobian at the solution
+    # and away from it
+    climb    = climb_mission(analyses).evaluate().segments.climb
+    solution = climb.state.unknowns.pack_array()
+    assert(climb.state.numerics.converged)
+    for point in [solution,solution*(1. + 0.05*np.random.default_rng(0).standard_normal(len(solution)))]:
+        point_residuals    = iterate(point,climb)
+        climb_sparsity,_,_ = compute_jacobian_sparsity(iterate,point,point_residuals,climb.state.unknowns,
+                                                       climb.state.residuals,args=(climb,))
+        reference          = dense_jacobian(iterate,point,point_residuals,climb)
+        assert(np.any(reference != 0) and np.all(climb_sparsity.toarray()[reference != 0]))
+    iterate(solution,climb)
+
+    # couplings that vanish at the initial guess are missed by its pattern, the Newton method widens the pattern
+    # once its steps stall and still converges
+    coupled    = coupled_segment(6)
+    x0         = coupled.state.unknowns.pack_array()
+    missed,_,_ = compute_jacobian_sparsity(iterate,x0,iterate(x0,coupled),coupled.state.unknowns,
+                                           coupled.state.residuals,args=(coupled,))
+    reference  = dense_jacobian(iterate,np.ones(12),iterate(np.ones(12),coupled),coupled)
+    assert(not np.all(missed.toarray()[reference != 0]))
+    coupled.state.unknowns.unpack_array(x0)
+    converge_root(coupled)
+    assert(coupled.state.numerics.converged)
+    assert(np.linalg.norm(coupled.state.residuals.pack_array()) < 1e-10)
+
+    # truth values
+    number_of_colors_truth = 9
+    final_mass_truth       = 68509.07658818176
+    number_of_colors       = np.max(colors) + 1
+    final_mass             = sparse.state.conditions.weights.total_mass[-1,0]
+    print('unknowns         : ' + str(len(unknowns)))
+    print('colors           : ' + str(number_of_colors))
+    print('final mass       : ' + str(final_mass))
+
+    error                  = Data()
+    error.number_of_colors = np.abs(number_of_colors - number_of_colors_truth)
+    error.final_mass       = np.abs(final_mass - final_mass_truth)/final_mass_truth
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def dense_jacobian(function,unknowns,residuals,segment):
+    """ Column by column forward difference Jacobian, with the steps of compute_sparse_jacobian """
+    h         = finite_difference_steps(unknowns)
+    reference = np.zeros((len(residuals),len(unknowns)))
+    for j in range(len(unknowns)):
+        perturbed       = np.copy(unknowns)
+        perturbed[j]   += h[j]
+        reference[:,j]  = (function(perturbed,segment) - residuals)/h[j]
+    return reference
+
+def climb_mission(analyses):
+    """ A constant speed, constant rate climb trimmed in x and z with the throttle and the body angle """
+    mission                                                           = RCAIDE.Framework.Mission.Sequential_Segments()
+    segment                                                           = RCAIDE.Framework.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.tag                                                       = 'climb'
+    segment.analyses.extend(analyses)
+    segment.state.numerics.number_of_control_points                   = 8
+    segment.state.numerics.solver_jacobian                            = 'sparse'
+    segment.altitude_start                                            = 3000. * Units.m
+    segment.altitude_end                                              = 7000. * Units.m
+    segment.air_speed                                                 = 180.  * Units['m/s']
+    segment.climb_rate                                                = 10.   * Units['m/s']
+    segment.flight_dynamics.force_x                                   = True
+    segment.flight_dynamics.force_z                                   = True
+    segment.assigned_control_variables.throttle.active                = True
+    segment.assigned_control_variables.throttle.assigned_propulsors   = [['engine']]
+    segment.assigned_control_variables.body_angle.active              = True
+    mission.append_segment(segment)
+    return mission
+
+def coupled_segment(n):
+    """ A segment with unknowns u and v and residuals u - 2 + 3 v (sum(u) - u) and v - 1/2, every u couples to
+        every other u once v is not zero
+    """
+    segment                                 = RCAIDE.Framework.Mission.Segments.Segment()
+    segment.tag                             = 'coupled'
+    segment.state.numerics.solver_jacobian  = 'sparse'
+    segment.state.unknowns.u                = np.zeros((n,1))
+    segment.state.unknowns.v                = np.zeros((n,1))
+    segment.state.residuals.u               = np.zeros((n,1))
+    segment.state.residuals.v               = np.zeros((n,1))
+    segment.process.iterate.residuals       = coupled_residuals
+    return segment
+
+def coupled_residuals(segment):
+    u                         = segment.state.unknowns.u
+    v                         = segment.state.unknowns.v
+    segment.state.residuals.u = u - 2. + 3.*v*(np.sum(u) - u)
+    segment.state.residuals.v = v - 0.5
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# warm_start_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of warm started segments, see Solver.warm_start. A cruise is seeded from its last converged solution,
+    from the same solution on more control points and, as a follow-on cruise, from the end of the cruise before it.
+    Each warm start has to converge to the cold start solution in fewer evaluations.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core                      import Units, Data
+from RCAIDE.Framework.Mission.Functions.Solver  import warm_start
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Closed_Form_Transport import vehicle_setup, analyses_setup, mission_setup, cruise_segment_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analyses = analyses_setup(vehicle_setup())
+
+    # the first evaluation is a cold start, the second one reuses its solution
+    mission                                       = mission_setup(analyses,8000. * Units.m)
+    mission.settings.warm_start.previous_solution = True
+    cold                                          = evaluate(mission)
+    assert('warm_start' in mission.segments.cruise.state.numerics)
+    solution                                      = mission.segments.cruise.state.numerics.warm_start
+    warm                                          = evaluate(mission)
+    assert(warm.evaluations < cold.evaluations)
+    assert(np.abs(warm.final_mass - cold.final_mass)/cold.final_mass < 1e-9)
+
+    # a solution on 8 control points is resampled onto 12
+    fine_cold  = evaluate(fine_mission_setup(analyses))
+    fine_warm  = fine_mission_setup(analyses)
+    fine_warm.segments.cruise.state.numerics.warm_start = solution
+    fine_warm  = evaluate(fine_warm)
+    assert(fine_warm.evaluations < fine_cold.evaluations)
+    assert(np.abs(fine_warm.final_mass - fine_cold.final_mass)/fine_cold.final_mass < 1e-9)
+
+    # a follow-on cruise is seeded from the end of the cruise before it
+    previous_segment = mission.segments.cruise
+    follow_on_cold   = follow_on_evaluate(analyses,previous_segment,seed=False)
+    follow_on_warm   = follow_on_evaluate(analyses,previous_segment,seed=True)
+    assert(follow_on_warm.evaluations < follow_on_cold.evaluations)
+    assert(np.abs(follow_on_warm.final_mass - follow_on_cold.final_mass)/follow_on_cold.final_mass < 1e-9)
+
+    # truth values
+    final_mass_truth           = 68509.07658818176
+    follow_on_final_mass_truth = 67917.50936575234
+    print('final mass, cruise          : ' + str(warm.final_mass))
+    print('final mass, follow-on cruise: ' + str(follow_on_warm.final_mass))
+    print('evaluations, cold and warm  : ' + str([cold.evaluations,warm.evaluations]))
+
+    error                      = Data()
+    error.final_mass           = np.abs(warm.final_mass - final_mass_truth)/final_mass_truth
+    error.fine_final_mass      = np.abs(fine_warm.final_mass - final_mass_truth)/final_mass_truth
+    error.follow_on_final_mass = np.abs(follow_on_warm.final_mass - follow_on_final_mass_truth)/follow_on_final_mass_truth
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def evaluate(mission):
+    """ Evaluates a mission and returns the final mass and the function evaluations of its cruise """
+    segment             = mission.evaluate().segments.cruise
+    results             = Data()
+    results.evaluations = segment.state.numerics.function_evaluations
+    results.final_mass  = segment.state.conditions.weights.total_mass[-1,0]
+    assert(segment.state.numerics.converged)
+    return results
+
+def fine_mission_setup(analyses):
+    mission                                                         = mission_setup(analyses,8000. * Units.m)
+    mission.settings.warm_start.previous_solution                   = True
+    mission.segments.cruise.state.numerics.number_of_control_points = 12
+    return mission
+
+def follow_on_evaluate(analyses,previous_segment,seed):
+    """ A cruise that starts from the end of another segment, converged on its own so that the seed can be
+        controlled
+    """
+    mission                = RCAIDE.Framework.Mission.Sequential_Segments()
+    segment                = cruise_segment_setup(analyses,'cruise')
+    segment.distance       = 200. * Units.km
+    segment.state.initials = previous_segment.state
+    mission.append_segment(segment)
+
+    mission.process.initialize.evaluate(mission)
+    segment.process.initialize.expand_state(segment)
+    if seed:
+        warm_start(segment,previous_segment,previous_solution=False)
+        assert(np.all(segment.state.unknowns.throttle_0 == previous_segment.state.unknowns.throttle_0[-1,0]))
+    segment.evaluate()
+
+    results             = Data()
+    results.evaluations = segment.state.numerics.function_evaluations
+    results.final_mass  = segment.state.conditions.weights.total_mass[-1,0]
+    assert(segment.state.numerics.converged)
+    return results
+
+if __name__ == '__main__':
+    main()
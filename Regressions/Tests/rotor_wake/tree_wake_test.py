@@ -0,0 +1,163 @@
+# tree_wake_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the tree code for the velocities induced by a rotor wake, see compute_tree_wake_induced_velocity.
+    A tolerance of zero has to reproduce the direct Biot-Savart sum of compute_wake_induced_velocity, and the error
+    of the far field expansion has to shrink with the tolerance.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity      import compute_wake_induced_velocity
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_tree_wake_induced_velocity import compute_tree_wake_induced_velocity
+from Legacy.trunk.S.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities import compute_fidelity_one_inflow_velocities
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_control_points = 2
+    WD                       = wake_setup(number_of_control_points)
+    VD                       = wing_setup()
+
+    # the direct sum
+    V_direct = compute_wake_induced_velocity(WD,VD,number_of_control_points,azi_start_idx=1)
+    V_max    = np.max(np.linalg.norm(V_direct,axis=-1))
+
+    # without the far field expansion the tree sums every filament directly
+    V_tree   = compute_tree_wake_induced_velocity(WD,VD,number_of_control_points,azi_start_idx=1,tolerance=0.)
+    assert(V_tree.shape == V_direct.shape)
+    assert(np.allclose(V_tree,V_direct,rtol=0,atol=1e-12*V_max))
+
+    # the error of the expansion shrinks with the tolerance
+    errors = Data()
+    for tolerance in [0.2,0.5]:
+        V_tree                 = compute_tree_wake_induced_velocity(WD,VD,number_of_control_points,azi_start_idx=1,tolerance=tolerance)
+        errors[str(tolerance)] = np.max(np.linalg.norm(V_tree - V_direct,axis=-1))/V_max
+        print('tolerance ' + str(tolerance) + ', maximum error relative to max |V|: ' + str(errors[str(tolerance)]))
+    assert(errors['0.2'] < errors['0.5'])
+    assert(errors['0.2'] < 1e-3)
+
+    # the rotor wake analysis sums directly unless the tree is selected
+    wake = RCAIDE.Framework.Analyses.Propulsion.Rotor_Wake_Fidelity_One()
+    assert(wake.wake_settings.induced_velocity_method == 'direct')
+    assert(wake.wake_settings.induced_velocity_tolerance == 0.2)
+
+    # the tree selected through the analysis gives the direct sum, on the wing and at the rotor disc
+    rotor                      = rotor_setup(WD,number_of_control_points)
+    wake.vortex_distribution   = WD
+    V_wing_direct              = wake.evaluate_wake_velocities(rotor,wing_setup(),number_of_control_points)
+    Va_direct, Vt_direct       = compute_fidelity_one_inflow_velocities(wake,rotor)
+    V_wing_max                 = np.max(np.abs(V_wing_direct))
+    V_disc_max                 = np.max(np.abs(np.stack([Va_direct,Vt_direct])))
+    for tolerance,atol in [(0.,1e-12),(0.2,1e-3)]:
+        wake.wake_settings.induced_velocity_method    = 'tree'
+        wake.wake_settings.induced_velocity_tolerance = tolerance
+        V_wing                 = wake.evaluate_wake_velocities(rotor,wing_setup(),number_of_control_points)
+        Va, Vt                 = compute_fidelity_one_inflow_velocities(wake,rotor)
+        assert(np.allclose(V_wing,V_wing_direct,rtol=0,atol=atol*V_wing_max))
+        assert(np.allclose(Va,Va_direct,rtol=0,atol=atol*V_disc_max))
+        assert(np.allclose(Vt,Vt_direct,rtol=0,atol=atol*V_disc_max))
+        assert(tolerance == 0. or np.any(Va != Va_direct))
+
+    # truth values
+    V_max_truth   = 2.964737408229836
+    error         = Data()
+    error.V_max   = np.abs(V_max - V_max_truth)/V_max_truth
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def wake_setup(number_of_control_points):
+    """ The helical wake of a three bladed rotor in axial flight, with a sine distribution of circulation along the
+        blades that decays downstream. Two azimuth stations are defined, the second is evaluated
+    """
+    n_azimuth   = 2
+    n_blades    = 3
+    n_stations  = 9
+    n_steps     = 40
+    R           = 2.0
+    V_inf       = 10.
+    omega       = 2*np.pi*8
+    r           = np.linspace(0.2*R,R,n_stations)
+    time        = np.arange(n_steps + 1)/(omega/(2*np.pi))/24
+    keys        = ['XA1','YA1','ZA1','XA2','YA2','ZA2','XB1','YB1','ZB1','XB2','YB2','ZB2','GAMMA']
+    arrays      = {key:np.zeros((n_azimuth,number_of_control_points,n_blades,n_stations - 1,n_steps)) for key in keys}
+    for i in range(n_azimuth):
+        for j in range(number_of_control_points):
+            psi = omega*time[None,None,:] + 2*np.pi*np.arange(n_blades)[:,None,None]/n_blades + 0.3*i + 0.1*j
+            X   = np.broadcast_to(V_inf*time[None,None,:]*(1 + 0.05*np.cos(psi)),(n_blades,n_stations,n_steps + 1))
+            Y   = r[None,:,None]*np.cos(psi)
+            Z   = r[None,:,None]*np.sin(psi)
+            for name,P in zip('XYZ',(X,Y,Z)):
+                arrays[name + 'A1'][i,j] = P[:,:-1,:-1]
+                arrays[name + 'B1'][i,j] = P[:,1:,:-1]
+                arrays[name + 'A2'][i,j] = P[:,:-1,1:]
+                arrays[name + 'B2'][i,j] = P[:,1:,1:]
+            r_mid = 0.5*(r[1:] + r[:-1])
+            arrays['GAMMA'][i,j] = np.sin(np.pi*(r_mid - r[0])/(R - r[0]))[None,:,None]*np.exp(-0.002*np.arange(n_steps))[None,None,:]*(1 + 0.1*j)
+
+    WD = Data()
+    for key in keys:
+        WD[key] = arrays[key].reshape(n_azimuth,number_of_control_points,-1)
+    WD.reshaped_wake     = Data()
+    WD.reshaped_wake.XA1 = arrays['XA1']
+
+    # the blade sections of every azimuth station, just behind the rotor disc
+    for name in 'XYZ':
+        blades             = np.zeros((n_azimuth,number_of_control_points,n_blades,n_stations,1))
+        blades[...,:-1,0]  = arrays[name + 'A1'][...,0]
+        blades[...,-1,0]   = arrays[name + 'B1'][...,-1,0]
+        WD.reshaped_wake[name + 'blades_cp'] = blades
+    WD.reshaped_wake.Xblades_cp += 0.05*R
+    return WD
+
+def rotor_setup(WD,number_of_control_points):
+    """ The rotor of the wake, as far as the fidelity one inflow velocities and the slipstream use it """
+    R                                = 2.0
+    n_stations                       = WD.reshaped_wake.Yblades_cp.shape[3]
+    rotor                            = Data()
+    rotor.Wake                       = Data()
+    rotor.Wake.vortex_distribution   = WD
+    rotor.vortex_distribution        = Data()
+    rotor.inputs                     = Data()
+    rotor.inputs.omega               = 2*np.pi*8*np.ones((number_of_control_points,1))
+    rotor.outputs                    = Data()
+    rotor.outputs.velocity           = np.zeros((number_of_control_points,3))
+    rotor.number_azimuthal_stations  = WD.reshaped_wake.Yblades_cp.shape[0]
+    rotor.radius_distribution        = np.linspace(0.2*R,R,n_stations)
+    rotor.chord_distribution         = 0.1*np.ones(n_stations)
+    rotor.rotation                   = 1
+    rotor.vec_to_prop_body           = lambda: np.tile(np.eye(3),(number_of_control_points,1,1))
+    return rotor
+
+def wing_setup():
+    """ Control points of a wing that spans the rotor, just above its axis """
+    R       = 2.0
+    X,Y     = np.meshgrid(np.linspace(0.5,2.0,6)*R,np.linspace(-3*R,3*R,40))
+    VD      = Data()
+    VD.XC   = X.ravel()
+    VD.YC   = Y.ravel()
+    VD.ZC   = 0.1*R + 0*X.ravel()
+    VD.n_cp = VD.XC.size
+    return VD
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# adaptive_training_grids_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the VLM training grids adapted to the vehicle, see settings.adaptive_training. The adapted grids
+    have to keep the points the training relies on, interpolate the VLM better than the initial grids, and be the
+    grids the surrogates are trained on.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.train_VLM_surrogates import adapt_training_grids, sample_alpha_sweep, leave_one_out, refine_intervals, alpha_training_points
+
+# python imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # points that their neighbours interpolate are dropped, unless fixed, and the neighbours of a dropped point stay
+    points       = np.arange(7.)
+    values       = np.abs(points - 4.)[:,None]
+    fixed        = np.zeros(7,dtype=bool)
+    fixed[1]     = True
+    keep         = leave_one_out(points,values,fixed,1e-6)
+    assert(np.array_equal(keep,[True,True,False,True,True,False,True]))
+
+    # values that are not a number, such as singular coefficients, are not measured
+    values       = np.stack([np.abs(points - 4.),np.where(points == 2.,np.nan,points)],axis=-1)
+    keep         = leave_one_out(points,values,fixed,1e-6)
+    assert(np.array_equal(keep,[True,True,False,True,True,False,True]))
+
+    # only the intervals whose midpoint is missed are halved, and their halves are checked next
+    points              = np.array([0.,1.,2.])
+    square              = lambda x: np.where(x < 1.,x,x**2)[:,None]
+    points,values,check = refine_intervals(points,square(points),[(0.,1.),(1.,2.)],1e-6,square)
+    assert(np.array_equal(points,[0.,1.,1.5,2.]))
+    assert(np.array_equal(values[:,0],square(points)[:,0]))
+    assert(check == [(1.,1.5),(1.5,2.)])
+
+    # grids that are not increasing are refused
+    analysis                          = VLM_analysis()
+    analysis.training.angle_of_attack = analysis.training.angle_of_attack[::-1]
+    try:
+        adapt_training_grids(analysis)
+        refused = False
+    except ValueError:
+        refused = True
+    assert(refused)
+
+    # the adapted grids keep the points the training relies on
+    analysis     = VLM_analysis()
+    initial_AoA  = np.array(analysis.training.angle_of_attack)
+    initial_Mach = np.array(analysis.training.Mach)
+    alpha_sweep  = adapt_training_grids(analysis)
+    AoA          = analysis.training.angle_of_attack
+    Mach         = analysis.training.Mach
+    kept         = max(alpha_training_points.derivative + [alpha_training_points.zero]) + 1
+    assert(np.all(np.diff(AoA) > 0) and np.all(np.diff(Mach) > 0))
+    assert(np.array_equal(AoA[:kept],initial_AoA[:kept]) and AoA[-1] == initial_AoA[-1])
+    for regime in [initial_Mach < 1.,initial_Mach >= 1.]:
+        assert(np.all(np.isin(initial_Mach[regime][[0,-1]],Mach)))
+
+    # the sweep of the adaptation holds the VLM over the adapted grids, so the training does not solve it again
+    assert(np.array_equal(alpha_sweep.angle_of_attack,AoA) and np.array_equal(alpha_sweep.Mach,Mach))
+    resampled    = sample_alpha_sweep(analysis,AoA,Mach)
+    assert(np.allclose(alpha_sweep.values,resampled.values,rtol=1e-6,atol=1e-6))
+
+    # and interpolate the VLM better than the initial grids, within each speed regime
+    generator     = np.random.default_rng(0)
+    test_AoA      = np.sort(generator.uniform(initial_AoA[2],initial_AoA[-1],20))
+    errors        = Data()
+    for label,grid_AoA,grid_Mach in [['initial',initial_AoA,initial_Mach],['adapted',AoA,Mach]]:
+        errors[label] = 0.
+        for regime in [grid_Mach < 1.,grid_Mach >= 1.]:
+            test_Mach     = np.sort(generator.uniform(grid_Mach[regime][0],grid_Mach[regime][-1],10))
+            errors[label] = np.maximum(errors[label],interpolation_error(analysis,grid_AoA,grid_Mach[regime],test_AoA,test_Mach))
+        print(label + ' grids, largest relative interpolation error: ' + str(errors[label]))
+    assert(errors.adapted < 0.5*errors.initial)
+
+    # the surrogates are trained on the adapted grids, and without the option on the initial grids
+    adaptive                            = VLM_analysis()
+    adaptive.settings.adaptive_training = True
+    train_VLM_surrogates(adaptive)
+    assert(np.array_equal(adaptive.training.angle_of_attack,AoA) and np.array_equal(adaptive.training.Mach,Mach))
+    assert(adaptive.training.subsonic.Clift_alpha.shape == (len(AoA),np.sum(Mach < 1.)))
+    assert(adaptive.training.supersonic.Clift_alpha.shape == (len(AoA),np.sum(Mach >= 1.)))
+    fixed_grids = VLM_analysis()
+    train_VLM_surrogates(fixed_grids)
+    assert(np.array_equal(fixed_grids.training.angle_of_attack,initial_AoA) and np.array_equal(fixed_grids.training.Mach,initial_Mach))
+
+    # truth values
+    AoA_points_truth  = 24
+    Mach_points_truth = 31
+    CL_truth          = 0.6969824354638019
+    error             = Data()
+    error.AoA_points  = len(AoA) - AoA_points_truth
+    error.Mach_points = len(Mach) - Mach_points_truth
+    error.CL          = np.abs(adaptive.training.subsonic.Clift_alpha[4,4] - CL_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_analysis():
+    analysis                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    analysis.vehicle                               = vehicle_setup()
+    analysis.settings.number_of_spanwise_vortices  = 5
+    analysis.settings.number_of_chordwise_vortices = 2
+    return analysis
+
+def interpolation_error(analysis,grid_AoA,grid_Mach,test_AoA,test_Mach):
+    """ The largest error of the lift, drag and pitching moment interpolated linearly over a grid, relative to the
+        largest magnitude of each coefficient at the test points
+    """
+    grid_values = sample_alpha_sweep(analysis,grid_AoA,grid_Mach).values[:,:,[0,1,6]]
+    test_values = sample_alpha_sweep(analysis,test_AoA,test_Mach).values[:,:,[0,1,6]]
+    AoA,Mach    = np.meshgrid(test_AoA,test_Mach,indexing='ij')
+    pts         = np.stack([AoA.ravel(),Mach.ravel()],axis=-1)
+    scale       = np.max(np.abs(test_values),axis=(0,1))
+    error       = 0.
+    for i in range(3):
+        interpolated = RegularGridInterpolator((grid_AoA,grid_Mach),grid_values[:,:,i])(pts)
+        error        = np.maximum(error,np.max(np.abs(interpolated - test_values[:,:,i].ravel()))/scale[i])
+    return error
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# airfoil_geometry_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the airfoil geometries kept in memory across panelizations, see cached_airfoil_geometry. Every
+    coordinate file is parsed once per discretization, and a stored geometry has to be the imported one.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution
+from RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry, cached_airfoil_geometry, clear_airfoil_geometry_cache
+from RCAIDE.Library.Methods.Geometry.Airfoil.cached_airfoil_geometry import _import_airfoil_geometry
+
+# python imports
+import numpy as np
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    airfoil_file = '../../Vehicles/Airfoils/B737a.txt'
+    clear_airfoil_geometry_cache()
+
+    # a stored geometry is the imported one, and every call gets its own copy
+    imported = import_airfoil_geometry(airfoil_file,npoints = 101)
+    cached   = cached_airfoil_geometry(airfoil_file,npoints = 101)
+    for name in ['x_coordinates','y_coordinates','x_upper_surface','y_lower_surface','camber_coordinates']:
+        assert(np.all(cached[name] == imported[name]))
+    assert(cached.thickness_to_chord == imported.thickness_to_chord)
+    cached.camber_coordinates[:] = 0.
+    again    = cached_airfoil_geometry(airfoil_file,npoints = 101)
+    assert(np.all(again.camber_coordinates == imported.camber_coordinates))
+    assert(_import_airfoil_geometry.cache_info().misses == 1)
+
+    # the discretization and the interpolation are part of the key
+    cached_airfoil_geometry(airfoil_file,npoints = 121)
+    cached_airfoil_geometry(airfoil_file,npoints = 101,surface_interpolation = 'linear')
+    assert(_import_airfoil_geometry.cache_info().misses == 3)
+
+    # a changed file is parsed again
+    directory = tempfile.mkdtemp()
+    try:
+        copied  = shutil.copy(airfoil_file,directory)
+        before  = cached_airfoil_geometry(copied,npoints = 101)
+        with open('../../Vehicles/Airfoils/B737d.txt') as source, open(copied,'w') as target:
+            target.write(source.read())
+        os.utime(copied,ns = (os.stat(copied).st_atime_ns,os.stat(copied).st_mtime_ns + 10**9))
+        after   = cached_airfoil_geometry(copied,npoints = 101)
+        assert(after.thickness_to_chord != before.thickness_to_chord)
+        assert(after.thickness_to_chord == import_airfoil_geometry('../../Vehicles/Airfoils/B737d.txt',npoints = 101).thickness_to_chord)
+    finally:
+        shutil.rmtree(directory)
+
+    # panelizing a vehicle again parses none of its airfoils
+    vehicle  = vehicle_setup()
+    settings = VLM_settings()
+    clear_airfoil_geometry_cache()
+    tic      = time.time()
+    first    = generate_vortex_distribution(vehicle,settings)
+    t_first  = time.time() - tic
+    misses   = _import_airfoil_geometry.cache_info().misses
+    tic      = time.time()
+    second   = generate_vortex_distribution(vehicle,settings)
+    t_second = time.time() - tic
+    print('first panelization in %.3f s, second in %.3f s' % (t_first,t_second))
+    assert(_import_airfoil_geometry.cache_info().misses == misses)
+    for name in ['XA1','YA1','ZA1','XC','YC','ZC','n_cp']:
+        assert(np.all(first[name] == second[name]))
+
+    # truth values
+    tc_truth        = 0.15382746
+    error           = Data()
+    error.tc        = np.abs(imported.thickness_to_chord - tc_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_settings():
+    settings                              = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 5
+    settings.number_of_chordwise_vortices = 2
+    return settings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# fused_surrogates_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the VLM surrogates fused per training grid, see build_VLM_surrogates. Every column of a fused
+    interpolator has to match an interpolator built for that coefficient alone, and the blended coefficients of
+    evaluate_surrogate have to match the sum of the single coefficient interpolators.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates, build_VLM_surrogates, evaluate_surrogate
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.build_VLM_surrogates import coefficient_names, perturbation_names, perturbation_grids, control_surface_flags
+from RCAIDE.Library.Methods.Utilities import Cubic_Spline_Blender
+
+# python imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator, interp1d
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number_of_points = 50
+    generator        = np.random.default_rng(0)
+
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle_setup()
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    train_VLM_surrogates(aerodynamics)
+    build_VLM_surrogates(aerodynamics)
+
+    # each column of a fused interpolator is the interpolator of its coefficient, inside and outside the grid
+    trained = [delta for delta,flag in control_surface_flags.items() if aerodynamics[flag]]
+    Mach    = generator.uniform(0.05,3.6,(number_of_points,1))
+    for regime in ['subsonic','supersonic','transonic']:
+        training   = aerodynamics.training[regime]
+        surrogates = aerodynamics.surrogates[regime]
+        for perturbation in perturbation_names + trained:
+            grid = aerodynamics.training[perturbation_grids[perturbation]]
+            pts  = np.hstack((generator.uniform(np.min(grid),1.1*np.max(grid),(number_of_points,1)),Mach))
+            for i,name in enumerate(coefficient_names):
+                single = single_interpolator(grid,training.Mach,training[name + '_' + perturbation])
+                assert(np.allclose(surrogates[perturbation](pts)[:,i],single(pts),rtol=1e-12,atol=1e-14))
+        pts = np.hstack((generator.uniform(-0.1,0.3,(number_of_points,1)),Mach))
+        for i,wing in enumerate(aerodynamics.vehicle.wings):
+            single = single_interpolator(aerodynamics.training.angle_of_attack,training.Mach,training.Clift_wing_alpha[wing.tag])
+            assert(np.allclose(surrogates.wings_alpha(pts)[:,i],single(pts),rtol=1e-12,atol=1e-14))
+        for i,name in enumerate(surrogates.derivative_names):
+            single = interp1d(training.Mach,training[name],kind='linear',bounds_error=False,fill_value='extrapolate')
+            assert(np.allclose(surrogates.derivatives(Mach)[i],single(Mach),rtol=1e-12,atol=1e-14))
+    assert(len(aerodynamics.surrogates.subsonic.derivative_names) == len(coefficient_names)*(len(perturbation_names) + len(trained)))
+
+    # the blended coefficients are the sum of the single coefficient interpolators over every perturbation
+    state      = state_setup(aerodynamics,number_of_points,generator)
+    evaluate_surrogate(state,aerodynamics.settings,aerodynamics.vehicle)
+    conditions = state.conditions
+    for name,label in [['Clift','lift'],['CM','M'],['CY','Y']]:
+        reference = blended_reference(aerodynamics,conditions,name)
+        assert(np.allclose(conditions.static_stability.coefficients[label],reference,rtol=1e-10,atol=1e-12))
+
+    # truth values
+    CL_truth      = 0.7156162710739834
+    CL            = aerodynamics.surrogates.subsonic.alpha(np.array([[aerodynamics.training.angle_of_attack[4],aerodynamics.training.subsonic.Mach[4]]]))[0,0]
+    error         = Data()
+    error.CL      = np.abs(CL - CL_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def single_interpolator(grid,Mach,values):
+    """ The interpolator of one coefficient, as build_VLM_surrogates made them before they were fused """
+    return RegularGridInterpolator((grid,Mach),values,method='linear',bounds_error=False,fill_value=None)
+
+def blended_reference(aerodynamics,conditions,name):
+    """ One coefficient summed over the perturbations and control surfaces and blended over the speed regimes, with
+        the interpolators of that coefficient alone
+    """
+    Mach                = conditions.freestream.mach_number
+    h_sub               = Cubic_Spline_Blender(aerodynamics.hsub_min,aerodynamics.hsub_max).compute(Mach)
+    h_sup               = Cubic_Spline_Blender(aerodynamics.hsup_max,aerodynamics.hsup_min).compute(Mach)
+    perturbations       = Data()
+    perturbations.alpha = conditions.aerodynamics.angles.alpha
+    perturbations.beta  = conditions.aerodynamics.angles.beta
+    perturbations.u     = conditions.freestream.u
+    perturbations.v     = conditions.freestream.v
+    perturbations.w     = conditions.freestream.w
+    perturbations.p     = conditions.static_stability.roll_rate
+    perturbations.q     = conditions.static_stability.pitch_rate
+    perturbations.r     = conditions.static_stability.yaw_rate
+    for wing in aerodynamics.vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            for delta,flag in control_surface_flags.items():
+                if flag.split('_')[0] == type(control_surface).__name__.lower():
+                    perturbations[delta] = np.ones_like(Mach)*control_surface.deflection
+
+    total = 0.
+    for perturbation,values in perturbations.items():
+        grid    = aerodynamics.training[perturbation_grids[perturbation]]
+        pts     = np.hstack((values,Mach))
+        regimes = []
+        for regime in ['subsonic','transonic','supersonic']:
+            training = aerodynamics.training[regime]
+            regimes.append(single_interpolator(grid,training.Mach,training[name + '_' + perturbation])(pts)[:,None])
+        total = total + h_sub*regimes[0] + (1 - (h_sup + h_sub))*regimes[1] + h_sup*regimes[2]
+    return total
+
+def state_setup(aerodynamics,number_of_points,generator):
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(number_of_points)
+    conditions.aerodynamics.angles.alpha   = generator.uniform(-0.1,0.3,(number_of_points,1))
+    conditions.aerodynamics.angles.beta    = generator.uniform(-0.05,0.05,(number_of_points,1))
+    conditions.freestream.mach_number      = generator.uniform(0.1,2.0,(number_of_points,1))
+    for name in ['u','v','w']:
+        conditions.freestream[name]        = generator.uniform(-0.05,0.05,(number_of_points,1))
+    for name in ['roll_rate','pitch_rate','yaw_rate']:
+        conditions.static_stability[name]  = generator.uniform(-0.05,0.05,(number_of_points,1))
+    state                        = Data()
+    state.conditions             = conditions
+    state.analyses               = Data()
+    state.analyses.aerodynamics  = aerodynamics
+    return state
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# gmres_solver_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the block Jacobi preconditioned GMRES solver of the VLM, see settings.linear_solver. GMRES has to
+    solve the influence matrix systems to its tolerance or leave them to the direct solve, reuse the conditions it
+    solved before, and give the lift of the direct solver.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM, cached_vortex_distribution, cached_influence_matrices, solve_influence_matrices
+
+# python imports
+import numpy as np
+import warnings
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle    = vehicle_setup()
+    conditions = VLM_conditions()
+    generator  = np.random.default_rng(0)
+
+    # the influence matrix system of one Mach number, with its wings as preconditioner blocks
+    settings               = VLM_settings()
+    settings.linear_solver = 'gmres'
+    VD                     = cached_vortex_distribution(vehicle,settings)
+    ones                   = np.ones((1,1))
+    phi                    = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones
+    delta                  = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*ones))
+    system                 = cached_influence_matrices(VD,np.array([0.5]),delta,phi,settings).systems[0]
+    A                      = system.matrix
+    assert(len(system.blocks) == len(VD.spanwise_breaks))
+    assert(system.blocks[0][0] == 0 and system.blocks[-1][1] == VD.n_cp)
+    assert(list(settings.influence_matrix_cache.keys())[0].endswith('_gmres'))
+
+    # every right hand side is solved to the tolerance
+    RHS     = generator.standard_normal((4,VD.n_cp))
+    inverse = np.zeros(4,dtype=int)
+    GAMMA   = solve_influence_matrices([system],inverse,RHS,settings)
+    exact   = np.linalg.solve(A,RHS.T).T
+    residual = np.linalg.norm(RHS - GAMMA @ A.T,axis=1)/np.linalg.norm(RHS,axis=1)
+    assert(np.all(residual <= settings.linear_solver_tolerance))
+    assert(np.allclose(GAMMA,exact,rtol=0,atol=1e-6*np.max(np.abs(exact))))
+
+    # the solved conditions are kept, a combination of them is solved by the initial guess alone
+    assert(system.solutions.shape == (VD.n_cp,4))
+    combined       = np.array([[0.5,-2.,1.,0.25]]) @ RHS
+    GAMMA_combined = solve_influence_matrices([system],np.zeros(1,dtype=int),combined,settings)
+    assert(system.solutions.shape[1] == 5)
+    assert(np.allclose(GAMMA_combined,np.array([[0.5,-2.,1.,0.25]]) @ GAMMA,rtol=0,atol=1e-9*np.max(np.abs(GAMMA))))
+
+    # conditions GMRES does not converge within its restarts are solved directly, with a warning, and only solved
+    # conditions are kept to start from
+    system                        = cached_influence_matrices(VD,np.array([0.7]),delta,phi,settings).systems[0]
+    settings.gmres_restart        = 2
+    settings.gmres_maximum_cycles = 1
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        GAMMA = solve_influence_matrices([system],inverse,RHS,settings)
+    assert(len(caught) == 1 and 'GMRES' in str(caught[0].message))
+    assert(np.allclose(GAMMA,np.linalg.solve(system.matrix,RHS.T).T,rtol=0,atol=1e-9*np.max(np.abs(GAMMA))))
+    residual = np.linalg.norm(system.right_hand_sides - system.matrix @ system.solutions,axis=0)/np.linalg.norm(system.right_hand_sides,axis=0)
+    assert(system.solutions.shape == (VD.n_cp,4) and np.all(residual <= settings.linear_solver_tolerance))
+
+    # the lift of GMRES matches the direct solve
+    direct                 = VLM(conditions,VLM_settings(),vehicle)
+    settings               = VLM_settings()
+    settings.linear_solver = 'gmres'
+    iterative              = VLM(conditions,settings,vehicle)
+    assert(np.allclose(iterative.CL,direct.CL,rtol=0,atol=1e-7))
+    assert(np.allclose(iterative.CDi,direct.CDi,rtol=0,atol=1e-7))
+
+    # truth values
+    CL_truth        = np.array([0.17112511,0.4885486,0.8834541])
+    error           = Data()
+    error.CL        = np.max(np.abs(iterative.CL[:,0] - CL_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_settings():
+    settings                              = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 5
+    settings.number_of_chordwise_vortices = 2
+    return settings
+
+def VLM_conditions():
+    conditions                             = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(3)
+    conditions.freestream.mach_number      = np.array([[0.3],[0.5],[0.7]])
+    conditions.freestream.velocity         = conditions.freestream.mach_number*300
+    conditions.aerodynamics.angles.alpha   = np.array([[0.],[0.05],[0.1]])
+    return conditions
+
+if __name__ == '__main__':
+    main()
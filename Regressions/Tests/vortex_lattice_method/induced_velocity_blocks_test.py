@@ -0,0 +1,76 @@
+# induced_velocity_blocks_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the wing induced velocities evaluated in blocks of control points, see
+    compute_wing_induced_velocity. Every memory budget and number of threads has to give the influence matrices of a
+    single block, including at supersonic Mach numbers with sonic vortices.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import generate_vortex_distribution, compute_wing_induced_velocity
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import control_point_blocks, temporaries_per_velocity
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    settings                              = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 10
+    settings.number_of_chordwise_vortices = 4
+    VD                                    = generate_vortex_distribution(vehicle_setup(),settings)
+    mach                                  = np.array([[0.3],[0.8],[1.2],[1.6]])
+    n_mach                                = len(mach)
+
+    # a single block
+    C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD,mach,compute_EW=True)
+    assert(np.sum(RFLAG == 0) > 0)
+
+    # every budget splits the control points in consecutive blocks that stay within it
+    bytes_per_point = temporaries_per_velocity*4*n_mach*VD.n_cp
+    for memory_budget in [None,1,10*bytes_per_point,10**9]:
+        blocks = control_point_blocks(VD.n_cp,VD.n_cp,n_mach,memory_budget)
+        assert(blocks[0][0] == 0 and blocks[-1][1] == VD.n_cp)
+        assert(all([blocks[i][1] == blocks[i+1][0] for i in range(len(blocks) - 1)]))
+        if memory_budget is not None:
+            assert(all([(last - first) == 1 or (last - first)*bytes_per_point <= memory_budget for first,last in blocks]))
+    assert(len(control_point_blocks(VD.n_cp,VD.n_cp,n_mach,1)) == VD.n_cp)
+    assert(len(control_point_blocks(VD.n_cp,VD.n_cp,n_mach,10*bytes_per_point)) == int(np.ceil(VD.n_cp/10)))
+
+    # the blocks, evaluated serially or over threads, give the matrices of a single block
+    for memory_budget,number_of_threads in [[1,1],[10*bytes_per_point,1],[10*bytes_per_point,4],[10**9,2]]:
+        blocked = compute_wing_induced_velocity(VD,mach,compute_EW=True,memory_budget=memory_budget,number_of_threads=number_of_threads)
+        for single,block in zip([C_mn,s,RFLAG,EW],blocked):
+            assert(np.array_equal(single,block,equal_nan=True))
+
+    # truth values
+    C_mn_truth    = -0.7863965715680804
+    EW_truth      = -1.0293055943080358
+    print('sonic vortices: ' + str(np.sum(RFLAG == 0)))
+    error         = Data()
+    error.C_mn    = np.abs(np.sum(C_mn[0,:,:,2])/VD.n_cp - C_mn_truth)
+    error.EW      = np.abs(np.sum(EW[2])/VD.n_cp - EW_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
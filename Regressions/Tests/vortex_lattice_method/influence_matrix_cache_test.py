@@ -0,0 +1,138 @@
+# influence_matrix_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the factorized influence matrices kept across VLM calls, see cached_influence_matrices """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_vortex_distribution import cached_vortex_distribution
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_influence_matrices  import cached_influence_matrices, solve_influence_matrices
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
+
+# python imports
+import numpy as np
+import tracemalloc
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle    = vehicle_setup()
+    conditions = VLM_conditions()
+
+    # no cache
+    settings                               = VLM_settings()
+    settings.influence_matrix_cache_memory = 0
+    uncached                               = VLM(conditions,settings,vehicle)
+    assert(len(settings.influence_matrix_cache) == 0)
+
+    # every Mach number is kept and reused
+    settings = VLM_settings()
+    cached   = VLM(conditions,settings,vehicle)
+    entries  = list(settings.influence_matrix_cache.values())
+    reused   = VLM(conditions,settings,vehicle)
+    assert(len(entries) == 3)
+    assert(all([a is b for a,b in zip(entries,settings.influence_matrix_cache.values())]))
+    assert(np.all(cached.CL == uncached.CL) and np.all(reused.CL == uncached.CL))
+    entry_memory = entries[0].memory
+    print('bytes per influence matrix : ' + str(entry_memory))
+
+    # single precision panels still factorize in double precision, matching np.linalg.solve on the same matrix
+    settings  = VLM_settings()
+    VD        = cached_vortex_distribution(vehicle,settings)
+    phi       = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*np.ones((1,1))
+    delta     = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*np.ones((1,1))))
+    normal    = np.stack([np.sin(delta[0])*np.cos(phi[0]),np.cos(delta[0])*np.sin(phi[0]),-np.cos(phi[0])*np.cos(delta[0])],axis=-1)
+    A         = compute_wing_induced_velocity(VD,np.array([[0.4]]),normal=normal)[0][0]
+    RHS       = np.random.default_rng(0).random((2,VD.n_cp))
+    influence = cached_influence_matrices(VD,np.array([0.4]),delta,phi,settings)
+    GAMMA     = solve_influence_matrices(influence.systems,np.zeros(2,dtype=int),RHS,settings)
+    reference = np.linalg.solve(A,RHS.T).T
+    assert(influence.systems[0][0].dtype == np.float64)
+    assert(np.allclose(GAMMA,reference,rtol=1e-12,atol=1e-12*np.max(np.abs(reference))))
+
+    # the memory cap keeps the latest Mach numbers that fit
+    settings                               = VLM_settings()
+    settings.influence_matrix_cache_memory = int(2.5*entry_memory)
+    capped                                 = VLM(conditions,settings,vehicle)
+    assert(len(settings.influence_matrix_cache) == 2)
+    assert(np.all(capped.CL == uncached.CL))
+
+    # the induced velocity memory budget bounds the temporaries of building a matrix, not the cache
+    settings                                = VLM_settings()
+    settings.induced_velocity_memory_budget = int(0.1*entry_memory)
+    budget                                  = VLM(conditions,settings,vehicle)
+    assert(len(settings.influence_matrix_cache) == 3)
+    assert(np.all(budget.CL == uncached.CL))
+
+    # with a budget the blocks are written into one matrix, the velocity matrices of all panels are never built
+    VD        = cached_vortex_distribution(vehicle,settings)
+    n_cp      = VD.n_cp
+    phi       = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*np.ones((1,1))
+    delta     = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*np.ones((1,1))))
+    tracemalloc.start()
+    cached_influence_matrices(VD,np.array([0.4]),delta,phi,settings)
+    peak      = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('peak bytes per matrix entry : ' + str(peak/n_cp**2))
+    assert(peak < 4*8*n_cp**2)
+
+    # the matrices are built with the panel angles of the first condition, differing angles are refused
+    settings  = VLM_settings()
+    VD        = cached_vortex_distribution(vehicle,settings)
+    ones      = np.ones((2,1))
+    phi       = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones
+    delta     = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*ones))
+    cached_influence_matrices(VD,np.array([0.3]),delta,phi,settings)
+    delta[1] += 0.01
+    try:
+        cached_influence_matrices(VD,np.array([0.4]),delta,phi,settings)
+        refused = False
+    except ValueError:
+        refused = True
+    assert(refused)
+
+    # truth values
+    CL_truth        = np.array([0.17112511,0.4885486,0.8834541])
+    error           = Data()
+    error.CL        = np.max(np.abs(cached.CL[:,0] - CL_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_settings():
+    settings                              = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 5
+    settings.number_of_chordwise_vortices = 2
+    return settings
+
+def VLM_conditions():
+    conditions                             = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(3)
+    conditions.freestream.mach_number      = np.array([[0.3],[0.5],[0.7]])
+    conditions.freestream.velocity         = conditions.freestream.mach_number*300
+    conditions.aerodynamics.angles.alpha   = np.array([[0.],[0.05],[0.1]])
+    return conditions
+
+if __name__ == '__main__':
+    main()
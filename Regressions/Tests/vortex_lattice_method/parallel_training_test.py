@@ -0,0 +1,93 @@
+# parallel_training_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of VLM surrogates trained over a process pool, see settings.number_of_training_workers. The training
+    data, reference values and control surface flags of three workers have to match those of a single process.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates
+
+# python imports
+import numpy as np
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    flags = ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']
+
+    trained = Data()
+    for number_of_workers in [1,3]:
+        aerodynamics                                     = VLM_analysis()
+        aerodynamics.settings.number_of_training_workers = number_of_workers
+        train_VLM_surrogates(aerodynamics)
+        trained[str(number_of_workers)] = aerodynamics
+
+    serial   = trained['1']
+    parallel = trained['3']
+
+    # the Mach blocks are merged back in order, every array is identical
+    for regime in ['subsonic','supersonic','transonic']:
+        serial_arrays   = flatten(serial.training[regime])
+        parallel_arrays = flatten(parallel.training[regime])
+        assert(list(serial_arrays.keys()) == list(parallel_arrays.keys()))
+        for key,value in serial_arrays.items():
+            assert(np.shape(value) == np.shape(parallel_arrays[key]))
+            assert(np.array_equal(value,parallel_arrays[key]))
+    assert(serial.training.subsonic.Clift_alpha.shape[-1] == int(sum(serial.training.Mach<1.)))
+
+    # the reference values and control surface flags come back from the workers
+    for key,value in serial.reference_values.items():
+        assert(np.all(value == parallel.reference_values[key]))
+    for flag in flags:
+        assert(serial[flag] == parallel[flag])
+    assert(parallel.flap_flag and parallel.elevator_flag)
+
+    # truth values
+    CL_truth      = 0.7156162710739834
+    CL            = parallel.training.subsonic.Clift_alpha[4,4]
+    error         = Data()
+    error.CL      = np.abs(CL - CL_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_analysis():
+    analysis                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    analysis.vehicle                               = vehicle_setup()
+    analysis.settings.number_of_spanwise_vortices  = 5
+    analysis.settings.number_of_chordwise_vortices = 2
+    return analysis
+
+def flatten(data,prefix=''):
+    arrays = {}
+    for k,v in data.items():
+        if isinstance(v,Data):
+            arrays.update(flatten(v,prefix + k + '.'))
+        else:
+            arrays[prefix + k] = v
+    return arrays
+
+if __name__ == '__main__':
+    main()
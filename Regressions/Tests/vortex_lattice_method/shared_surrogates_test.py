@@ -0,0 +1,99 @@
+# shared_surrogates_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the VLM surrogates shared by the aerodynamics and stability analyses, see VLM_surrogate_registry.
+    Surrogates are shared only by analyses with the same training inputs.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_training_cache import VLM_training_key
+
+# python imports
+import numpy as np
+import pickle
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle      = vehicle_setup()
+    aerodynamics = VLM_analysis(RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method(),vehicle)
+    stability    = VLM_analysis(RCAIDE.Framework.Analyses.Stability.Vortex_Lattice_Method(),vehicle)
+
+    # the default analyses train on different angles of attack, so each trains its own surrogates
+    assert(VLM_training_key(aerodynamics) != VLM_training_key(stability))
+    stability.initialize()
+    aerodynamics.initialize()
+    assert(aerodynamics.training.subsonic is not stability.training.subsonic)
+    assert(aerodynamics.surrogates.subsonic is not stability.surrogates.subsonic)
+
+    # a stability analysis given the training grid of the aerodynamics analysis shares its training and surrogates
+    shared                          = VLM_analysis(RCAIDE.Framework.Analyses.Stability.Vortex_Lattice_Method(),vehicle)
+    shared.training.angle_of_attack = aerodynamics.training.angle_of_attack
+    assert(VLM_training_key(aerodynamics) == VLM_training_key(shared))
+    shared.initialize()
+    assert(aerodynamics.training.subsonic is shared.training.subsonic)
+    assert(aerodynamics.surrogates.subsonic is shared.surrogates.subsonic)
+
+    # the lift of the stability process is evaluated with the surrogates of the segment's aerodynamics analysis
+    segment                           = VLM_segment(stability)
+    stability.process.compute.lift.evaluate(segment,stability.settings,stability.vehicle)
+    assert(np.all(np.isfinite(segment.conditions.aerodynamics.coefficients.lift.total)))
+
+    # every analysis keeps its own caches, and the factorizations of the training are released
+    for name in ['vortex_distribution_cache','influence_matrix_cache']:
+        assert(aerodynamics.settings[name] is not shared.settings[name])
+    for analysis in [aerodynamics,stability,shared]:
+        assert(len(analysis.settings.influence_matrix_cache) == 0)
+    settings_memory = len(pickle.dumps(aerodynamics.settings))
+    print('pickled settings bytes : ' + str(settings_memory))
+    assert(settings_memory < 2**20)
+
+    # truth values
+    CL_truth      = 0.7156162710739834
+    CL            = aerodynamics.training.subsonic.Clift_alpha[4,4]
+    error         = Data()
+    error.CL      = np.abs(CL - CL_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_analysis(analysis,vehicle):
+    analysis.vehicle                               = vehicle
+    analysis.settings.number_of_spanwise_vortices  = 5
+    analysis.settings.number_of_chordwise_vortices = 2
+    return analysis
+
+def VLM_segment(analysis):
+    segment                                        = RCAIDE.Framework.Mission.Segments.Segment()
+    segment.analyses.aerodynamics                  = analysis
+    segment.state.conditions                       = RCAIDE.Framework.Mission.Common.Results()
+    segment.state.conditions.expand_rows(2)
+    segment.conditions                             = segment.state.conditions
+    segment.conditions.freestream.mach_number      = np.array([[0.3],[0.5]])
+    segment.conditions.freestream.velocity         = segment.conditions.freestream.mach_number*300
+    segment.conditions.aerodynamics.angles.alpha   = np.array([[0.02],[0.05]])
+    return segment
+
+if __name__ == '__main__':
+    main()
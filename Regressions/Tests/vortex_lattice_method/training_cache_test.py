@@ -0,0 +1,120 @@
+# training_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the VLM training data stored on disk, see VLM_training_cache. An analysis initialized from the
+    stored file has to hold the training data of the analysis that was trained, and any change to the training inputs
+    has to name another file.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates, VLM_training_file, VLM_training_key, load_VLM_training, save_VLM_training
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_surrogate_registry import registry
+
+# python imports
+import numpy as np
+import tempfile
+import os
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    flags = ['aileron_flag','flap_flag','rudder_flag','elevator_flag','slat_flag']
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        # without a directory nothing is stored
+        trained = VLM_analysis(None)
+        assert(VLM_training_file(trained,VLM_training_key(trained)) is None)
+
+        # the training data is stored under the key of its inputs
+        trained.settings.training_cache_directory = directory
+        key      = VLM_training_key(trained)
+        filename = VLM_training_file(trained,key)
+        assert(not load_VLM_training(trained,filename))
+        train_VLM_surrogates(trained)
+        save_VLM_training(trained,filename)
+        assert(os.listdir(directory) == [key + '.npz'])
+
+        # settings that only control caching and parallelism keep the key, the training inputs change it
+        analysis = VLM_analysis(directory)
+        analysis.settings.number_of_training_workers = 4
+        analysis.settings.induced_velocity_threads   = 2
+        assert(VLM_training_key(analysis) == key)
+        analysis.training.angle_of_attack = analysis.training.angle_of_attack*1.01
+        assert(VLM_training_key(analysis) != key)
+        analysis = VLM_analysis(directory)
+        analysis.vehicle.wings.main_wing.control_surfaces.flap.deflection = 20. * Units.degrees
+        assert(VLM_training_key(analysis) != key)
+
+        # a new analysis of the same vehicle loads the stored training instead of training, this process has not
+        # shared any surrogates yet
+        registry.surrogates.clear()
+        loaded = VLM_analysis(directory)
+        loaded.initialize()
+        assert(len(loaded.settings.vortex_distribution_cache) == 0)
+        for regime in ['subsonic','supersonic','transonic']:
+            trained_arrays = flatten(trained.training[regime])
+            loaded_arrays  = flatten(loaded.training[regime])
+            assert(list(trained_arrays.keys()) == list(loaded_arrays.keys()))
+            for name,value in trained_arrays.items():
+                assert(np.array_equal(value,loaded_arrays[name]))
+        for name,value in trained.reference_values.items():
+            assert(np.all(value == loaded.reference_values[name]))
+        for flag in flags:
+            assert(trained[flag] == loaded[flag])
+        registry.surrogates.clear()
+
+        # a damaged file is not loaded, the analysis trains instead
+        with open(filename,'wb') as file:
+            file.write(b'not a training file')
+        assert(not load_VLM_training(VLM_analysis(directory),filename))
+
+    # truth values
+    CL_truth      = 0.7156162710739834
+    CL            = loaded.training.subsonic.Clift_alpha[4,4]
+    error         = Data()
+    error.CL      = np.abs(CL - CL_truth)
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_analysis(directory):
+    analysis                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    analysis.vehicle                               = vehicle_setup()
+    analysis.settings.number_of_spanwise_vortices  = 5
+    analysis.settings.number_of_chordwise_vortices = 2
+    analysis.settings.training_cache_directory     = directory
+    return analysis
+
+def flatten(data,prefix=''):
+    arrays = {}
+    for k,v in data.items():
+        if isinstance(v,Data):
+            arrays.update(flatten(v,prefix + k + '.'))
+        else:
+            arrays[prefix + k] = v
+    return arrays
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# vortex_distribution_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" regression of the vortex distributions kept across VLM calls, see cached_vortex_distribution """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units, Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import VLM, cached_vortex_distribution, generate_vortex_distribution
+from Legacy.trunk.S.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.cached_vortex_distribution import vortex_distribution_key
+
+# python imports
+import numpy as np
+import copy
+import sys
+
+# local imports
+sys.path.append('../../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle    = vehicle_setup()
+    conditions = VLM_conditions()
+
+    # without a cache the panelization is generated on every call
+    settings = VLM_settings()
+    del settings.vortex_distribution_cache
+    uncached = VLM(conditions,settings,vehicle)
+    assert(cached_vortex_distribution(vehicle,settings) is not cached_vortex_distribution(vehicle,settings))
+
+    # a cached panelization is reused and identical to a generated one
+    settings  = VLM_settings()
+    cached    = VLM(conditions,settings,vehicle)
+    VD        = cached_vortex_distribution(vehicle,settings)
+    reused    = VLM(conditions,settings,vehicle)
+    assert(len(settings.vortex_distribution_cache) == 1)
+    assert(cached_vortex_distribution(vehicle,settings) is VD)
+    assert(np.all(cached.CL == uncached.CL) and np.all(reused.CL == uncached.CL))
+    generated = generate_vortex_distribution(vehicle,VLM_settings())
+    for name in ['XA1','YA1','ZA1','XC','YC','ZC','n_cp']:
+        assert(np.all(VD[name] == generated[name]))
+
+    # the key only depends on the values of the geometry and settings
+    assert(vortex_distribution_key(copy.deepcopy(vehicle),VLM_settings()) == vortex_distribution_key(vehicle,settings))
+
+    # control surface deflections and discretization settings are part of the key
+    deflected = copy.deepcopy(vehicle)
+    deflected.wings.main_wing.control_surfaces.flap.deflection = 20. * Units.degrees
+    flapped   = VLM(conditions,settings,deflected)
+    assert(len(settings.vortex_distribution_cache) == 2)
+    assert(np.all(flapped.CL > uncached.CL))
+    settings.number_of_spanwise_vortices = 6
+    cached_vortex_distribution(vehicle,settings)
+    assert(len(settings.vortex_distribution_cache) == 3)
+
+    # the oldest panelization is dropped first
+    settings                                 = VLM_settings()
+    settings.vortex_distribution_cache_size  = 2
+    for number_of_spanwise_vortices in [5,6,7]:
+        settings.number_of_spanwise_vortices = number_of_spanwise_vortices
+        cached_vortex_distribution(vehicle,settings)
+    assert(len(settings.vortex_distribution_cache) == 2)
+    settings.number_of_spanwise_vortices = 5
+    assert(vortex_distribution_key(vehicle,settings) not in settings.vortex_distribution_cache)
+
+    # truth values
+    CL_truth        = np.array([0.17112511,0.4885486,0.8834541])
+    error           = Data()
+    error.CL        = np.max(np.abs(cached.CL[:,0] - CL_truth))
+    print('Errors:')
+    print(error)
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def VLM_settings():
+    settings                              = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 5
+    settings.number_of_chordwise_vortices = 2
+    return settings
+
+def VLM_conditions():
+    conditions                             = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(3)
+    conditions.freestream.mach_number      = np.array([[0.3],[0.5],[0.7]])
+    conditions.freestream.velocity         = conditions.freestream.mach_number*300
+    conditions.aerodynamics.angles.alpha   = np.array([[0.],[0.05],[0.1]])
+    return conditions
+
+if __name__ == '__main__':
+    main()
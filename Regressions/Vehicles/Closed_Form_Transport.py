@@ -0,0 +1,117 @@
+# Regressions/Vehicles/Closed_Form_Transport.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" Transport aircraft whose aerodynamics and propulsion are reduced to closed forms. Missions flown with it converge
+    in a fraction of a second and only exercise the mission solver and the segment functions.
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units, Data, Container
+
+# python imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Vehicle
+# ----------------------------------------------------------------------------------------------------------------------
+def vehicle_setup():
+    vehicle                         = RCAIDE.Vehicle()
+    vehicle.tag                     = 'closed_form_transport'
+    vehicle.reference_area          = 120.   * Units['meters**2']
+    vehicle.mass_properties.takeoff = 70000. * Units.kg
+    return vehicle
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Analyses
+# ----------------------------------------------------------------------------------------------------------------------
+class Closed_Form_Aerodynamics(RCAIDE.Framework.Analyses.Aerodynamics.Aerodynamics):
+    """ Linear lift curve and parabolic drag polar """
+
+    def __defaults__(self):
+        self.tag                               = 'aerodynamics'
+        self.vehicle                           = Data()
+        self.settings.maximum_lift_coefficient = 1.5
+        self.lift_slope                        = 5.5
+        self.zero_lift_lift_coefficient        = 0.2
+        self.zero_lift_drag_coefficient        = 0.02
+        self.induced_drag_factor               = 0.045
+
+    def evaluate(self,segment):
+        conditions = segment.state.conditions
+        CL         = self.lift_slope*conditions.aerodynamics.angles.alpha + self.zero_lift_lift_coefficient
+        conditions.aerodynamics.coefficients.lift.total = CL
+        conditions.aerodynamics.coefficients.drag.total = self.zero_lift_drag_coefficient + self.induced_drag_factor*CL**2
+        return conditions
+
+class Closed_Form_Propulsion(RCAIDE.Framework.Analyses.Energy.Energy):
+    """ Thrust proportional to throttle at a constant thrust specific fuel consumption """
+
+    def __defaults__(self):
+        self.tag                              = 'energy'
+        self.vehicle                          = Data()
+        self.vehicle.networks                 = Container()
+        self.maximum_thrust                   = 200000.
+        self.thrust_specific_fuel_consumption = 1.5e-5
+
+    def evaluate(self,state):
+        conditions = state.conditions
+        thrust     = self.maximum_thrust*state.unknowns.throttle_0
+        conditions.energy.thrust_force_vector  = np.hstack([thrust,0*thrust,0*thrust])
+        conditions.energy.thrust_moment_vector = 0*conditions.energy.thrust_force_vector
+        conditions.energy.vehicle_mass_rate    = self.thrust_specific_fuel_consumption*thrust
+        return
+
+def analyses_setup(vehicle):
+    analyses             = RCAIDE.Framework.Analyses.Vehicle_Analyses()
+    weights              = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weights.vehicle      = vehicle
+    analyses.append(weights)
+    aerodynamics         = Closed_Form_Aerodynamics()
+    aerodynamics.vehicle = vehicle
+    analyses.append(aerodynamics)
+    analyses.append(Closed_Form_Propulsion())
+    planet               = RCAIDE.Framework.Analyses.Planets.Planet()
+    analyses.append(planet)
+    atmosphere           = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+    return analyses
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Segments
+# ----------------------------------------------------------------------------------------------------------------------
+def cruise_segment_setup(analyses,tag='cruise',number_of_cases=1):
+    """ Constant speed, constant altitude cruise trimmed in x and z with the throttle and the body angle. Altitude,
+        speed and distance are left to the caller.
+    """
+    segment                                         = RCAIDE.Framework.Mission.Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag                                     = tag
+    segment.analyses.extend(analyses)
+    segment.state.numerics.number_of_control_points = 8
+    segment.state.numerics.number_of_cases          = number_of_cases
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                                   = True
+    segment.flight_dynamics.force_z                                   = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active                = True
+    segment.assigned_control_variables.throttle.assigned_propulsors   = [['engine']]
+    segment.assigned_control_variables.body_angle.active              = True
+    return segment
+
+def mission_setup(analyses,altitude,tag='mission',number_of_cases=1):
+    """ A single 500 km cruise at 230 m/s """
+    mission           = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag       = tag
+    segment           = cruise_segment_setup(analyses,'cruise',number_of_cases)
+    segment.altitude  = altitude
+    segment.air_speed = 230. * Units['m/s']
+    segment.distance  = 500. * Units.km
+    mission.append_segment(segment)
+    return mission
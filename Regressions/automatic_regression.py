@@ -19,7 +19,31 @@ import sys, os, traceback, time
 modules = [ 
     # ----------------------- Regression List -------------------------- 
     'Tests/mission_segments/segment_test.py',     
+    'Tests/mission_segments/batched_cases_test.py',
+    'Tests/mission_segments/parallel_missions_test.py',
+    'Tests/mission_solver/sparse_jacobian_test.py',
+    'Tests/mission_solver/root_finders_test.py',
+    'Tests/mission_solver/warm_start_test.py',
+    'Tests/mission_solver/compiled_pack_test.py',
     'Tests/network_turbofan/turbofan_network_test.py', 
+    'Tests/mission_conditions/column_buffer_conditions_test.py',
+    'Tests/mission_conditions/lazy_conditions_test.py',
+    'Tests/mission_conditions/merged_states_test.py',
+    'Tests/vortex_lattice_method/vortex_distribution_cache_test.py',
+    'Tests/vortex_lattice_method/influence_matrix_cache_test.py',
+    'Tests/vortex_lattice_method/induced_velocity_blocks_test.py',
+    'Tests/vortex_lattice_method/gmres_solver_test.py',
+    'Tests/vortex_lattice_method/adaptive_training_grids_test.py',
+    'Tests/vortex_lattice_method/parallel_training_test.py',
+    'Tests/vortex_lattice_method/training_cache_test.py',
+    'Tests/vortex_lattice_method/shared_surrogates_test.py',
+    'Tests/vortex_lattice_method/fused_surrogates_test.py',
+    'Tests/vortex_lattice_method/airfoil_geometry_cache_test.py',
+    'Tests/rotor_wake/tree_wake_test.py',
+    'Tests/airfoil_panel_method/boundary_layer_march_test.py',
+    'Tests/airfoil_panel_method/shared_geometry_test.py',
+    'Tests/airfoil_panel_method/transition_march_test.py',
+    'Tests/airfoil_polars/polar_database_test.py',
 ]
 
 def regressions():